@@ -0,0 +1 @@
+"""Benchmarks for the MPF Media Controller."""
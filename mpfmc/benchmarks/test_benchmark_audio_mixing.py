@@ -0,0 +1,74 @@
+import logging
+import random
+import struct
+import time
+import unittest
+from array import array
+
+from mpfmc.tests.test_AudioMixing import mix_per_sample, mix_samples, float_samples_to_output
+
+
+@unittest.skipIf(mix_samples is None, "mpfmc.core.audio library could not be loaded")
+class BenchmarkAudioMixing(unittest.TestCase):
+
+    """Compare mixing one sample at a time (like the previous byte-wise
+    functions) with the vectorizable mixing functions of the audio callback
+    for common buffer sizes. The output has to be identical."""
+
+    buffer_samples = [256, 1024, 4096]
+    iterations = 2000
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkAudioMixing')
+
+    def _output(self, what, start, end, num, length):
+        self.log.info("%s: %.3fus per buffer  %.1f MB/s",
+                      what, 1000000 * (end - start) / num, num * length / (end - start) / 1000000)
+
+    def testMixing(self):
+        rand = random.Random(20)
+        for samples in self.buffer_samples:
+            # stereo
+            values = [rand.randint(-32768, 32767) for _ in range(samples * 2)]
+            input_buffer = struct.pack('<{}h'.format(len(values)), *values)
+            output_buffer = bytearray(reversed(input_buffer))
+            for volume_left, volume_right in ((128, -1), (90, -1), (128, 40)):
+                expected = mix_per_sample(output_buffer, input_buffer, volume_left, volume_right)
+                result = bytearray(output_buffer)
+                mix_samples(result, input_buffer, volume_left, volume_right)
+                self.assertEqual(expected, result)
+
+            num = max(1, self.iterations // 100)
+            start = time.perf_counter()
+            for _ in range(num):
+                mix_per_sample(output_buffer, input_buffer, 90, 40)
+            end = time.perf_counter()
+            self._output("{} samples per sample".format(samples), start, end, num, len(input_buffer))
+
+            start = time.perf_counter()
+            for _ in range(self.iterations):
+                mix_samples(output_buffer, input_buffer, 90)
+            end = time.perf_counter()
+            self._output("{} samples vectorized".format(samples), start, end, self.iterations, len(input_buffer))
+
+            start = time.perf_counter()
+            for _ in range(self.iterations):
+                mix_samples(output_buffer, input_buffer, 90, 40)
+            end = time.perf_counter()
+            self._output("{} samples vectorized stereo".format(samples), start, end, self.iterations,
+                         len(input_buffer))
+
+    def testFloatOutput(self):
+        # cost of the output conversion of the float mix bus (with and without the soft limiter)
+        rand = random.Random(21)
+        for samples in self.buffer_samples:
+            input_buffer = array('f', [rand.uniform(-40000, 40000) for _ in range(samples * 2)])
+            output_buffer = bytearray(samples * 4)
+
+            for soft_limiter in (False, True):
+                start = time.perf_counter()
+                for _ in range(self.iterations):
+                    float_samples_to_output(output_buffer, input_buffer, 0.5, soft_limiter)
+                end = time.perf_counter()
+                self._output("{} samples float output (soft limiter: {})".format(samples, soft_limiter),
+                             start, end, self.iterations, len(output_buffer))
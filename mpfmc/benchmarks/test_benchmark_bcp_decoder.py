@@ -0,0 +1,68 @@
+import logging
+import time
+import unittest
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+from mpfmc.core import bcp_decoder
+
+
+class BenchmarkBcpDecoder(unittest.TestCase):
+
+    """Compare the cached decoder with decode_command_string in MPF on a
+    typical traffic mix."""
+
+    num = 100000
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkBcpDecoder')
+
+    def _messages(self):
+        messages = []
+        for i in range(self.num):
+            score = (i % 50) * 10
+            messages.append('player_variable?name=score&value=int:{}&prev_value=int:{}&change=int:10&'
+                            'player_num=int:1'.format(score + 10, score))
+            messages.append('trigger?name=sw_{}_active'.format(i % 20))
+            if i % 10 == 0:
+                messages.append('machine_variable?name=credits_string&value=FREE%20PLAY&'
+                                'prev_value=FREE%20PLAY&change=bool:False')
+        return messages
+
+    def _output(self, what, start, end, num):
+        self.log.info("%s: Duration %.5fus  Per second: %.0f",
+                      what, 1e6 * (end - start) / num, num / (end - start))
+
+    def testDecoder(self):
+        messages = self._messages()
+        for message in messages[:1000]:
+            self.assertEqual(bcp.decode_command_string(message), bcp_decoder.decode_command_string(message))
+
+        start = time.perf_counter()
+        for message in messages:
+            bcp.decode_command_string(message)
+        end = time.perf_counter()
+        self._output("MPF decoder", start, end, len(messages))
+
+        bcp_decoder._decode_cached.cache_clear()
+        start = time.perf_counter()
+        for message in messages:
+            bcp_decoder.decode_command_string(message)
+        end = time.perf_counter()
+        self._output("Cached decoder", start, end, len(messages))
+        self.log.info("Cache: %s", bcp_decoder.get_decoder_stats())
+
+        # unique messages only use the fast path
+        unique = ['player_variable?name=score&value=int:{}&prev_value=int:0&change=int:1&player_num=int:1'.format(i)
+                  for i in range(self.num)]
+        start = time.perf_counter()
+        for message in unique:
+            bcp.decode_command_string(message)
+        end = time.perf_counter()
+        self._output("MPF decoder (unique)", start, end, len(unique))
+
+        start = time.perf_counter()
+        for message in unique:
+            bcp_decoder.decode_command_string(message)
+        end = time.perf_counter()
+        self._output("Cached decoder (unique)", start, end, len(unique))
@@ -0,0 +1,115 @@
+import logging
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+from mpfmc.core.bcp_payload_ring import BcpPayloadRing
+from mpfmc.core.bcp_selector_server import BCPSelectorServer
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+
+
+class BenchmarkBcpTransport(unittest.TestCase):
+
+    """Compare latency and frame throughput of TCP, unix sockets and the
+    shared memory payload ring."""
+
+    frame_size = 128 * 32 * 3
+    num_frames = 5000
+    num_pings = 2000
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkBcpTransport')
+
+    def _start_server(self, interface):
+        mc = MagicMock()
+        mc.machine_config = {'mpf-mc': {'bcp_interface': interface, 'bcp_port': 0,
+                                        'bcp_payload_ring_size': 1 << 20}}
+        mc.options = {'production': False}
+        mc.thread_stopper = threading.Event()
+        mc.crash_queue = queue.Queue()
+
+        sending_queue = BcpSendQueue()
+        server = BCPSelectorServer(mc, queue.Queue(), sending_queue)
+        server.daemon = True
+        server.start()
+
+        def stop():
+            mc.thread_stopper.set()
+            server.wakeup()
+            server.join(5)
+        self.addCleanup(stop)
+
+        if server.unix_socket_path:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(server.unix_socket_path)
+        else:
+            client = socket.create_connection(server.socket.getsockname())
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.addCleanup(client.close)
+        return sending_queue, client, client.makefile('rb')
+
+    @staticmethod
+    def _read_message(reader, ring):
+        cmd, kwargs = bcp.decode_command_string(reader.readline()[:-1].decode())
+        if 'bytes' in kwargs:
+            payload = reader.read(int(kwargs['bytes']))
+        elif 'ring_bytes' in kwargs:
+            payload = ring.read(kwargs['ring_position'], kwargs['ring_bytes'])
+        else:
+            payload = None
+        return cmd, payload
+
+    def _benchmark(self, name, interface, use_ring):
+        sending_queue, client, reader = self._start_server(interface)
+        ring = None
+        if use_ring:
+            client.sendall(b'payload_ring_request\n')
+            _, kwargs = bcp.decode_command_string(reader.readline()[:-1].decode())
+            ring = BcpPayloadRing.attach(kwargs['name'])
+            self.addCleanup(ring.close)
+
+        latencies = []
+        for _ in range(self.num_pings):
+            start = time.perf_counter()
+            sending_queue.put(('trigger?name=ping', None))
+            self._read_message(reader, ring)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+
+        frames = [os.urandom(self.frame_size) for _ in range(16)]
+        start = time.perf_counter()
+        for i in range(self.num_frames):
+            sending_queue.put(('dmd_frame?name=dmd', frames[i % 16]))
+            _, payload = self._read_message(reader, ring)
+            self.assertEqual(self.frame_size, len(payload))
+        duration = time.perf_counter() - start
+
+        self.log.info("%s: Latency mean %.1fus p99 %.1fus  Frames per second: %.0f (%.1f MB/s)",
+                      name,
+                      1e6 * sum(latencies) / len(latencies),
+                      1e6 * latencies[int(len(latencies) * .99)],
+                      self.num_frames / duration,
+                      self.num_frames * self.frame_size / duration / 1e6)
+
+    def testTcp(self):
+        self._benchmark("TCP", "localhost", False)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not supported")
+    def testUnixSocket(self):
+        with tempfile.TemporaryDirectory() as path:
+            self._benchmark("Unix socket", "unix:" + os.path.join(path, "bcp.sock"), False)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not supported")
+    def testUnixSocketWithPayloadRing(self):
+        with tempfile.TemporaryDirectory() as path:
+            self._benchmark("Unix socket + payload ring", "unix:" + os.path.join(path, "bcp.sock"), True)
+
+    def testTcpWithPayloadRing(self):
+        self._benchmark("TCP + payload ring", "localhost", True)
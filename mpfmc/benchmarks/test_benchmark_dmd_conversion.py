@@ -0,0 +1,83 @@
+import logging
+import os
+import random
+import time
+import unittest
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from mpfmc.core.dmd import Dmd, RgbDmd
+from mpfmc.tests.test_DmdConversion import convert_per_pixel, reorder_per_pixel
+
+
+class BenchmarkDmdConversion(unittest.TestCase):
+
+    """Compare the per pixel and the vectorized conversion of DMD frames to
+    brightness values (used without the GPU output effect) and of the channel
+    order of RGB DMD frames for common panel sizes. Also measures dithering
+    and packing of monochrome frames."""
+
+    sizes = [(128, 32), (192, 64), (256, 64)]
+    frames = 50
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkDmdConversion')
+
+    def _output(self, what, start, end, num):
+        self.log.info("%s: %.3fms per frame  Frames per second: %.0f",
+                      what, 1000 * (end - start) / num, num / (end - start))
+
+    def testConversion(self):
+        rand = random.Random(11)
+        luminosity = (.299, .587, .114)
+        for width, height in self.sizes:
+            data = bytes(rand.getrandbits(8) for _ in range(width * height * 3))
+            self.assertEqual(convert_per_pixel(data, luminosity),
+                             Dmd._convert_to_single_bytes(data, {'luminosity': luminosity}))
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                convert_per_pixel(data, luminosity)
+            end = time.perf_counter()
+            self._output("{}x{} per pixel".format(width, height), start, end, self.frames)
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                Dmd._convert_to_single_bytes(data, {'luminosity': luminosity})
+            end = time.perf_counter()
+            self._output("{}x{} vectorized".format(width, height), start, end, self.frames)
+
+    def testReorderChannels(self):
+        rand = random.Random(12)
+        for width, height in self.sizes:
+            data = bytes(rand.getrandbits(8) for _ in range(width * height * 3))
+            self.assertEqual(reorder_per_pixel(data, "bgr"), RgbDmd._reorder_channels(data, "bgr"))
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                reorder_per_pixel(data, "bgr")
+            end = time.perf_counter()
+            self._output("{}x{} bgr per pixel".format(width, height), start, end, self.frames)
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                RgbDmd._reorder_channels(data, "bgr")
+            end = time.perf_counter()
+            self._output("{}x{} bgr vectorized".format(width, height), start, end, self.frames)
+
+    def testDitherAndPack(self):
+        rand = random.Random(16)
+        for width, height in self.sizes:
+            data = bytes(rand.getrandbits(8) for _ in range(width * height))
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                Dmd._pack_pixels(Dmd._dither(data, width, height, 15), 4)
+            end = time.perf_counter()
+            self._output("{}x{} dither and pack 4 bit".format(width, height), start, end, self.frames)
+
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                Dmd._pack_pixels(Dmd._dither(data, width, height, 3), 2)
+            end = time.perf_counter()
+            self._output("{}x{} dither and pack 2 bit".format(width, height), start, end, self.frames)
@@ -0,0 +1,64 @@
+import logging
+import random
+import time
+import unittest
+
+import numpy as np
+
+from mpfmc.core.dmd_encoding import DmdFrameDecoder, DmdFrameEncoder
+
+
+class BenchmarkDmdEncoding(unittest.TestCase):
+
+    """Compare the BCP bandwidth of uncompressed and delta encoded DMD frames
+    for typical content: a score which changes every few frames and a
+    scrolling line of text on a black background."""
+
+    fps = 30
+    seconds = 10
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkDmdEncoding')
+
+    def _frames(self, width, height, channels):
+        rand = random.Random(15)
+        text = np.array([rand.randrange(2) * 15 for _ in range(8 * width * 2)], dtype=np.uint8).reshape(8, -1)
+        for num in range(self.fps * self.seconds):
+            frame = np.zeros((height, width, channels), dtype=np.uint8)
+            # the score in the top half
+            if num % 3 == 0:
+                digits = np.array([rand.randrange(2) * 15 for _ in range(8 * 48)], dtype=np.uint8).reshape(8, 48)
+            frame[4:12, 40:88] = digits[:, :, None]
+            # a scrolling line at the bottom
+            offset = num % width
+            frame[height - 10:height - 2] = text[:, offset:offset + width, None]
+            yield frame.tobytes()
+
+    def _output(self, what, raw_bytes, encoded_bytes, encode_time, decode_time, num):
+        self.log.info("%s: %.0f bytes/s raw  %.0f bytes/s encoded (%.1fx)  encode %.3fms  decode %.3fms",
+                      what, raw_bytes / self.seconds, encoded_bytes / self.seconds, raw_bytes / encoded_bytes,
+                      1000 * encode_time / num, 1000 * decode_time / num)
+
+    def testBandwidth(self):
+        for width, height, channels in ((128, 32, 1), (128, 32, 3), (256, 64, 3)):
+            encoder = DmdFrameEncoder(self.fps)
+            decoder = DmdFrameDecoder(width * height * channels)
+            raw_bytes = encoded_bytes = 0
+            encode_time = decode_time = 0
+            num = 0
+            for frame in self._frames(width, height, channels):
+                start = time.perf_counter()
+                kwargs, payload = encoder.encode(frame)
+                encode_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                decoded = decoder.decode(payload, **kwargs)
+                decode_time += time.perf_counter() - start
+                self.assertEqual(frame, decoded)
+
+                raw_bytes += len(frame)
+                encoded_bytes += len(payload)
+                num += 1
+
+            self._output("{}x{}x{}".format(width, height, channels), raw_bytes, encoded_bytes, encode_time,
+                         decode_time, num)
@@ -0,0 +1,68 @@
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+from mpfmc.core.dmd_frame_sink import DmdFrameSink, DmdFrameSinkReader
+
+
+def _read_frames(path, num, result):
+    """Read frames like a driver would and count the consistent ones."""
+    reader = DmdFrameSinkReader(path)
+    received = torn = checksum = 0
+    while reader.last_sequence < num:
+        frame = reader.wait_for_frame(timeout=5, interval=0)
+        if not frame:
+            break
+        sequence, data, _ = frame
+        checksum += data[0]
+        if reader.is_valid(sequence):
+            received += 1
+        else:
+            torn += 1
+        data.release()
+    result.put((received, torn, reader.missed_frames))
+    reader.close()
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), "Uses /dev/shm")
+class BenchmarkDmdFrameSink(unittest.TestCase):
+
+    """Write frames into a frame sink in /dev/shm while a reader process
+    consumes them."""
+
+    num = 20000
+
+    def setUp(self):
+        self.log = logging.getLogger('BenchmarkDmdFrameSink')
+
+    def testThroughput(self):
+        directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+        for width, height, channels in ((128, 32, 1), (128, 32, 3), (256, 64, 3)):
+            path = os.path.join(directory, 'mpfmc_benchmark_dmd_{}'.format(os.getpid()))
+            sink = DmdFrameSink(path, width, height, channels, slots=4)
+            frames = [bytes([i]) * (width * height * channels) for i in range(8)]
+
+            result = multiprocessing.Queue()
+            reader = multiprocessing.Process(target=_read_frames, args=(path, self.num, result))
+            reader.start()
+            time.sleep(.2)
+
+            start = time.perf_counter()
+            for i in range(self.num):
+                sink.write(frames[i % 8])
+            end = time.perf_counter()
+
+            received, torn, missed = result.get(timeout=10)
+            reader.join()
+            sink.close()
+            os.unlink(path)
+
+            size = width * height * channels
+            self.log.info("%sx%sx%s: %.0f frames/s  %.0f MB/s  read %s frames (%s torn, %s skipped)",
+                          width, height, channels, self.num / (end - start), self.num * size / (end - start) / 1e6,
+                          received, torn, missed)
+            self.assertGreater(received, 0)
@@ -49,6 +49,12 @@ class Command:
                             action="store_false", dest="bcp", default=True,
                             help="Do not set up the BCP server threads")
 
+        parser.add_argument("--bcp-record",
+                            action="store", dest="bcp_record", default=None,
+                            metavar='file_name',
+                            help="Record all incoming BCP commands to a file. "
+                                 "Use 'mpf mc_replay' to replay it.")
+
         parser.add_argument("-c",
                             action="store", dest="configfile",
                             default="config", metavar='config_file(s)',
@@ -0,0 +1,128 @@
+"""Replays a BCP recording into the MPF media controller."""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+from mpf.core.config_loader import YamlMultifileConfigLoader
+
+
+# Note, other imports are done deeper in this file, which we need to do there
+# since Kivy does so much with singletons and we don't want MPF to import
+# them when it reads this command
+
+
+class Command:
+
+    """Run MC without MPF and feed it a recording made with mc --bcp-record."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Replay a BCP recording."""
+        # Force Kivy to not do its own weird logging, adding in Kivy 2.2
+        os.environ['KIVY_LOG_MODE'] = 'PYTHON'
+
+        # pylint: disable-msg=import-outside-toplevel
+        from mpf.core.utility_functions import Util
+
+        del mpf_path
+
+        parser = argparse.ArgumentParser(description='Replays a BCP recording into the MPF Media Controller')
+
+        parser.add_argument("recording",
+                            help="The file which has been recorded with 'mpf mc --bcp-record'")
+
+        parser.add_argument("--fast",
+                            action="store_true", dest="fast", default=False,
+                            help="Feed commands as fast as the MC processes them "
+                                 "instead of at the original pace")
+
+        parser.add_argument("--speed",
+                            action="store", dest="speed", type=float, default=1.0,
+                            help="Factor for the original pace. Default is 1")
+
+        parser.add_argument("--keep-open",
+                            action="store_false", dest="exit_when_done", default=True,
+                            help="Do not exit at the end of the recording")
+
+        parser.add_argument("--hidden",
+                            action="store_true", dest="hidden", default=False,
+                            help="Hide the window. A display (e.g. xvfb) is still needed for OpenGL")
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config", metavar='config_file(s)',
+                            help="The name of a config file to load. Default is "
+                                 "config.yaml. Multiple files can be used via a comma-"
+                                 "separated list (no spaces between)")
+
+        parser.add_argument("-C",
+                            action="store", dest="mcconfigfile",
+                            default="mcconfig.yaml",
+                            metavar='config_file',
+                            help="The MPF framework default config file. Default is "
+                                 "<mpf-mc install folder>/mcconfig.yaml")
+
+        parser.add_argument("-v",
+                            action="store_const", dest="loglevel", const=logging.DEBUG,
+                            default=logging.INFO, help="Enables verbose logging")
+
+        parser.add_argument("-a",
+                            action="store_true", dest="no_load_cache",
+                            help="Forces the config to be loaded from files "
+                                 "and not cache")
+
+        parser.add_argument("-A",
+                            action="store_false", dest="create_config_cache",
+                            help="Does not create the cache config files")
+
+        parser.add_argument("--no-sound",
+                            action="store_true", dest="no_sound", default=False)
+
+        args = parser.parse_args(args)
+
+        args.configfile = Util.string_to_event_list(args.configfile)
+        # there is no MPF. commands come from the recording.
+        args.bcp = False
+        args.production = False
+
+        logging.basicConfig(level=args.loglevel,
+                            format='%(asctime)s.%(msecs)03d : %(levelname)s [%(name)s] %(message)s',
+                            datefmt="%H:%M:%S")
+
+        if args.hidden:
+            from kivy.config import Config
+            Config.set('graphics', 'window_state', 'hidden')
+
+        from mpfmc.core.mc import MpfMc
+        from mpfmc.core.bcp_replay import BcpReplay
+
+        thread_stopper = threading.Event()
+
+        config_loader = YamlMultifileConfigLoader(machine_path, args.configfile,
+                                                  not args.no_load_cache, args.create_config_cache)
+        config = config_loader.load_mc_config()
+
+        try:
+            mc = MpfMc(options=vars(args),
+                       config=config,
+                       thread_stopper=thread_stopper)
+            BcpReplay(mc, args.recording, args.fast, args.speed, args.exit_when_done)
+            mc.run()
+            logging.info("MC run loop ended.")
+        except Exception as e:  # noqa
+            logging.exception(str(e))
+
+        thread_stopper.set()
+
+        while len(threading.enumerate()) > 1:
+            time.sleep(.1)
+
+        logging.shutdown()
+        sys.exit()
+
+
+def get_command():
+    return 'mc_replay', Command
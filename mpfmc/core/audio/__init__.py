@@ -3,7 +3,9 @@ import logging
 
 from kivy.clock import Clock
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
+from mpf.core.config_spec_loader import ConfigSpecLoader
 from mpf.core.utility_functions import Util
+from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpfmc.core.audio.audio_interface import AudioInterface
 from mpfmc.core.audio.audio_exception import AudioException
 
@@ -19,6 +21,11 @@ DEFAULT_AUDIO_BUFFER_SAMPLE_SIZE = 2048
 DEFAULT_SAMPLE_RATE = 44100
 DEFAULT_AUDIO_CHANNELS = 1
 DEFAULT_MASTER_VOLUME = 0.5
+DEFAULT_MIX_FORMAT = 'int16'
+DEFAULT_SOFT_LIMITER = False
+DEFAULT_PREMIX_PERIODS = 0
+DEFAULT_TIMING_HISTOGRAM_FILE = None
+DEFAULT_OUTPUT = 'device'
 DEFAULT_TRACK_MAX_SIMULTANEOUS_SOUNDS = 1
 DEFAULT_TRACK_VOLUME = 0.5
 
@@ -33,6 +40,16 @@ class SoundSystem:
     specified tracks.
     """
 
+    # settings which are only used by the MC. they are added to the spec of
+    # the sound_system section.
+    mc_config_spec = '''
+mix_format: single|enum(int16,float)|int16
+soft_limiter: single|bool|false
+premix_periods: single|int|0
+timing_histogram_file: single|str|None
+output: single|enum(device,offline)|device
+'''
+
     # pylint: disable=invalid-name, too-many-branches
     def __init__(self, mc):
         """initialize sound system."""
@@ -80,12 +97,33 @@ class SoundSystem:
         if 'channels' not in self.config:
             self.config['channels'] = DEFAULT_AUDIO_CHANNELS
 
+        if 'mix_format' not in self.config:
+            self.config['mix_format'] = DEFAULT_MIX_FORMAT
+
+        if 'soft_limiter' not in self.config:
+            self.config['soft_limiter'] = DEFAULT_SOFT_LIMITER
+
+        if 'premix_periods' not in self.config:
+            self.config['premix_periods'] = DEFAULT_PREMIX_PERIODS
+
+        if 'timing_histogram_file' not in self.config:
+            self.config['timing_histogram_file'] = DEFAULT_TIMING_HISTOGRAM_FILE
+
+        if 'output' not in self.config:
+            self.config['output'] = DEFAULT_OUTPUT
+
+        self._validate_mc_settings()
+
         # Initialize audio interface library (get audio output)
         try:
             self.audio_interface = AudioInterface(
                 rate=self.config['frequency'],
                 channels=self.config['channels'],
-                buffer_samples=self.config['buffer'])
+                buffer_samples=self.config['buffer'],
+                mix_format=self.config['mix_format'],
+                soft_limiter=self.config['soft_limiter'],
+                premix_periods=self.config['premix_periods'],
+                output=self.config['output'])
         except AudioException:
             self.log.error("Could not initialize the audio interface. "
                            "Audio features will not be available.")
@@ -114,10 +152,33 @@ class SoundSystem:
         self._initialized = True
 
         self.mc.events.add_handler("shutdown", self.shutdown)
+        self.mc.events.add_handler("debug_dump_stats", self._debug_dump_stats)
         self.mc.events.add_handler("machine_var_master_volume", self._set_volume)
         for track in self.tracks.keys():
             self.mc.events.add_handler(f"machine_var_{track}_volume", self._set_volume, track=track)
 
+    def _validate_mc_settings(self):
+        """Add mc_config_spec to the sound_system spec and validate these settings."""
+        spec = self.mc.config_validator.get_config_spec()['sound_system']
+        mc_spec = ConfigSpecLoader.process_config_spec(YamlInterface.process(self.mc_config_spec), 'sound_system')
+        for key, value in mc_spec.items():
+            spec.setdefault(key, value)
+
+        settings = {key: self.config[key] for key in mc_spec}
+        self.config.update(self.mc.config_validator.validate_config('sound_system', settings,
+                                                                    add_missing_keys=False))
+
+        if self.config['soft_limiter'] and self.config['mix_format'] != 'float':
+            self.log.warning("SoundSystem: The soft limiter only works with the float mix format. "
+                             "It will not be used.")
+
+        if self.config['premix_periods'] < 0:
+            raise ValueError("premix_periods in sound_system should be zero or positive. Yours is {}".format(
+                self.config['premix_periods']))
+
+        if self.config['premix_periods'] and self.config['output'] == 'offline':
+            raise ValueError("premix_periods in sound_system can only be used with output: device.")
+
     def _set_volume(self, **kwargs):
         track = kwargs.get("track")
         if not track:
@@ -128,6 +189,19 @@ class SoundSystem:
 
         self.tracks[track].set_volume(kwargs['value'])
 
+    def _debug_dump_stats(self, **kwargs):
+        del kwargs
+        self.log.info("--- DEBUG DUMP AUDIO ---")
+        for name, value in self.audio_interface.get_timing_stats().items():
+            self.log.info("%s: %s", name, value)
+        settings = self.audio_interface.get_settings()
+        if settings and settings['premix_periods']:
+            self.log.info("premix underruns: %s (periods mixed: %s)", settings['premix_underruns'],
+                          settings['premix_periods_mixed'])
+        if self.config['timing_histogram_file']:
+            self.audio_interface.write_timing_histogram(self.config['timing_histogram_file'])
+        self.log.info("--- DEBUG DUMP AUDIO END ---")
+
     def shutdown(self, **kwargs):
         """Shuts down the audio interface"""
         del kwargs
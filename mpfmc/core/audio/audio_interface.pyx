@@ -10,13 +10,17 @@ This library requires the SDL2, SDL_Mixer, and Gstreamer libraries.
 from libc.stdio cimport FILE, fopen, fprintf, sprintf, fflush
 from libc.string cimport memset, memcpy
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.bytearray cimport PyByteArray_AS_STRING
 cimport cpython.pycapsule as pycapsule
 
-from math import pow
+from math import pow, ceil
 import logging
+import wave
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.message_ring cimport *
+from mpfmc.core.audio.audio_timing cimport *
 from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.track_standard cimport *
 from mpfmc.core.audio.track_sound_loop cimport *
@@ -30,9 +34,6 @@ from mpfmc.core.audio.playlist_controller import PlaylistController
 # ---------------------------------------------------------------------------
 DEF MAX_TRACKS = 8
 
-# The maximum number of markers that can be specified for a single sound
-DEF MAX_MARKERS = 16
-
 # The number of seconds over which to perform a quick fade to avoid pops and
 # clicks
 DEF QUICK_FADE_DURATION_SECS = 0.05
@@ -72,19 +73,34 @@ cdef class AudioInterface:
     cdef dict playlist_controllers
     cdef object mc
     cdef object log
+    cdef bint offline
+    cdef bint offline_enabled
+    cdef Uint64 rendered_buffers
 
     cdef AudioCallbackData audio_callback_data
 
     def __cinit__(self, *args, **kw):
         pass
 
-    def __init__(self, rate=44100, channels=2, buffer_samples=4096):
+    def __init__(self, rate=44100, channels=2, buffer_samples=4096, mix_format='int16', soft_limiter=False,
+                 premix_periods=0, output='device'):
         """
         Initializes the AudioInterface.
         Args:
             rate: The audio sample rate used in the library
             channels: The number of channels to use (1=mono, 2=stereo)
             buffer_samples: The audio buffer size to use (in number of samples, must be power of two)
+            mix_format: The format of the internal mix bus ('int16' or 'float'). With 'float' sounds and
+                tracks are summed without clipping and the mix is only clipped (or limited) once at the output.
+            soft_limiter: Whether to use a soft limiter instead of hard clipping at the output (float mix
+                bus only)
+            premix_periods: The number of buffers which are mixed ahead by a separate thread (0 disables
+                the premix thread). The audio callback then only copies mixed buffers to the output, which
+                allows small buffers (e.g. 256 or 512 samples) without dropouts. The latency is
+                buffer_samples * (premix_periods + 1).
+            output: The audio output ('device' or 'offline'). With 'offline' nothing is played (SDL's dummy
+                audio driver is used, so no sound hardware is needed) and audio is only mixed when render
+                or render_to_wav is called (e.g. for tests and benchmarks).
         """
         self.log = logging.getLogger("AudioInterface")
 
@@ -102,15 +118,51 @@ cdef class AudioInterface:
             raise AudioException("Unable to initialize Audio Interface: "
                                  "Buffer samples is required to be a power of two")
 
-        # Warn if a small buffer is used
-        if buffer_samples <= 1024:
+        if mix_format not in ('int16', 'float'):
+            self.log.error("Mix format is required to be either 'int16' or 'float'")
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Mix format is required to be either 'int16' or 'float'")
+
+        if output not in ('device', 'offline'):
+            self.log.error("Output is required to be either 'device' or 'offline'")
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Output is required to be either 'device' or 'offline'")
+
+        if output == 'offline' and premix_periods:
+            self.log.error('The premix thread can only be used with an audio device')
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "The premix thread can only be used with an audio device")
+
+        self.offline = output == 'offline'
+        self.offline_enabled = False
+        self.rendered_buffers = 0
+
+        if premix_periods < 0:
+            self.log.error('Premix periods is required to be zero or positive')
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Premix periods is required to be zero or positive")
+
+        # Warn if a small buffer is used (the premix thread is meant for small buffers)
+        if buffer_samples <= 1024 and not premix_periods and not self.offline:
             self.log.warning('NOTE: You may experience noise and other undesirable sound artifacts '
                              'when you set your buffer at 1024 or smaller.')
 
+        # SDL_Mixer needs an opened audio device to load sounds in the output format. The offline output
+        # opens one with the dummy driver of SDL which works without sound hardware. The audio callback is
+        # never hooked to it.
+        cdef const char *audio_driver_hint = SDL_GetHint(SDL_HINT_AUDIODRIVER)
+        previous_audio_driver = None if audio_driver_hint == NULL else <bytes>audio_driver_hint
+        if self.offline:
+            SDL_SetHint(SDL_HINT_AUDIODRIVER, b"dummy")
+
         # Initialize the SDL audio system
-        if SDL_InitSubSystem(SDL_INIT_AUDIO) < 0:
-            self.log.error('SDL_InitSubSystem error - %s' % SDL_GetError())
-            raise AudioException('Unable to initialize SDL (SDL_InitSubSystem call failed: %s)' % SDL_GetError())
+        try:
+            if SDL_InitSubSystem(SDL_INIT_AUDIO) < 0:
+                self.log.error('SDL_InitSubSystem error - %s' % SDL_GetError())
+                raise AudioException('Unable to initialize SDL (SDL_InitSubSystem call failed: %s)' % SDL_GetError())
+        finally:
+            if self.offline:
+                SDL_SetHint(SDL_HINT_AUDIODRIVER, NULL if previous_audio_driver is None else <char*>previous_audio_driver)
 
         # Initialize the SDL_Mixer library to establish the output audio format and encoding
         # (sample rate, bit depth, buffer size)
@@ -131,8 +183,12 @@ cdef class AudioInterface:
         self.log.info("Loaded %s", AudioInterface.get_gstreamer_version())
         self.log.info("Loaded %s", AudioInterface.get_glib_version())
 
-        # Lock SDL from calling the audio callback functions while we set things up
-        SDL_LockAudio()
+        # Lock the mixer while we set things up
+        self.audio_callback_data.mixer_lock = SDL_CreateMutex()
+        if self.audio_callback_data.mixer_lock == NULL:
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Could not create the mixer lock (%s)" % SDL_GetError())
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
 
         # Determine the actual audio format in use by the opened audio device.  This may or may not match
         # the parameters used to initialize the audio interface.
@@ -145,6 +201,7 @@ cdef class AudioInterface:
         if not SDL_AUDIO_ISLITTLEENDIAN(self.audio_callback_data.format):
             self.log.error("The audio interface only supports little endian systems in this release. "
                            "Audio features will not be available.")
+            SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
             raise AudioException("The audio interface only supports little endian systems in this release.")
 
         # The requested values used to initialize the audio interface.  A pointer to the audio_callback_data
@@ -163,6 +220,33 @@ cdef class AudioInterface:
         self.audio_callback_data.silence = 0
         self.audio_callback_data.track_count = 0
         self.audio_callback_data.tracks = <void**>PyMem_Malloc(MAX_TRACKS * sizeof(TrackState*))
+        self.audio_callback_data.float_mix = mix_format == 'float'
+        self.audio_callback_data.soft_limiter = soft_limiter and self.audio_callback_data.float_mix
+        self.audio_callback_data.mix_buffer = NULL
+        if self.audio_callback_data.float_mix:
+            self.audio_callback_data.mix_buffer = <float*>PyMem_Malloc(
+                self.audio_callback_data.buffer_size // self.audio_callback_data.bytes_per_sample * sizeof(float))
+        self.audio_callback_data.premix_periods = premix_periods
+        self.audio_callback_data.premix_ring = NULL
+        self.audio_callback_data.premix_position = 0
+        self.audio_callback_data.premix_free_periods = NULL
+        self.audio_callback_data.premix_thread = NULL
+        SDL_AtomicSet(&self.audio_callback_data.premix_running, 0)
+        self.audio_callback_data.premix_underruns = 0
+        self.audio_callback_data.premix_periods_mixed = 0
+        if premix_periods:
+            # The ring capacity must be a power of two, the semaphore limits it to premix_periods
+            self.audio_callback_data.premix_ring = message_ring_create(
+                1 << (premix_periods - 1).bit_length(), self.audio_callback_data.buffer_size)
+            if self.audio_callback_data.premix_ring == NULL:
+                SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
+                raise AudioException("Unable to initialize Audio Interface: "
+                                     "Could not allocate the premix buffers")
+        self.audio_callback_data.period_ticks = max(1, SDL_GetPerformanceFrequency() *
+                                                    self.audio_callback_data.buffer_samples //
+                                                    self.audio_callback_data.sample_rate)
+        timing_stats_reset(&self.audio_callback_data.callback_timing)
+        timing_stats_reset(&self.audio_callback_data.mix_timing)
         self.audio_callback_data.c_log_file = NULL
         # self.audio_callback_data.c_log_file = fopen("/tmp/MPFMC_AudioLibrary.log", "wb")
         # self.audio_callback_data.c_log_file = fopen("D:\\Temp\\Dev\\MPFMC_AudioLibrary.log", "wb")
@@ -175,9 +259,16 @@ cdef class AudioInterface:
                        self.audio_callback_data.sample_rate, self.audio_callback_data.channels,
                        self.audio_callback_data.buffer_samples, self.audio_callback_data.buffer_size,
                        self.audio_callback_data.bytes_per_sample)
+        self.log.info('Mix format: %s (soft limiter: %s)', mix_format, self.audio_callback_data.soft_limiter)
+        if self.offline:
+            self.log.info('Offline output: audio is only mixed when it is rendered')
+        if premix_periods:
+            self.log.info('Low-latency mode: %d buffers are mixed ahead (%.1f ms latency)', premix_periods,
+                          1000.0 * self.audio_callback_data.buffer_samples * (premix_periods + 1) /
+                          self.audio_callback_data.sample_rate)
 
-        # Unlock the SDL audio callback functions
-        SDL_UnlockAudio()
+        # Unlock the mixer
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
 
         self.tracks = list()
         self.playlist_controllers = dict()
@@ -192,10 +283,17 @@ cdef class AudioInterface:
         self.audio_callback_data.track_count = 0
         PyMem_Free(self.audio_callback_data.tracks)
         self.audio_callback_data.tracks = NULL
+        PyMem_Free(self.audio_callback_data.mix_buffer)
+        self.audio_callback_data.mix_buffer = NULL
+        message_ring_free(<MessageRing*>self.audio_callback_data.premix_ring)
+        self.audio_callback_data.premix_ring = NULL
 
         # Remove tracks
         self.tracks.clear()
 
+        SDL_DestroyMutex(self.audio_callback_data.mixer_lock)
+        self.audio_callback_data.mixer_lock = NULL
+
         # SDL and SDL_Mixer no longer needed
         Mix_Quit()
         SDL_Quit()
@@ -387,9 +485,9 @@ cdef class AudioInterface:
         return round(self.audio_callback_data.master_volume / SDL_MIX_MAXVOLUME, 2)
 
     def set_master_volume(self, float volume):
-        SDL_LockAudio()
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
         self.audio_callback_data.master_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
 
     def get_settings(self):
         """
@@ -404,11 +502,72 @@ cdef class AudioInterface:
                     'buffer_samples': self.audio_callback_data.buffer_samples,
                     'buffer_size': self.audio_callback_data.buffer_size,
                     'bytes_per_sample': self.audio_callback_data.bytes_per_sample,
-                    'seconds_to_bytes_factor': self.audio_callback_data.seconds_to_bytes_factor
+                    'seconds_to_bytes_factor': self.audio_callback_data.seconds_to_bytes_factor,
+                    'mix_format': 'float' if self.audio_callback_data.float_mix else 'int16',
+                    'soft_limiter': True if self.audio_callback_data.soft_limiter else False,
+                    'premix_periods': self.audio_callback_data.premix_periods,
+                    'premix_underruns': self.audio_callback_data.premix_underruns,
+                    'premix_periods_mixed': self.audio_callback_data.premix_periods_mixed,
+                    'callback_timing': timing_stats_to_dict(&self.audio_callback_data.callback_timing,
+                                                            self.audio_callback_data.period_ticks),
+                    'mix_timing': timing_stats_to_dict(&self.audio_callback_data.mix_timing,
+                                                       self.audio_callback_data.period_ticks)
                     }
         else:
             return None
 
+    def get_timing_stats(self):
+        """
+        Gets the timing statistics of the audio engine (since the start or the last call of
+        reset_timing_stats).
+        Returns:
+            A dictionary with the timing statistics of the audio callback ('callback'), the mix of
+            each buffer ('mix', done by the premix thread in low-latency mode) and the mix callback
+            of each track ('tracks'). Each contains the count, min, mean, p99 and max duration
+            (in ms), the mean share of the buffer duration ('period_share') and the number of
+            durations longer than a buffer ('missed_deadlines').
+        """
+        return {'period': round(1000.0 * self.audio_callback_data.buffer_samples /
+                                self.audio_callback_data.sample_rate, 3),
+                'callback': timing_stats_to_dict(&self.audio_callback_data.callback_timing,
+                                                 self.audio_callback_data.period_ticks),
+                'mix': timing_stats_to_dict(&self.audio_callback_data.mix_timing,
+                                            self.audio_callback_data.period_ticks),
+                'tracks': {track.name: track.get_mix_timing() for track in self.tracks}}
+
+    def reset_timing_stats(self):
+        """Resets the timing statistics of the audio engine (including all tracks)."""
+        # The audio callback only holds the device lock while the premix thread is used
+        SDL_LockAudio()
+        timing_stats_reset(&self.audio_callback_data.callback_timing)
+        SDL_UnlockAudio()
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
+        timing_stats_reset(&self.audio_callback_data.mix_timing)
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
+        for track in self.tracks:
+            track.reset_mix_timing()
+
+    def write_timing_histogram(self, str file_name not None):
+        """
+        Writes the timing histograms of the audio engine to a CSV file for offline analysis.
+        Every row is one bin. The first two columns are the range of the bin (as a share of the
+        buffer duration, the last bin is open), followed by the counts of the audio callback, the
+        buffer mix and the mix callback of every track.
+        """
+        columns = [timing_stats_histogram(&self.audio_callback_data.callback_timing),
+                   timing_stats_histogram(&self.audio_callback_data.mix_timing)]
+        columns.extend(track.get_mix_timing_histogram() for track in self.tracks)
+
+        with open(file_name, 'w') as histogram_file:
+            histogram_file.write(','.join(['from', 'to', 'callback', 'mix'] +
+                                          ['track_' + track.name for track in self.tracks]) + '\n')
+            for index in range(TIMING_HISTOGRAM_BINS):
+                upper = (index + 1) / TIMING_BINS_PER_PERIOD if index < TIMING_HISTOGRAM_BINS - 1 else ''
+                histogram_file.write(','.join([str(index / TIMING_BINS_PER_PERIOD), str(upper)] +
+                                              [str(column[index]) for column in columns]) + '\n')
+
+        self.log.info("Wrote audio timing histogram to %s", file_name)
+
     cdef write_gst_log_message(self, message_type, message):
         """Write GStreamer log message to the mpfmc log"""
         # print(message_type, message)
@@ -421,6 +580,8 @@ cdef class AudioInterface:
 
     @property
     def enabled(self):
+        if self.offline:
+            return self.offline_enabled
         return Mix_GetMusicHookData() != NULL
 
     def enable(self):
@@ -428,6 +589,11 @@ cdef class AudioInterface:
         Enables audio playback (begins audio processing)
         """
         self.log.info("Enabling audio playback")
+        if self.offline:
+            self.offline_enabled = True
+            return
+        if self.audio_callback_data.premix_periods:
+            self._start_premix_thread()
         Mix_HookMusic(self.audio_callback, &self.audio_callback_data)
 
     def disable(self):
@@ -436,7 +602,58 @@ cdef class AudioInterface:
         """
         self.log.info("Disabling audio playback")
         self.stop_all_sounds()
+        if self.offline:
+            self.offline_enabled = False
+            return
         Mix_HookMusic(NULL, NULL)
+        self._stop_premix_thread()
+
+    @property
+    def premix_thread_running(self):
+        """Whether the premix thread is running (only in low-latency mode while audio is enabled)"""
+        return self.audio_callback_data.premix_thread != NULL
+
+    def _start_premix_thread(self):
+        """Starts the thread which mixes buffers ahead of the audio device (low-latency mode)"""
+        cdef MessageRing *ring = <MessageRing*>self.audio_callback_data.premix_ring
+        cdef Uint8 *period
+        if self.audio_callback_data.premix_thread != NULL:
+            return
+
+        # Start with a full ring, so the first audio callbacks do not run into an underrun before the
+        # thread has been scheduled (the callback is not hooked while the thread is stopped)
+        SDL_AtomicSet(&ring.write_index, 0)
+        SDL_AtomicSet(&ring.read_index, 0)
+        self.audio_callback_data.premix_position = 0
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
+        for _ in range(self.audio_callback_data.premix_periods):
+            period = <Uint8*>message_ring_reserve(ring)
+            AudioInterface.mix_output(&self.audio_callback_data, period, ring.message_size)
+            message_ring_commit(ring)
+            self.audio_callback_data.premix_periods_mixed += 1
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
+        self.audio_callback_data.premix_free_periods = SDL_CreateSemaphore(0)
+        SDL_AtomicSet(&self.audio_callback_data.premix_running, 1)
+        self.audio_callback_data.premix_thread = SDL_CreateThread(AudioInterface.premix_thread, "MPFMC Premix",
+                                                                  &self.audio_callback_data)
+        if self.audio_callback_data.premix_thread == NULL:
+            SDL_AtomicSet(&self.audio_callback_data.premix_running, 0)
+            SDL_DestroySemaphore(self.audio_callback_data.premix_free_periods)
+            self.audio_callback_data.premix_free_periods = NULL
+            raise AudioException('Unable to start the premix thread (%s)' % SDL_GetError())
+
+    def _stop_premix_thread(self):
+        """Stops the premix thread (the audio callback must not be hooked any more)"""
+        if self.audio_callback_data.premix_thread == NULL:
+            return
+
+        SDL_AtomicSet(&self.audio_callback_data.premix_running, 0)
+        SDL_SemPost(self.audio_callback_data.premix_free_periods)
+        with nogil:
+            SDL_WaitThread(self.audio_callback_data.premix_thread, NULL)
+        self.audio_callback_data.premix_thread = NULL
+        SDL_DestroySemaphore(self.audio_callback_data.premix_free_periods)
+        self.audio_callback_data.premix_free_periods = NULL
 
     def shutdown(self):
         """
@@ -526,8 +743,8 @@ cdef class AudioInterface:
                 self.log.error("Add track failed - the track name '%s' already exists.", name)
                 return None
 
-        # Make sure audio callback function cannot be called while we are changing the track data
-        SDL_LockAudio()
+        # Make sure no buffer is mixed while we are changing the track data
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
 
         # Create the new standard track
         new_track = TrackStandard(mc,
@@ -543,8 +760,8 @@ cdef class AudioInterface:
         self.audio_callback_data.track_count = len(self.tracks)
         self.audio_callback_data.tracks[track_num] = new_track.state
 
-        # Allow audio callback function to be called again
-        SDL_UnlockAudio()
+        # Allow buffers to be mixed again
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
 
         self.log.debug("The '%s' standard track has successfully been created.", name)
 
@@ -577,8 +794,8 @@ cdef class AudioInterface:
                 self.log.error("Add track failed - the track name '%s' already exists.", name)
                 return None
 
-        # Make sure audio callback function cannot be called while we are changing the track data
-        SDL_LockAudio()
+        # Make sure no buffer is mixed while we are changing the track data
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
 
         # Create the new live loop track
         new_track = TrackSoundLoop(mc,
@@ -594,8 +811,8 @@ cdef class AudioInterface:
         self.audio_callback_data.track_count = len(self.tracks)
         self.audio_callback_data.tracks[track_num] = new_track.state
 
-        # Allow audio callback function to be called again
-        SDL_UnlockAudio()
+        # Allow buffers to be mixed again
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
 
         self.log.debug("The '%s' live loop track has successfully been created.", name)
 
@@ -631,8 +848,8 @@ cdef class AudioInterface:
                 self.log.error("Add track failed - the track name '%s' already exists.", name)
                 return None
 
-        # Make sure audio callback function cannot be called while we are changing the track data
-        SDL_LockAudio()
+        # Make sure no buffer is mixed while we are changing the track data
+        SDL_LockMutex(self.audio_callback_data.mixer_lock)
 
         # Create the new standard track
         new_track = TrackStandard(mc,
@@ -648,8 +865,8 @@ cdef class AudioInterface:
         self.audio_callback_data.track_count = len(self.tracks)
         self.audio_callback_data.tracks[track_num] = new_track.state
 
-        # Allow audio callback function to be called again
-        SDL_UnlockAudio()
+        # Allow buffers to be mixed again
+        SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
 
         # Create playlist controller for the track
         playlist_controller = PlaylistController(mc, new_track, crossfade_time)
@@ -745,6 +962,84 @@ cdef class AudioInterface:
             if hasattr(track, "stop_sound_instance_looping"):
                 track.stop_sound_instance_looping(sound_instance)
 
+    def get_render_time(self):
+        """Return the time (in seconds) of audio which has been rendered with the offline output."""
+        return self.rendered_buffers * self.audio_callback_data.buffer_samples / self.audio_callback_data.sample_rate
+
+    def render(self, int buffers=1):
+        """
+        Mixes audio with the offline output as fast as possible. Every buffer is mixed like in the
+        audio callback and the tracks are processed after each buffer (like on every tick), so the
+        result only depends on the calls made before and not on the timing of the machine.
+        Args:
+            buffers: The number of buffers to render
+
+        Returns:
+            A bytes object containing the rendered audio samples.
+        """
+        cdef Uint32 buffer_size = self.audio_callback_data.buffer_size
+        cdef bytearray output
+        cdef Uint8 *output_buffer
+        cdef int index
+
+        if not self.offline:
+            raise AudioException("Audio can only be rendered with the offline output")
+
+        if not self.enabled:
+            raise AudioException("Audio can only be rendered while the audio interface is enabled")
+
+        output = bytearray(buffers * buffer_size)
+        output_buffer = <Uint8*>PyByteArray_AS_STRING(output)
+        for index in range(buffers):
+            SDL_LockMutex(self.audio_callback_data.mixer_lock)
+            AudioInterface.mix_output(&self.audio_callback_data, output_buffer + index * buffer_size, buffer_size)
+            SDL_UnlockMutex(self.audio_callback_data.mixer_lock)
+            self.rendered_buffers += 1
+            self.process()
+
+        return bytes(output)
+
+    def render_to_wav(self, str file_name not None, scenario, float duration):
+        """
+        Renders a scenario with the offline output into a WAV file.
+        Args:
+            file_name: The name of the WAV file to write
+            scenario: An iterable of (time, function) tuples. Each function is called (without
+                arguments) when the render time reaches its time (in seconds, relative to the start
+                of this call). Calls are made at the start of a buffer, so their resolution is
+                the buffer size.
+            duration: The number of seconds to render
+
+        Returns:
+            The number of sample frames written to the file.
+
+        Example:
+            track = interface.get_track_by_name("sfx")
+            interface.render_to_wav("out.wav", [
+                (0.0, lambda: track.play_sound(sound, None, {})),
+                (1.5, lambda: track.stop_all_sounds())], 3.0)
+        """
+        cdef int buffers = <int>ceil(duration * self.audio_callback_data.sample_rate /
+                                     self.audio_callback_data.buffer_samples)
+        start_time = self.get_render_time()
+        events = sorted(scenario, key=lambda event: event[0])
+        next_event = 0
+
+        with wave.open(file_name, 'wb') as wav_file:
+            wav_file.setnchannels(self.audio_callback_data.channels)
+            wav_file.setsampwidth(self.audio_callback_data.bytes_per_sample)
+            wav_file.setframerate(self.audio_callback_data.sample_rate)
+
+            for _ in range(buffers):
+                while next_event < len(events) and events[next_event][0] <= self.get_render_time() - start_time:
+                    events[next_event][1]()
+                    next_event += 1
+
+                wav_file.writeframes(self.render())
+
+        self.log.debug("Rendered %d buffers to %s", buffers, file_name)
+        return buffers * self.audio_callback_data.buffer_samples
+
     def clear_context(self, context):
         """Clears the context in all tracks"""
         for track in self.tracks:
@@ -770,27 +1065,124 @@ cdef class AudioInterface:
             This static function is responsible for filling the supplied audio buffer with sound.
             samples. The function is called during the custom music player callback. Individual
             track buffers are maintained in each Track object and are processed during this callback.
+            In low-latency mode the buffers have already been mixed by the premix thread and are
+            only copied here.
         """
-        cdef Uint32 buffer_length = <Uint32> length
         cdef AudioCallbackData *callback_data = <AudioCallbackData*> data
-        cdef TrackState *track
+        cdef Uint64 start_time = SDL_GetPerformanceCounter()
 
         if callback_data == NULL:
             return
 
+        if callback_data.premix_ring != NULL and SDL_AtomicGet(&callback_data.premix_running):
+            # Never waits for the mixer lock
+            AudioInterface.copy_premixed_output(callback_data, output_buffer, <Uint32> length)
+        else:
+            SDL_LockMutex(callback_data.mixer_lock)
+            AudioInterface.mix_output(callback_data, output_buffer, <Uint32> length)
+            SDL_UnlockMutex(callback_data.mixer_lock)
+
+        timing_stats_add(&callback_data.callback_timing, SDL_GetPerformanceCounter() - start_time,
+                         callback_data.period_ticks)
+
+    @staticmethod
+    cdef void copy_premixed_output(AudioCallbackData *callback_data, Uint8 *output_buffer,
+                                   Uint32 buffer_length) nogil:
+        """
+        Copies buffers mixed by the premix thread to the output buffer. Missing data (an underrun)
+        is replaced by silence and counted.
+        """
+        cdef MessageRing *ring = <MessageRing*>callback_data.premix_ring
+        cdef Uint8 *period
+        cdef Uint32 output_pos = 0
+        cdef Uint32 chunk_bytes
+
+        while output_pos < buffer_length:
+            period = <Uint8*>message_ring_peek(ring)
+            if period == NULL:
+                memset(output_buffer + output_pos, 0, buffer_length - output_pos)
+                callback_data.premix_underruns += 1
+                return
+
+            chunk_bytes = min(buffer_length - output_pos, ring.message_size - callback_data.premix_position)
+            memcpy(output_buffer + output_pos, period + callback_data.premix_position, chunk_bytes)
+            output_pos += chunk_bytes
+            callback_data.premix_position += chunk_bytes
+
+            if callback_data.premix_position == ring.message_size:
+                callback_data.premix_position = 0
+                message_ring_release(ring)
+                SDL_SemPost(callback_data.premix_free_periods)
+
+    @staticmethod
+    cdef int premix_thread(void *data) nogil:
+        """
+        Thread function of the premix thread (low-latency mode). Mixes a buffer whenever there is
+        a free period in the premix ring. Only the mixer lock is held while mixing a buffer, so
+        the audio callback is never blocked by Python (or by the premix thread).
+        """
+        cdef AudioCallbackData *callback_data = <AudioCallbackData*> data
+        cdef MessageRing *ring = <MessageRing*>callback_data.premix_ring
+        cdef Uint8 *period
+
+        SDL_SetThreadPriority(SDL_THREAD_PRIORITY_HIGH)
+
+        while True:
+            SDL_SemWait(callback_data.premix_free_periods)
+            if not SDL_AtomicGet(&callback_data.premix_running):
+                break
+
+            period = <Uint8*>message_ring_reserve(ring)
+            if period == NULL:
+                continue
+
+            SDL_LockMutex(callback_data.mixer_lock)
+            AudioInterface.mix_output(callback_data, period, ring.message_size)
+            SDL_UnlockMutex(callback_data.mixer_lock)
+            message_ring_commit(ring)
+            callback_data.premix_periods_mixed += 1
+
+        return 0
+
+    @staticmethod
+    cdef void mix_output(AudioCallbackData *callback_data, Uint8 *output_buffer, Uint32 buffer_length) nogil:
+        """
+        Mixes all tracks into one buffer of output (called from the audio callback, the premix
+        thread or render with the mixer lock held).
+        Args:
+            callback_data: A pointer to the AudioCallbackData struct
+            output_buffer: A pointer to the output buffer
+            buffer_length: The length of the output buffer (in bytes)
+        """
+        cdef TrackState *track
+        cdef Uint32 sample_count
+        cdef Uint64 start_time = SDL_GetPerformanceCounter()
+        cdef Uint64 track_start_time
+
+        sample_count = buffer_length // callback_data.bytes_per_sample
+
         # Initialize master output buffer with silence as it arrives uninitialized
         memset(output_buffer, 0, buffer_length)
+        if callback_data.float_mix:
+            memset(callback_data.mix_buffer, 0, sample_count * sizeof(float))
 
         # Note: There are three separate loops over the tracks that must remain separate due
         # to various track parameters than can be set for any track during each loop.  Difficult
         # to debug logic errors can occur when these track loops are combined.
 
-        # Loop over tracks, initializing the status, track buffer, and track ducking.
+        # Loop over tracks, applying requests (e.g. to play or stop sounds) and initializing the status,
+        # track buffer, and track ducking.
         for track_num in range(callback_data.track_count):
             track = <TrackState*>callback_data.tracks[track_num]
 
+            if track.process_requests_function != NULL:
+                track.process_requests_function(track)
+
             track.active = False
-            memset(track.buffer, 0, buffer_length)
+            if callback_data.float_mix:
+                memset(track.float_buffer, 0, sample_count * sizeof(float))
+            else:
+                memset(track.buffer, 0, buffer_length)
 
             track.ducking_is_active = False
             for control_point in range(CONTROL_POINTS_PER_BUFFER):
@@ -806,7 +1198,10 @@ cdef class AudioInterface:
 
             # Call the track's mix callback function (generates audio into track buffer)
             if track.mix_callback_function != NULL:
+                track_start_time = SDL_GetPerformanceCounter()
                 track.mix_callback_function(track, buffer_length, callback_data)
+                timing_stats_add(&track.mix_timing, SDL_GetPerformanceCounter() - track_start_time,
+                                 callback_data.period_ticks)
 
         # Loop over tracks again, applying ducking and mixing down tracks to the master output buffer
         for track_num in range(callback_data.track_count):
@@ -819,5 +1214,13 @@ cdef class AudioInterface:
                                           output_buffer,
                                           buffer_length)
 
-        # Apply master volume to output buffer
-        Track.apply_volume(output_buffer, output_buffer, buffer_length, callback_data.master_volume)
+        # Apply master volume to output buffer (the float mix bus is clipped or limited only here)
+        if callback_data.float_mix:
+            Track.convert_float_to_output(output_buffer, callback_data.mix_buffer, sample_count,
+                                          <float>callback_data.master_volume / SDL_MIX_MAXVOLUME,
+                                          callback_data.soft_limiter)
+        else:
+            Track.apply_volume(output_buffer, output_buffer, buffer_length, callback_data.master_volume)
+
+        timing_stats_add(&callback_data.mix_timing, SDL_GetPerformanceCounter() - start_time,
+                         callback_data.period_ticks)
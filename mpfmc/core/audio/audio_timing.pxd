@@ -0,0 +1,64 @@
+from libc.string cimport memset
+
+from mpfmc.core.audio.sdl2 cimport *
+
+
+# ---------------------------------------------------------------------------
+#    Audio timing statistics
+# ---------------------------------------------------------------------------
+
+cdef inline void timing_stats_add(AudioTimingStats *stats, Uint64 duration, Uint64 period_ticks) nogil:
+    """
+    Adds a duration to the timing statistics (called in the audio thread, the caller owns stats).
+    Args:
+        stats: The timing statistics
+        duration: The duration (in SDL performance counter ticks)
+        period_ticks: The duration of one buffer (in SDL performance counter ticks)
+    """
+    cdef Uint64 index = duration * TIMING_BINS_PER_PERIOD // period_ticks
+
+    if stats.count == 0 or duration < stats.minimum:
+        stats.minimum = duration
+    if duration > stats.maximum:
+        stats.maximum = duration
+    if duration > period_ticks:
+        stats.missed_deadlines += 1
+
+    stats.count += 1
+    stats.total += duration
+    stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1
+
+cdef inline void timing_stats_reset(AudioTimingStats *stats) nogil:
+    """Resets the timing statistics."""
+    memset(stats, 0, sizeof(AudioTimingStats))
+
+cdef inline dict timing_stats_to_dict(AudioTimingStats *stats, Uint64 period_ticks):
+    """
+    Returns a dictionary of the timing statistics. Durations are in milliseconds and the share
+    of the period is the mean duration divided by the duration of one buffer. p99 is the upper
+    bound of the histogram bin it falls into (limited by the maximum).
+    """
+    cdef double ms_per_tick = 1000.0 / SDL_GetPerformanceFrequency()
+    cdef Uint64 count = stats.count
+    cdef Uint64 total = 0
+    cdef int index
+
+    if count == 0:
+        return {'count': 0}
+
+    for index in range(TIMING_HISTOGRAM_BINS):
+        total += stats.histogram[index]
+        if total >= 0.99 * count:
+            break
+
+    return {'count': count,
+            'min': round(stats.minimum * ms_per_tick, 3),
+            'mean': round(stats.total * ms_per_tick / count, 3),
+            'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),
+            'max': round(stats.maximum * ms_per_tick, 3),
+            'period_share': round(<double>stats.total / count / period_ticks, 3),
+            'missed_deadlines': stats.missed_deadlines}
+
+cdef inline list timing_stats_histogram(AudioTimingStats *stats):
+    """Returns the bin counts of the timing histogram."""
+    return [stats.histogram[index] for index in range(TIMING_HISTOGRAM_BINS)]
@@ -0,0 +1,92 @@
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.string cimport memset
+
+from mpfmc.core.audio.sdl2 cimport *
+
+
+# ---------------------------------------------------------------------------
+#    Lock-free message ring
+# ---------------------------------------------------------------------------
+
+ctypedef struct MessageRing:
+    # A single producer/single consumer ring buffer of fixed size messages (used to pass
+    # requests to the audio callback and notifications back without the mixer lock). The
+    # producer only changes write_index and the consumer only changes read_index. The SDL
+    # atomic functions are full memory barriers, so a message is complete when the consumer
+    # sees the new write_index. A producer other than the mixer (the audio callback or the
+    # premix thread) must still hold the mixer lock if the mixer produces messages for the
+    # same ring. Standard tracks have a request ring and a notification ring, the sound loop
+    # track only a notification ring (its players are still changed under the mixer lock).
+    SDL_atomic_t write_index
+    SDL_atomic_t read_index
+    Uint32 capacity
+    Uint32 message_size
+    Uint32 dropped
+    Uint8 *messages
+
+
+cdef inline MessageRing *message_ring_create(Uint32 capacity, Uint32 message_size):
+    """
+    Allocates a new message ring.
+    Args:
+        capacity: The number of messages in the ring (must be a power of two)
+        message_size: The size of a message (in bytes)
+
+    Returns:
+        A pointer to the new message ring (free it with message_ring_free).
+    """
+    cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+    if ring == NULL:
+        return NULL
+
+    ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+    if ring.messages == NULL:
+        PyMem_Free(ring)
+        return NULL
+
+    SDL_AtomicSet(&ring.write_index, 0)
+    SDL_AtomicSet(&ring.read_index, 0)
+    ring.capacity = capacity
+    ring.message_size = message_size
+    ring.dropped = 0
+    return ring
+
+cdef inline void message_ring_free(MessageRing *ring):
+    """Frees a message ring and all messages in it."""
+    if ring != NULL:
+        PyMem_Free(ring.messages)
+        PyMem_Free(ring)
+
+cdef inline void *message_ring_reserve(MessageRing *ring) nogil:
+    """
+    Returns the next free message (zero filled) to the producer. The message is passed to the
+    consumer by message_ring_commit. If the ring is full, the message is dropped (counted in
+    ring.dropped) and NULL is returned.
+    """
+    cdef Uint32 write_index = <Uint32>SDL_AtomicGet(&ring.write_index)
+    cdef Uint8 *message
+
+    if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:
+        ring.dropped += 1
+        return NULL
+
+    message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+    memset(message, 0, ring.message_size)
+    return message
+
+cdef inline void message_ring_commit(MessageRing *ring) nogil:
+    """Passes the message returned by message_ring_reserve to the consumer."""
+    SDL_AtomicAdd(&ring.write_index, 1)
+
+cdef inline void *message_ring_peek(MessageRing *ring) nogil:
+    """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+    cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+
+    if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):
+        return NULL
+
+    return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+
+cdef inline void message_ring_release(MessageRing *ring) nogil:
+    """Returns the message returned by message_ring_peek to the producer."""
+    SDL_AtomicAdd(&ring.read_index, 1)
@@ -1,6 +1,7 @@
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.track cimport TrackState
+from mpfmc.core.audio.message_ring cimport *
 
 
 # ---------------------------------------------------------------------------
@@ -49,12 +50,13 @@ ctypedef struct NotificationMessageContainer:
 #    Notification Message functions
 # ---------------------------------------------------------------------------
 
-cdef inline NotificationMessageContainer *_create_notification_message() nogil:
+cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:
     """
-    Creates a new notification message.
-    :return: A pointer to the new notification message.
+    Creates a new notification message in the notification ring of the track. The message is
+    sent with message_ring_commit.
+    :return: A pointer to the new notification message (NULL if the ring is full).
     """
-    return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+    return <NotificationMessageContainer*>message_ring_reserve(track.notification_messages)
 
 cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -66,14 +68,14 @@ cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_started
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -85,14 +87,14 @@ cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_stopped
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -104,14 +106,14 @@ cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Ui
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_looping
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                          TrackState *track) nogil:
@@ -123,14 +125,14 @@ cdef inline void send_sound_about_to_finish_notification(int player, Uint64 soun
         sound_instance_id: The sound instance id
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_about_to_finish
         notification_message.player = player
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                 TrackState *track,
@@ -144,7 +146,7 @@ cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uin
         track: The TrackState pointer
         marker_id: The id of the marker being sent for the specified sound
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_marker
         notification_message.player = player
@@ -152,7 +154,7 @@ cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uin
         notification_message.sound_instance_id = sound_instance_id
         notification_message.data.marker.id = marker_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     """
@@ -160,10 +162,10 @@ cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     Args:
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_track_stopped
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_track_paused_notification(TrackState *track) nogil:
     """
@@ -171,10 +173,10 @@ cdef inline void send_track_paused_notification(TrackState *track) nogil:
     Args:
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_track_paused
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -185,7 +187,7 @@ cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_started
         notification_message.player = 0
@@ -194,7 +196,7 @@ cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -205,7 +207,7 @@ cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_stopped
         notification_message.player = 0
@@ -214,7 +216,7 @@ cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
 cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
     """
@@ -225,7 +227,7 @@ cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id,
         player: A pointer to the sound loop player that was playing this sound loop set 
         track: The TrackState pointer
     """
-    cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
     if notification_message != NULL:
         notification_message.message = notification_sound_loop_set_looping
         notification_message.player = 0
@@ -234,5 +236,5 @@ cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id,
         notification_message.data.sound_loop_set.id = sound_loop_set_id
         notification_message.data.sound_loop_set.player = player
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        message_ring_commit(track.notification_messages)
 
@@ -754,6 +754,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "gst/gst.h"
 #include "glib.h"
 #include "gstreamer_helper.h"
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -971,10 +972,24 @@ static const char *__pyx_f[] = {
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes;
 union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16;
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
+typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":231
+/* "mpfmc/core/audio/sdl2.pxd":279
+ * 
+ * # The number of histogram bins per period (buffer duration) in AudioTimingStats
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     TIMING_BINS_PER_PERIOD = 32
+ *     TIMING_HISTOGRAM_BINS = 96
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD = 32,
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS = 96
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":258
  * # specific data structures used in the MPF media controller audio library:
  * 
  * cdef struct Sample16Bytes:             # <<<<<<<<<<<<<<
@@ -986,7 +1001,7 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes {
   Uint8 byte1;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":238
+/* "mpfmc/core/audio/sdl2.pxd":265
  *     Uint8 byte1
  * 
  * cdef union Sample16:             # <<<<<<<<<<<<<<
@@ -998,8 +1013,24 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 {
   struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes bytes;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":251
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sdl2.pxd":283
+ *     TIMING_HISTOGRAM_BINS = 96
+ * 
+ * ctypedef struct AudioTimingStats:             # <<<<<<<<<<<<<<
+ *     # Durations (in SDL performance counter ticks) of the audio callback, the mix of a buffer or
+ *     # the mix callback of a track (see audio_timing.pxd). Bin n of the histogram counts durations
+ */
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats {
+  Uint64 count;
+  Uint64 total;
+  Uint64 minimum;
+  Uint64 maximum;
+  Uint64 missed_deadlines;
+  Uint32 histogram[__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS];
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":294
+ *     Uint32 histogram[TIMING_HISTOGRAM_BINS]
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
  *     # A pointer to this struct is passed to the main audio callback function and
@@ -1019,12 +1050,45 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  struct SDL_mutex *mixer_lock;
+  int float_mix;
+  int soft_limiter;
+  float *mix_buffer;
+  Uint32 premix_periods;
+  void *premix_ring;
+  Uint32 premix_position;
+  SDL_sem *premix_free_periods;
+  struct SDL_Thread *premix_thread;
+  SDL_atomic_t premix_running;
+  Uint32 premix_underruns;
+  Uint32 premix_periods_mixed;
+  Uint64 period_ticks;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats callback_timing;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats mix_timing;
   FILE *c_log_file;
 };
+struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing;
+typedef struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing;
+
+/* "mpfmc/core/audio/message_ring.pxd":11
+ * # ---------------------------------------------------------------------------
+ * 
+ * ctypedef struct MessageRing:             # <<<<<<<<<<<<<<
+ *     # A single producer/single consumer ring buffer of fixed size messages (used to pass
+ *     # requests to the audio callback and notifications back without the mixer lock). The
+ */
+struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing {
+  SDL_atomic_t write_index;
+  SDL_atomic_t read_index;
+  Uint32 capacity;
+  Uint32 message_size;
+  Uint32 dropped;
+  Uint8 *messages;
+};
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 typedef struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 
-/* "mpfmc/core/audio/track.pxd":10
+/* "mpfmc/core/audio/track.pxd":11
  * 
  * # The number of control points per audio buffer (sets control rate for ducking)
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1035,7 +1099,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":13
+/* "mpfmc/core/audio/track.pxd":14
  *     CONTROL_POINTS_PER_BUFFER = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1046,7 +1110,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":16
+/* "mpfmc/core/audio/track.pxd":17
  *     MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1057,7 +1121,18 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
 };
 
-/* "mpfmc/core/audio/track.pxd":20
+/* "mpfmc/core/audio/track.pxd":22
+ * # The number of notification messages which fit into the notification ring of a track (must be
+ * # a power of two). Notifications are processed on every tick.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     NOTIFICATION_RING_SIZE = 1024
+ * 
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_5track_NOTIFICATION_RING_SIZE = 0x400
+};
+
+/* "mpfmc/core/audio/track.pxd":26
  * 
  * 
  * cdef enum TrackStatus:             # <<<<<<<<<<<<<<
@@ -1072,7 +1147,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
   __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused = 4
 };
 
-/* "mpfmc/core/audio/track.pxd":27
+/* "mpfmc/core/audio/track.pxd":33
  *     track_status_paused = 4
  * 
  * ctypedef struct TrackState:             # <<<<<<<<<<<<<<
@@ -1082,6 +1157,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *callback_data;
   void (*mix_callback_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint32, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *);
+  void (*process_requests_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *);
   void *type_state;
   enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus status;
   int active;
@@ -1094,12 +1170,14 @@ struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   Uint32 fade_steps_remaining;
   int buffer_size;
   Uint8 *buffer;
-  GSList *notification_messages;
+  float *float_buffer;
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *notification_messages;
   int ducking_is_active;
   GArray *ducking_control_points;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats mix_timing;
 };
 
-/* "mpfmc/core/audio/track.pxd":51
+/* "mpfmc/core/audio/track.pxd":60
  * #    Track base class
  * # ---------------------------------------------------------------------------
  * cdef class Track:             # <<<<<<<<<<<<<<
@@ -1117,6 +1195,7 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject *mc;
   SDL_AudioDeviceID device_id;
   PyObject *log;
+  Uint32 _dropped_notifications;
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *state;
 };
 
@@ -1124,9 +1203,13 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
 
 struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track {
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*get_state)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
+  void (*_check_dropped_notifications)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
   void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32);
   void (*mix_audio)(Uint8 *, Uint8 const *, Uint32, int);
   void (*mix_audio_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
+  void (*mix_sound_to_track)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint8 *, Uint8 const *, Uint32, int);
+  void (*mix_audio_float)(float *, float const *, Uint32, float);
+  void (*convert_float_to_output)(Uint8 *, float const *, Uint32, float, int);
   void (*apply_volume)(Uint8 *, Uint8 const *, Uint32, int);
   void (*apply_volume_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
 };
@@ -1630,6 +1713,12 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* Module declarations from 'mpfmc.core.audio.gstreamer' */
 
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'mpfmc.core.audio.message_ring' */
+
 /* Module declarations from 'mpfmc.core.audio.track' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_5track_Track = 0;
 
@@ -7161,6 +7250,471 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
+/* "mpfmc/core/audio/message_ring.pxd":28
+ * 
+ * 
+ * cdef inline MessageRing *message_ring_create(Uint32 capacity, Uint32 message_size):             # <<<<<<<<<<<<<<
+ *     """
+ *     Allocates a new message ring.
+ */
+
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_create(Uint32 __pyx_v_capacity, Uint32 __pyx_v_message_size) {
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring;
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("message_ring_create", 0);
+
+  /* "mpfmc/core/audio/message_ring.pxd":38
+ *         A pointer to the new message ring (free it with message_ring_free).
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))             # <<<<<<<<<<<<<<
+ *     if ring == NULL:
+ *         return NULL
+ */
+  __pyx_v_ring = ((__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing))));
+
+  /* "mpfmc/core/audio/message_ring.pxd":39
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_ring == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":40
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":39
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":42
+ *         return NULL
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)             # <<<<<<<<<<<<<<
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)
+ */
+  __pyx_v_ring->messages = ((Uint8 *)PyMem_Malloc((__pyx_v_capacity * __pyx_v_message_size)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":43
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ *         return NULL
+ */
+  __pyx_t_1 = ((__pyx_v_ring->messages == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":44
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+    PyMem_Free(__pyx_v_ring);
+
+    /* "mpfmc/core/audio/message_ring.pxd":45
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":43
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ *         return NULL
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":47
+ *         return NULL
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)             # <<<<<<<<<<<<<<
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity
+ */
+  (void)(SDL_AtomicSet((&__pyx_v_ring->write_index), 0));
+
+  /* "mpfmc/core/audio/message_ring.pxd":48
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ *     SDL_AtomicSet(&ring.read_index, 0)             # <<<<<<<<<<<<<<
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size
+ */
+  (void)(SDL_AtomicSet((&__pyx_v_ring->read_index), 0));
+
+  /* "mpfmc/core/audio/message_ring.pxd":49
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity             # <<<<<<<<<<<<<<
+ *     ring.message_size = message_size
+ *     ring.dropped = 0
+ */
+  __pyx_v_ring->capacity = __pyx_v_capacity;
+
+  /* "mpfmc/core/audio/message_ring.pxd":50
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size             # <<<<<<<<<<<<<<
+ *     ring.dropped = 0
+ *     return ring
+ */
+  __pyx_v_ring->message_size = __pyx_v_message_size;
+
+  /* "mpfmc/core/audio/message_ring.pxd":51
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size
+ *     ring.dropped = 0             # <<<<<<<<<<<<<<
+ *     return ring
+ * 
+ */
+  __pyx_v_ring->dropped = 0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":52
+ *     ring.message_size = message_size
+ *     ring.dropped = 0
+ *     return ring             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):
+ */
+  __pyx_r = __pyx_v_ring;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":28
+ * 
+ * 
+ * cdef inline MessageRing *message_ring_create(Uint32 capacity, Uint32 message_size):             # <<<<<<<<<<<<<<
+ *     """
+ *     Allocates a new message ring.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":54
+ *     return ring
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):             # <<<<<<<<<<<<<<
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_free(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("message_ring_free", 0);
+
+  /* "mpfmc/core/audio/message_ring.pxd":56
+ * cdef inline void message_ring_free(MessageRing *ring):
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)
+ */
+  __pyx_t_1 = ((__pyx_v_ring != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":57
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ *         PyMem_Free(ring.messages)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ * 
+ */
+    PyMem_Free(__pyx_v_ring->messages);
+
+    /* "mpfmc/core/audio/message_ring.pxd":58
+ *     if ring != NULL:
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:
+ */
+    PyMem_Free(__pyx_v_ring);
+
+    /* "mpfmc/core/audio/message_ring.pxd":56
+ * cdef inline void message_ring_free(MessageRing *ring):
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":54
+ *     return ring
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):             # <<<<<<<<<<<<<<
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":60
+ *         PyMem_Free(ring)
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the next free message (zero filled) to the producer. The message is passed to the
+ */
+
+static CYTHON_INLINE void *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_reserve(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  Uint32 __pyx_v_write_index;
+  Uint8 *__pyx_v_message;
+  void *__pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/message_ring.pxd":66
+ *     ring.dropped) and NULL is returned.
+ *     """
+ *     cdef Uint32 write_index = <Uint32>SDL_AtomicGet(&ring.write_index)             # <<<<<<<<<<<<<<
+ *     cdef Uint8 *message
+ * 
+ */
+  __pyx_v_write_index = ((Uint32)SDL_AtomicGet((&__pyx_v_ring->write_index)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":69
+ *     cdef Uint8 *message
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:             # <<<<<<<<<<<<<<
+ *         ring.dropped += 1
+ *         return NULL
+ */
+  __pyx_t_1 = (((__pyx_v_write_index - ((Uint32)SDL_AtomicGet((&__pyx_v_ring->read_index)))) >= __pyx_v_ring->capacity) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":70
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:
+ *         ring.dropped += 1             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+    __pyx_v_ring->dropped = (__pyx_v_ring->dropped + 1);
+
+    /* "mpfmc/core/audio/message_ring.pxd":71
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:
+ *         ring.dropped += 1
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":69
+ *     cdef Uint8 *message
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:             # <<<<<<<<<<<<<<
+ *         ring.dropped += 1
+ *         return NULL
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":73
+ *         return NULL
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size             # <<<<<<<<<<<<<<
+ *     memset(message, 0, ring.message_size)
+ *     return message
+ */
+  __pyx_v_message = (__pyx_v_ring->messages + ((__pyx_v_write_index & (__pyx_v_ring->capacity - 1)) * __pyx_v_ring->message_size));
+
+  /* "mpfmc/core/audio/message_ring.pxd":74
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ *     memset(message, 0, ring.message_size)             # <<<<<<<<<<<<<<
+ *     return message
+ * 
+ */
+  (void)(memset(__pyx_v_message, 0, __pyx_v_ring->message_size));
+
+  /* "mpfmc/core/audio/message_ring.pxd":75
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ *     memset(message, 0, ring.message_size)
+ *     return message             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:
+ */
+  __pyx_r = __pyx_v_message;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":60
+ *         PyMem_Free(ring)
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the next free message (zero filled) to the producer. The message is passed to the
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":77
+ *     return message
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+
+  /* "mpfmc/core/audio/message_ring.pxd":79
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:
+ */
+  (void)(SDL_AtomicAdd((&__pyx_v_ring->write_index), 1));
+
+  /* "mpfmc/core/audio/message_ring.pxd":77
+ *     return message
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":81
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ */
+
+static CYTHON_INLINE void *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_peek(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  Uint32 __pyx_v_read_index;
+  void *__pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/message_ring.pxd":83
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)             # <<<<<<<<<<<<<<
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):
+ */
+  __pyx_v_read_index = ((Uint32)SDL_AtomicGet((&__pyx_v_ring->read_index)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":85
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_read_index == ((Uint32)SDL_AtomicGet((&__pyx_v_ring->write_index)))) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":86
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":85
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":88
+ *         return NULL
+ * 
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:
+ */
+  __pyx_r = (__pyx_v_ring->messages + ((__pyx_v_read_index & (__pyx_v_ring->capacity - 1)) * __pyx_v_ring->message_size));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":81
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":90
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_release(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+
+  /* "mpfmc/core/audio/message_ring.pxd":92
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)             # <<<<<<<<<<<<<<
+ */
+  (void)(SDL_AtomicAdd((&__pyx_v_ring->read_index), 1));
+
+  /* "mpfmc/core/audio/message_ring.pxd":90
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)
+ */
+
+  /* function exit code */
+}
+
 static PyMethodDef __pyx_methods[] = {
   {0, 0, 0, 0}
 };
@@ -7627,10 +8181,10 @@ static int __Pyx_modinit_type_import_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
-  __pyx_t_1 = PyImport_ImportModule("mpfmc.core.audio.track"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 51, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("mpfmc.core.audio.track"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = __Pyx_ImportType_0_29_36(__pyx_t_1, "mpfmc.core.audio.track", "Track", sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track),__Pyx_ImportType_CheckSize_Warn_0_29_36); if (!__pyx_ptype_5mpfmc_4core_5audio_5track_Track) __PYX_ERR(1, 51, __pyx_L1_error)
-  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = (struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track*)__Pyx_GetVtable(__pyx_ptype_5mpfmc_4core_5audio_5track_Track->tp_dict); if (unlikely(!__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(1, 51, __pyx_L1_error)
+  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = __Pyx_ImportType_0_29_36(__pyx_t_1, "mpfmc.core.audio.track", "Track", sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track),__Pyx_ImportType_CheckSize_Warn_0_29_36); if (!__pyx_ptype_5mpfmc_4core_5audio_5track_Track) __PYX_ERR(1, 60, __pyx_L1_error)
+  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = (struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track*)__Pyx_GetVtable(__pyx_ptype_5mpfmc_4core_5audio_5track_Track->tp_dict); if (unlikely(!__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(1, 60, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8230,6 +8784,14 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "mpfmc/core/audio/message_ring.pxd":90
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)
+ */
+
   /*--- Wrapped vars code ---*/
 
   goto __pyx_L0;
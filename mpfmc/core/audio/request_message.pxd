@@ -1,3 +1,12 @@
+from mpfmc.core.audio.sdl2 cimport *
+from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.sound_file cimport *
+
+
+# The maximum number of markers per sound
+cdef enum:
+    MAX_MARKERS = 16
+
 # ---------------------------------------------------------------------------
 #    Request Message types
 # ---------------------------------------------------------------------------
@@ -10,21 +19,34 @@ cdef enum RequestMessage:
     request_sound_stop_looping = 5        # Request to stop looping a sound that is playing
 
 
+ctypedef struct DuckingSettings:
+    int track_bit_mask
+    Sint32 attack_start_pos
+    Sint32 attack_duration
+    Uint8 attenuation_volume
+    Sint32 release_start_pos
+    Sint32 release_duration
+
 ctypedef struct RequestMessageDataPlaySound:
     SoundSample *sample
     Uint8 volume
+    Uint8 volume_left
+    Uint8 volume_right
     int loops
     int priority
     Uint32 start_at_position
-    Uint32 fade_in_duration
-    Uint32 fade_out_duration
-    int marker_count
-    GArray *markers
+    Uint32 loop_start_position
+    Uint32 loop_end_position
+    Uint32 fade_in_steps
+    Uint32 fade_out_steps
+    Uint32 about_to_finish_marker
+    Uint8 marker_count
+    guint markers[MAX_MARKERS]
     bint sound_has_ducking
     DuckingSettings ducking_settings
 
 ctypedef struct RequestMessageDataStopSound:
-    Uint32 fade_out_duration
+    Uint32 fade_out_steps
     Uint32 ducking_release_duration
 
 ctypedef union RequestMessageData:
@@ -37,5 +59,3 @@ ctypedef struct RequestMessageContainer:
     Uint64 sound_instance_id
     int player
     RequestMessageData data
-
-
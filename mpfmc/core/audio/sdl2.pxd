@@ -91,10 +91,25 @@ cdef extern from "SDL.h" nogil:
         pass
 
     ctypedef int (*SDLCALL)(void *)
-    SDL_Thread *SDL_CreateThread(SDLCALL, void *data)
+    SDL_Thread *SDL_CreateThread(SDLCALL, const char *name, void *data)
     void SDL_WaitThread(SDL_Thread *thread, int *status)
     Uint32 SDL_ThreadID()
 
+    ctypedef enum SDL_ThreadPriority:
+        SDL_THREAD_PRIORITY_LOW
+        SDL_THREAD_PRIORITY_NORMAL
+        SDL_THREAD_PRIORITY_HIGH
+    int SDL_SetThreadPriority(SDL_ThreadPriority priority)
+
+    struct SDL_semaphore:
+        pass
+    ctypedef SDL_semaphore SDL_sem
+
+    SDL_sem *SDL_CreateSemaphore(Uint32 initial_value)
+    void SDL_DestroySemaphore(SDL_sem *sem)
+    int SDL_SemWait(SDL_sem *sem)
+    int SDL_SemPost(SDL_sem *sem)
+
     void SDL_SetError(char *fmt)
     char *SDL_GetError()
     void SDL_ClearError()
@@ -112,6 +127,9 @@ cdef extern from "SDL.h" nogil:
     void SDL_Delay(int)
     int SDL_Init(int)
     int SDL_InitSubSystem(Uint32 flags)
+    const char *SDL_HINT_AUDIODRIVER
+    const char *SDL_GetHint(const char *name)
+    SDL_bool SDL_SetHint(const char *name, const char *value)
     void SDL_Quit()
     void SDL_LockAudio()
     void SDL_UnlockAudio()
@@ -123,6 +141,15 @@ cdef extern from "SDL.h" nogil:
     void SDL_free(void *ptr)
 
     Uint32 SDL_GetTicks()
+    Uint64 SDL_GetPerformanceCounter()
+    Uint64 SDL_GetPerformanceFrequency()
+
+    ctypedef struct SDL_atomic_t:
+        int value
+
+    int SDL_AtomicGet(SDL_atomic_t *a)
+    int SDL_AtomicSet(SDL_atomic_t *a, int v)
+    int SDL_AtomicAdd(SDL_atomic_t *a, int v)
 
     struct SDL_version:
         Uint8 major
@@ -248,6 +275,22 @@ cdef union Sample16:
 #    Audio Callback Data type
 # ---------------------------------------------------------------------------
 
+# The number of histogram bins per period (buffer duration) in AudioTimingStats
+cdef enum:
+    TIMING_BINS_PER_PERIOD = 32
+    TIMING_HISTOGRAM_BINS = 96
+
+ctypedef struct AudioTimingStats:
+    # Durations (in SDL performance counter ticks) of the audio callback, the mix of a buffer or
+    # the mix callback of a track (see audio_timing.pxd). Bin n of the histogram counts durations
+    # from n / TIMING_BINS_PER_PERIOD periods, the last bin counts all longer durations.
+    Uint64 count
+    Uint64 total
+    Uint64 minimum
+    Uint64 maximum
+    Uint64 missed_deadlines
+    Uint32 histogram[TIMING_HISTOGRAM_BINS]
+
 ctypedef struct AudioCallbackData:
     # A pointer to this struct is passed to the main audio callback function and
     # is the only way data is made available to the main audio thread.  Must not
@@ -265,4 +308,29 @@ ctypedef struct AudioCallbackData:
     Uint8 silence
     Uint8 track_count
     void **tracks
+    # Protects the mixer state (tracks, sound players, master volume) between Python and the thread
+    # which mixes (the audio callback or the premix thread). It is used instead of the audio device
+    # lock, so Python never blocks the audio callback while the premix thread is used.
+    SDL_mutex *mixer_lock
+    # Optional 32-bit float mix bus (see AudioInterface). mix_buffer is the master bus in that case.
+    bint float_mix
+    bint soft_limiter
+    float *mix_buffer
+    # Optional low-latency mode (see AudioInterface). A premix thread mixes up to premix_periods
+    # periods ahead into premix_ring (a MessageRing of whole periods) and the audio callback only
+    # copies them to the output. premix_position is the number of bytes of the oldest period
+    # which have already been copied.
+    Uint32 premix_periods
+    void *premix_ring
+    Uint32 premix_position
+    SDL_sem *premix_free_periods
+    SDL_Thread *premix_thread
+    SDL_atomic_t premix_running
+    Uint32 premix_underruns
+    Uint32 premix_periods_mixed
+    # Timing of the audio callback and of the mix of each buffer (the same unless the premix thread
+    # is used). period_ticks is the duration of one buffer.
+    Uint64 period_ticks
+    AudioTimingStats callback_timing
+    AudioTimingStats mix_timing
     FILE *c_log_file
@@ -985,10 +985,24 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile;
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes;
 union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16;
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
+typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":231
+/* "mpfmc/core/audio/sdl2.pxd":279
+ * 
+ * # The number of histogram bins per period (buffer duration) in AudioTimingStats
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     TIMING_BINS_PER_PERIOD = 32
+ *     TIMING_HISTOGRAM_BINS = 96
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD = 32,
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS = 96
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":258
  * # specific data structures used in the MPF media controller audio library:
  * 
  * cdef struct Sample16Bytes:             # <<<<<<<<<<<<<<
@@ -1000,7 +1014,7 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes {
   Uint8 byte1;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":238
+/* "mpfmc/core/audio/sdl2.pxd":265
  *     Uint8 byte1
  * 
  * cdef union Sample16:             # <<<<<<<<<<<<<<
@@ -1012,8 +1026,24 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 {
   struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes bytes;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":251
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sdl2.pxd":283
+ *     TIMING_HISTOGRAM_BINS = 96
+ * 
+ * ctypedef struct AudioTimingStats:             # <<<<<<<<<<<<<<
+ *     # Durations (in SDL performance counter ticks) of the audio callback, the mix of a buffer or
+ *     # the mix callback of a track (see audio_timing.pxd). Bin n of the histogram counts durations
+ */
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats {
+  Uint64 count;
+  Uint64 total;
+  Uint64 minimum;
+  Uint64 maximum;
+  Uint64 missed_deadlines;
+  Uint32 histogram[__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS];
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":294
+ *     Uint32 histogram[TIMING_HISTOGRAM_BINS]
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
  *     # A pointer to this struct is passed to the main audio callback function and
@@ -1033,6 +1063,21 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  struct SDL_mutex *mixer_lock;
+  int float_mix;
+  int soft_limiter;
+  float *mix_buffer;
+  Uint32 premix_periods;
+  void *premix_ring;
+  Uint32 premix_position;
+  SDL_sem *premix_free_periods;
+  struct SDL_Thread *premix_thread;
+  SDL_atomic_t premix_running;
+  Uint32 premix_underruns;
+  Uint32 premix_periods_mixed;
+  Uint64 period_ticks;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats callback_timing;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats mix_timing;
   FILE *c_log_file;
 };
 struct __pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory;
@@ -1112,12 +1157,12 @@ struct __pyx_t_5mpfmc_4core_5audio_10sound_file_SoundSample {
   Uint32 size;
 };
 
-/* "mpfmc/core/audio/sound_file.pyx":18
- * #    SoundFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":34
+ * 
+ * 
  * cdef class SoundFile:             # <<<<<<<<<<<<<<
  *     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
- * 
+ *     cdef str file_name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
   PyObject_HEAD
@@ -1128,9 +1173,9 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":47
- * #    SoundMemoryFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":42
+ * 
+ * 
  * cdef class SoundMemoryFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundMemoryFile is a wrapper class to manage sound sample data stored
  *     in memory."""
@@ -1141,12 +1186,12 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":124
- * #    SoundStreamingFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":48
+ * 
+ * 
  * cdef class SoundStreamingFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
- * 
+ *     cdef GstElement *pipeline
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile {
   struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile __pyx_base;
@@ -1509,14 +1554,14 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 
-/* Module declarations from 'cpython.mem' */
-
-/* Module declarations from 'cpython.pycapsule' */
-
 /* Module declarations from 'mpfmc.core.audio.sdl2' */
 
 /* Module declarations from 'mpfmc.core.audio.gstreamer' */
 
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'cpython.pycapsule' */
+
 /* Module declarations from 'mpfmc.core.audio.sound_file' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile = 0;
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile = 0;
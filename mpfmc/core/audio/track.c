@@ -754,6 +754,9 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "gst/gst.h"
 #include "glib.h"
 #include "gstreamer_helper.h"
+#include <string.h>
+#include <stdio.h>
+#include "math.h"
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -965,6 +968,8 @@ static const char *__pyx_filename;
 static const char *__pyx_f[] = {
   "mpfmc/core/audio/track.pyx",
   "stringsource",
+  "mpfmc/core/audio/audio_timing.pxd",
+  "type.pxd",
 };
 /* ForceInitThreads.proto */
 #ifndef __PYX_FORCE_INIT_THREADS
@@ -983,10 +988,24 @@ static const char *__pyx_f[] = {
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes;
 union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16;
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
+typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":231
+/* "mpfmc/core/audio/sdl2.pxd":279
+ * 
+ * # The number of histogram bins per period (buffer duration) in AudioTimingStats
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     TIMING_BINS_PER_PERIOD = 32
+ *     TIMING_HISTOGRAM_BINS = 96
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD = 32,
+  __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS = 96
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":258
  * # specific data structures used in the MPF media controller audio library:
  * 
  * cdef struct Sample16Bytes:             # <<<<<<<<<<<<<<
@@ -998,7 +1017,7 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes {
   Uint8 byte1;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":238
+/* "mpfmc/core/audio/sdl2.pxd":265
  *     Uint8 byte1
  * 
  * cdef union Sample16:             # <<<<<<<<<<<<<<
@@ -1010,8 +1029,24 @@ union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 {
   struct __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16Bytes bytes;
 };
 
-/* "mpfmc/core/audio/sdl2.pxd":251
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sdl2.pxd":283
+ *     TIMING_HISTOGRAM_BINS = 96
+ * 
+ * ctypedef struct AudioTimingStats:             # <<<<<<<<<<<<<<
+ *     # Durations (in SDL performance counter ticks) of the audio callback, the mix of a buffer or
+ *     # the mix callback of a track (see audio_timing.pxd). Bin n of the histogram counts durations
+ */
+struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats {
+  Uint64 count;
+  Uint64 total;
+  Uint64 minimum;
+  Uint64 maximum;
+  Uint64 missed_deadlines;
+  Uint32 histogram[__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS];
+};
+
+/* "mpfmc/core/audio/sdl2.pxd":294
+ *     Uint32 histogram[TIMING_HISTOGRAM_BINS]
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
  *     # A pointer to this struct is passed to the main audio callback function and
@@ -1031,8 +1066,41 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  struct SDL_mutex *mixer_lock;
+  int float_mix;
+  int soft_limiter;
+  float *mix_buffer;
+  Uint32 premix_periods;
+  void *premix_ring;
+  Uint32 premix_position;
+  SDL_sem *premix_free_periods;
+  struct SDL_Thread *premix_thread;
+  SDL_atomic_t premix_running;
+  Uint32 premix_underruns;
+  Uint32 premix_periods_mixed;
+  Uint64 period_ticks;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats callback_timing;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats mix_timing;
   FILE *c_log_file;
 };
+struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing;
+typedef struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing;
+
+/* "mpfmc/core/audio/message_ring.pxd":11
+ * # ---------------------------------------------------------------------------
+ * 
+ * ctypedef struct MessageRing:             # <<<<<<<<<<<<<<
+ *     # A single producer/single consumer ring buffer of fixed size messages (used to pass
+ *     # requests to the audio callback and notifications back without the mixer lock). The
+ */
+struct __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing {
+  SDL_atomic_t write_index;
+  SDL_atomic_t read_index;
+  Uint32 capacity;
+  Uint32 message_size;
+  Uint32 dropped;
+  Uint8 *messages;
+};
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping;
 typedef struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping;
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataMarker;
@@ -1044,7 +1112,7 @@ typedef union __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMes
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer;
 typedef struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer;
 
-/* "mpfmc/core/audio/notification_message.pxd":10
+/* "mpfmc/core/audio/notification_message.pxd":11
  * # ---------------------------------------------------------------------------
  * 
  * cdef enum NotificationMessage:             # <<<<<<<<<<<<<<
@@ -1065,7 +1133,7 @@ enum __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessage {
   __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping = 33
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":23
+/* "mpfmc/core/audio/notification_message.pxd":24
  *     notification_sound_loop_set_looping = 33  # Notification that a sound_loop_set is looping back to the beginning
  * 
  * ctypedef struct NotificationMessageDataLooping:             # <<<<<<<<<<<<<<
@@ -1077,7 +1145,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDat
   int loops_remaining;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":27
+/* "mpfmc/core/audio/notification_message.pxd":28
  *     int loops_remaining
  * 
  * ctypedef struct NotificationMessageDataMarker:             # <<<<<<<<<<<<<<
@@ -1088,7 +1156,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDat
   int id;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":30
+/* "mpfmc/core/audio/notification_message.pxd":31
  *     int id
  * 
  * ctypedef struct NotificationMessageSoundLoopSet:             # <<<<<<<<<<<<<<
@@ -1100,7 +1168,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageSou
   gpointer player;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":35
+/* "mpfmc/core/audio/notification_message.pxd":36
  * 
  * 
  * ctypedef union NotificationMessageData:             # <<<<<<<<<<<<<<
@@ -1113,7 +1181,7 @@ union __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageData
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageSoundLoopSet sound_loop_set;
 };
 
-/* "mpfmc/core/audio/notification_message.pxd":40
+/* "mpfmc/core/audio/notification_message.pxd":41
  *     NotificationMessageSoundLoopSet sound_loop_set
  * 
  * ctypedef struct NotificationMessageContainer:             # <<<<<<<<<<<<<<
@@ -1130,7 +1198,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageCon
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 typedef struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 
-/* "mpfmc/core/audio/track.pxd":10
+/* "mpfmc/core/audio/track.pxd":11
  * 
  * # The number of control points per audio buffer (sets control rate for ducking)
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1141,7 +1209,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":13
+/* "mpfmc/core/audio/track.pxd":14
  *     CONTROL_POINTS_PER_BUFFER = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1152,7 +1220,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":16
+/* "mpfmc/core/audio/track.pxd":17
  *     MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -1163,7 +1231,18 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
 };
 
-/* "mpfmc/core/audio/track.pxd":20
+/* "mpfmc/core/audio/track.pxd":22
+ * # The number of notification messages which fit into the notification ring of a track (must be
+ * # a power of two). Notifications are processed on every tick.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     NOTIFICATION_RING_SIZE = 1024
+ * 
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_5track_NOTIFICATION_RING_SIZE = 0x400
+};
+
+/* "mpfmc/core/audio/track.pxd":26
  * 
  * 
  * cdef enum TrackStatus:             # <<<<<<<<<<<<<<
@@ -1178,7 +1257,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
   __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused = 4
 };
 
-/* "mpfmc/core/audio/track.pxd":27
+/* "mpfmc/core/audio/track.pxd":33
  *     track_status_paused = 4
  * 
  * ctypedef struct TrackState:             # <<<<<<<<<<<<<<
@@ -1188,6 +1267,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *callback_data;
   void (*mix_callback_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint32, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *);
+  void (*process_requests_function)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *);
   void *type_state;
   enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus status;
   int active;
@@ -1200,17 +1280,19 @@ struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   Uint32 fade_steps_remaining;
   int buffer_size;
   Uint8 *buffer;
-  GSList *notification_messages;
+  float *float_buffer;
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *notification_messages;
   int ducking_is_active;
   GArray *ducking_control_points;
+  __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats mix_timing;
 };
 
-/* "mpfmc/core/audio/track.pyx":23
+/* "mpfmc/core/audio/track.pxd":60
  * #    Track base class
  * # ---------------------------------------------------------------------------
  * cdef class Track:             # <<<<<<<<<<<<<<
- *     """
- *     Track base class
+ * 
+ *     cdef str _name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject_HEAD
@@ -1223,16 +1305,29 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject *mc;
   SDL_AudioDeviceID device_id;
   PyObject *log;
+  Uint32 _dropped_notifications;
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *state;
 };
 
 
 
+/* "mpfmc/core/audio/track.pyx":39
+ * #    Track base class
+ * # ---------------------------------------------------------------------------
+ * cdef class Track:             # <<<<<<<<<<<<<<
+ *     """
+ *     Track base class
+ */
+
 struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track {
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*get_state)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
+  void (*_check_dropped_notifications)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
   void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32);
   void (*mix_audio)(Uint8 *, Uint8 const *, Uint32, int);
   void (*mix_audio_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
+  void (*mix_sound_to_track)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint8 *, Uint8 const *, Uint32, int);
+  void (*mix_audio_float)(float *, float const *, Uint32, float);
+  void (*convert_float_to_output)(Uint8 *, float const *, Uint32, float, int);
   void (*apply_volume)(Uint8 *, Uint8 const *, Uint32, int);
   void (*apply_volume_stereo)(Uint8 *, Uint8 const *, Uint32, int, int);
 };
@@ -1436,6 +1531,13 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* DivInt[int].proto */
+static CYTHON_INLINE int __Pyx_div_int(int, int);
+
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1472,20 +1574,68 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
 #endif
 
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* DivInt[int].proto */
-static CYTHON_INLINE int __Pyx_div_int(int, int);
+/* DivInt[ptrdiff_t].proto */
+static CYTHON_INLINE ptrdiff_t __Pyx_div_ptrdiff_t(ptrdiff_t, ptrdiff_t);
 
-/* UnaryNegOverflows.proto */
-#define UNARY_NEG_WOULD_OVERFLOW(x)\
-        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-/* WriteUnraisableException.proto */
-static void __Pyx_WriteUnraisable(const char *name, int clineno,
-                                  int lineno, const char *filename,
-                                  int full_traceback, int nogil);
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* DivInt[Py_ssize_t].proto */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
 
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
@@ -1518,6 +1668,25 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, P
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_36
+#define __PYX_HAVE_RT_ImportType_proto_0_29_36
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_36(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_36(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_36 {
+   __Pyx_ImportType_CheckSize_Error_0_29_36 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_36 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_36 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_36(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_36 check_size);
+#endif
+
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
@@ -1558,6 +1727,15 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -1584,31 +1762,64 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track__check_dropped_notifications(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_sound_to_track(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, Uint8 *__pyx_v_track_buffer_position, Uint8 const *__pyx_v_sound_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_float(float *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_convert_float_to_output(Uint8 *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain, int __pyx_v_soft_limiter); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume); /* proto*/
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto*/
 
+/* Module declarations from 'mpfmc.core.audio.sdl2' */
+
+/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+
 /* Module declarations from 'cpython.mem' */
 
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'mpfmc.core.audio.message_ring' */
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_create(Uint32, Uint32); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_free(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *); /*proto*/
+static CYTHON_INLINE void *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_reserve(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *); /*proto*/
+
 /* Module declarations from 'cpython.pycapsule' */
 
-/* Module declarations from 'mpfmc.core.audio.sdl2' */
+/* Module declarations from 'cpython.buffer' */
 
-/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytearray' */
 
 /* Module declarations from 'mpfmc.core.audio.inline' */
 static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float, Uint8, Uint8); /*proto*/
 static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float); /*proto*/
 
+/* Module declarations from 'mpfmc.core.audio.audio_timing' */
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_reset(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_to_dict(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *, Uint64); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_histogram(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *); /*proto*/
+
 /* Module declarations from 'mpfmc.core.audio.notification_message' */
-static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void); /*proto*/
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 
 /* Module declarations from 'mpfmc.core.audio.track' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_5track_Track = 0;
+static void __pyx_f_5mpfmc_4core_5audio_5track__process_samples(PyObject *, PyObject *, int, int, int); /*proto*/
 #define __Pyx_MODULE_NAME "mpfmc.core.audio.track"
 extern int __pyx_module_is_main_mpfmc__core__audio__track;
 int __pyx_module_is_main_mpfmc__core__audio__track = 0;
@@ -1616,13 +1827,22 @@ int __pyx_module_is_main_mpfmc__core__audio__track = 0;
 /* Implementation of 'mpfmc.core.audio.track' */
 static PyObject *__pyx_builtin_round;
 static PyObject *__pyx_builtin_NotImplementedError;
+static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
 static const char __pyx_k_mc[] = "mc";
+static const char __pyx_k_max[] = "max";
+static const char __pyx_k_min[] = "min";
+static const char __pyx_k_p99[] = "p99";
+static const char __pyx_k_gain[] = "gain";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mean[] = "mean";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_Track[] = "Track";
+static const char __pyx_k_count[] = "count";
 static const char __pyx_k_debug[] = "debug";
+static const char __pyx_k_range[] = "range";
 static const char __pyx_k_round[] = "round";
 static const char __pyx_k_track[] = "track";
 static const char __pyx_k_format[] = "format";
@@ -1640,22 +1860,40 @@ static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_getLogger[] = "getLogger";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_track_num[] = "track_num";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_input_view[] = "input_view";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_buffer_size[] = "buffer_size";
+static const char __pyx_k_mix_samples[] = "mix_samples";
+static const char __pyx_k_output_data[] = "output_data";
+static const char __pyx_k_volume_left[] = "volume_left";
 static const char __pyx_k_fade_seconds[] = "fade_seconds";
+static const char __pyx_k_input_buffer[] = "input_buffer";
+static const char __pyx_k_period_share[] = "period_share";
+static const char __pyx_k_sample_count[] = "sample_count";
+static const char __pyx_k_soft_limiter[] = "soft_limiter";
+static const char __pyx_k_volume_right[] = "volume_right";
+static const char __pyx_k_output_buffer[] = "output_buffer";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_fade_in_seconds[] = "fade_in_seconds";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_fade_out_seconds[] = "fade_out_seconds";
+static const char __pyx_k_missed_deadlines[] = "missed_deadlines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_events_when_played[] = "events_when_played";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
 static const char __pyx_k_audio_callback_data[] = "audio_callback_data";
 static const char __pyx_k_post_mc_native_event[] = "post_mc_native_event";
+static const char __pyx_k_mpfmc_core_audio_track[] = "mpfmc.core.audio.track";
+static const char __pyx_k_apply_volume_to_samples[] = "apply_volume_to_samples";
+static const char __pyx_k_float_samples_to_output[] = "float_samples_to_output";
+static const char __pyx_k_mpfmc_core_audio_track_pyx[] = "mpfmc/core/audio/track.pyx";
 static const char __pyx_k_play_Applying_s_second_fade_in[] = "play - Applying %s second fade in";
+static const char __pyx_k_d_notification_messages_were_dr[] = "%d notification messages were dropped because the notification ring was full";
 static const char __pyx_k_pause_Pause_sound_processing_on[] = "pause - Pause sound processing on track";
 static const char __pyx_k_stop_Applying_s_second_fade_out[] = "stop - Applying %s second fade out";
 static const char __pyx_k_Allocated_track_audio_buffer_d_b[] = "Allocated track audio buffer (%d bytes)";
+static const char __pyx_k_Input_and_output_buffer_must_hav[] = "Input and output buffer must have the same length";
 static const char __pyx_k_Must_be_overridden_in_derived_cl[] = "Must be overridden in derived class";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_pause_Action_may_only_be_used_wh[] = "pause - Action may only be used when a track is playing; action will be ignored.";
@@ -1666,48 +1904,73 @@ static const char __pyx_k_set_volume_Applying_s_second_fad[] = "set_volume - App
 static const char __pyx_k_set_volume_Interrupting_an_exist[] = "set_volume - Interrupting an existing fade on this track so start a new fade";
 static const char __pyx_k_stop_Action_may_only_be_used_whe[] = "stop - Action may only be used when a track is playing; action will be ignored.";
 static const char __pyx_k_stop_Stop_sound_processing_on_tr[] = "stop - Stop sound processing on track and clear state";
+static const char __pyx_k_Input_and_output_buffer_must_hav_2[] = "Input and output buffer must have the same number of samples";
 static PyObject *__pyx_kp_u_Allocated_track_audio_buffer_d_b;
+static PyObject *__pyx_kp_u_Input_and_output_buffer_must_hav;
+static PyObject *__pyx_kp_u_Input_and_output_buffer_must_hav_2;
 static PyObject *__pyx_kp_u_Must_be_overridden_in_derived_cl;
 static PyObject *__pyx_n_s_NotImplementedError;
 static PyObject *__pyx_n_s_Track;
 static PyObject *__pyx_n_u_Track;
 static PyObject *__pyx_kp_u_Track_2;
 static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_apply_volume_to_samples;
 static PyObject *__pyx_n_s_audio_callback_data;
 static PyObject *__pyx_n_s_buffer_size;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_u_count;
+static PyObject *__pyx_kp_u_d_notification_messages_were_dr;
 static PyObject *__pyx_n_s_debug;
 static PyObject *__pyx_n_s_events_when_played;
 static PyObject *__pyx_n_s_fade_in_seconds;
 static PyObject *__pyx_n_s_fade_out_seconds;
 static PyObject *__pyx_n_s_fade_seconds;
+static PyObject *__pyx_n_s_float_samples_to_output;
 static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_s_gain;
 static PyObject *__pyx_n_s_getLogger;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_input_buffer;
+static PyObject *__pyx_n_s_input_view;
 static PyObject *__pyx_n_s_logging;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_u_max;
 static PyObject *__pyx_n_s_mc;
+static PyObject *__pyx_n_u_mean;
+static PyObject *__pyx_n_u_min;
+static PyObject *__pyx_n_u_missed_deadlines;
+static PyObject *__pyx_n_s_mix_samples;
+static PyObject *__pyx_n_s_mpfmc_core_audio_track;
+static PyObject *__pyx_kp_s_mpfmc_core_audio_track_pyx;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_number;
+static PyObject *__pyx_n_s_output_buffer;
+static PyObject *__pyx_n_s_output_data;
+static PyObject *__pyx_n_u_p99;
 static PyObject *__pyx_kp_u_pause_Action_may_only_be_used_wh;
 static PyObject *__pyx_kp_u_pause_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_pause_Pause_sound_processing_on;
+static PyObject *__pyx_n_u_period_share;
 static PyObject *__pyx_kp_u_play_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_play_Applying_s_second_fade_in;
 static PyObject *__pyx_kp_u_play_Begin_sound_processing_on_t;
 static PyObject *__pyx_n_s_post_mc_native_event;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
 static PyObject *__pyx_n_s_round;
+static PyObject *__pyx_n_s_sample_count;
 static PyObject *__pyx_kp_u_set_volume_Applying_s_second_fad;
 static PyObject *__pyx_kp_u_set_volume_Interrupting_an_exist;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_soft_limiter;
 static PyObject *__pyx_kp_u_stop_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_stop_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_stop_Stop_sound_processing_on_tr;
@@ -1715,6 +1978,8 @@ static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_track;
 static PyObject *__pyx_n_s_track_num;
 static PyObject *__pyx_n_s_volume;
+static PyObject *__pyx_n_s_volume_left;
+static PyObject *__pyx_n_s_volume_right;
 static PyObject *__pyx_n_s_warning;
 static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kw); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_audio_callback_data, PyObject *__pyx_v_name, int __pyx_v_track_num, int __pyx_v_buffer_size, float __pyx_v_volume); /* proto */
@@ -1740,16 +2005,32 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED float __pyx_v_fade_out_seconds); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22get_mix_timing(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24get_mix_timing_histogram(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_26reset_mix_timing(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_30__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_mix_samples(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_2apply_volume_to_samples(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, int __pyx_v_volume_left, int __pyx_v_volume_right); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_4float_samples_to_output(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, float __pyx_v_gain, int __pyx_v_soft_limiter); /* proto */
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_codeobj__7;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
 /* Late includes */
 
-/* "mpfmc/core/audio/track.pyx":28
+/* "mpfmc/core/audio/track.pyx":44
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1782,7 +2063,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":30
+  /* "mpfmc/core/audio/track.pyx":46
  *     def __cinit__(self, *args, **kw):
  *         """C constructor"""
  *         self.state = NULL             # <<<<<<<<<<<<<<
@@ -1791,7 +2072,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":31
+  /* "mpfmc/core/audio/track.pyx":47
  *         """C constructor"""
  *         self.state = NULL
  *         self.device_id = 0             # <<<<<<<<<<<<<<
@@ -1800,7 +2081,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->device_id = 0;
 
-  /* "mpfmc/core/audio/track.pyx":28
+  /* "mpfmc/core/audio/track.pyx":44
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1814,7 +2095,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":33
+/* "mpfmc/core/audio/track.pyx":49
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -1872,25 +2153,25 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 49, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_name)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 49, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_track_num)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 49, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buffer_size)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 33, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 49, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
@@ -1900,7 +2181,7 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 33, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 49, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1918,23 +2199,23 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
     __pyx_v_mc = values[0];
     __pyx_v_audio_callback_data = values[1];
     __pyx_v_name = ((PyObject*)values[2]);
-    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
-    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 49, __pyx_L3_error)
+    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 49, __pyx_L3_error)
     if (values[5]) {
-      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 49, __pyx_L3_error)
     } else {
       __pyx_v_volume = ((float)1.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 33, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 49, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 49, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_mc, __pyx_v_audio_callback_data, __pyx_v_name, __pyx_v_track_num, __pyx_v_buffer_size, __pyx_v_volume);
 
   /* function exit code */
@@ -1957,24 +2238,25 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   int __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
   void *__pyx_t_7;
-  long __pyx_t_8;
-  float __pyx_t_9;
+  int __pyx_t_8;
+  long __pyx_t_9;
   float __pyx_t_10;
+  float __pyx_t_11;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":44
+  /* "mpfmc/core/audio/track.pyx":60
  *             volume: The track volume (0.0 to 1.0)
  *         """
  *         self.log = logging.getLogger("Track")             # <<<<<<<<<<<<<<
  *         self.mc = mc
  *         self._name = name
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -1989,7 +2271,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_n_u_Track) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_Track);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -1998,7 +2280,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __pyx_v_self->log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":45
+  /* "mpfmc/core/audio/track.pyx":61
  *         """
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc             # <<<<<<<<<<<<<<
@@ -2011,7 +2293,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->mc);
   __pyx_v_self->mc = __pyx_v_mc;
 
-  /* "mpfmc/core/audio/track.pyx":46
+  /* "mpfmc/core/audio/track.pyx":62
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc
  *         self._name = name             # <<<<<<<<<<<<<<
@@ -2024,7 +2306,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_name);
   __pyx_v_self->_name = __pyx_v_name;
 
-  /* "mpfmc/core/audio/track.pyx":47
+  /* "mpfmc/core/audio/track.pyx":63
  *         self.mc = mc
  *         self._name = name
  *         self._number = track_num             # <<<<<<<<<<<<<<
@@ -2033,7 +2315,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->_number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":48
+  /* "mpfmc/core/audio/track.pyx":64
  *         self._name = name
  *         self._number = track_num
  *         self._events_when_stopped = None             # <<<<<<<<<<<<<<
@@ -2046,7 +2328,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_stopped);
   __pyx_v_self->_events_when_stopped = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":49
+  /* "mpfmc/core/audio/track.pyx":65
  *         self._number = track_num
  *         self._events_when_stopped = None
  *         self._events_when_played = None             # <<<<<<<<<<<<<<
@@ -2059,7 +2341,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_played);
   __pyx_v_self->_events_when_played = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":50
+  /* "mpfmc/core/audio/track.pyx":66
  *         self._events_when_stopped = None
  *         self._events_when_played = None
  *         self._events_when_paused = None             # <<<<<<<<<<<<<<
@@ -2072,35 +2354,44 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_paused);
   __pyx_v_self->_events_when_paused = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":53
+  /* "mpfmc/core/audio/track.pyx":69
  * 
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))             # <<<<<<<<<<<<<<
  *         self.state.mix_callback_function = NULL
- *         self.state.type_state = NULL
+ *         self.state.process_requests_function = NULL
  */
   __pyx_v_self->state = ((__pyx_t_5mpfmc_4core_5audio_5track_TrackState *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_5track_TrackState))));
 
-  /* "mpfmc/core/audio/track.pyx":54
+  /* "mpfmc/core/audio/track.pyx":70
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL             # <<<<<<<<<<<<<<
+ *         self.state.process_requests_function = NULL
  *         self.state.type_state = NULL
- *         self.state.number = track_num
  */
   __pyx_v_self->state->mix_callback_function = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":55
+  /* "mpfmc/core/audio/track.pyx":71
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL
+ *         self.state.process_requests_function = NULL             # <<<<<<<<<<<<<<
+ *         self.state.type_state = NULL
+ *         self.state.number = track_num
+ */
+  __pyx_v_self->state->process_requests_function = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":72
+ *         self.state.mix_callback_function = NULL
+ *         self.state.process_requests_function = NULL
  *         self.state.type_state = NULL             # <<<<<<<<<<<<<<
  *         self.state.number = track_num
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
  */
   __pyx_v_self->state->type_state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":56
- *         self.state.mix_callback_function = NULL
+  /* "mpfmc/core/audio/track.pyx":73
+ *         self.state.process_requests_function = NULL
  *         self.state.type_state = NULL
  *         self.state.number = track_num             # <<<<<<<<<<<<<<
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
@@ -2108,7 +2399,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":57
+  /* "mpfmc/core/audio/track.pyx":74
  *         self.state.type_state = NULL
  *         self.state.number = track_num
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)             # <<<<<<<<<<<<<<
@@ -2117,34 +2408,43 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->buffer = ((Uint8 *)PyMem_Malloc(__pyx_v_buffer_size));
 
-  /* "mpfmc/core/audio/track.pyx":58
+  /* "mpfmc/core/audio/track.pyx":75
  *         self.state.number = track_num
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
  *         self.state.buffer_size = buffer_size             # <<<<<<<<<<<<<<
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
- *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ *         timing_stats_reset(&self.state.mix_timing)
  */
   __pyx_v_self->state->buffer_size = __pyx_v_buffer_size;
 
-  /* "mpfmc/core/audio/track.pyx":59
+  /* "mpfmc/core/audio/track.pyx":76
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
  *         self.state.buffer_size = buffer_size
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)             # <<<<<<<<<<<<<<
+ *         timing_stats_reset(&self.state.mix_timing)
  *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
- * 
  */
   __pyx_v_self->state->ducking_control_points = g_array_sized_new(0, 1, (sizeof(guint8)), __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER);
 
-  /* "mpfmc/core/audio/track.pyx":60
+  /* "mpfmc/core/audio/track.pyx":77
  *         self.state.buffer_size = buffer_size
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         timing_stats_reset(&self.state.mix_timing)             # <<<<<<<<<<<<<<
+ *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ * 
+ */
+  __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_reset((&__pyx_v_self->state->mix_timing));
+
+  /* "mpfmc/core/audio/track.pyx":78
+ *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         timing_stats_reset(&self.state.mix_timing)
  *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)             # <<<<<<<<<<<<<<
  * 
  *         # The easiest way to pass a C pointer in a constructor is to wrap it in a PyCapsule
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_buffer_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_buffer_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -2161,7 +2461,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -2170,14 +2470,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -2188,25 +2488,78 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
     __Pyx_GIVEREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_t_2);
     __pyx_t_2 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":65
+  /* "mpfmc/core/audio/track.pyx":83
  *         # (see https://docs.python.org/3.4/c-api/capsule.html).  This basically wraps the
  *         # pointer in a Python object. It can be extracted using PyCapsule_GetPointer.
  *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)             # <<<<<<<<<<<<<<
  * 
- *         self.state.status = track_status_playing
+ *         # Sounds are mixed into a float buffer when the float mix bus is used (one float per sample)
  */
-  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
   __pyx_v_self->state->callback_data = ((__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *)__pyx_t_7);
 
-  /* "mpfmc/core/audio/track.pyx":67
- *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
+  /* "mpfmc/core/audio/track.pyx":86
+ * 
+ *         # Sounds are mixed into a float buffer when the float mix bus is used (one float per sample)
+ *         self.state.float_buffer = NULL             # <<<<<<<<<<<<<<
+ *         if self.state.callback_data.float_mix:
+ *             self.state.float_buffer = <float *>PyMem_Malloc(
+ */
+  __pyx_v_self->state->float_buffer = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":87
+ *         # Sounds are mixed into a float buffer when the float mix bus is used (one float per sample)
+ *         self.state.float_buffer = NULL
+ *         if self.state.callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *             self.state.float_buffer = <float *>PyMem_Malloc(
+ *                 buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))
+ */
+  __pyx_t_8 = (__pyx_v_self->state->callback_data->float_mix != 0);
+  if (__pyx_t_8) {
+
+    /* "mpfmc/core/audio/track.pyx":89
+ *         if self.state.callback_data.float_mix:
+ *             self.state.float_buffer = <float *>PyMem_Malloc(
+ *                 buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))             # <<<<<<<<<<<<<<
+ * 
+ *         self.state.status = track_status_playing
+ */
+    if (unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 89, __pyx_L1_error)
+    }
+    else if (sizeof(int) == sizeof(long) && (!(((Uint8)-1) > 0)) && unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == (Uint8)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_v_buffer_size))) {
+      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+      __PYX_ERR(0, 89, __pyx_L1_error)
+    }
+
+    /* "mpfmc/core/audio/track.pyx":88
+ *         self.state.float_buffer = NULL
+ *         if self.state.callback_data.float_mix:
+ *             self.state.float_buffer = <float *>PyMem_Malloc(             # <<<<<<<<<<<<<<
+ *                 buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))
+ * 
+ */
+    __pyx_v_self->state->float_buffer = ((float *)PyMem_Malloc((__Pyx_div_int(__pyx_v_buffer_size, __pyx_v_self->state->callback_data->bytes_per_sample) * (sizeof(float)))));
+
+    /* "mpfmc/core/audio/track.pyx":87
+ *         # Sounds are mixed into a float buffer when the float mix bus is used (one float per sample)
+ *         self.state.float_buffer = NULL
+ *         if self.state.callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *             self.state.float_buffer = <float *>PyMem_Malloc(
+ *                 buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":91
+ *                 buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))
  * 
  *         self.state.status = track_status_playing             # <<<<<<<<<<<<<<
  *         self.state.fade_steps = 0
@@ -2214,7 +2567,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-  /* "mpfmc/core/audio/track.pyx":68
+  /* "mpfmc/core/audio/track.pyx":92
  * 
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -2223,7 +2576,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps = 0;
 
-  /* "mpfmc/core/audio/track.pyx":69
+  /* "mpfmc/core/audio/track.pyx":93
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -2232,7 +2585,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps_remaining = 0;
 
-  /* "mpfmc/core/audio/track.pyx":70
+  /* "mpfmc/core/audio/track.pyx":94
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
@@ -2240,22 +2593,22 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  *         self.state.fade_volume_current = new_volume
  */
   __pyx_t_5 = SDL_MIX_MAXVOLUME;
-  __pyx_t_8 = 0;
-  __pyx_t_9 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
-  if (((__pyx_t_8 > __pyx_t_9) != 0)) {
-    __pyx_t_10 = __pyx_t_8;
+  __pyx_t_9 = 0;
+  __pyx_t_10 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
+  if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+    __pyx_t_11 = __pyx_t_9;
   } else {
-    __pyx_t_10 = __pyx_t_9;
+    __pyx_t_11 = __pyx_t_10;
   }
-  __pyx_t_9 = __pyx_t_10;
-  if (((__pyx_t_5 < __pyx_t_9) != 0)) {
-    __pyx_t_10 = __pyx_t_5;
+  __pyx_t_10 = __pyx_t_11;
+  if (((__pyx_t_5 < __pyx_t_10) != 0)) {
+    __pyx_t_11 = __pyx_t_5;
   } else {
-    __pyx_t_10 = __pyx_t_9;
+    __pyx_t_11 = __pyx_t_10;
   }
-  __pyx_v_new_volume = ((Uint8)__pyx_t_10);
+  __pyx_v_new_volume = ((Uint8)__pyx_t_11);
 
-  /* "mpfmc/core/audio/track.pyx":71
+  /* "mpfmc/core/audio/track.pyx":95
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -2264,7 +2617,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":72
+  /* "mpfmc/core/audio/track.pyx":96
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
@@ -2273,7 +2626,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":73
+  /* "mpfmc/core/audio/track.pyx":97
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
@@ -2282,25 +2635,34 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":74
+  /* "mpfmc/core/audio/track.pyx":98
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume
  *         self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
  * 
- *         self.state.notification_messages = NULL
+ *         # Notifications are passed from the audio callback to the track without the mixer lock
  */
   __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":76
- *         self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":101
  * 
- *         self.state.notification_messages = NULL             # <<<<<<<<<<<<<<
+ *         # Notifications are passed from the audio callback to the track without the mixer lock
+ *         self.state.notification_messages = message_ring_create(NOTIFICATION_RING_SIZE,             # <<<<<<<<<<<<<<
+ *                                                                sizeof(NotificationMessageContainer))
+ *         self._dropped_notifications = 0
+ */
+  __pyx_v_self->state->notification_messages = __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_create(__pyx_e_5mpfmc_4core_5audio_5track_NOTIFICATION_RING_SIZE, (sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer)));
+
+  /* "mpfmc/core/audio/track.pyx":103
+ *         self.state.notification_messages = message_ring_create(NOTIFICATION_RING_SIZE,
+ *                                                                sizeof(NotificationMessageContainer))
+ *         self._dropped_notifications = 0             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_v_self->state->notification_messages = NULL;
+  __pyx_v_self->_dropped_notifications = 0;
 
-  /* "mpfmc/core/audio/track.pyx":33
+  /* "mpfmc/core/audio/track.pyx":49
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -2324,12 +2686,12 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":78
- *         self.state.notification_messages = NULL
+/* "mpfmc/core/audio/track.pyx":105
+ *         self._dropped_notifications = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
- *         SDL_LockAudio()
+ *         # No lock is needed, the audio interface does not mix any more when its tracks are freed
  */
 
 /* Python wrapper */
@@ -2347,56 +2709,56 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":80
- *     def __dealloc__(self):
- *         """Destructor"""
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
- *         g_array_free(self.state.ducking_control_points, True)
- *         PyMem_Free(self.state)
- */
-  SDL_LockAudio();
-
-  /* "mpfmc/core/audio/track.pyx":81
+  /* "mpfmc/core/audio/track.pyx":108
  *         """Destructor"""
- *         SDL_LockAudio()
+ *         # No lock is needed, the audio interface does not mix any more when its tracks are freed
  *         g_array_free(self.state.ducking_control_points, True)             # <<<<<<<<<<<<<<
- *         PyMem_Free(self.state)
- *         SDL_UnlockAudio()
+ *         message_ring_free(self.state.notification_messages)
+ *         PyMem_Free(self.state.float_buffer)
  */
   (void)(g_array_free(__pyx_v_self->state->ducking_control_points, 1));
 
-  /* "mpfmc/core/audio/track.pyx":82
- *         SDL_LockAudio()
+  /* "mpfmc/core/audio/track.pyx":109
+ *         # No lock is needed, the audio interface does not mix any more when its tracks are freed
  *         g_array_free(self.state.ducking_control_points, True)
- *         PyMem_Free(self.state)             # <<<<<<<<<<<<<<
- *         SDL_UnlockAudio()
- * 
+ *         message_ring_free(self.state.notification_messages)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state.float_buffer)
+ *         PyMem_Free(self.state)
  */
-  PyMem_Free(__pyx_v_self->state);
+  __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_free(__pyx_v_self->state->notification_messages);
 
-  /* "mpfmc/core/audio/track.pyx":83
+  /* "mpfmc/core/audio/track.pyx":110
  *         g_array_free(self.state.ducking_control_points, True)
+ *         message_ring_free(self.state.notification_messages)
+ *         PyMem_Free(self.state.float_buffer)             # <<<<<<<<<<<<<<
  *         PyMem_Free(self.state)
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ * 
+ */
+  PyMem_Free(__pyx_v_self->state->float_buffer);
+
+  /* "mpfmc/core/audio/track.pyx":111
+ *         message_ring_free(self.state.notification_messages)
+ *         PyMem_Free(self.state.float_buffer)
+ *         PyMem_Free(self.state)             # <<<<<<<<<<<<<<
  * 
  *     def __repr__(self):
  */
-  SDL_UnlockAudio();
+  PyMem_Free(__pyx_v_self->state);
 
-  /* "mpfmc/core/audio/track.pyx":78
- *         self.state.notification_messages = NULL
+  /* "mpfmc/core/audio/track.pyx":105
+ *         self._dropped_notifications = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
- *         SDL_LockAudio()
+ *         # No lock is needed, the audio interface does not mix any more when its tracks are freed
  */
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/track.pyx":85
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":113
+ *         PyMem_Free(self.state)
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<Track.{}.{}>'.format(self.number, self.name)
@@ -2431,7 +2793,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":86
+  /* "mpfmc/core/audio/track.pyx":114
  * 
  *     def __repr__(self):
  *         return '<Track.{}.{}>'.format(self.number, self.name)             # <<<<<<<<<<<<<<
@@ -2439,11 +2801,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
  *     cdef TrackState *get_state(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
   __pyx_t_6 = 0;
@@ -2460,7 +2822,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2470,7 +2832,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2478,7 +2840,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   } else
   #endif
   {
-    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     if (__pyx_t_5) {
       __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2489,7 +2851,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
     PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
     __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
@@ -2498,8 +2860,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":85
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":113
+ *         PyMem_Free(self.state)
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<Track.{}.{}>'.format(self.number, self.name)
@@ -2522,7 +2884,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":88
+/* "mpfmc/core/audio/track.pyx":116
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2535,17 +2897,17 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_state", 0);
 
-  /* "mpfmc/core/audio/track.pyx":89
+  /* "mpfmc/core/audio/track.pyx":117
  * 
  *     cdef TrackState *get_state(self):
  *         return self.state             # <<<<<<<<<<<<<<
  * 
- *     property name:
+ *     cdef void _check_dropped_notifications(self):
  */
   __pyx_r = __pyx_v_self->state;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":88
+  /* "mpfmc/core/audio/track.pyx":116
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2559,68 +2921,209 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":92
- * 
- *     property name:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self._name
+/* "mpfmc/core/audio/track.pyx":119
+ *         return self.state
  * 
+ *     cdef void _check_dropped_notifications(self):             # <<<<<<<<<<<<<<
+ *         """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track__check_dropped_notifications(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__get__", 0);
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Uint32 __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_check_dropped_notifications", 0);
 
-  /* "mpfmc/core/audio/track.pyx":93
- *     property name:
- *         def __get__(self):
- *             return self._name             # <<<<<<<<<<<<<<
- * 
- *     property volume:
+  /* "mpfmc/core/audio/track.pyx":121
+ *     cdef void _check_dropped_notifications(self):
+ *         """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:             # <<<<<<<<<<<<<<
+ *             self.log.warning("%d notification messages were dropped because the notification ring was full",
+ *                              self.state.notification_messages.dropped - self._dropped_notifications)
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_self->_name);
-  __pyx_r = __pyx_v_self->_name;
-  goto __pyx_L0;
+  __pyx_t_1 = ((__pyx_v_self->state->notification_messages->dropped != __pyx_v_self->_dropped_notifications) != 0);
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/track.pyx":92
- * 
- *     property name:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return self._name
- * 
+    /* "mpfmc/core/audio/track.pyx":122
+ *         """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:
+ *             self.log.warning("%d notification messages were dropped because the notification ring was full",             # <<<<<<<<<<<<<<
+ *                              self.state.notification_messages.dropped - self._dropped_notifications)
+ *             self._dropped_notifications = self.state.notification_messages.dropped
  */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
 
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "mpfmc/core/audio/track.pyx":96
- * 
- *     property volume:
- *         def __get__(self):             # <<<<<<<<<<<<<<
- *             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)
+    /* "mpfmc/core/audio/track.pyx":123
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:
+ *             self.log.warning("%d notification messages were dropped because the notification ring was full",
+ *                              self.state.notification_messages.dropped - self._dropped_notifications)             # <<<<<<<<<<<<<<
+ *             self._dropped_notifications = self.state.notification_messages.dropped
  * 
  */
-
-/* Python wrapper */
+    __pyx_t_4 = __Pyx_PyInt_From_Uint32((__pyx_v_self->state->notification_messages->dropped - __pyx_v_self->_dropped_notifications)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 123, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_d_notification_messages_were_dr, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 122, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_d_notification_messages_were_dr, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 122, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(__pyx_kp_u_d_notification_messages_were_dr);
+      __Pyx_GIVEREF(__pyx_kp_u_d_notification_messages_were_dr);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_d_notification_messages_were_dr);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 122, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":124
+ *             self.log.warning("%d notification messages were dropped because the notification ring was full",
+ *                              self.state.notification_messages.dropped - self._dropped_notifications)
+ *             self._dropped_notifications = self.state.notification_messages.dropped             # <<<<<<<<<<<<<<
+ * 
+ *     property name:
+ */
+    __pyx_t_8 = __pyx_v_self->state->notification_messages->dropped;
+    __pyx_v_self->_dropped_notifications = __pyx_t_8;
+
+    /* "mpfmc/core/audio/track.pyx":121
+ *     cdef void _check_dropped_notifications(self):
+ *         """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:             # <<<<<<<<<<<<<<
+ *             self.log.warning("%d notification messages were dropped because the notification ring was full",
+ *                              self.state.notification_messages.dropped - self._dropped_notifications)
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":119
+ *         return self.state
+ * 
+ *     cdef void _check_dropped_notifications(self):             # <<<<<<<<<<<<<<
+ *         """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+ *         if self.state.notification_messages.dropped != self._dropped_notifications:
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track._check_dropped_notifications", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/core/audio/track.pyx":127
+ * 
+ *     property name:
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._name
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/core/audio/track.pyx":128
+ *     property name:
+ *         def __get__(self):
+ *             return self._name             # <<<<<<<<<<<<<<
+ * 
+ *     property volume:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->_name);
+  __pyx_r = __pyx_v_self->_name;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":127
+ * 
+ *     property name:
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._name
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":131
+ * 
+ *     property volume:
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)
+ * 
+ */
+
+/* Python wrapper */
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_6volume_1__get__(PyObject *__pyx_v_self); /*proto*/
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_6volume_1__get__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
@@ -2643,7 +3146,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":97
+  /* "mpfmc/core/audio/track.pyx":132
  *     property volume:
  *         def __get__(self):
  *             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)             # <<<<<<<<<<<<<<
@@ -2653,11 +3156,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_XDECREF(__pyx_r);
   if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 97, __pyx_L1_error)
+    __PYX_ERR(0, 132, __pyx_L1_error)
   }
-  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -2665,14 +3168,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_GIVEREF(__pyx_int_2);
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_2);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":96
+  /* "mpfmc/core/audio/track.pyx":131
  * 
  *     property volume:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2692,7 +3195,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":100
+/* "mpfmc/core/audio/track.pyx":135
  * 
  *     @property
  *     def type(self):             # <<<<<<<<<<<<<<
@@ -2722,20 +3225,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":101
+  /* "mpfmc/core/audio/track.pyx":136
  *     @property
  *     def type(self):
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 101, __pyx_L1_error)
+  __PYX_ERR(0, 136, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":100
+  /* "mpfmc/core/audio/track.pyx":135
  * 
  *     @property
  *     def type(self):             # <<<<<<<<<<<<<<
@@ -2753,7 +3256,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":104
+/* "mpfmc/core/audio/track.pyx":139
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2786,77 +3289,77 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":106
+  /* "mpfmc/core/audio/track.pyx":141
  *     def number(self):
  *         """Return the track number"""
  *         cdef int number = -1             # <<<<<<<<<<<<<<
  *         if self.state != NULL:
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  */
   __pyx_v_number = -1;
 
-  /* "mpfmc/core/audio/track.pyx":107
+  /* "mpfmc/core/audio/track.pyx":142
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             number = self.state.number
  */
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":108
+    /* "mpfmc/core/audio/track.pyx":143
  *         cdef int number = -1
  *         if self.state != NULL:
- *             SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  *             number = self.state.number
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  */
-    SDL_LockAudio();
+    (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-    /* "mpfmc/core/audio/track.pyx":109
+    /* "mpfmc/core/audio/track.pyx":144
  *         if self.state != NULL:
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             number = self.state.number             # <<<<<<<<<<<<<<
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  *         return number
  */
     __pyx_t_2 = __pyx_v_self->state->number;
     __pyx_v_number = __pyx_t_2;
 
-    /* "mpfmc/core/audio/track.pyx":110
- *             SDL_LockAudio()
+    /* "mpfmc/core/audio/track.pyx":145
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             number = self.state.number
- *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  *         return number
  * 
  */
-    SDL_UnlockAudio();
+    (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-    /* "mpfmc/core/audio/track.pyx":107
+    /* "mpfmc/core/audio/track.pyx":142
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             number = self.state.number
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":111
+  /* "mpfmc/core/audio/track.pyx":146
  *             number = self.state.number
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  *         return number             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":104
+  /* "mpfmc/core/audio/track.pyx":139
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2875,7 +3378,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":114
+/* "mpfmc/core/audio/track.pyx":149
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2901,7 +3404,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":116
+  /* "mpfmc/core/audio/track.pyx":151
  *     def events_when_stopped(self):
  *         """Return the list of events that are posted when the track is stopped"""
  *         return self._events_when_stopped             # <<<<<<<<<<<<<<
@@ -2913,7 +3416,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __pyx_r = __pyx_v_self->_events_when_stopped;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":114
+  /* "mpfmc/core/audio/track.pyx":149
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2928,7 +3431,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":119
+/* "mpfmc/core/audio/track.pyx":154
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2958,14 +3461,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":121
+  /* "mpfmc/core/audio/track.pyx":156
  *     def events_when_stopped(self, events):
  *         """Sets the list of events that are posted when the track is stopped"""
  *         self._events_when_stopped = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 121, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 156, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2974,7 +3477,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   __pyx_v_self->_events_when_stopped = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":119
+  /* "mpfmc/core/audio/track.pyx":154
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2994,7 +3497,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":124
+/* "mpfmc/core/audio/track.pyx":159
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -3020,7 +3523,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":126
+  /* "mpfmc/core/audio/track.pyx":161
  *     def events_when_played(self):
  *         """Return the list of events that are posted when the track is played"""
  *         return self._events_when_played             # <<<<<<<<<<<<<<
@@ -3032,7 +3535,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __pyx_r = __pyx_v_self->_events_when_played;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":124
+  /* "mpfmc/core/audio/track.pyx":159
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -3047,7 +3550,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":129
+/* "mpfmc/core/audio/track.pyx":164
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -3077,14 +3580,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":131
+  /* "mpfmc/core/audio/track.pyx":166
  *     def events_when_played(self, events):
  *         """Sets the list of events that are posted when the track is played"""
  *         self._events_when_played = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 131, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 166, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3093,7 +3596,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   __pyx_v_self->_events_when_played = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":129
+  /* "mpfmc/core/audio/track.pyx":164
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -3113,7 +3616,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":134
+/* "mpfmc/core/audio/track.pyx":169
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -3139,7 +3642,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":136
+  /* "mpfmc/core/audio/track.pyx":171
  *     def events_when_paused(self):
  *         """Return the list of events that are posted when the track is paused"""
  *         return self._events_when_paused             # <<<<<<<<<<<<<<
@@ -3151,7 +3654,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __pyx_r = __pyx_v_self->_events_when_paused;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":134
+  /* "mpfmc/core/audio/track.pyx":169
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -3166,7 +3669,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":139
+/* "mpfmc/core/audio/track.pyx":174
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -3196,14 +3699,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":141
+  /* "mpfmc/core/audio/track.pyx":176
  *     def events_when_paused(self, events):
  *         """Sets the list of events that are posted when the track is paused"""
  *         self._events_when_paused = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 176, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3212,7 +3715,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   __pyx_v_self->_events_when_paused = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":139
+  /* "mpfmc/core/audio/track.pyx":174
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -3232,7 +3735,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":144
+/* "mpfmc/core/audio/track.pyx":179
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -3262,20 +3765,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":146
+  /* "mpfmc/core/audio/track.pyx":181
  *     def supports_in_memory_sounds(self):
  *         """Return whether or not track supports in-memory sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 146, __pyx_L1_error)
+  __PYX_ERR(0, 181, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":144
+  /* "mpfmc/core/audio/track.pyx":179
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -3293,7 +3796,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":149
+/* "mpfmc/core/audio/track.pyx":184
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -3323,20 +3826,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":151
+  /* "mpfmc/core/audio/track.pyx":186
  *     def supports_streaming_sounds(self):
  *         """Return whether or not track supports streaming sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 151, __pyx_L1_error)
+  __PYX_ERR(0, 186, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":149
+  /* "mpfmc/core/audio/track.pyx":184
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -3354,7 +3857,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":154
+/* "mpfmc/core/audio/track.pyx":189
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -3386,76 +3889,76 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":156
+  /* "mpfmc/core/audio/track.pyx":191
  *     def fading(self):
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False             # <<<<<<<<<<<<<<
  *         if self.state != NULL:
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  */
   __pyx_v_fading = 0;
 
-  /* "mpfmc/core/audio/track.pyx":157
+  /* "mpfmc/core/audio/track.pyx":192
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             fading = self.state.fade_steps_remaining > 0
  */
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":158
+    /* "mpfmc/core/audio/track.pyx":193
  *         cdef bint fading = False
  *         if self.state != NULL:
- *             SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  *             fading = self.state.fade_steps_remaining > 0
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  */
-    SDL_LockAudio();
+    (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-    /* "mpfmc/core/audio/track.pyx":159
+    /* "mpfmc/core/audio/track.pyx":194
  *         if self.state != NULL:
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             fading = self.state.fade_steps_remaining > 0             # <<<<<<<<<<<<<<
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  *         return fading
  */
     __pyx_v_fading = (__pyx_v_self->state->fade_steps_remaining > 0);
 
-    /* "mpfmc/core/audio/track.pyx":160
- *             SDL_LockAudio()
+    /* "mpfmc/core/audio/track.pyx":195
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             fading = self.state.fade_steps_remaining > 0
- *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  *         return fading
  * 
  */
-    SDL_UnlockAudio();
+    (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-    /* "mpfmc/core/audio/track.pyx":157
+    /* "mpfmc/core/audio/track.pyx":192
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
- *             SDL_LockAudio()
+ *             SDL_LockMutex(self.state.callback_data.mixer_lock)
  *             fading = self.state.fade_steps_remaining > 0
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":161
+  /* "mpfmc/core/audio/track.pyx":196
  *             fading = self.state.fade_steps_remaining > 0
- *             SDL_UnlockAudio()
+ *             SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  *         return fading             # <<<<<<<<<<<<<<
  * 
  *     def clear_context(self, context):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":154
+  /* "mpfmc/core/audio/track.pyx":189
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -3474,7 +3977,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":163
+/* "mpfmc/core/audio/track.pyx":198
  *         return fading
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
@@ -3505,20 +4008,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHO
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("clear_context", 0);
 
-  /* "mpfmc/core/audio/track.pyx":165
+  /* "mpfmc/core/audio/track.pyx":200
  *     def clear_context(self, context):
  *         """Stop all sounds played from the specified context."""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 165, __pyx_L1_error)
+  __PYX_ERR(0, 200, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":163
+  /* "mpfmc/core/audio/track.pyx":198
  *         return fading
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
@@ -3536,7 +4039,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHO
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":167
+/* "mpfmc/core/audio/track.pyx":202
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -3583,7 +4086,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObjec
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 167, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 202, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3594,16 +4097,16 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObjec
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L3_error)
+    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
     if (values[1]) {
-      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L3_error)
+      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
     } else {
       __pyx_v_fade_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 167, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 202, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3637,11 +4140,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_volume", 0);
 
-  /* "mpfmc/core/audio/track.pyx":169
+  /* "mpfmc/core/audio/track.pyx":204
  *     def set_volume(self, float volume, float fade_seconds = 0.0):
  *         """Sets the current track volume with an optional fade time"""
  *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
- *         SDL_LockAudio()
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
  * 
  */
   __pyx_t_1 = SDL_MIX_MAXVOLUME;
@@ -3660,16 +4163,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   }
   __pyx_v_new_volume = ((Uint8)__pyx_t_4);
 
-  /* "mpfmc/core/audio/track.pyx":170
+  /* "mpfmc/core/audio/track.pyx":205
  *         """Sets the current track volume with an optional fade time"""
  *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *         # Fades require special logic
  */
-  SDL_LockAudio();
+  (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":173
+  /* "mpfmc/core/audio/track.pyx":208
  * 
  *         # Fades require special logic
  *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3679,7 +4182,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   __pyx_t_5 = ((__pyx_v_fade_seconds > 0.0) != 0);
   if (__pyx_t_5) {
 
-    /* "mpfmc/core/audio/track.pyx":174
+    /* "mpfmc/core/audio/track.pyx":209
  *         # Fades require special logic
  *         if fade_seconds > 0:
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -3690,7 +4193,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
       case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-      /* "mpfmc/core/audio/track.pyx":176
+      /* "mpfmc/core/audio/track.pyx":211
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
  *                 # Fade is ignored if track is in the process of stopping or pausing
  *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3699,7 +4202,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":174
+      /* "mpfmc/core/audio/track.pyx":209
  *         # Fades require special logic
  *         if fade_seconds > 0:
  *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -3709,7 +4212,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       break;
       default:
 
-      /* "mpfmc/core/audio/track.pyx":181
+      /* "mpfmc/core/audio/track.pyx":216
  *                 # will be interrupted and a new fade will be calculated from the current
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -3719,14 +4222,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_5 = ((__pyx_v_self->state->fade_steps_remaining > 0) != 0);
       if (__pyx_t_5) {
 
-        /* "mpfmc/core/audio/track.pyx":182
+        /* "mpfmc/core/audio/track.pyx":217
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:
  *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
  *                                    "start a new fade")
  * 
  */
-        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 182, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 217, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __pyx_t_8 = NULL;
         if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
@@ -3740,12 +4243,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
         }
         __pyx_t_6 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_kp_u_set_volume_Interrupting_an_exist) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_kp_u_set_volume_Interrupting_an_exist);
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 182, __pyx_L1_error)
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 217, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":181
+        /* "mpfmc/core/audio/track.pyx":216
  *                 # will be interrupted and a new fade will be calculated from the current
  *                 # point of the existing fade
  *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -3754,18 +4257,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       }
 
-      /* "mpfmc/core/audio/track.pyx":185
+      /* "mpfmc/core/audio/track.pyx":220
  *                                    "start a new fade")
  * 
  *                 self.log.debug("set_volume - Applying %s second fade to new volume level", str(fade_seconds))             # <<<<<<<<<<<<<<
  * 
  *                 # Calculate fade
  */
-      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 220, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 220, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 220, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __pyx_t_8 = NULL;
@@ -3783,7 +4286,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_7)) {
         PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_9};
-        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 220, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -3792,14 +4295,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
         PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_9};
-        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 220, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       } else
       #endif
       {
-        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 220, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_10);
         if (__pyx_t_8) {
           __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
@@ -3810,14 +4313,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
         __Pyx_GIVEREF(__pyx_t_9);
         PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_1, __pyx_t_9);
         __pyx_t_9 = 0;
-        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 220, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
       }
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":188
+      /* "mpfmc/core/audio/track.pyx":223
  * 
  *                 # Calculate fade
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -3827,11 +4330,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_11 = ((Uint32)(__pyx_v_fade_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 188, __pyx_L1_error)
+        __PYX_ERR(0, 223, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_11 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":189
+      /* "mpfmc/core/audio/track.pyx":224
  *                 # Calculate fade
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -3841,7 +4344,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_11 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_11;
 
-      /* "mpfmc/core/audio/track.pyx":190
+      /* "mpfmc/core/audio/track.pyx":225
  *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -3851,7 +4354,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       __pyx_t_12 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_12;
 
-      /* "mpfmc/core/audio/track.pyx":191
+      /* "mpfmc/core/audio/track.pyx":226
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
@@ -3860,7 +4363,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
       __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":192
+      /* "mpfmc/core/audio/track.pyx":227
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = new_volume
  *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3871,7 +4374,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
       break;
     }
 
-    /* "mpfmc/core/audio/track.pyx":173
+    /* "mpfmc/core/audio/track.pyx":208
  * 
  *         # Fades require special logic
  *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
@@ -3881,7 +4384,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
     goto __pyx_L3;
   }
 
-  /* "mpfmc/core/audio/track.pyx":194
+  /* "mpfmc/core/audio/track.pyx":229
  *                 self.state.volume = new_volume
  *         else:
  *             self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -3891,7 +4394,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   /*else*/ {
     __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":195
+    /* "mpfmc/core/audio/track.pyx":230
  *         else:
  *             self.state.volume = new_volume
  *             self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
@@ -3900,7 +4403,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
     __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":196
+    /* "mpfmc/core/audio/track.pyx":231
  *             self.state.volume = new_volume
  *             self.state.fade_volume_current = new_volume
  *             self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
@@ -3909,27 +4412,27 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
  */
     __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-    /* "mpfmc/core/audio/track.pyx":197
+    /* "mpfmc/core/audio/track.pyx":232
  *             self.state.fade_volume_current = new_volume
  *             self.state.fade_volume_start = new_volume
  *             self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
  * 
- *         SDL_UnlockAudio()
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  */
     __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
   }
   __pyx_L3:;
 
-  /* "mpfmc/core/audio/track.pyx":199
+  /* "mpfmc/core/audio/track.pyx":234
  *             self.state.fade_volume_target = new_volume
  * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *     def play(self, float fade_in_seconds = 0.0):
  */
-  SDL_UnlockAudio();
+  (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":167
+  /* "mpfmc/core/audio/track.pyx":202
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -3954,8 +4457,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":201
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":236
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -3994,7 +4497,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 201, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 236, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4005,14 +4508,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
       }
     }
     if (values[0]) {
-      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 201, __pyx_L3_error)
+      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 236, __pyx_L3_error)
     } else {
       __pyx_v_fade_in_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 201, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 236, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4046,14 +4549,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("play", 0);
 
-  /* "mpfmc/core/audio/track.pyx":208
+  /* "mpfmc/core/audio/track.pyx":243
  *             fade_in_seconds: The number of seconds to fade in the track
  *         """
  *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
  * 
- *         SDL_LockAudio()
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4067,21 +4570,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_play_Begin_sound_processing_on_t) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_play_Begin_sound_processing_on_t);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":210
+  /* "mpfmc/core/audio/track.pyx":245
  *         self.log.debug("play - Begin sound processing on track")
  * 
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  */
-  SDL_LockAudio();
+  (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":213
+  /* "mpfmc/core/audio/track.pyx":248
  * 
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
@@ -4092,7 +4595,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
 
-    /* "mpfmc/core/audio/track.pyx":214
+    /* "mpfmc/core/audio/track.pyx":249
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \
  *                         self.state.status == track_status_stopped or \             # <<<<<<<<<<<<<<
@@ -4101,7 +4604,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
 
-    /* "mpfmc/core/audio/track.pyx":216
+    /* "mpfmc/core/audio/track.pyx":251
  *                         self.state.status == track_status_stopped or \
  *                         self.state.status == track_status_stopping:
  *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4111,18 +4614,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     __pyx_t_4 = ((__pyx_v_fade_in_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":218
+      /* "mpfmc/core/audio/track.pyx":253
  *             if fade_in_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 253, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 253, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -4140,7 +4643,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4149,14 +4652,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 253, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -4167,14 +4670,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":219
+      /* "mpfmc/core/audio/track.pyx":254
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -4184,11 +4687,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_in_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 219, __pyx_L1_error)
+        __PYX_ERR(0, 254, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":220
+      /* "mpfmc/core/audio/track.pyx":255
  *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -4198,7 +4701,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":221
+      /* "mpfmc/core/audio/track.pyx":256
  *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -4208,7 +4711,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":222
+      /* "mpfmc/core/audio/track.pyx":257
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
@@ -4218,7 +4721,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_target = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":216
+      /* "mpfmc/core/audio/track.pyx":251
  *                         self.state.status == track_status_stopped or \
  *                         self.state.status == track_status_stopping:
  *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4228,7 +4731,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":225
+    /* "mpfmc/core/audio/track.pyx":260
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -4238,7 +4741,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":226
+      /* "mpfmc/core/audio/track.pyx":261
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -4247,7 +4750,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":227
+      /* "mpfmc/core/audio/track.pyx":262
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = self.state.volume             # <<<<<<<<<<<<<<
@@ -4257,7 +4760,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_current = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":228
+      /* "mpfmc/core/audio/track.pyx":263
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = self.state.volume
  *                 self.state.fade_volume_start = self.state.volume             # <<<<<<<<<<<<<<
@@ -4267,7 +4770,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->volume;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":229
+      /* "mpfmc/core/audio/track.pyx":264
  *                 self.state.fade_volume_current = self.state.volume
  *                 self.state.fade_volume_start = self.state.volume
  *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
@@ -4279,7 +4782,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":231
+    /* "mpfmc/core/audio/track.pyx":266
  *                 self.state.fade_volume_target = self.state.volume
  * 
  *             self.state.status = track_status_playing             # <<<<<<<<<<<<<<
@@ -4288,36 +4791,36 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-    /* "mpfmc/core/audio/track.pyx":234
+    /* "mpfmc/core/audio/track.pyx":269
  * 
  *             # Trigger any events
  *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
  *                 for event in self.events_when_played:
  *                     self.mc.post_mc_native_event(event, track=self._name)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_4 = (__pyx_t_1 != Py_None);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_10 = (__pyx_t_4 != 0);
     if (__pyx_t_10) {
 
-      /* "mpfmc/core/audio/track.pyx":235
+      /* "mpfmc/core/audio/track.pyx":270
  *             # Trigger any events
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
  *                     self.mc.post_mc_native_event(event, track=self._name)
  *         else:
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
         __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_11 = 0;
         __pyx_t_12 = NULL;
       } else {
-        __pyx_t_11 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+        __pyx_t_11 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_12 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 235, __pyx_L1_error)
+        __pyx_t_12 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 270, __pyx_L1_error)
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       for (;;) {
@@ -4325,17 +4828,17 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
           if (likely(PyList_CheckExact(__pyx_t_2))) {
             if (__pyx_t_11 >= PyList_GET_SIZE(__pyx_t_2)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 270, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_1);
             #endif
           } else {
             if (__pyx_t_11 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_11); __Pyx_INCREF(__pyx_t_1); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 270, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_1);
             #endif
           }
@@ -4345,7 +4848,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 235, __pyx_L1_error)
+              else __PYX_ERR(0, 270, __pyx_L1_error)
             }
             break;
           }
@@ -4354,31 +4857,31 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
         __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_1);
         __pyx_t_1 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":236
+        /* "mpfmc/core/audio/track.pyx":271
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:
  *                     self.mc.post_mc_native_event(event, track=self._name)             # <<<<<<<<<<<<<<
  *         else:
  *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "
  */
-        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 271, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_INCREF(__pyx_v_event);
         __Pyx_GIVEREF(__pyx_v_event);
         PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_event);
-        __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
+        if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 271, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 271, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-        /* "mpfmc/core/audio/track.pyx":235
+        /* "mpfmc/core/audio/track.pyx":270
  *             # Trigger any events
  *             if self.events_when_played is not None:
  *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
@@ -4388,7 +4891,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":234
+      /* "mpfmc/core/audio/track.pyx":269
  * 
  *             # Trigger any events
  *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
@@ -4397,7 +4900,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
  */
     }
 
-    /* "mpfmc/core/audio/track.pyx":213
+    /* "mpfmc/core/audio/track.pyx":248
  * 
  *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
@@ -4407,14 +4910,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":238
+    /* "mpfmc/core/audio/track.pyx":273
  *                     self.mc.post_mc_native_event(event, track=self._name)
  *         else:
  *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
  *                              "of stopping; action will be ignored.")
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4428,24 +4931,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
     }
     __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_kp_u_play_Action_may_only_be_used_whe) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_play_Action_may_only_be_used_whe);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":241
+  /* "mpfmc/core/audio/track.pyx":276
  *                              "of stopping; action will be ignored.")
  * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *     def stop(self, float fade_out_seconds = 0.0):
  */
-  SDL_UnlockAudio();
+  (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":201
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":236
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -4470,8 +4973,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":243
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":278
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -4510,7 +5013,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 243, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 278, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4521,14 +5024,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 278, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 243, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 278, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4558,14 +5061,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop", 0);
 
-  /* "mpfmc/core/audio/track.pyx":250
+  /* "mpfmc/core/audio/track.pyx":285
  *             fade_out_seconds: The number of seconds to fade out the track
  *         """
  *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
  * 
- *         SDL_LockAudio()
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4579,21 +5082,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_stop_Stop_sound_processing_on_tr) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_stop_Stop_sound_processing_on_tr);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":252
+  /* "mpfmc/core/audio/track.pyx":287
  *         self.log.debug("stop - Stop sound processing on track and clear state")
  * 
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *         # Stop is only supported when a track is playing
  */
-  SDL_LockAudio();
+  (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":255
+  /* "mpfmc/core/audio/track.pyx":290
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4605,7 +5108,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/track.pyx":257
+    /* "mpfmc/core/audio/track.pyx":292
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4615,18 +5118,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     __pyx_t_4 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":259
+      /* "mpfmc/core/audio/track.pyx":294
  *             if fade_out_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 294, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 294, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 294, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -4644,7 +5147,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4653,14 +5156,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 294, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -4671,14 +5174,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":260
+      /* "mpfmc/core/audio/track.pyx":295
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -4688,11 +5191,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 260, __pyx_L1_error)
+        __PYX_ERR(0, 295, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":261
+      /* "mpfmc/core/audio/track.pyx":296
  *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -4702,7 +5205,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":262
+      /* "mpfmc/core/audio/track.pyx":297
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -4712,7 +5215,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":263
+      /* "mpfmc/core/audio/track.pyx":298
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4721,7 +5224,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":264
+      /* "mpfmc/core/audio/track.pyx":299
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopping             # <<<<<<<<<<<<<<
@@ -4730,7 +5233,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping;
 
-      /* "mpfmc/core/audio/track.pyx":257
+      /* "mpfmc/core/audio/track.pyx":292
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -4740,7 +5243,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":268
+    /* "mpfmc/core/audio/track.pyx":303
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -4750,7 +5253,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":269
+      /* "mpfmc/core/audio/track.pyx":304
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -4759,7 +5262,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":270
+      /* "mpfmc/core/audio/track.pyx":305
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
@@ -4768,7 +5271,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_current = 0;
 
-      /* "mpfmc/core/audio/track.pyx":271
+      /* "mpfmc/core/audio/track.pyx":306
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
@@ -4777,7 +5280,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_start = 0;
 
-      /* "mpfmc/core/audio/track.pyx":272
+      /* "mpfmc/core/audio/track.pyx":307
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -4786,7 +5289,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":273
+      /* "mpfmc/core/audio/track.pyx":308
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopped             # <<<<<<<<<<<<<<
@@ -4795,7 +5298,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-      /* "mpfmc/core/audio/track.pyx":274
+      /* "mpfmc/core/audio/track.pyx":309
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_stopped
  *                 send_track_stopped_notification(self.state)             # <<<<<<<<<<<<<<
@@ -4806,7 +5309,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":255
+    /* "mpfmc/core/audio/track.pyx":290
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -4816,14 +5319,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":277
+    /* "mpfmc/core/audio/track.pyx":312
  * 
  *         else:
  *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
  *                              "will be ignored.")
  * 
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 312, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4837,24 +5340,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
     }
     __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_7, __pyx_kp_u_stop_Action_may_only_be_used_whe) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_stop_Action_may_only_be_used_whe);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 312, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":280
+  /* "mpfmc/core/audio/track.pyx":315
  *                              "will be ignored.")
  * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *     def pause(self, float fade_out_seconds = 0.0):
  */
-  SDL_UnlockAudio();
+  (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":243
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":278
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -4878,8 +5381,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":282
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":317
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -4918,7 +5421,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 282, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 317, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4929,14 +5432,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 317, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 282, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 317, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4966,14 +5469,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pause", 0);
 
-  /* "mpfmc/core/audio/track.pyx":289
+  /* "mpfmc/core/audio/track.pyx":324
  *             fade_out_seconds: The number of seconds to fade out the track
  *         """
  *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
  * 
- *         SDL_LockAudio()
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4987,21 +5490,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_u_pause_Pause_sound_processing_on) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_pause_Pause_sound_processing_on);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":291
+  /* "mpfmc/core/audio/track.pyx":326
  *         self.log.debug("pause - Pause sound processing on track")
  * 
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *         # Stop is only supported when a track is playing
  */
-  SDL_LockAudio();
+  (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":294
+  /* "mpfmc/core/audio/track.pyx":329
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -5013,7 +5516,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/track.pyx":295
+    /* "mpfmc/core/audio/track.pyx":330
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -5023,18 +5526,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     __pyx_t_4 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "mpfmc/core/audio/track.pyx":297
+      /* "mpfmc/core/audio/track.pyx":332
  *             if fade_out_seconds > 0:
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 332, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 332, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 332, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -5052,7 +5555,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -5061,14 +5564,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 332, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -5079,14 +5582,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":298
+      /* "mpfmc/core/audio/track.pyx":333
  *                 # Calculate fade data (steps and volume)
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
@@ -5096,11 +5599,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 298, __pyx_L1_error)
+        __PYX_ERR(0, 333, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":299
+      /* "mpfmc/core/audio/track.pyx":334
  *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
@@ -5110,7 +5613,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":300
+      /* "mpfmc/core/audio/track.pyx":335
  *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
@@ -5120,7 +5623,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":301
+      /* "mpfmc/core/audio/track.pyx":336
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -5129,7 +5632,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":302
+      /* "mpfmc/core/audio/track.pyx":337
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_pausing             # <<<<<<<<<<<<<<
@@ -5138,7 +5641,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing;
 
-      /* "mpfmc/core/audio/track.pyx":295
+      /* "mpfmc/core/audio/track.pyx":330
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
@@ -5148,7 +5651,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":305
+    /* "mpfmc/core/audio/track.pyx":340
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -5158,7 +5661,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":306
+      /* "mpfmc/core/audio/track.pyx":341
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -5167,7 +5670,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":307
+      /* "mpfmc/core/audio/track.pyx":342
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
@@ -5176,7 +5679,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_current = 0;
 
-      /* "mpfmc/core/audio/track.pyx":308
+      /* "mpfmc/core/audio/track.pyx":343
  *                 self.state.fade_steps_remaining = 0
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
@@ -5185,7 +5688,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_start = 0;
 
-      /* "mpfmc/core/audio/track.pyx":309
+      /* "mpfmc/core/audio/track.pyx":344
  *                 self.state.fade_volume_current = 0
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
@@ -5194,7 +5697,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":310
+      /* "mpfmc/core/audio/track.pyx":345
  *                 self.state.fade_volume_start = 0
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_paused             # <<<<<<<<<<<<<<
@@ -5203,7 +5706,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
  */
       __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-      /* "mpfmc/core/audio/track.pyx":311
+      /* "mpfmc/core/audio/track.pyx":346
  *                 self.state.fade_volume_target = 0
  *                 self.state.status = track_status_paused
  *                 send_track_paused_notification(self.state)             # <<<<<<<<<<<<<<
@@ -5214,7 +5717,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":294
+    /* "mpfmc/core/audio/track.pyx":329
  * 
  *         # Stop is only supported when a track is playing
  *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
@@ -5224,14 +5727,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     break;
     default:
 
-    /* "mpfmc/core/audio/track.pyx":314
+    /* "mpfmc/core/audio/track.pyx":349
  * 
  *         else:
  *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
  *                              "will be ignored.")
  * 
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5245,24 +5748,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
     }
     __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_7, __pyx_kp_u_pause_Action_may_only_be_used_wh) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_u_pause_Action_may_only_be_used_wh);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":317
+  /* "mpfmc/core/audio/track.pyx":352
  *                              "will be ignored.")
  * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):
  */
-  SDL_UnlockAudio();
+  (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
 
-  /* "mpfmc/core/audio/track.pyx":282
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":317
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -5286,8 +5789,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":319
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":354
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -5326,7 +5829,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 319, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 354, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5337,14 +5840,14 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 319, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 354, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 319, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 354, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -5366,21 +5869,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CY
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop_all_sounds", 0);
 
-  /* "mpfmc/core/audio/track.pyx":325
+  /* "mpfmc/core/audio/track.pyx":360
  *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
  *         """
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     def process(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 325, __pyx_L1_error)
+  __PYX_ERR(0, 360, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":319
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":354
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
@@ -5397,7 +5900,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CY
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":327
+/* "mpfmc/core/audio/track.pyx":362
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def process(self):             # <<<<<<<<<<<<<<
@@ -5428,20 +5931,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("process", 0);
 
-  /* "mpfmc/core/audio/track.pyx":329
+  /* "mpfmc/core/audio/track.pyx":364
  *     def process(self):
  *         """Processes the track queue each tick."""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
- * 
+ *     def get_mix_timing(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 329, __pyx_L1_error)
+  __PYX_ERR(0, 364, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":327
+  /* "mpfmc/core/audio/track.pyx":362
  *         raise NotImplementedError('Must be overridden in derived class')
  * 
  *     def process(self):             # <<<<<<<<<<<<<<
@@ -5459,61 +5962,258 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":343
+/* "mpfmc/core/audio/track.pyx":366
+ *         raise NotImplementedError('Must be overridden in derived class')
  * 
- *     @staticmethod
- *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
- *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *     def get_mix_timing(self):             # <<<<<<<<<<<<<<
  *         """
+ *         Get the timing statistics of the mix callback of the track (see
  */
 
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
-  Uint8 *__pyx_v_track_buffer;
-  Uint32 __pyx_v_output_buffer_bytes_remaining;
-  Uint32 __pyx_v_current_chunk_bytes;
-  Uint32 __pyx_v_buffer_pos;
-  Uint8 __pyx_v_control_point;
-  Uint8 __pyx_v_ducking_volume;
-  Uint8 __pyx_v_track_volume;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Uint16 __pyx_t_3;
-  Uint32 __pyx_t_4;
-  Uint32 __pyx_t_5;
-  Uint8 __pyx_t_6;
-  int __pyx_t_7;
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23get_mix_timing(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22get_mix_timing[] = "Track.get_mix_timing(self)\n\n        Get the timing statistics of the mix callback of the track (see\n        AudioInterface.get_timing_stats).\n        Returns:\n            A dictionary containing the count, min, mean, p99 and max duration (in ms), the mean\n            share of the buffer duration and the number of mixes which took longer than a buffer.\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23get_mix_timing(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_mix_timing (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_22get_mix_timing(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22get_mix_timing(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_mix_timing", 0);
 
-  /* "mpfmc/core/audio/track.pyx":356
+  /* "mpfmc/core/audio/track.pyx":374
+ *             share of the buffer duration and the number of mixes which took longer than a buffer.
+ *         """
+ *         return timing_stats_to_dict(&self.state.mix_timing, self.state.callback_data.period_ticks)             # <<<<<<<<<<<<<<
  * 
- *         cdef Uint8 *track_buffer
- *         cdef Uint32 output_buffer_bytes_remaining = buffer_length             # <<<<<<<<<<<<<<
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0
+ *     def get_mix_timing_histogram(self):
  */
-  __pyx_v_output_buffer_bytes_remaining = __pyx_v_buffer_length;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_to_dict((&__pyx_v_self->state->mix_timing), __pyx_v_self->state->callback_data->period_ticks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":358
- *         cdef Uint32 output_buffer_bytes_remaining = buffer_length
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- *         cdef Uint8 control_point = 0
- *         cdef Uint8 ducking_volume
+  /* "mpfmc/core/audio/track.pyx":366
+ *         raise NotImplementedError('Must be overridden in derived class')
+ * 
+ *     def get_mix_timing(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Get the timing statistics of the mix callback of the track (see
  */
-  __pyx_v_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/track.pyx":359
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0
- *         cdef Uint8 control_point = 0             # <<<<<<<<<<<<<<
- *         cdef Uint8 ducking_volume
- *         cdef Uint8 track_volume
- */
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.get_mix_timing", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":376
+ *         return timing_stats_to_dict(&self.state.mix_timing, self.state.callback_data.period_ticks)
+ * 
+ *     def get_mix_timing_histogram(self):             # <<<<<<<<<<<<<<
+ *         """Get the bin counts of the timing histogram of the mix callback of the track."""
+ *         return timing_stats_histogram(&self.state.mix_timing)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25get_mix_timing_histogram(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24get_mix_timing_histogram[] = "Track.get_mix_timing_histogram(self)\nGet the bin counts of the timing histogram of the mix callback of the track.";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25get_mix_timing_histogram(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_mix_timing_histogram (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_24get_mix_timing_histogram(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24get_mix_timing_histogram(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_mix_timing_histogram", 0);
+
+  /* "mpfmc/core/audio/track.pyx":378
+ *     def get_mix_timing_histogram(self):
+ *         """Get the bin counts of the timing histogram of the mix callback of the track."""
+ *         return timing_stats_histogram(&self.state.mix_timing)             # <<<<<<<<<<<<<<
+ * 
+ *     def reset_mix_timing(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_histogram((&__pyx_v_self->state->mix_timing)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":376
+ *         return timing_stats_to_dict(&self.state.mix_timing, self.state.callback_data.period_ticks)
+ * 
+ *     def get_mix_timing_histogram(self):             # <<<<<<<<<<<<<<
+ *         """Get the bin counts of the timing histogram of the mix callback of the track."""
+ *         return timing_stats_histogram(&self.state.mix_timing)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.get_mix_timing_histogram", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":380
+ *         return timing_stats_histogram(&self.state.mix_timing)
+ * 
+ *     def reset_mix_timing(self):             # <<<<<<<<<<<<<<
+ *         """Resets the timing statistics of the mix callback of the track."""
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27reset_mix_timing(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_26reset_mix_timing[] = "Track.reset_mix_timing(self)\nResets the timing statistics of the mix callback of the track.";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27reset_mix_timing(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset_mix_timing (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_26reset_mix_timing(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_26reset_mix_timing(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset_mix_timing", 0);
+
+  /* "mpfmc/core/audio/track.pyx":382
+ *     def reset_mix_timing(self):
+ *         """Resets the timing statistics of the mix callback of the track."""
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
+ *         timing_stats_reset(&self.state.mix_timing)
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
+ */
+  (void)(SDL_LockMutex(__pyx_v_self->state->callback_data->mixer_lock));
+
+  /* "mpfmc/core/audio/track.pyx":383
+ *         """Resets the timing statistics of the mix callback of the track."""
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
+ *         timing_stats_reset(&self.state.mix_timing)             # <<<<<<<<<<<<<<
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)
+ * 
+ */
+  __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_reset((&__pyx_v_self->state->mix_timing));
+
+  /* "mpfmc/core/audio/track.pyx":384
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
+ *         timing_stats_reset(&self.state.mix_timing)
+ *         SDL_UnlockMutex(self.state.callback_data.mixer_lock)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  (void)(SDL_UnlockMutex(__pyx_v_self->state->callback_data->mixer_lock));
+
+  /* "mpfmc/core/audio/track.pyx":380
+ *         return timing_stats_histogram(&self.state.mix_timing)
+ * 
+ *     def reset_mix_timing(self):             # <<<<<<<<<<<<<<
+ *         """Resets the timing statistics of the mix callback of the track."""
+ *         SDL_LockMutex(self.state.callback_data.mixer_lock)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":398
+ * 
+ *     @staticmethod
+ *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
+ *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *         """
+ */
+
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
+  Uint8 *__pyx_v_track_buffer;
+  Uint32 __pyx_v_output_buffer_bytes_remaining;
+  Uint32 __pyx_v_current_chunk_bytes;
+  Uint32 __pyx_v_buffer_pos;
+  Uint8 __pyx_v_control_point;
+  Uint8 __pyx_v_ducking_volume;
+  Uint8 __pyx_v_track_volume;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Uint16 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  Uint32 __pyx_t_5;
+  Uint8 __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "mpfmc/core/audio/track.pyx":411
+ * 
+ *         cdef Uint8 *track_buffer
+ *         cdef Uint32 output_buffer_bytes_remaining = buffer_length             # <<<<<<<<<<<<<<
+ *         cdef Uint32 current_chunk_bytes
+ *         cdef Uint32 buffer_pos = 0
+ */
+  __pyx_v_output_buffer_bytes_remaining = __pyx_v_buffer_length;
+
+  /* "mpfmc/core/audio/track.pyx":413
+ *         cdef Uint32 output_buffer_bytes_remaining = buffer_length
+ *         cdef Uint32 current_chunk_bytes
+ *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
+ *         cdef Uint8 control_point = 0
+ *         cdef Uint8 ducking_volume
+ */
+  __pyx_v_buffer_pos = 0;
+
+  /* "mpfmc/core/audio/track.pyx":414
+ *         cdef Uint32 current_chunk_bytes
+ *         cdef Uint32 buffer_pos = 0
+ *         cdef Uint8 control_point = 0             # <<<<<<<<<<<<<<
+ *         cdef Uint8 ducking_volume
+ *         cdef Uint8 track_volume
+ */
   __pyx_v_control_point = 0;
 
-  /* "mpfmc/core/audio/track.pyx":363
+  /* "mpfmc/core/audio/track.pyx":418
  *         cdef Uint8 track_volume
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
@@ -5539,7 +6239,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":364
+    /* "mpfmc/core/audio/track.pyx":419
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
  *             return             # <<<<<<<<<<<<<<
@@ -5548,7 +6248,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/track.pyx":363
+    /* "mpfmc/core/audio/track.pyx":418
  *         cdef Uint8 track_volume
  * 
  *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
@@ -5557,7 +6257,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":366
+  /* "mpfmc/core/audio/track.pyx":421
  *             return
  * 
  *         track_buffer = <Uint8*>track.buffer             # <<<<<<<<<<<<<<
@@ -5566,7 +6266,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
   __pyx_v_track_buffer = ((Uint8 *)__pyx_v_track->buffer);
 
-  /* "mpfmc/core/audio/track.pyx":369
+  /* "mpfmc/core/audio/track.pyx":424
  * 
  *         # Loop over output buffer at control rate
  *         while output_buffer_bytes_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5577,7 +6277,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_t_1 = ((__pyx_v_output_buffer_bytes_remaining > 0) != 0);
     if (!__pyx_t_1) break;
 
-    /* "mpfmc/core/audio/track.pyx":372
+    /* "mpfmc/core/audio/track.pyx":427
  * 
  *             # Determine the number of bytes to process in the current chunk
  *             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)             # <<<<<<<<<<<<<<
@@ -5593,7 +6293,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     }
     __pyx_v_current_chunk_bytes = __pyx_t_5;
 
-    /* "mpfmc/core/audio/track.pyx":375
+    /* "mpfmc/core/audio/track.pyx":430
  * 
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
@@ -5611,7 +6311,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_L9_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":376
+      /* "mpfmc/core/audio/track.pyx":431
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:
  *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)             # <<<<<<<<<<<<<<
@@ -5620,7 +6320,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_ducking_volume = g_array_index_uint8(__pyx_v_track->ducking_control_points, __pyx_v_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":375
+      /* "mpfmc/core/audio/track.pyx":430
  * 
  *             # Apply any ducking to the track
  *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
@@ -5630,7 +6330,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       goto __pyx_L8;
     }
 
-    /* "mpfmc/core/audio/track.pyx":378
+    /* "mpfmc/core/audio/track.pyx":433
  *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
  *             else:
  *                 ducking_volume = SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
@@ -5642,7 +6342,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     }
     __pyx_L8:;
 
-    /* "mpfmc/core/audio/track.pyx":381
+    /* "mpfmc/core/audio/track.pyx":436
  * 
  *             # Calculate track volume (handle track fading)
  *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5652,7 +6352,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_t_1 = ((__pyx_v_track->fade_steps_remaining > 0) != 0);
     if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":385
+      /* "mpfmc/core/audio/track.pyx":440
  *                 # because the fraction is going from 1 to 0 over the fade and not from a more
  *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),             # <<<<<<<<<<<<<<
@@ -5667,10 +6367,10 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
         #ifdef WITH_THREAD
         __Pyx_PyGILState_Release(__pyx_gilstate_save);
         #endif
-        __PYX_ERR(0, 385, __pyx_L1_error)
+        __PYX_ERR(0, 440, __pyx_L1_error)
       }
 
-      /* "mpfmc/core/audio/track.pyx":386
+      /* "mpfmc/core/audio/track.pyx":441
  *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
  *                                                             track.fade_volume_target, track.fade_volume_start))             # <<<<<<<<<<<<<<
@@ -5679,7 +6379,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_track->fade_volume_current = ((Uint8)__pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(__pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad((((double)__pyx_v_track->fade_steps_remaining) / ((double)__pyx_v_track->fade_steps))), __pyx_v_track->fade_volume_target, __pyx_v_track->fade_volume_start));
 
-      /* "mpfmc/core/audio/track.pyx":387
+      /* "mpfmc/core/audio/track.pyx":442
  *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
  *                                                             track.fade_volume_target, track.fade_volume_start))
  *                 track.fade_steps_remaining -= 1             # <<<<<<<<<<<<<<
@@ -5688,7 +6388,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
       __pyx_v_track->fade_steps_remaining = (__pyx_v_track->fade_steps_remaining - 1);
 
-      /* "mpfmc/core/audio/track.pyx":381
+      /* "mpfmc/core/audio/track.pyx":436
  * 
  *             # Calculate track volume (handle track fading)
  *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
@@ -5698,7 +6398,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       goto __pyx_L11;
     }
 
-    /* "mpfmc/core/audio/track.pyx":389
+    /* "mpfmc/core/audio/track.pyx":444
  *                 track.fade_steps_remaining -= 1
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target             # <<<<<<<<<<<<<<
@@ -5709,7 +6409,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       __pyx_t_6 = __pyx_v_track->fade_volume_target;
       __pyx_v_track->fade_volume_current = __pyx_t_6;
 
-      /* "mpfmc/core/audio/track.pyx":390
+      /* "mpfmc/core/audio/track.pyx":445
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
@@ -5719,7 +6419,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       switch (__pyx_v_track->status) {
         case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
 
-        /* "mpfmc/core/audio/track.pyx":391
+        /* "mpfmc/core/audio/track.pyx":446
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:
  *                     track.status = track_status_stopped             # <<<<<<<<<<<<<<
@@ -5728,7 +6428,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-        /* "mpfmc/core/audio/track.pyx":392
+        /* "mpfmc/core/audio/track.pyx":447
  *                 if track.status == track_status_stopping:
  *                     track.status = track_status_stopped
  *                     send_track_stopped_notification(track)             # <<<<<<<<<<<<<<
@@ -5737,7 +6437,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_track);
 
-        /* "mpfmc/core/audio/track.pyx":390
+        /* "mpfmc/core/audio/track.pyx":445
  *             else:
  *                 track.fade_volume_current = track.fade_volume_target
  *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
@@ -5747,7 +6447,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
         break;
         case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-        /* "mpfmc/core/audio/track.pyx":394
+        /* "mpfmc/core/audio/track.pyx":449
  *                     send_track_stopped_notification(track)
  *                 elif track.status == track_status_pausing:
  *                     track.status = track_status_paused             # <<<<<<<<<<<<<<
@@ -5756,7 +6456,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-        /* "mpfmc/core/audio/track.pyx":395
+        /* "mpfmc/core/audio/track.pyx":450
  *                 elif track.status == track_status_pausing:
  *                     track.status = track_status_paused
  *                     send_track_paused_notification(track)             # <<<<<<<<<<<<<<
@@ -5765,7 +6465,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
         __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_track);
 
-        /* "mpfmc/core/audio/track.pyx":393
+        /* "mpfmc/core/audio/track.pyx":448
  *                     track.status = track_status_stopped
  *                     send_track_stopped_notification(track)
  *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
@@ -5778,12 +6478,12 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     }
     __pyx_L11:;
 
-    /* "mpfmc/core/audio/track.pyx":397
+    /* "mpfmc/core/audio/track.pyx":452
  *                     send_track_paused_notification(track)
  * 
  *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
  * 
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+ *             if callback_data.float_mix:
  */
     __pyx_t_7 = (__pyx_v_ducking_volume * __pyx_v_track->fade_volume_current);
     if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
@@ -5794,7 +6494,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 397, __pyx_L1_error)
+      __PYX_ERR(0, 452, __pyx_L1_error)
     }
     else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_7))) {
       #ifdef WITH_THREAD
@@ -5804,21 +6504,133 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(0, 397, __pyx_L1_error)
+      __PYX_ERR(0, 452, __pyx_L1_error)
     }
     __pyx_v_track_volume = __Pyx_div_int(__pyx_t_7, SDL_MIX_MAXVOLUME);
 
-    /* "mpfmc/core/audio/track.pyx":399
+    /* "mpfmc/core/audio/track.pyx":454
+ *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
+ * 
+ *             if callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *                 # Accumulate in the float master bus (no clipping until the final output conversion)
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+ */
+    __pyx_t_1 = (__pyx_v_callback_data->float_mix != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/track.pyx":456
+ *             if callback_data.float_mix:
+ *                 # Accumulate in the float master bus (no clipping until the final output conversion)
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                       track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       current_chunk_bytes // callback_data.bytes_per_sample,
+ */
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 456, __pyx_L1_error)
+      }
+
+      /* "mpfmc/core/audio/track.pyx":457
+ *                 # Accumulate in the float master bus (no clipping until the final output conversion)
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       track.float_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                       current_chunk_bytes // callback_data.bytes_per_sample,
+ *                                       <float>track_volume / SDL_MIX_MAXVOLUME)
+ */
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 457, __pyx_L1_error)
+      }
+
+      /* "mpfmc/core/audio/track.pyx":458
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       current_chunk_bytes // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                       <float>track_volume / SDL_MIX_MAXVOLUME)
+ *             else:
+ */
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 458, __pyx_L1_error)
+      }
+
+      /* "mpfmc/core/audio/track.pyx":459
+ *                                       track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       current_chunk_bytes // callback_data.bytes_per_sample,
+ *                                       <float>track_volume / SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes,
+ */
+      if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 459, __pyx_L1_error)
+      }
+
+      /* "mpfmc/core/audio/track.pyx":456
+ *             if callback_data.float_mix:
+ *                 # Accumulate in the float master bus (no clipping until the final output conversion)
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                       track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                       current_chunk_bytes // callback_data.bytes_per_sample,
+ */
+      __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_float((__pyx_v_callback_data->mix_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), (__pyx_v_track->float_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), (__pyx_v_current_chunk_bytes / __pyx_v_callback_data->bytes_per_sample), (((float)__pyx_v_track_volume) / ((float)SDL_MIX_MAXVOLUME)));
+
+      /* "mpfmc/core/audio/track.pyx":454
  *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
  * 
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)             # <<<<<<<<<<<<<<
+ *             if callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *                 # Accumulate in the float master bus (no clipping until the final output conversion)
+ *                 Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+ */
+      goto __pyx_L12;
+    }
+
+    /* "mpfmc/core/audio/track.pyx":461
+ *                                       <float>track_volume / SDL_MIX_MAXVOLUME)
+ *             else:
+ *                 Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes,             # <<<<<<<<<<<<<<
+ *                                 track_volume)
+ * 
+ */
+    /*else*/ {
+
+      /* "mpfmc/core/audio/track.pyx":462
+ *             else:
+ *                 Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes,
+ *                                 track_volume)             # <<<<<<<<<<<<<<
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  */
-    __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio((__pyx_v_output_buffer + __pyx_v_buffer_pos), (__pyx_v_track_buffer + __pyx_v_buffer_pos), __pyx_v_current_chunk_bytes, __pyx_v_track_volume);
+      __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio((__pyx_v_output_buffer + __pyx_v_buffer_pos), (__pyx_v_track_buffer + __pyx_v_buffer_pos), __pyx_v_current_chunk_bytes, __pyx_v_track_volume);
+    }
+    __pyx_L12:;
 
-    /* "mpfmc/core/audio/track.pyx":401
- *             Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+    /* "mpfmc/core/audio/track.pyx":464
+ *                                 track_volume)
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes             # <<<<<<<<<<<<<<
  *             buffer_pos += current_chunk_bytes
@@ -5826,7 +6638,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
     __pyx_v_output_buffer_bytes_remaining = (__pyx_v_output_buffer_bytes_remaining - __pyx_v_current_chunk_bytes);
 
-    /* "mpfmc/core/audio/track.pyx":402
+    /* "mpfmc/core/audio/track.pyx":465
  * 
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  *             buffer_pos += current_chunk_bytes             # <<<<<<<<<<<<<<
@@ -5835,7 +6647,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
     __pyx_v_buffer_pos = (__pyx_v_buffer_pos + __pyx_v_current_chunk_bytes);
 
-    /* "mpfmc/core/audio/track.pyx":403
+    /* "mpfmc/core/audio/track.pyx":466
  *             output_buffer_bytes_remaining -= current_chunk_bytes
  *             buffer_pos += current_chunk_bytes
  *             control_point += 1             # <<<<<<<<<<<<<<
@@ -5845,7 +6657,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
     __pyx_v_control_point = (__pyx_v_control_point + 1);
   }
 
-  /* "mpfmc/core/audio/track.pyx":343
+  /* "mpfmc/core/audio/track.pyx":398
  * 
  *     @staticmethod
  *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
@@ -5860,7 +6672,7 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
   __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":406
+/* "mpfmc/core/audio/track.pyx":469
  * 
  *     @staticmethod
  *     cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
@@ -5869,596 +6681,661 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_
  */
 
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume) {
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_input_sample;
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_output_sample;
+  Sint16 *__pyx_v_output_samples;
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_sample_count;
+  Uint32 __pyx_v_i;
   int __pyx_v_temp_sample;
-  Uint32 __pyx_v_buffer_pos;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Uint8 __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  long __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  long __pyx_t_7;
+
+  /* "mpfmc/core/audio/track.pyx":482
+ *             The loop works on whole 16-bit samples and has no branches so the C compiler can vectorize it.
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = buffer_length // 2
+ */
+  __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
+
+  /* "mpfmc/core/audio/track.pyx":483
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 sample_count = buffer_length // 2
+ *         cdef Uint32 i
+ */
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":419
- *         cdef Sample16 input_sample, output_sample
+  /* "mpfmc/core/audio/track.pyx":484
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = buffer_length // 2             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
  *         cdef int temp_sample
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- * 
- *         while buffer_pos < buffer_length:
  */
-  __pyx_v_buffer_pos = 0;
+  __pyx_v_sample_count = (__pyx_v_buffer_length / 2);
 
-  /* "mpfmc/core/audio/track.pyx":421
- *         cdef Uint32 buffer_pos = 0
- * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":488
+ *         cdef int temp_sample
  * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             # Mix the input sample multiplied by the volume with the existing output sample. The temporary
+ *             # output sample is a 32-bit value to avoid overflow.
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":424
- * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
+    /* "mpfmc/core/audio/track.pyx":491
+ *             # Mix the input sample multiplied by the volume with the existing output sample. The temporary
+ *             # output sample is a 32-bit value to avoid overflow.
+ *             temp_sample = output_samples[i] + ((input_samples[i] * volume) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
  * 
+ *             # Clip the temp sample back to the 16-bit range (will cause distortion if samples on the channel
  */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
+    __pyx_v_temp_sample = ((__pyx_v_output_samples[__pyx_v_i]) + (((__pyx_v_input_samples[__pyx_v_i]) * __pyx_v_volume) >> 7));
 
-    /* "mpfmc/core/audio/track.pyx":425
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":495
+ *             # Clip the temp sample back to the 16-bit range (will cause distortion if samples on the channel
+ *             # are outside of the allowable 16-bit int range). min and max compile to branchless selects.
+ *             output_samples[i] = <Sint16>min(max(temp_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)             # <<<<<<<<<<<<<<
  * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
+ *     @staticmethod
  */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
+    __pyx_t_4 = 0x7FFF;
+    __pyx_t_5 = -32768L;
+    __pyx_t_6 = __pyx_v_temp_sample;
+    if (((__pyx_t_5 > __pyx_t_6) != 0)) {
+      __pyx_t_7 = __pyx_t_5;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+    }
+    __pyx_t_5 = __pyx_t_7;
+    if (((__pyx_t_4 < __pyx_t_5) != 0)) {
+      __pyx_t_7 = __pyx_t_4;
+    } else {
+      __pyx_t_7 = __pyx_t_5;
+    }
+    (__pyx_v_output_samples[__pyx_v_i]) = ((Sint16)__pyx_t_7);
+  }
 
-    /* "mpfmc/core/audio/track.pyx":428
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+  /* "mpfmc/core/audio/track.pyx":469
  * 
+ *     @staticmethod
+ *     cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
+ *         """
+ *         Mixes input buffer samples into existing output buffer samples applying the specified volume setting.
  */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
 
-    /* "mpfmc/core/audio/track.pyx":429
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/track.pyx":498
  * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
+ *     @staticmethod
+ *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
+ *                                int volume_left, int volume_right) nogil:
+ *         """
  */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
 
-    /* "mpfmc/core/audio/track.pyx":433
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right) {
+  Sint16 *__pyx_v_output_samples;
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_frame_count;
+  Uint32 __pyx_v_i;
+  int __pyx_v_left_sample;
+  int __pyx_v_right_sample;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  long __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  long __pyx_t_7;
+
+  /* "mpfmc/core/audio/track.pyx":515
  * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = buffer_length // 4
  */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 433, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 433, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":437
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
+  __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-      /* "mpfmc/core/audio/track.pyx":438
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":516
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 frame_count = buffer_length // 4
+ *         cdef Uint32 i
  */
-      __pyx_v_temp_sample = 0x7FFF;
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-      /* "mpfmc/core/audio/track.pyx":437
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+  /* "mpfmc/core/audio/track.pyx":517
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = buffer_length // 4             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
+ *         cdef int left_sample, right_sample
  */
-      goto __pyx_L5;
-    }
+  __pyx_v_frame_count = (__pyx_v_buffer_length / 4);
 
-    /* "mpfmc/core/audio/track.pyx":439
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":521
+ *         cdef int left_sample, right_sample
  * 
+ *         for i in range(frame_count):             # <<<<<<<<<<<<<<
+ *             left_sample = output_samples[2 * i] + ((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+ *             right_sample = output_samples[2 * i + 1] + ((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+  __pyx_t_1 = __pyx_v_frame_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-      /* "mpfmc/core/audio/track.pyx":440
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":522
  * 
- *             # Write the new output sample back to the output buffer (from
- */
-      __pyx_v_temp_sample = -32768;
-
-      /* "mpfmc/core/audio/track.pyx":439
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+ *         for i in range(frame_count):
+ *             left_sample = output_samples[2 * i] + ((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
+ *             right_sample = output_samples[2 * i + 1] + ((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
  * 
  */
-    }
-    __pyx_L5:;
-
-    /* "mpfmc/core/audio/track.pyx":444
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
+    __pyx_v_left_sample = ((__pyx_v_output_samples[(2 * __pyx_v_i)]) + (((__pyx_v_input_samples[(2 * __pyx_v_i)]) * __pyx_v_volume_left) >> 7));
 
-    /* "mpfmc/core/audio/track.pyx":445
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    /* "mpfmc/core/audio/track.pyx":523
+ *         for i in range(frame_count):
+ *             left_sample = output_samples[2 * i] + ((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+ *             right_sample = output_samples[2 * i + 1] + ((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
  * 
+ *             output_samples[2 * i] = <Sint16>min(max(left_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
+    __pyx_v_right_sample = ((__pyx_v_output_samples[((2 * __pyx_v_i) + 1)]) + (((__pyx_v_input_samples[((2 * __pyx_v_i) + 1)]) * __pyx_v_volume_right) >> 7));
 
-    /* "mpfmc/core/audio/track.pyx":446
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":525
+ *             right_sample = output_samples[2 * i + 1] + ((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
+ * 
+ *             output_samples[2 * i] = <Sint16>min(max(left_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)             # <<<<<<<<<<<<<<
+ *             output_samples[2 * i + 1] = <Sint16>min(max(right_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
  * 
- *             buffer_pos += 2
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+    __pyx_t_4 = 0x7FFF;
+    __pyx_t_5 = -32768L;
+    __pyx_t_6 = __pyx_v_left_sample;
+    if (((__pyx_t_5 > __pyx_t_6) != 0)) {
+      __pyx_t_7 = __pyx_t_5;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+    }
+    __pyx_t_5 = __pyx_t_7;
+    if (((__pyx_t_4 < __pyx_t_5) != 0)) {
+      __pyx_t_7 = __pyx_t_4;
+    } else {
+      __pyx_t_7 = __pyx_t_5;
+    }
+    (__pyx_v_output_samples[(2 * __pyx_v_i)]) = ((Sint16)__pyx_t_7);
 
-    /* "mpfmc/core/audio/track.pyx":448
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    /* "mpfmc/core/audio/track.pyx":526
  * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+ *             output_samples[2 * i] = <Sint16>min(max(left_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
+ *             output_samples[2 * i + 1] = <Sint16>min(max(right_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)             # <<<<<<<<<<<<<<
  * 
  *     @staticmethod
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+    __pyx_t_7 = 0x7FFF;
+    __pyx_t_4 = -32768L;
+    __pyx_t_6 = __pyx_v_right_sample;
+    if (((__pyx_t_4 > __pyx_t_6) != 0)) {
+      __pyx_t_5 = __pyx_t_4;
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+    }
+    __pyx_t_4 = __pyx_t_5;
+    if (((__pyx_t_7 < __pyx_t_4) != 0)) {
+      __pyx_t_5 = __pyx_t_7;
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+    }
+    (__pyx_v_output_samples[((2 * __pyx_v_i) + 1)]) = ((Sint16)__pyx_t_5);
   }
 
-  /* "mpfmc/core/audio/track.pyx":406
+  /* "mpfmc/core/audio/track.pyx":498
  * 
  *     @staticmethod
- *     cdef void mix_audio(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
+ *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
+ *                                int volume_left, int volume_right) nogil:
  *         """
- *         Mixes input buffer samples into existing output buffer samples applying the specified volume setting.
  */
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_audio", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":451
+/* "mpfmc/core/audio/track.pyx":529
  * 
  *     @staticmethod
- *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
- *                                int volume_left, int volume_right) nogil:
+ *     cdef void mix_sound_to_track(TrackState *track, Uint8 *track_buffer_position, const Uint8 *sound_buffer,             # <<<<<<<<<<<<<<
+ *                                  Uint32 buffer_length, int volume) nogil:
  *         """
  */
 
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right) {
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_input_sample;
-  union __pyx_t_5mpfmc_4core_5audio_4sdl2_Sample16 __pyx_v_output_sample;
-  int __pyx_v_temp_sample;
-  Uint32 __pyx_v_buffer_pos;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_sound_to_track(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, Uint8 *__pyx_v_track_buffer_position, Uint8 const *__pyx_v_sound_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume) {
+  float *__pyx_v_output_samples;
+  Sint16 const *__pyx_v_input_samples;
+  float __pyx_v_gain;
+  Uint32 __pyx_v_i;
   int __pyx_t_1;
-  int __pyx_t_2;
-  Uint8 __pyx_t_3;
+  ptrdiff_t __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  Uint32 __pyx_t_5;
+  Uint32 __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "mpfmc/core/audio/track.pyx":470
- *         cdef Sample16 input_sample, output_sample
- *         cdef int temp_sample
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- * 
- *         while buffer_pos < buffer_length:
+  /* "mpfmc/core/audio/track.pyx":545
+ *         """
+ *         cdef float *output_samples
+ *         cdef const Sint16 *input_samples = <const Sint16*>sound_buffer             # <<<<<<<<<<<<<<
+ *         cdef float gain
+ *         cdef Uint32 i
  */
-  __pyx_v_buffer_pos = 0;
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_sound_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":472
- *         cdef Uint32 buffer_pos = 0
- * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":549
+ *         cdef Uint32 i
  * 
- *             # Process left channel
+ *         if not track.callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *             SDL_MixAudioFormat(track_buffer_position, sound_buffer, track.callback_data.format, buffer_length, volume)
+ *             return
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_t_1 = ((!(__pyx_v_track->callback_data->float_mix != 0)) != 0);
+  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":477
+    /* "mpfmc/core/audio/track.pyx":550
  * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
+ *         if not track.callback_data.float_mix:
+ *             SDL_MixAudioFormat(track_buffer_position, sound_buffer, track.callback_data.format, buffer_length, volume)             # <<<<<<<<<<<<<<
+ *             return
  * 
  */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
+    SDL_MixAudioFormat(__pyx_v_track_buffer_position, __pyx_v_sound_buffer, __pyx_v_track->callback_data->format, __pyx_v_buffer_length, __pyx_v_volume);
 
-    /* "mpfmc/core/audio/track.pyx":478
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":551
+ *         if not track.callback_data.float_mix:
+ *             SDL_MixAudioFormat(track_buffer_position, sound_buffer, track.callback_data.format, buffer_length, volume)
+ *             return             # <<<<<<<<<<<<<<
  * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
+ *         output_samples = track.float_buffer + (track_buffer_position - track.buffer) // track.callback_data.bytes_per_sample
  */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
+    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/track.pyx":481
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+    /* "mpfmc/core/audio/track.pyx":549
+ *         cdef Uint32 i
  * 
+ *         if not track.callback_data.float_mix:             # <<<<<<<<<<<<<<
+ *             SDL_MixAudioFormat(track_buffer_position, sound_buffer, track.callback_data.format, buffer_length, volume)
+ *             return
  */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
+  }
 
-    /* "mpfmc/core/audio/track.pyx":482
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":553
+ *             return
  * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
-
-    /* "mpfmc/core/audio/track.pyx":486
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume_left) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+ *         output_samples = track.float_buffer + (track_buffer_position - track.buffer) // track.callback_data.bytes_per_sample             # <<<<<<<<<<<<<<
+ *         gain = <float>volume / SDL_MIX_MAXVOLUME
  * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume_left);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 486, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 486, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":490
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
-
-      /* "mpfmc/core/audio/track.pyx":491
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- */
-      __pyx_v_temp_sample = 0x7FFF;
+  __pyx_t_2 = (__pyx_v_track_buffer_position - __pyx_v_track->buffer);
+  if (unlikely(__pyx_v_track->callback_data->bytes_per_sample == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 553, __pyx_L1_error)
+  }
+  else if (sizeof(ptrdiff_t) == sizeof(long) && (!(((Uint8)-1) > 0)) && unlikely(__pyx_v_track->callback_data->bytes_per_sample == (Uint8)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 553, __pyx_L1_error)
+  }
+  __pyx_v_output_samples = (__pyx_v_track->float_buffer + __Pyx_div_ptrdiff_t(__pyx_t_2, __pyx_v_track->callback_data->bytes_per_sample));
 
-      /* "mpfmc/core/audio/track.pyx":490
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+  /* "mpfmc/core/audio/track.pyx":554
+ * 
+ *         output_samples = track.float_buffer + (track_buffer_position - track.buffer) // track.callback_data.bytes_per_sample
+ *         gain = <float>volume / SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(buffer_length // track.callback_data.bytes_per_sample):
  */
-      goto __pyx_L5;
-    }
+  if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 554, __pyx_L1_error)
+  }
+  __pyx_v_gain = (((float)__pyx_v_volume) / ((float)SDL_MIX_MAXVOLUME));
 
-    /* "mpfmc/core/audio/track.pyx":492
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":556
+ *         gain = <float>volume / SDL_MIX_MAXVOLUME
+ * 
+ *         for i in range(buffer_length // track.callback_data.bytes_per_sample):             # <<<<<<<<<<<<<<
+ *             output_samples[i] += input_samples[i] * gain
  * 
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+  if (unlikely(__pyx_v_track->callback_data->bytes_per_sample == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 556, __pyx_L1_error)
+  }
+  __pyx_t_3 = (__pyx_v_buffer_length / __pyx_v_track->callback_data->bytes_per_sample);
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
 
-      /* "mpfmc/core/audio/track.pyx":493
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":557
  * 
- *             # Write the new output sample back to the output buffer (from
+ *         for i in range(buffer_length // track.callback_data.bytes_per_sample):
+ *             output_samples[i] += input_samples[i] * gain             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
  */
-      __pyx_v_temp_sample = -32768;
+    __pyx_t_6 = __pyx_v_i;
+    (__pyx_v_output_samples[__pyx_t_6]) = ((__pyx_v_output_samples[__pyx_t_6]) + ((__pyx_v_input_samples[__pyx_v_i]) * __pyx_v_gain));
+  }
 
-      /* "mpfmc/core/audio/track.pyx":492
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":529
  * 
+ *     @staticmethod
+ *     cdef void mix_sound_to_track(TrackState *track, Uint8 *track_buffer_position, const Uint8 *sound_buffer,             # <<<<<<<<<<<<<<
+ *                                  Uint32 buffer_length, int volume) nogil:
+ *         """
  */
-    }
-    __pyx_L5:;
 
-    /* "mpfmc/core/audio/track.pyx":497
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_sound_to_track", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
 
-    /* "mpfmc/core/audio/track.pyx":498
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+/* "mpfmc/core/audio/track.pyx":560
  * 
+ *     @staticmethod
+ *     cdef void mix_audio_float(float *output_buffer, const float *input_buffer, Uint32 sample_count, float gain) nogil:             # <<<<<<<<<<<<<<
+ *         """
+ *         Mixes float input samples into existing float output samples applying the specified gain.
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":499
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
- * 
- *             buffer_pos += 2
- */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_float(float *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain) {
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
 
-    /* "mpfmc/core/audio/track.pyx":501
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+  /* "mpfmc/core/audio/track.pyx":571
+ *         cdef Uint32 i
  * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             output_buffer[i] += input_buffer[i] * gain
  * 
- *             # Process right channel
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":506
+    /* "mpfmc/core/audio/track.pyx":572
  * 
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
- * 
- */
-    __pyx_v_input_sample.bytes.byte0 = (__pyx_v_input_buffer[__pyx_v_buffer_pos]);
-
-    /* "mpfmc/core/audio/track.pyx":507
- *             # Get sample (2 bytes) from the input buffer and combine into 16-bit value
- *             input_sample.bytes.byte0 = input_buffer[buffer_pos]
- *             input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
+ *         for i in range(sample_count):
+ *             output_buffer[i] += input_buffer[i] * gain             # <<<<<<<<<<<<<<
  * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
+ *     @staticmethod
  */
-    __pyx_v_input_sample.bytes.byte1 = (__pyx_v_input_buffer[(__pyx_v_buffer_pos + 1)]);
+    __pyx_t_4 = __pyx_v_i;
+    (__pyx_v_output_buffer[__pyx_t_4]) = ((__pyx_v_output_buffer[__pyx_t_4]) + ((__pyx_v_input_buffer[__pyx_v_i]) * __pyx_v_gain));
+  }
 
-    /* "mpfmc/core/audio/track.pyx":510
- * 
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]             # <<<<<<<<<<<<<<
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+  /* "mpfmc/core/audio/track.pyx":560
  * 
+ *     @staticmethod
+ *     cdef void mix_audio_float(float *output_buffer, const float *input_buffer, Uint32 sample_count, float gain) nogil:             # <<<<<<<<<<<<<<
+ *         """
+ *         Mixes float input samples into existing float output samples applying the specified gain.
  */
-    __pyx_v_output_sample.bytes.byte0 = (__pyx_v_output_buffer[__pyx_v_buffer_pos]);
 
-    /* "mpfmc/core/audio/track.pyx":511
- *             # Get sample (2 bytes) from the output buffer and combine into 16-bit value
- *             output_sample.bytes.byte0 = output_buffer[buffer_pos]
- *             output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]             # <<<<<<<<<<<<<<
- * 
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- */
-    __pyx_v_output_sample.bytes.byte1 = (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]);
+  /* function exit code */
+}
 
-    /* "mpfmc/core/audio/track.pyx":515
- *             # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
- *             # sample). The temporary output sample is a 32-bit value to avoid overflow.
- *             temp_sample = output_sample.value + ((input_sample.value * volume_right) // SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
+/* "mpfmc/core/audio/track.pyx":575
  * 
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- */
-    __pyx_t_2 = (__pyx_v_input_sample.value * __pyx_v_volume_right);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 515, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 515, __pyx_L1_error)
-    }
-    __pyx_v_temp_sample = (__pyx_v_output_sample.value + __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME));
-
-    /* "mpfmc/core/audio/track.pyx":519
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+ *     @staticmethod
+ *     cdef void convert_float_to_output(Uint8 *output_buffer, const float *input_buffer, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                                       float gain, bint soft_limiter) nogil:
+ *         """
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample > 0x7FFF) != 0);
-    if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":520
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- */
-      __pyx_v_temp_sample = 0x7FFF;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_convert_float_to_output(Uint8 *__pyx_v_output_buffer, float const *__pyx_v_input_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain, int __pyx_v_soft_limiter) {
+  Sint16 *__pyx_v_output_samples;
+  float __pyx_v_sample;
+  float __pyx_v_magnitude;
+  float __pyx_v_excess;
+  Uint32 __pyx_v_i;
+  int __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  double __pyx_t_5;
+  double __pyx_t_6;
+  double __pyx_t_7;
+  float __pyx_t_8;
+  long __pyx_t_9;
+  long __pyx_t_10;
+  float __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
 
-      /* "mpfmc/core/audio/track.pyx":519
- *             # Clip the temp sample back to a 16-bit value (will cause distortion if samples
- *             # on channel are outside of the allowable 16-bit int range)
- *             if temp_sample > MAX_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
+  /* "mpfmc/core/audio/track.pyx":591
+ *             1 at the threshold and approaches full scale.
+ *         """
+ *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
+ *         cdef float sample, magnitude, excess
+ *         cdef Uint32 i
  */
-      goto __pyx_L6;
-    }
+  __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-    /* "mpfmc/core/audio/track.pyx":521
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
+  /* "mpfmc/core/audio/track.pyx":595
+ *         cdef Uint32 i
  * 
+ *         if soft_limiter:             # <<<<<<<<<<<<<<
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain
  */
-    __pyx_t_1 = ((__pyx_v_temp_sample < -32768L) != 0);
-    if (__pyx_t_1) {
+  __pyx_t_1 = (__pyx_v_soft_limiter != 0);
+  if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":522
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:
- *                 temp_sample = MIN_AUDIO_VALUE_S16             # <<<<<<<<<<<<<<
- * 
- *             # Write the new output sample back to the output buffer (from
+    /* "mpfmc/core/audio/track.pyx":596
+ * 
+ *         if soft_limiter:
+ *             for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *                 sample = input_buffer[i] * gain
+ *                 magnitude = fabsf(sample)
+ */
+    __pyx_t_2 = __pyx_v_sample_count;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_i = __pyx_t_4;
+
+      /* "mpfmc/core/audio/track.pyx":597
+ *         if soft_limiter:
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain             # <<<<<<<<<<<<<<
+ *                 magnitude = fabsf(sample)
+ *                 excess = max(magnitude - LIMITER_THRESHOLD, 0.0)
+ */
+      __pyx_v_sample = ((__pyx_v_input_buffer[__pyx_v_i]) * __pyx_v_gain);
+
+      /* "mpfmc/core/audio/track.pyx":598
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain
+ *                 magnitude = fabsf(sample)             # <<<<<<<<<<<<<<
+ *                 excess = max(magnitude - LIMITER_THRESHOLD, 0.0)
+ *                 magnitude = min(magnitude, LIMITER_THRESHOLD) + excess * LIMITER_HEADROOM / (LIMITER_HEADROOM + excess)
+ */
+      __pyx_v_magnitude = fabsf(__pyx_v_sample);
+
+      /* "mpfmc/core/audio/track.pyx":599
+ *                 sample = input_buffer[i] * gain
+ *                 magnitude = fabsf(sample)
+ *                 excess = max(magnitude - LIMITER_THRESHOLD, 0.0)             # <<<<<<<<<<<<<<
+ *                 magnitude = min(magnitude, LIMITER_THRESHOLD) + excess * LIMITER_HEADROOM / (LIMITER_HEADROOM + excess)
+ *                 output_samples[i] = <Sint16>copysignf(magnitude, sample)
+ */
+      __pyx_t_5 = 0.0;
+      __pyx_t_6 = (__pyx_v_magnitude - 24576.0);
+      if (((__pyx_t_5 > __pyx_t_6) != 0)) {
+        __pyx_t_7 = __pyx_t_5;
+      } else {
+        __pyx_t_7 = __pyx_t_6;
+      }
+      __pyx_v_excess = __pyx_t_7;
+
+      /* "mpfmc/core/audio/track.pyx":600
+ *                 magnitude = fabsf(sample)
+ *                 excess = max(magnitude - LIMITER_THRESHOLD, 0.0)
+ *                 magnitude = min(magnitude, LIMITER_THRESHOLD) + excess * LIMITER_HEADROOM / (LIMITER_HEADROOM + excess)             # <<<<<<<<<<<<<<
+ *                 output_samples[i] = <Sint16>copysignf(magnitude, sample)
+ *         else:
  */
-      __pyx_v_temp_sample = -32768;
+      __pyx_t_7 = 24576.0;
+      __pyx_t_8 = __pyx_v_magnitude;
+      if (((__pyx_t_7 < __pyx_t_8) != 0)) {
+        __pyx_t_5 = __pyx_t_7;
+      } else {
+        __pyx_t_5 = __pyx_t_8;
+      }
+      __pyx_t_7 = (__pyx_v_excess * 8191.0);
+      __pyx_t_6 = (8191.0 + __pyx_v_excess);
+      if (unlikely(__pyx_t_6 == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 600, __pyx_L1_error)
+      }
+      __pyx_v_magnitude = (__pyx_t_5 + (__pyx_t_7 / __pyx_t_6));
 
-      /* "mpfmc/core/audio/track.pyx":521
- *             if temp_sample > MAX_AUDIO_VALUE_S16:
- *                 temp_sample = MAX_AUDIO_VALUE_S16
- *             elif temp_sample < MIN_AUDIO_VALUE_S16:             # <<<<<<<<<<<<<<
- *                 temp_sample = MIN_AUDIO_VALUE_S16
- * 
+      /* "mpfmc/core/audio/track.pyx":601
+ *                 excess = max(magnitude - LIMITER_THRESHOLD, 0.0)
+ *                 magnitude = min(magnitude, LIMITER_THRESHOLD) + excess * LIMITER_HEADROOM / (LIMITER_HEADROOM + excess)
+ *                 output_samples[i] = <Sint16>copysignf(magnitude, sample)             # <<<<<<<<<<<<<<
+ *         else:
+ *             for i in range(sample_count):
  */
+      (__pyx_v_output_samples[__pyx_v_i]) = ((Sint16)copysignf(__pyx_v_magnitude, __pyx_v_sample));
     }
-    __pyx_L6:;
 
-    /* "mpfmc/core/audio/track.pyx":526
- *             # Write the new output sample back to the output buffer (from
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    /* "mpfmc/core/audio/track.pyx":595
+ *         cdef Uint32 i
+ * 
+ *         if soft_limiter:             # <<<<<<<<<<<<<<
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain
  */
-    __pyx_v_output_sample.value = __pyx_v_temp_sample;
+    goto __pyx_L3;
+  }
 
-    /* "mpfmc/core/audio/track.pyx":527
- *             # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0             # <<<<<<<<<<<<<<
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- * 
+  /* "mpfmc/core/audio/track.pyx":603
+ *                 output_samples[i] = <Sint16>copysignf(magnitude, sample)
+ *         else:
+ *             for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *                 sample = input_buffer[i] * gain
+ *                 output_samples[i] = <Sint16>min(max(sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte0;
-    (__pyx_v_output_buffer[__pyx_v_buffer_pos]) = __pyx_t_3;
+  /*else*/ {
+    __pyx_t_2 = __pyx_v_sample_count;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_i = __pyx_t_4;
 
-    /* "mpfmc/core/audio/track.pyx":528
- *             output_sample.value = temp_sample
- *             output_buffer[buffer_pos] = output_sample.bytes.byte0
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":604
+ *         else:
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain             # <<<<<<<<<<<<<<
+ *                 output_samples[i] = <Sint16>min(max(sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
  * 
- *             buffer_pos += 2
  */
-    __pyx_t_3 = __pyx_v_output_sample.bytes.byte1;
-    (__pyx_v_output_buffer[(__pyx_v_buffer_pos + 1)]) = __pyx_t_3;
+      __pyx_v_sample = ((__pyx_v_input_buffer[__pyx_v_i]) * __pyx_v_gain);
 
-    /* "mpfmc/core/audio/track.pyx":530
- *             output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
- * 
- *             buffer_pos += 2             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":605
+ *             for i in range(sample_count):
+ *                 sample = input_buffer[i] * gain
+ *                 output_samples[i] = <Sint16>min(max(sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)             # <<<<<<<<<<<<<<
  * 
  *     @staticmethod
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 2);
+      __pyx_t_9 = 0x7FFF;
+      __pyx_t_10 = -32768L;
+      __pyx_t_8 = __pyx_v_sample;
+      if (((__pyx_t_10 > __pyx_t_8) != 0)) {
+        __pyx_t_11 = __pyx_t_10;
+      } else {
+        __pyx_t_11 = __pyx_t_8;
+      }
+      __pyx_t_8 = __pyx_t_11;
+      if (((__pyx_t_9 < __pyx_t_8) != 0)) {
+        __pyx_t_11 = __pyx_t_9;
+      } else {
+        __pyx_t_11 = __pyx_t_8;
+      }
+      (__pyx_v_output_samples[__pyx_v_i]) = ((Sint16)__pyx_t_11);
+    }
   }
+  __pyx_L3:;
 
-  /* "mpfmc/core/audio/track.pyx":451
+  /* "mpfmc/core/audio/track.pyx":575
  * 
  *     @staticmethod
- *     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
- *                                int volume_left, int volume_right) nogil:
+ *     cdef void convert_float_to_output(Uint8 *output_buffer, const float *input_buffer, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                                       float gain, bint soft_limiter) nogil:
  *         """
  */
 
   /* function exit code */
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_audio_stereo", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.convert_float_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
   __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":533
+/* "mpfmc/core/audio/track.pyx":608
  * 
  *     @staticmethod
  *     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
@@ -6468,102 +7345,63 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(Uint8 *__
 
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume) {
   Sint16 *__pyx_v_output_samples;
-  Sint16 *__pyx_v_input_samples;
-  Uint32 __pyx_v_buffer_pos;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_sample_count;
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
 
-  /* "mpfmc/core/audio/track.pyx":543
+  /* "mpfmc/core/audio/track.pyx":618
  * 
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
- *         cdef Sint16* input_samples = <Sint16*>input_buffer
- *         cdef Uint32 buffer_pos = 0
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = buffer_length // 2
  */
   __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":544
+  /* "mpfmc/core/audio/track.pyx":619
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
- *         cdef Sint16* input_samples = <Sint16*>input_buffer             # <<<<<<<<<<<<<<
- *         cdef Uint32 buffer_pos = 0
- * 
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 sample_count = buffer_length // 2
+ *         cdef Uint32 i
  */
-  __pyx_v_input_samples = ((Sint16 *)__pyx_v_input_buffer);
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":545
+  /* "mpfmc/core/audio/track.pyx":620
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
- *         cdef Sint16* input_samples = <Sint16*>input_buffer
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 sample_count = buffer_length // 2             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
  * 
- *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
  */
-  __pyx_v_buffer_pos = 0;
+  __pyx_v_sample_count = (__pyx_v_buffer_length / 2);
 
-  /* "mpfmc/core/audio/track.pyx":549
- *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
- *         # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
- *         buffer_length = buffer_length // 2             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":623
+ *         cdef Uint32 i
  * 
- *         while buffer_pos < buffer_length:
- */
-  __pyx_v_buffer_length = (__pyx_v_buffer_length / 2);
-
-  /* "mpfmc/core/audio/track.pyx":551
- *         buffer_length = buffer_length // 2
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             output_samples[i] = <Sint16>((input_samples[i] * volume) >> MIX_VOLUME_SHIFT)
  * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME
- *             buffer_pos += 1
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_t_1 = __pyx_v_sample_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":552
+    /* "mpfmc/core/audio/track.pyx":624
  * 
- *         while buffer_pos < buffer_length:
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
- *             buffer_pos += 1
+ *         for i in range(sample_count):
+ *             output_samples[i] = <Sint16>((input_samples[i] * volume) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
  * 
+ *     @staticmethod
  */
-    __pyx_t_2 = ((__pyx_v_input_samples[__pyx_v_buffer_pos]) * __pyx_v_volume);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 552, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 552, __pyx_L1_error)
-    }
-    (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
+    (__pyx_v_output_samples[__pyx_v_i]) = ((Sint16)(((__pyx_v_input_samples[__pyx_v_i]) * __pyx_v_volume) >> 7));
+  }
 
-    /* "mpfmc/core/audio/track.pyx":553
- *         while buffer_pos < buffer_length:
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME
- *             buffer_pos += 1             # <<<<<<<<<<<<<<
- * 
- *     @staticmethod
- */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
-  }
-
-  /* "mpfmc/core/audio/track.pyx":533
+  /* "mpfmc/core/audio/track.pyx":608
  * 
  *     @staticmethod
  *     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:             # <<<<<<<<<<<<<<
@@ -6572,13 +7410,9 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
  */
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.apply_volume", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/track.pyx":556
+/* "mpfmc/core/audio/track.pyx":627
  * 
  *     @staticmethod
  *     cdef void apply_volume_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
@@ -6588,138 +7422,72 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(Uint8 *__pyx_
 
 static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8 *__pyx_v_output_buffer, Uint8 const *__pyx_v_input_buffer, Uint32 __pyx_v_buffer_length, int __pyx_v_volume_left, int __pyx_v_volume_right) {
   Sint16 *__pyx_v_output_samples;
-  Sint16 *__pyx_v_input_samples;
-  Uint32 __pyx_v_buffer_pos;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+  Sint16 const *__pyx_v_input_samples;
+  Uint32 __pyx_v_frame_count;
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
 
-  /* "mpfmc/core/audio/track.pyx":573
+  /* "mpfmc/core/audio/track.pyx":644
  * 
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer             # <<<<<<<<<<<<<<
- *         cdef Sint16* input_samples = <Sint16*>input_buffer
- *         cdef Uint32 buffer_pos = 0
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = buffer_length // 4
  */
   __pyx_v_output_samples = ((Sint16 *)__pyx_v_output_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":574
+  /* "mpfmc/core/audio/track.pyx":645
  *         """
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
- *         cdef Sint16* input_samples = <Sint16*>input_buffer             # <<<<<<<<<<<<<<
- *         cdef Uint32 buffer_pos = 0
- * 
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer             # <<<<<<<<<<<<<<
+ *         cdef Uint32 frame_count = buffer_length // 4
+ *         cdef Uint32 i
  */
-  __pyx_v_input_samples = ((Sint16 *)__pyx_v_input_buffer);
+  __pyx_v_input_samples = ((Sint16 const *)__pyx_v_input_buffer);
 
-  /* "mpfmc/core/audio/track.pyx":575
+  /* "mpfmc/core/audio/track.pyx":646
  *         cdef Sint16* output_samples = <Sint16*>output_buffer
- *         cdef Sint16* input_samples = <Sint16*>input_buffer
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- * 
- *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
- */
-  __pyx_v_buffer_pos = 0;
-
-  /* "mpfmc/core/audio/track.pyx":579
- *         # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
- *         # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
- *         buffer_length = buffer_length // 2             # <<<<<<<<<<<<<<
+ *         cdef const Sint16* input_samples = <const Sint16*>input_buffer
+ *         cdef Uint32 frame_count = buffer_length // 4             # <<<<<<<<<<<<<<
+ *         cdef Uint32 i
  * 
- *         while buffer_pos < buffer_length:
  */
-  __pyx_v_buffer_length = (__pyx_v_buffer_length / 2);
+  __pyx_v_frame_count = (__pyx_v_buffer_length / 4);
 
-  /* "mpfmc/core/audio/track.pyx":581
- *         buffer_length = buffer_length // 2
+  /* "mpfmc/core/audio/track.pyx":649
+ *         cdef Uint32 i
  * 
- *         while buffer_pos < buffer_length:             # <<<<<<<<<<<<<<
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME
- *             buffer_pos += 1
+ *         for i in range(frame_count):             # <<<<<<<<<<<<<<
+ *             output_samples[2 * i] = <Sint16>((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+ *             output_samples[2 * i + 1] = <Sint16>((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_buffer_pos < __pyx_v_buffer_length) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_t_1 = __pyx_v_frame_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "mpfmc/core/audio/track.pyx":582
- * 
- *         while buffer_pos < buffer_length:
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
- *             buffer_pos += 1
+    /* "mpfmc/core/audio/track.pyx":650
  * 
- */
-    __pyx_t_2 = ((__pyx_v_input_samples[__pyx_v_buffer_pos]) * __pyx_v_volume_left);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 582, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 582, __pyx_L1_error)
-    }
-    (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
-
-    /* "mpfmc/core/audio/track.pyx":583
- *         while buffer_pos < buffer_length:
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME
- *             buffer_pos += 1             # <<<<<<<<<<<<<<
+ *         for i in range(frame_count):
+ *             output_samples[2 * i] = <Sint16>((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
+ *             output_samples[2 * i + 1] = <Sint16>((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
  * 
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
+    (__pyx_v_output_samples[(2 * __pyx_v_i)]) = ((Sint16)(((__pyx_v_input_samples[(2 * __pyx_v_i)]) * __pyx_v_volume_left) >> 7));
 
-    /* "mpfmc/core/audio/track.pyx":585
- *             buffer_pos += 1
+    /* "mpfmc/core/audio/track.pyx":651
+ *         for i in range(frame_count):
+ *             output_samples[2 * i] = <Sint16>((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+ *             output_samples[2 * i + 1] = <Sint16>((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)             # <<<<<<<<<<<<<<
  * 
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
- *             buffer_pos += 1
- */
-    __pyx_t_2 = ((__pyx_v_input_samples[__pyx_v_buffer_pos]) * __pyx_v_volume_right);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 585, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_2))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 585, __pyx_L1_error)
-    }
-    (__pyx_v_output_samples[__pyx_v_buffer_pos]) = __Pyx_div_int(__pyx_t_2, SDL_MIX_MAXVOLUME);
-
-    /* "mpfmc/core/audio/track.pyx":586
  * 
- *             output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME
- *             buffer_pos += 1             # <<<<<<<<<<<<<<
  */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + 1);
+    (__pyx_v_output_samples[((2 * __pyx_v_i) + 1)]) = ((Sint16)(((__pyx_v_input_samples[((2 * __pyx_v_i) + 1)]) * __pyx_v_volume_right) >> 7));
   }
 
-  /* "mpfmc/core/audio/track.pyx":556
+  /* "mpfmc/core/audio/track.pyx":627
  * 
  *     @staticmethod
  *     cdef void apply_volume_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,             # <<<<<<<<<<<<<<
@@ -6728,10 +7496,6 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.apply_volume_stereo", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
 }
 
 /* "(tree fragment)":1
@@ -6741,20 +7505,20 @@ static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(Uint8
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__[] = "Track.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_28__reduce_cython__[] = "Track.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -6799,20 +7563,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__[] = "Track.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_31__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_30__setstate_cython__[] = "Track.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_31__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_30__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_30__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -6849,149 +7613,2181 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/inline.pxd":7
+/* "mpfmc/core/audio/track.pyx":658
  * # ---------------------------------------------------------------------------
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Linearly interpolate between 2 8-bit values.
+ * cdef void _process_samples(bytearray output_buffer, object input_buffer, int volume_left, int volume_right,             # <<<<<<<<<<<<<<
+ *                            bint mix) except *:
+ *     """Calls a mixing function with the contents of two buffers."""
  */
 
-static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
-  Uint8 __pyx_r;
+static void __pyx_f_5mpfmc_4core_5audio_5track__process_samples(PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, int __pyx_v_volume_left, int __pyx_v_volume_right, int __pyx_v_mix) {
+  Py_buffer __pyx_v_input_view;
+  Uint8 *__pyx_v_output_data;
+  Uint32 __pyx_v_buffer_length;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  char const *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_process_samples", 0);
 
-  /* "mpfmc/core/audio/inline.pxd":18
- *         New 8-bit value between the supplied values
- *     """
- *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":662
+ *     """Calls a mixing function with the contents of two buffers."""
+ *     cdef Py_buffer input_view
+ *     cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)             # <<<<<<<<<<<<<<
+ *     cdef Uint32 buffer_length = len(output_buffer)
  * 
- * cdef inline float in_out_quad(float progress) nogil:
  */
-  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
-  goto __pyx_L0;
+  __pyx_v_output_data = ((Uint8 *)PyByteArray_AS_STRING(__pyx_v_output_buffer));
 
-  /* "mpfmc/core/audio/inline.pxd":7
- * # ---------------------------------------------------------------------------
+  /* "mpfmc/core/audio/track.pyx":663
+ *     cdef Py_buffer input_view
+ *     cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)
+ *     cdef Uint32 buffer_length = len(output_buffer)             # <<<<<<<<<<<<<<
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Linearly interpolate between 2 8-bit values.
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
  */
+  if (unlikely(__pyx_v_output_buffer == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 663, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyByteArray_GET_SIZE(__pyx_v_output_buffer); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 663, __pyx_L1_error)
+  __pyx_v_buffer_length = __pyx_t_1;
 
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
+  /* "mpfmc/core/audio/track.pyx":665
+ *     cdef Uint32 buffer_length = len(output_buffer)
+ * 
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ *     try:
+ *         if input_view.len != buffer_length:
+ */
+  __pyx_t_2 = PyObject_GetBuffer(__pyx_v_input_buffer, (&__pyx_v_input_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 665, __pyx_L1_error)
 
-/* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+  /* "mpfmc/core/audio/track.pyx":666
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     A quadratic easing function used for smoother audio fading
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:             # <<<<<<<<<<<<<<
+ *         if input_view.len != buffer_length:
+ *             raise ValueError("Input and output buffer must have the same length")
  */
+  /*try:*/ {
 
-static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
-  float __pyx_v_p;
-  float __pyx_r;
-  int __pyx_t_1;
+    /* "mpfmc/core/audio/track.pyx":667
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:
+ *         if input_view.len != buffer_length:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Input and output buffer must have the same length")
+ * 
+ */
+    __pyx_t_3 = ((__pyx_v_input_view.len != __pyx_v_buffer_length) != 0);
+    if (unlikely(__pyx_t_3)) {
 
-  /* "mpfmc/core/audio/inline.pxd":30
- *     """
- *     cdef float p
- *     p = progress * 2             # <<<<<<<<<<<<<<
- *     if p < 1:
- *         return 0.5 * p * p
+      /* "mpfmc/core/audio/track.pyx":668
+ *     try:
+ *         if input_view.len != buffer_length:
+ *             raise ValueError("Input and output buffer must have the same length")             # <<<<<<<<<<<<<<
+ * 
+ *         with nogil:
  */
-  __pyx_v_p = (__pyx_v_progress * 2.0);
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 668, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 668, __pyx_L4_error)
 
-  /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+      /* "mpfmc/core/audio/track.pyx":667
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:
+ *         if input_view.len != buffer_length:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Input and output buffer must have the same length")
+ * 
  */
-  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
-  if (__pyx_t_1) {
+    }
 
-    /* "mpfmc/core/audio/inline.pxd":32
- *     p = progress * 2
- *     if p < 1:
- *         return 0.5 * p * p             # <<<<<<<<<<<<<<
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+    /* "mpfmc/core/audio/track.pyx":670
+ *             raise ValueError("Input and output buffer must have the same length")
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             if mix and volume_right < 0:
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
  */
-    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
-    goto __pyx_L0;
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
 
-    /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+          /* "mpfmc/core/audio/track.pyx":671
+ * 
+ *         with nogil:
+ *             if mix and volume_right < 0:             # <<<<<<<<<<<<<<
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             elif mix:
+ */
+          __pyx_t_5 = (__pyx_v_mix != 0);
+          if (__pyx_t_5) {
+          } else {
+            __pyx_t_3 = __pyx_t_5;
+            goto __pyx_L11_bool_binop_done;
+          }
+          __pyx_t_5 = ((__pyx_v_volume_right < 0) != 0);
+          __pyx_t_3 = __pyx_t_5;
+          __pyx_L11_bool_binop_done:;
+          if (__pyx_t_3) {
+
+            /* "mpfmc/core/audio/track.pyx":672
+ *         with nogil:
+ *             if mix and volume_right < 0:
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)             # <<<<<<<<<<<<<<
+ *             elif mix:
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ */
+            __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio(__pyx_v_output_data, ((Uint8 const *)__pyx_v_input_view.buf), __pyx_v_buffer_length, __pyx_v_volume_left);
+
+            /* "mpfmc/core/audio/track.pyx":671
+ * 
+ *         with nogil:
+ *             if mix and volume_right < 0:             # <<<<<<<<<<<<<<
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             elif mix:
+ */
+            goto __pyx_L10;
+          }
+
+          /* "mpfmc/core/audio/track.pyx":673
+ *             if mix and volume_right < 0:
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             elif mix:             # <<<<<<<<<<<<<<
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ *                                        volume_left, volume_right)
+ */
+          __pyx_t_3 = (__pyx_v_mix != 0);
+          if (__pyx_t_3) {
+
+            /* "mpfmc/core/audio/track.pyx":674
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             elif mix:
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,             # <<<<<<<<<<<<<<
+ *                                        volume_left, volume_right)
+ *             elif volume_right < 0:
+ */
+            __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo(__pyx_v_output_data, ((Uint8 const *)__pyx_v_input_view.buf), __pyx_v_buffer_length, __pyx_v_volume_left, __pyx_v_volume_right);
+
+            /* "mpfmc/core/audio/track.pyx":673
+ *             if mix and volume_right < 0:
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             elif mix:             # <<<<<<<<<<<<<<
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ *                                        volume_left, volume_right)
+ */
+            goto __pyx_L10;
+          }
+
+          /* "mpfmc/core/audio/track.pyx":676
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ *                                        volume_left, volume_right)
+ *             elif volume_right < 0:             # <<<<<<<<<<<<<<
+ *                 Track.apply_volume(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             else:
+ */
+          __pyx_t_3 = ((__pyx_v_volume_right < 0) != 0);
+          if (__pyx_t_3) {
+
+            /* "mpfmc/core/audio/track.pyx":677
+ *                                        volume_left, volume_right)
+ *             elif volume_right < 0:
+ *                 Track.apply_volume(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 Track.apply_volume_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ */
+            __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume(__pyx_v_output_data, ((Uint8 const *)__pyx_v_input_view.buf), __pyx_v_buffer_length, __pyx_v_volume_left);
+
+            /* "mpfmc/core/audio/track.pyx":676
+ *                 Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ *                                        volume_left, volume_right)
+ *             elif volume_right < 0:             # <<<<<<<<<<<<<<
+ *                 Track.apply_volume(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             else:
+ */
+            goto __pyx_L10;
+          }
+
+          /* "mpfmc/core/audio/track.pyx":679
+ *                 Track.apply_volume(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+ *             else:
+ *                 Track.apply_volume_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,             # <<<<<<<<<<<<<<
+ *                                           volume_left, volume_right)
+ *     finally:
+ */
+          /*else*/ {
+
+            /* "mpfmc/core/audio/track.pyx":680
+ *             else:
+ *                 Track.apply_volume_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+ *                                           volume_left, volume_right)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         PyBuffer_Release(&input_view)
+ */
+            __pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo(__pyx_v_output_data, ((Uint8 const *)__pyx_v_input_view.buf), __pyx_v_buffer_length, __pyx_v_volume_left, __pyx_v_volume_right);
+          }
+          __pyx_L10:;
+        }
+
+        /* "mpfmc/core/audio/track.pyx":670
+ *             raise ValueError("Input and output buffer must have the same length")
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             if mix and volume_right < 0:
+ *                 Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
  */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
   }
 
-  /* "mpfmc/core/audio/inline.pxd":33
- *     if p < 1:
- *         return 0.5 * p * p
- *     p -= 1.0             # <<<<<<<<<<<<<<
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+  /* "mpfmc/core/audio/track.pyx":682
+ *                                           volume_left, volume_right)
+ *     finally:
+ *         PyBuffer_Release(&input_view)             # <<<<<<<<<<<<<<
+ * 
  * 
  */
-  __pyx_v_p = (__pyx_v_p - 1.0);
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_input_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10) < 0)) __Pyx_ErrFetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __pyx_t_2 = __pyx_lineno; __pyx_t_6 = __pyx_clineno; __pyx_t_7 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_input_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      }
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_ErrRestore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0;
+      __pyx_lineno = __pyx_t_2; __pyx_clineno = __pyx_t_6; __pyx_filename = __pyx_t_7;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
 
-  /* "mpfmc/core/audio/inline.pxd":34
- *         return 0.5 * p * p
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":658
+ * # ---------------------------------------------------------------------------
  * 
+ * cdef void _process_samples(bytearray output_buffer, object input_buffer, int volume_left, int volume_right,             # <<<<<<<<<<<<<<
+ *                            bint mix) except *:
+ *     """Calls a mixing function with the contents of two buffers."""
  */
-  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("mpfmc.core.audio.track._process_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/core/audio/track.pyx":685
+ * 
+ * 
+ * def mix_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                 int volume_right=-1):
+ *     """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_1mix_samples(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_mix_samples[] = "mix_samples(bytearray output_buffer, input_buffer, int volume_left, int volume_right=-1)\n\n    Mixes 16-bit input samples into the output samples (in place) using the same function as the audio callback.\n    Args:\n        output_buffer: Output samples\n        input_buffer: Input samples (bytes or any other buffer with the same length as the output buffer)\n        volume_left: Volume (0 to 128) of all samples or of the left channel\n        volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.\n    ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_5track_1mix_samples = {"mix_samples", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_1mix_samples, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_mix_samples};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_1mix_samples(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_output_buffer = 0;
+  PyObject *__pyx_v_input_buffer = 0;
+  int __pyx_v_volume_left;
+  int __pyx_v_volume_right;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("mix_samples (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_output_buffer,&__pyx_n_s_input_buffer,&__pyx_n_s_volume_left,&__pyx_n_s_volume_right,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_output_buffer)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_input_buffer)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("mix_samples", 0, 3, 4, 1); __PYX_ERR(0, 685, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_volume_left)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("mix_samples", 0, 3, 4, 2); __PYX_ERR(0, 685, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_volume_right);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "mix_samples") < 0)) __PYX_ERR(0, 685, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_output_buffer = ((PyObject*)values[0]);
+    __pyx_v_input_buffer = values[1];
+    __pyx_v_volume_left = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_volume_left == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 685, __pyx_L3_error)
+    if (values[3]) {
+      __pyx_v_volume_right = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_volume_right == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 686, __pyx_L3_error)
+    } else {
+      __pyx_v_volume_right = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("mix_samples", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 685, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.mix_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_output_buffer), (&PyByteArray_Type), 0, "output_buffer", 1))) __PYX_ERR(0, 685, __pyx_L1_error)
+  if (unlikely(((PyObject *)__pyx_v_input_buffer) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "input_buffer"); __PYX_ERR(0, 685, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_mix_samples(__pyx_self, __pyx_v_output_buffer, __pyx_v_input_buffer, __pyx_v_volume_left, __pyx_v_volume_right);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_mix_samples(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, int __pyx_v_volume_left, int __pyx_v_volume_right) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("mix_samples", 0);
+
+  /* "mpfmc/core/audio/track.pyx":695
+ *         volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.
+ *     """
+ *     _process_samples(output_buffer, input_buffer, volume_left, volume_right, True)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_f_5mpfmc_4core_5audio_5track__process_samples(__pyx_v_output_buffer, __pyx_v_input_buffer, __pyx_v_volume_left, __pyx_v_volume_right, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 695, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":685
+ * 
+ * 
+ * def mix_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                 int volume_right=-1):
+ *     """
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.mix_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":698
+ * 
+ * 
+ * def apply_volume_to_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                             int volume_right=-1):
+ *     """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_3apply_volume_to_samples(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_2apply_volume_to_samples[] = "apply_volume_to_samples(bytearray output_buffer, input_buffer, int volume_left, int volume_right=-1)\n\n    Copies 16-bit input samples with the volume applied into the output buffer using the same function as the\n    audio callback.\n    Args:\n        output_buffer: Output samples\n        input_buffer: Input samples (bytes or any other buffer with the same length as the output buffer). This\n            may be the output buffer.\n        volume_left: Volume (0 to 128) of all samples or of the left channel\n        volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.\n    ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_5track_3apply_volume_to_samples = {"apply_volume_to_samples", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_3apply_volume_to_samples, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_2apply_volume_to_samples};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_3apply_volume_to_samples(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_output_buffer = 0;
+  PyObject *__pyx_v_input_buffer = 0;
+  int __pyx_v_volume_left;
+  int __pyx_v_volume_right;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("apply_volume_to_samples (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_output_buffer,&__pyx_n_s_input_buffer,&__pyx_n_s_volume_left,&__pyx_n_s_volume_right,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_output_buffer)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_input_buffer)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("apply_volume_to_samples", 0, 3, 4, 1); __PYX_ERR(0, 698, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_volume_left)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("apply_volume_to_samples", 0, 3, 4, 2); __PYX_ERR(0, 698, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_volume_right);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "apply_volume_to_samples") < 0)) __PYX_ERR(0, 698, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_output_buffer = ((PyObject*)values[0]);
+    __pyx_v_input_buffer = values[1];
+    __pyx_v_volume_left = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_volume_left == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 698, __pyx_L3_error)
+    if (values[3]) {
+      __pyx_v_volume_right = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_volume_right == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 699, __pyx_L3_error)
+    } else {
+      __pyx_v_volume_right = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("apply_volume_to_samples", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 698, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.apply_volume_to_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_output_buffer), (&PyByteArray_Type), 0, "output_buffer", 1))) __PYX_ERR(0, 698, __pyx_L1_error)
+  if (unlikely(((PyObject *)__pyx_v_input_buffer) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "input_buffer"); __PYX_ERR(0, 698, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_2apply_volume_to_samples(__pyx_self, __pyx_v_output_buffer, __pyx_v_input_buffer, __pyx_v_volume_left, __pyx_v_volume_right);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_2apply_volume_to_samples(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, int __pyx_v_volume_left, int __pyx_v_volume_right) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("apply_volume_to_samples", 0);
+
+  /* "mpfmc/core/audio/track.pyx":710
+ *         volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.
+ *     """
+ *     _process_samples(output_buffer, input_buffer, volume_left, volume_right, False)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_f_5mpfmc_4core_5audio_5track__process_samples(__pyx_v_output_buffer, __pyx_v_input_buffer, __pyx_v_volume_left, __pyx_v_volume_right, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 710, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":698
+ * 
+ * 
+ * def apply_volume_to_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                             int volume_right=-1):
+ *     """
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.apply_volume_to_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":713
+ * 
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,             # <<<<<<<<<<<<<<
+ *                             bint soft_limiter=False):
+ *     """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5float_samples_to_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_4float_samples_to_output[] = "float_samples_to_output(bytearray output_buffer, input_buffer, float gain=1.0, bool soft_limiter=False)\n\n    Converts float samples of the float mix bus to 16-bit output samples using the same function as the audio\n    callback.\n    Args:\n        output_buffer: Output samples (2 bytes per sample)\n        input_buffer: Float samples (e.g. an array('f'), 4 bytes per sample)\n        gain: Gain (master volume) to apply to the samples\n        soft_limiter: Whether to use the soft limiter\n    ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_5track_5float_samples_to_output = {"float_samples_to_output", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_5float_samples_to_output, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_4float_samples_to_output};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5float_samples_to_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_output_buffer = 0;
+  PyObject *__pyx_v_input_buffer = 0;
+  float __pyx_v_gain;
+  int __pyx_v_soft_limiter;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("float_samples_to_output (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_output_buffer,&__pyx_n_s_input_buffer,&__pyx_n_s_gain,&__pyx_n_s_soft_limiter,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_output_buffer)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_input_buffer)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("float_samples_to_output", 0, 2, 4, 1); __PYX_ERR(0, 713, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gain);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_soft_limiter);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "float_samples_to_output") < 0)) __PYX_ERR(0, 713, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_output_buffer = ((PyObject*)values[0]);
+    __pyx_v_input_buffer = values[1];
+    if (values[2]) {
+      __pyx_v_gain = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_gain == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 713, __pyx_L3_error)
+    } else {
+      __pyx_v_gain = ((float)1.0);
+    }
+    if (values[3]) {
+      __pyx_v_soft_limiter = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_soft_limiter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 714, __pyx_L3_error)
+    } else {
+
+      /* "mpfmc/core/audio/track.pyx":714
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,
+ *                             bint soft_limiter=False):             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts float samples of the float mix bus to 16-bit output samples using the same function as the audio
+ */
+      __pyx_v_soft_limiter = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("float_samples_to_output", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 713, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.float_samples_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_output_buffer), (&PyByteArray_Type), 0, "output_buffer", 1))) __PYX_ERR(0, 713, __pyx_L1_error)
+  if (unlikely(((PyObject *)__pyx_v_input_buffer) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "input_buffer"); __PYX_ERR(0, 713, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_4float_samples_to_output(__pyx_self, __pyx_v_output_buffer, __pyx_v_input_buffer, __pyx_v_gain, __pyx_v_soft_limiter);
+
+  /* "mpfmc/core/audio/track.pyx":713
+ * 
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,             # <<<<<<<<<<<<<<
+ *                             bint soft_limiter=False):
+ *     """
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_4float_samples_to_output(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_output_buffer, PyObject *__pyx_v_input_buffer, float __pyx_v_gain, int __pyx_v_soft_limiter) {
+  Py_buffer __pyx_v_input_view;
+  Uint8 *__pyx_v_output_data;
+  Uint32 __pyx_v_sample_count;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  char const *__pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("float_samples_to_output", 0);
+
+  /* "mpfmc/core/audio/track.pyx":725
+ *     """
+ *     cdef Py_buffer input_view
+ *     cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)             # <<<<<<<<<<<<<<
+ *     cdef Uint32 sample_count = len(output_buffer) // 2
+ * 
+ */
+  __pyx_v_output_data = ((Uint8 *)PyByteArray_AS_STRING(__pyx_v_output_buffer));
+
+  /* "mpfmc/core/audio/track.pyx":726
+ *     cdef Py_buffer input_view
+ *     cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)
+ *     cdef Uint32 sample_count = len(output_buffer) // 2             # <<<<<<<<<<<<<<
+ * 
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ */
+  __pyx_t_1 = PyByteArray_GET_SIZE(__pyx_v_output_buffer); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 726, __pyx_L1_error)
+  __pyx_v_sample_count = __Pyx_div_Py_ssize_t(__pyx_t_1, 2);
+
+  /* "mpfmc/core/audio/track.pyx":728
+ *     cdef Uint32 sample_count = len(output_buffer) // 2
+ * 
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ *     try:
+ *         if input_view.len != sample_count * sizeof(float):
+ */
+  __pyx_t_2 = PyObject_GetBuffer(__pyx_v_input_buffer, (&__pyx_v_input_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 728, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":729
+ * 
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:             # <<<<<<<<<<<<<<
+ *         if input_view.len != sample_count * sizeof(float):
+ *             raise ValueError("Input and output buffer must have the same number of samples")
+ */
+  /*try:*/ {
+
+    /* "mpfmc/core/audio/track.pyx":730
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:
+ *         if input_view.len != sample_count * sizeof(float):             # <<<<<<<<<<<<<<
+ *             raise ValueError("Input and output buffer must have the same number of samples")
+ * 
+ */
+    __pyx_t_3 = ((__pyx_v_input_view.len != (__pyx_v_sample_count * (sizeof(float)))) != 0);
+    if (unlikely(__pyx_t_3)) {
+
+      /* "mpfmc/core/audio/track.pyx":731
+ *     try:
+ *         if input_view.len != sample_count * sizeof(float):
+ *             raise ValueError("Input and output buffer must have the same number of samples")             # <<<<<<<<<<<<<<
+ * 
+ *         with nogil:
+ */
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 731, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 731, __pyx_L4_error)
+
+      /* "mpfmc/core/audio/track.pyx":730
+ *     PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+ *     try:
+ *         if input_view.len != sample_count * sizeof(float):             # <<<<<<<<<<<<<<
+ *             raise ValueError("Input and output buffer must have the same number of samples")
+ * 
+ */
+    }
+
+    /* "mpfmc/core/audio/track.pyx":733
+ *             raise ValueError("Input and output buffer must have the same number of samples")
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             Track.convert_float_to_output(output_data, <const float*>input_view.buf, sample_count, gain, soft_limiter)
+ *     finally:
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "mpfmc/core/audio/track.pyx":734
+ * 
+ *         with nogil:
+ *             Track.convert_float_to_output(output_data, <const float*>input_view.buf, sample_count, gain, soft_limiter)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         PyBuffer_Release(&input_view)
+ */
+          __pyx_f_5mpfmc_4core_5audio_5track_5Track_convert_float_to_output(__pyx_v_output_data, ((float const *)__pyx_v_input_view.buf), __pyx_v_sample_count, __pyx_v_gain, __pyx_v_soft_limiter);
+        }
+
+        /* "mpfmc/core/audio/track.pyx":733
+ *             raise ValueError("Input and output buffer must have the same number of samples")
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             Track.convert_float_to_output(output_data, <const float*>input_view.buf, sample_count, gain, soft_limiter)
+ *     finally:
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+  }
+
+  /* "mpfmc/core/audio/track.pyx":736
+ *             Track.convert_float_to_output(output_data, <const float*>input_view.buf, sample_count, gain, soft_limiter)
+ *     finally:
+ *         PyBuffer_Release(&input_view)             # <<<<<<<<<<<<<<
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_input_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9) < 0)) __Pyx_ErrFetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __pyx_t_2 = __pyx_lineno; __pyx_t_5 = __pyx_clineno; __pyx_t_6 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_input_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+      }
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_ErrRestore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+      __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+      __pyx_lineno = __pyx_t_2; __pyx_clineno = __pyx_t_5; __pyx_filename = __pyx_t_6;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":713
+ * 
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,             # <<<<<<<<<<<<<<
+ *                             bint soft_limiter=False):
+ *     """
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.float_samples_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":28
+ * 
+ * 
+ * cdef inline MessageRing *message_ring_create(Uint32 capacity, Uint32 message_size):             # <<<<<<<<<<<<<<
+ *     """
+ *     Allocates a new message ring.
+ */
+
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_create(Uint32 __pyx_v_capacity, Uint32 __pyx_v_message_size) {
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring;
+  __pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("message_ring_create", 0);
+
+  /* "mpfmc/core/audio/message_ring.pxd":38
+ *         A pointer to the new message ring (free it with message_ring_free).
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))             # <<<<<<<<<<<<<<
+ *     if ring == NULL:
+ *         return NULL
+ */
+  __pyx_v_ring = ((__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing))));
+
+  /* "mpfmc/core/audio/message_ring.pxd":39
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_ring == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":40
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":39
+ *     """
+ *     cdef MessageRing *ring = <MessageRing*>PyMem_Malloc(sizeof(MessageRing))
+ *     if ring == NULL:             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":42
+ *         return NULL
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)             # <<<<<<<<<<<<<<
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)
+ */
+  __pyx_v_ring->messages = ((Uint8 *)PyMem_Malloc((__pyx_v_capacity * __pyx_v_message_size)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":43
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ *         return NULL
+ */
+  __pyx_t_1 = ((__pyx_v_ring->messages == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":44
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+    PyMem_Free(__pyx_v_ring);
+
+    /* "mpfmc/core/audio/message_ring.pxd":45
+ *     if ring.messages == NULL:
+ *         PyMem_Free(ring)
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":43
+ * 
+ *     ring.messages = <Uint8*>PyMem_Malloc(capacity * message_size)
+ *     if ring.messages == NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ *         return NULL
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":47
+ *         return NULL
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)             # <<<<<<<<<<<<<<
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity
+ */
+  (void)(SDL_AtomicSet((&__pyx_v_ring->write_index), 0));
+
+  /* "mpfmc/core/audio/message_ring.pxd":48
+ * 
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ *     SDL_AtomicSet(&ring.read_index, 0)             # <<<<<<<<<<<<<<
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size
+ */
+  (void)(SDL_AtomicSet((&__pyx_v_ring->read_index), 0));
+
+  /* "mpfmc/core/audio/message_ring.pxd":49
+ *     SDL_AtomicSet(&ring.write_index, 0)
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity             # <<<<<<<<<<<<<<
+ *     ring.message_size = message_size
+ *     ring.dropped = 0
+ */
+  __pyx_v_ring->capacity = __pyx_v_capacity;
+
+  /* "mpfmc/core/audio/message_ring.pxd":50
+ *     SDL_AtomicSet(&ring.read_index, 0)
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size             # <<<<<<<<<<<<<<
+ *     ring.dropped = 0
+ *     return ring
+ */
+  __pyx_v_ring->message_size = __pyx_v_message_size;
+
+  /* "mpfmc/core/audio/message_ring.pxd":51
+ *     ring.capacity = capacity
+ *     ring.message_size = message_size
+ *     ring.dropped = 0             # <<<<<<<<<<<<<<
+ *     return ring
+ * 
+ */
+  __pyx_v_ring->dropped = 0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":52
+ *     ring.message_size = message_size
+ *     ring.dropped = 0
+ *     return ring             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):
+ */
+  __pyx_r = __pyx_v_ring;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":28
+ * 
+ * 
+ * cdef inline MessageRing *message_ring_create(Uint32 capacity, Uint32 message_size):             # <<<<<<<<<<<<<<
+ *     """
+ *     Allocates a new message ring.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":54
+ *     return ring
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):             # <<<<<<<<<<<<<<
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_free(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("message_ring_free", 0);
+
+  /* "mpfmc/core/audio/message_ring.pxd":56
+ * cdef inline void message_ring_free(MessageRing *ring):
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)
+ */
+  __pyx_t_1 = ((__pyx_v_ring != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":57
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ *         PyMem_Free(ring.messages)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring)
+ * 
+ */
+    PyMem_Free(__pyx_v_ring->messages);
+
+    /* "mpfmc/core/audio/message_ring.pxd":58
+ *     if ring != NULL:
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:
+ */
+    PyMem_Free(__pyx_v_ring);
+
+    /* "mpfmc/core/audio/message_ring.pxd":56
+ * cdef inline void message_ring_free(MessageRing *ring):
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:             # <<<<<<<<<<<<<<
+ *         PyMem_Free(ring.messages)
+ *         PyMem_Free(ring)
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":54
+ *     return ring
+ * 
+ * cdef inline void message_ring_free(MessageRing *ring):             # <<<<<<<<<<<<<<
+ *     """Frees a message ring and all messages in it."""
+ *     if ring != NULL:
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":60
+ *         PyMem_Free(ring)
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the next free message (zero filled) to the producer. The message is passed to the
+ */
+
+static CYTHON_INLINE void *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_reserve(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  Uint32 __pyx_v_write_index;
+  Uint8 *__pyx_v_message;
+  void *__pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/message_ring.pxd":66
+ *     ring.dropped) and NULL is returned.
+ *     """
+ *     cdef Uint32 write_index = <Uint32>SDL_AtomicGet(&ring.write_index)             # <<<<<<<<<<<<<<
+ *     cdef Uint8 *message
+ * 
+ */
+  __pyx_v_write_index = ((Uint32)SDL_AtomicGet((&__pyx_v_ring->write_index)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":69
+ *     cdef Uint8 *message
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:             # <<<<<<<<<<<<<<
+ *         ring.dropped += 1
+ *         return NULL
+ */
+  __pyx_t_1 = (((__pyx_v_write_index - ((Uint32)SDL_AtomicGet((&__pyx_v_ring->read_index)))) >= __pyx_v_ring->capacity) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":70
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:
+ *         ring.dropped += 1             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+    __pyx_v_ring->dropped = (__pyx_v_ring->dropped + 1);
+
+    /* "mpfmc/core/audio/message_ring.pxd":71
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:
+ *         ring.dropped += 1
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":69
+ *     cdef Uint8 *message
+ * 
+ *     if write_index - <Uint32>SDL_AtomicGet(&ring.read_index) >= ring.capacity:             # <<<<<<<<<<<<<<
+ *         ring.dropped += 1
+ *         return NULL
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":73
+ *         return NULL
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size             # <<<<<<<<<<<<<<
+ *     memset(message, 0, ring.message_size)
+ *     return message
+ */
+  __pyx_v_message = (__pyx_v_ring->messages + ((__pyx_v_write_index & (__pyx_v_ring->capacity - 1)) * __pyx_v_ring->message_size));
+
+  /* "mpfmc/core/audio/message_ring.pxd":74
+ * 
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ *     memset(message, 0, ring.message_size)             # <<<<<<<<<<<<<<
+ *     return message
+ * 
+ */
+  (void)(memset(__pyx_v_message, 0, __pyx_v_ring->message_size));
+
+  /* "mpfmc/core/audio/message_ring.pxd":75
+ *     message = ring.messages + (write_index & (ring.capacity - 1)) * ring.message_size
+ *     memset(message, 0, ring.message_size)
+ *     return message             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:
+ */
+  __pyx_r = __pyx_v_message;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":60
+ *         PyMem_Free(ring)
+ * 
+ * cdef inline void *message_ring_reserve(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns the next free message (zero filled) to the producer. The message is passed to the
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":77
+ *     return message
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+
+  /* "mpfmc/core/audio/message_ring.pxd":79
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:
+ */
+  (void)(SDL_AtomicAdd((&__pyx_v_ring->write_index), 1));
+
+  /* "mpfmc/core/audio/message_ring.pxd":77
+ *     return message
+ * 
+ * cdef inline void message_ring_commit(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Passes the message returned by message_ring_reserve to the consumer."""
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":81
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ */
+
+static CYTHON_INLINE void *__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_peek(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+  Uint32 __pyx_v_read_index;
+  void *__pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/message_ring.pxd":83
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)             # <<<<<<<<<<<<<<
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):
+ */
+  __pyx_v_read_index = ((Uint32)SDL_AtomicGet((&__pyx_v_ring->read_index)));
+
+  /* "mpfmc/core/audio/message_ring.pxd":85
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_read_index == ((Uint32)SDL_AtomicGet((&__pyx_v_ring->write_index)))) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/message_ring.pxd":86
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):
+ *         return NULL             # <<<<<<<<<<<<<<
+ * 
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/message_ring.pxd":85
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ * 
+ *     if read_index == <Uint32>SDL_AtomicGet(&ring.write_index):             # <<<<<<<<<<<<<<
+ *         return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/message_ring.pxd":88
+ *         return NULL
+ * 
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:
+ */
+  __pyx_r = (__pyx_v_ring->messages + ((__pyx_v_read_index & (__pyx_v_ring->capacity - 1)) * __pyx_v_ring->message_size));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/message_ring.pxd":81
+ *     SDL_AtomicAdd(&ring.write_index, 1)
+ * 
+ * cdef inline void *message_ring_peek(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the oldest message to the consumer (or NULL if the ring is empty)."""
+ *     cdef Uint32 read_index = <Uint32>SDL_AtomicGet(&ring.read_index)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/message_ring.pxd":90
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_release(__pyx_t_5mpfmc_4core_5audio_12message_ring_MessageRing *__pyx_v_ring) {
+
+  /* "mpfmc/core/audio/message_ring.pxd":92
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)             # <<<<<<<<<<<<<<
+ */
+  (void)(SDL_AtomicAdd((&__pyx_v_ring->read_index), 1));
+
+  /* "mpfmc/core/audio/message_ring.pxd":90
+ *     return ring.messages + (read_index & (ring.capacity - 1)) * ring.message_size
+ * 
+ * cdef inline void message_ring_release(MessageRing *ring) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the message returned by message_ring_peek to the producer."""
+ *     SDL_AtomicAdd(&ring.read_index, 1)
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
+  Uint8 __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":18
+ *         New 8-bit value between the supplied values
+ *     """
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:
+ */
+  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
+  float __pyx_v_p;
+  float __pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/inline.pxd":30
+ *     """
+ *     cdef float p
+ *     p = progress * 2             # <<<<<<<<<<<<<<
+ *     if p < 1:
+ *         return 0.5 * p * p
+ */
+  __pyx_v_p = (__pyx_v_progress * 2.0);
+
+  /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/inline.pxd":32
+ *     p = progress * 2
+ *     if p < 1:
+ *         return 0.5 * p * p             # <<<<<<<<<<<<<<
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ */
+    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  }
+
+  /* "mpfmc/core/audio/inline.pxd":33
+ *     if p < 1:
+ *         return 0.5 * p * p
+ *     p -= 1.0             # <<<<<<<<<<<<<<
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ * 
+ */
+  __pyx_v_p = (__pyx_v_p - 1.0);
+
+  /* "mpfmc/core/audio/inline.pxd":34
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+ * 
+ */
+  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/audio_timing.pxd":10
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void timing_stats_add(AudioTimingStats *stats, Uint64 duration, Uint64 period_ticks) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Adds a duration to the timing statistics (called in the audio thread, the caller owns stats).
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_add(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *__pyx_v_stats, Uint64 __pyx_v_duration, Uint64 __pyx_v_period_ticks) {
+  Uint64 __pyx_v_index;
+  Uint64 __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  Uint64 __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":18
+ *         period_ticks: The duration of one buffer (in SDL performance counter ticks)
+ *     """
+ *     cdef Uint64 index = duration * TIMING_BINS_PER_PERIOD // period_ticks             # <<<<<<<<<<<<<<
+ * 
+ *     if stats.count == 0 or duration < stats.minimum:
+ */
+  __pyx_t_1 = (__pyx_v_duration * __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD);
+  if (unlikely(__pyx_v_period_ticks == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(2, 18, __pyx_L1_error)
+  }
+  __pyx_v_index = (__pyx_t_1 / __pyx_v_period_ticks);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":20
+ *     cdef Uint64 index = duration * TIMING_BINS_PER_PERIOD // period_ticks
+ * 
+ *     if stats.count == 0 or duration < stats.minimum:             # <<<<<<<<<<<<<<
+ *         stats.minimum = duration
+ *     if duration > stats.maximum:
+ */
+  __pyx_t_3 = ((__pyx_v_stats->count == 0) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_duration < __pyx_v_stats->minimum) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/audio_timing.pxd":21
+ * 
+ *     if stats.count == 0 or duration < stats.minimum:
+ *         stats.minimum = duration             # <<<<<<<<<<<<<<
+ *     if duration > stats.maximum:
+ *         stats.maximum = duration
+ */
+    __pyx_v_stats->minimum = __pyx_v_duration;
+
+    /* "mpfmc/core/audio/audio_timing.pxd":20
+ *     cdef Uint64 index = duration * TIMING_BINS_PER_PERIOD // period_ticks
+ * 
+ *     if stats.count == 0 or duration < stats.minimum:             # <<<<<<<<<<<<<<
+ *         stats.minimum = duration
+ *     if duration > stats.maximum:
+ */
+  }
+
+  /* "mpfmc/core/audio/audio_timing.pxd":22
+ *     if stats.count == 0 or duration < stats.minimum:
+ *         stats.minimum = duration
+ *     if duration > stats.maximum:             # <<<<<<<<<<<<<<
+ *         stats.maximum = duration
+ *     if duration > period_ticks:
+ */
+  __pyx_t_2 = ((__pyx_v_duration > __pyx_v_stats->maximum) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/audio_timing.pxd":23
+ *         stats.minimum = duration
+ *     if duration > stats.maximum:
+ *         stats.maximum = duration             # <<<<<<<<<<<<<<
+ *     if duration > period_ticks:
+ *         stats.missed_deadlines += 1
+ */
+    __pyx_v_stats->maximum = __pyx_v_duration;
+
+    /* "mpfmc/core/audio/audio_timing.pxd":22
+ *     if stats.count == 0 or duration < stats.minimum:
+ *         stats.minimum = duration
+ *     if duration > stats.maximum:             # <<<<<<<<<<<<<<
+ *         stats.maximum = duration
+ *     if duration > period_ticks:
+ */
+  }
+
+  /* "mpfmc/core/audio/audio_timing.pxd":24
+ *     if duration > stats.maximum:
+ *         stats.maximum = duration
+ *     if duration > period_ticks:             # <<<<<<<<<<<<<<
+ *         stats.missed_deadlines += 1
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_duration > __pyx_v_period_ticks) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/audio_timing.pxd":25
+ *         stats.maximum = duration
+ *     if duration > period_ticks:
+ *         stats.missed_deadlines += 1             # <<<<<<<<<<<<<<
+ * 
+ *     stats.count += 1
+ */
+    __pyx_v_stats->missed_deadlines = (__pyx_v_stats->missed_deadlines + 1);
+
+    /* "mpfmc/core/audio/audio_timing.pxd":24
+ *     if duration > stats.maximum:
+ *         stats.maximum = duration
+ *     if duration > period_ticks:             # <<<<<<<<<<<<<<
+ *         stats.missed_deadlines += 1
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/audio_timing.pxd":27
+ *         stats.missed_deadlines += 1
+ * 
+ *     stats.count += 1             # <<<<<<<<<<<<<<
+ *     stats.total += duration
+ *     stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1
+ */
+  __pyx_v_stats->count = (__pyx_v_stats->count + 1);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":28
+ * 
+ *     stats.count += 1
+ *     stats.total += duration             # <<<<<<<<<<<<<<
+ *     stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1
+ * 
+ */
+  __pyx_v_stats->total = (__pyx_v_stats->total + __pyx_v_duration);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":29
+ *     stats.count += 1
+ *     stats.total += duration
+ *     stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void timing_stats_reset(AudioTimingStats *stats) nogil:
+ */
+  __pyx_t_4 = (__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS - 1);
+  __pyx_t_1 = __pyx_v_index;
+  if (((__pyx_t_4 < __pyx_t_1) != 0)) {
+    __pyx_t_5 = __pyx_t_4;
+  } else {
+    __pyx_t_5 = __pyx_t_1;
+  }
+  __pyx_t_1 = __pyx_t_5;
+  (__pyx_v_stats->histogram[__pyx_t_1]) = ((__pyx_v_stats->histogram[__pyx_t_1]) + 1);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":10
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void timing_stats_add(AudioTimingStats *stats, Uint64 duration, Uint64 period_ticks) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Adds a duration to the timing statistics (called in the audio thread, the caller owns stats).
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.audio_timing.timing_stats_add", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/audio_timing.pxd":31
+ *     stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1
+ * 
+ * cdef inline void timing_stats_reset(AudioTimingStats *stats) nogil:             # <<<<<<<<<<<<<<
+ *     """Resets the timing statistics."""
+ *     memset(stats, 0, sizeof(AudioTimingStats))
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_reset(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *__pyx_v_stats) {
+
+  /* "mpfmc/core/audio/audio_timing.pxd":33
+ * cdef inline void timing_stats_reset(AudioTimingStats *stats) nogil:
+ *     """Resets the timing statistics."""
+ *     memset(stats, 0, sizeof(AudioTimingStats))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dict timing_stats_to_dict(AudioTimingStats *stats, Uint64 period_ticks):
+ */
+  (void)(memset(__pyx_v_stats, 0, (sizeof(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats))));
+
+  /* "mpfmc/core/audio/audio_timing.pxd":31
+ *     stats.histogram[min(index, TIMING_HISTOGRAM_BINS - 1)] += 1
+ * 
+ * cdef inline void timing_stats_reset(AudioTimingStats *stats) nogil:             # <<<<<<<<<<<<<<
+ *     """Resets the timing statistics."""
+ *     memset(stats, 0, sizeof(AudioTimingStats))
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/audio_timing.pxd":35
+ *     memset(stats, 0, sizeof(AudioTimingStats))
+ * 
+ * cdef inline dict timing_stats_to_dict(AudioTimingStats *stats, Uint64 period_ticks):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns a dictionary of the timing statistics. Durations are in milliseconds and the share
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_to_dict(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *__pyx_v_stats, Uint64 __pyx_v_period_ticks) {
+  double __pyx_v_ms_per_tick;
+  Uint64 __pyx_v_count;
+  Uint64 __pyx_v_total;
+  int __pyx_v_index;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Uint64 __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  Uint64 __pyx_t_10;
+  double __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("timing_stats_to_dict", 0);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":41
+ *     bound of the histogram bin it falls into (limited by the maximum).
+ *     """
+ *     cdef double ms_per_tick = 1000.0 / SDL_GetPerformanceFrequency()             # <<<<<<<<<<<<<<
+ *     cdef Uint64 count = stats.count
+ *     cdef Uint64 total = 0
+ */
+  __pyx_t_1 = SDL_GetPerformanceFrequency();
+  if (unlikely(__pyx_t_1 == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(2, 41, __pyx_L1_error)
+  }
+  __pyx_v_ms_per_tick = (1000.0 / ((double)__pyx_t_1));
+
+  /* "mpfmc/core/audio/audio_timing.pxd":42
+ *     """
+ *     cdef double ms_per_tick = 1000.0 / SDL_GetPerformanceFrequency()
+ *     cdef Uint64 count = stats.count             # <<<<<<<<<<<<<<
+ *     cdef Uint64 total = 0
+ *     cdef int index
+ */
+  __pyx_t_1 = __pyx_v_stats->count;
+  __pyx_v_count = __pyx_t_1;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":43
+ *     cdef double ms_per_tick = 1000.0 / SDL_GetPerformanceFrequency()
+ *     cdef Uint64 count = stats.count
+ *     cdef Uint64 total = 0             # <<<<<<<<<<<<<<
+ *     cdef int index
+ * 
+ */
+  __pyx_v_total = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":46
+ *     cdef int index
+ * 
+ *     if count == 0:             # <<<<<<<<<<<<<<
+ *         return {'count': 0}
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_count == 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/audio_timing.pxd":47
+ * 
+ *     if count == 0:
+ *         return {'count': 0}             # <<<<<<<<<<<<<<
+ * 
+ *     for index in range(TIMING_HISTOGRAM_BINS):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 47, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_count, __pyx_int_0) < 0) __PYX_ERR(2, 47, __pyx_L1_error)
+    __pyx_r = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/audio_timing.pxd":46
+ *     cdef int index
+ * 
+ *     if count == 0:             # <<<<<<<<<<<<<<
+ *         return {'count': 0}
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/audio_timing.pxd":49
+ *         return {'count': 0}
+ * 
+ *     for index in range(TIMING_HISTOGRAM_BINS):             # <<<<<<<<<<<<<<
+ *         total += stats.histogram[index]
+ *         if total >= 0.99 * count:
+ */
+  __pyx_t_4 = __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_index = __pyx_t_6;
+
+    /* "mpfmc/core/audio/audio_timing.pxd":50
+ * 
+ *     for index in range(TIMING_HISTOGRAM_BINS):
+ *         total += stats.histogram[index]             # <<<<<<<<<<<<<<
+ *         if total >= 0.99 * count:
+ *             break
+ */
+    __pyx_v_total = (__pyx_v_total + (__pyx_v_stats->histogram[__pyx_v_index]));
+
+    /* "mpfmc/core/audio/audio_timing.pxd":51
+ *     for index in range(TIMING_HISTOGRAM_BINS):
+ *         total += stats.histogram[index]
+ *         if total >= 0.99 * count:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    __pyx_t_2 = ((__pyx_v_total >= (0.99 * __pyx_v_count)) != 0);
+    if (__pyx_t_2) {
+
+      /* "mpfmc/core/audio/audio_timing.pxd":52
+ *         total += stats.histogram[index]
+ *         if total >= 0.99 * count:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     return {'count': count,
+ */
+      goto __pyx_L5_break;
+
+      /* "mpfmc/core/audio/audio_timing.pxd":51
+ *     for index in range(TIMING_HISTOGRAM_BINS):
+ *         total += stats.histogram[index]
+ *         if total >= 0.99 * count:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    }
+  }
+  __pyx_L5_break:;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":54
+ *             break
+ * 
+ *     return {'count': count,             # <<<<<<<<<<<<<<
+ *             'min': round(stats.minimum * ms_per_tick, 3),
+ *             'mean': round(stats.total * ms_per_tick / count, 3),
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_7 = __Pyx_PyInt_From_Uint64(__pyx_v_count); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_count, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":55
+ * 
+ *     return {'count': count,
+ *             'min': round(stats.minimum * ms_per_tick, 3),             # <<<<<<<<<<<<<<
+ *             'mean': round(stats.total * ms_per_tick / count, 3),
+ *             'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),
+ */
+  __pyx_t_7 = PyFloat_FromDouble((__pyx_v_stats->minimum * __pyx_v_ms_per_tick)); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_int_3);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_min, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":56
+ *     return {'count': count,
+ *             'min': round(stats.minimum * ms_per_tick, 3),
+ *             'mean': round(stats.total * ms_per_tick / count, 3),             # <<<<<<<<<<<<<<
+ *             'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),
+ *             'max': round(stats.maximum * ms_per_tick, 3),
+ */
+  __pyx_t_9 = (__pyx_v_stats->total * __pyx_v_ms_per_tick);
+  if (unlikely(__pyx_v_count == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(2, 56, __pyx_L1_error)
+  }
+  __pyx_t_7 = PyFloat_FromDouble((__pyx_t_9 / ((double)__pyx_v_count))); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 56, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 56, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_int_3);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 56, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_mean, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":57
+ *             'min': round(stats.minimum * ms_per_tick, 3),
+ *             'mean': round(stats.total * ms_per_tick / count, 3),
+ *             'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),             # <<<<<<<<<<<<<<
+ *             'max': round(stats.maximum * ms_per_tick, 3),
+ *             'period_share': round(<double>stats.total / count / period_ticks, 3),
+ */
+  __pyx_t_1 = __pyx_v_stats->maximum;
+  __pyx_t_10 = ((__pyx_v_index + 1) * __pyx_v_period_ticks);
+  if (unlikely(__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(2, 57, __pyx_L1_error)
+  }
+  __pyx_t_9 = (((double)__pyx_t_10) / ((double)__pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_BINS_PER_PERIOD));
+  if (((__pyx_t_1 < __pyx_t_9) != 0)) {
+    __pyx_t_11 = __pyx_t_1;
+  } else {
+    __pyx_t_11 = __pyx_t_9;
+  }
+  __pyx_t_7 = PyFloat_FromDouble((__pyx_t_11 * __pyx_v_ms_per_tick)); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_int_3);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_p99, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":58
+ *             'mean': round(stats.total * ms_per_tick / count, 3),
+ *             'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),
+ *             'max': round(stats.maximum * ms_per_tick, 3),             # <<<<<<<<<<<<<<
+ *             'period_share': round(<double>stats.total / count / period_ticks, 3),
+ *             'missed_deadlines': stats.missed_deadlines}
+ */
+  __pyx_t_7 = PyFloat_FromDouble((__pyx_v_stats->maximum * __pyx_v_ms_per_tick)); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_int_3);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_max, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":59
+ *             'p99': round(min((index + 1) * period_ticks / TIMING_BINS_PER_PERIOD, stats.maximum) * ms_per_tick, 3),
+ *             'max': round(stats.maximum * ms_per_tick, 3),
+ *             'period_share': round(<double>stats.total / count / period_ticks, 3),             # <<<<<<<<<<<<<<
+ *             'missed_deadlines': stats.missed_deadlines}
+ * 
+ */
+  if (unlikely(__pyx_v_count == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(2, 59, __pyx_L1_error)
+  }
+  __pyx_t_11 = (((double)__pyx_v_stats->total) / ((double)__pyx_v_count));
+  if (unlikely(__pyx_v_period_ticks == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(2, 59, __pyx_L1_error)
+  }
+  __pyx_t_7 = PyFloat_FromDouble((__pyx_t_11 / ((double)__pyx_v_period_ticks))); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 59, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 59, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_int_3);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 59, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_period_share, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":60
+ *             'max': round(stats.maximum * ms_per_tick, 3),
+ *             'period_share': round(<double>stats.total / count / period_ticks, 3),
+ *             'missed_deadlines': stats.missed_deadlines}             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline list timing_stats_histogram(AudioTimingStats *stats):
+ */
+  __pyx_t_7 = __Pyx_PyInt_From_Uint64(__pyx_v_stats->missed_deadlines); if (unlikely(!__pyx_t_7)) __PYX_ERR(2, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_missed_deadlines, __pyx_t_7) < 0) __PYX_ERR(2, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/audio_timing.pxd":35
+ *     memset(stats, 0, sizeof(AudioTimingStats))
+ * 
+ * cdef inline dict timing_stats_to_dict(AudioTimingStats *stats, Uint64 period_ticks):             # <<<<<<<<<<<<<<
+ *     """
+ *     Returns a dictionary of the timing statistics. Durations are in milliseconds and the share
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("mpfmc.core.audio.audio_timing.timing_stats_to_dict", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/audio_timing.pxd":62
+ *             'missed_deadlines': stats.missed_deadlines}
+ * 
+ * cdef inline list timing_stats_histogram(AudioTimingStats *stats):             # <<<<<<<<<<<<<<
+ *     """Returns the bin counts of the timing histogram."""
+ *     return [stats.histogram[index] for index in range(TIMING_HISTOGRAM_BINS)]
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_12audio_timing_timing_stats_histogram(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioTimingStats *__pyx_v_stats) {
+  int __pyx_7genexpr__pyx_v_index;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("timing_stats_histogram", 0);
+
+  /* "mpfmc/core/audio/audio_timing.pxd":64
+ * cdef inline list timing_stats_histogram(AudioTimingStats *stats):
+ *     """Returns the bin counts of the timing histogram."""
+ *     return [stats.histogram[index] for index in range(TIMING_HISTOGRAM_BINS)]             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_e_5mpfmc_4core_5audio_4sdl2_TIMING_HISTOGRAM_BINS;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_7genexpr__pyx_v_index = __pyx_t_4;
+      __pyx_t_5 = __Pyx_PyInt_From_Uint32((__pyx_v_stats->histogram[__pyx_7genexpr__pyx_v_index])); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(2, 64, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+  /* "mpfmc/core/audio/audio_timing.pxd":62
+ *             'missed_deadlines': stats.missed_deadlines}
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     A quadratic easing function used for smoother audio fading
+ * cdef inline list timing_stats_histogram(AudioTimingStats *stats):             # <<<<<<<<<<<<<<
+ *     """Returns the bin counts of the timing histogram."""
+ *     return [stats.histogram[index] for index in range(TIMING_HISTOGRAM_BINS)]
  */
 
   /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("mpfmc.core.audio.audio_timing.timing_stats_histogram", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":52
+/* "mpfmc/core/audio/notification_message.pxd":53
  * # ---------------------------------------------------------------------------
  * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ * cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Creates a new notification message.
+ *     Creates a new notification message in the notification ring of the track. The message is
  */
 
-static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void) {
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
 
-  /* "mpfmc/core/audio/notification_message.pxd":57
- *     :return: A pointer to the new notification message.
+  /* "mpfmc/core/audio/notification_message.pxd":59
+ *     :return: A pointer to the new notification message (NULL if the ring is full).
  *     """
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))             # <<<<<<<<<<<<<<
+ *     return <NotificationMessageContainer*>message_ring_reserve(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *)g_slice_alloc0((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer))));
+  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *)__pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_reserve(__pyx_v_track->notification_messages));
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/notification_message.pxd":52
+  /* "mpfmc/core/audio/notification_message.pxd":53
  * # ---------------------------------------------------------------------------
  * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ * cdef inline NotificationMessageContainer *_create_notification_message(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
- *     Creates a new notification message.
+ *     Creates a new notification message in the notification ring of the track. The message is
  */
 
   /* function exit code */
@@ -6999,8 +9795,8 @@ static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_Notifica
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":59
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+/* "mpfmc/core/audio/notification_message.pxd":61
+ *     return <NotificationMessageContainer*>message_ring_reserve(track.notification_messages)
  * 
  * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7011,18 +9807,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":69
+  /* "mpfmc/core/audio/notification_message.pxd":71
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":70
+  /* "mpfmc/core/audio/notification_message.pxd":72
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
@@ -7030,8 +9826,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":71
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":73
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7039,7 +9835,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_started;
 
-    /* "mpfmc/core/audio/notification_message.pxd":72
+    /* "mpfmc/core/audio/notification_message.pxd":74
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7048,7 +9844,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":73
+    /* "mpfmc/core/audio/notification_message.pxd":75
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7057,35 +9853,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":74
+    /* "mpfmc/core/audio/notification_message.pxd":76
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":76
+    /* "mpfmc/core/audio/notification_message.pxd":78
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":70
+    /* "mpfmc/core/audio/notification_message.pxd":72
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_started
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":59
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+  /* "mpfmc/core/audio/notification_message.pxd":61
+ *     return <NotificationMessageContainer*>message_ring_reserve(track.notification_messages)
  * 
  * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7095,8 +9891,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":78
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":80
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7107,18 +9903,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":88
+  /* "mpfmc/core/audio/notification_message.pxd":90
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":89
+  /* "mpfmc/core/audio/notification_message.pxd":91
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
@@ -7126,8 +9922,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":90
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":92
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7135,7 +9931,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":91
+    /* "mpfmc/core/audio/notification_message.pxd":93
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7144,7 +9940,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":92
+    /* "mpfmc/core/audio/notification_message.pxd":94
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7153,35 +9949,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":93
+    /* "mpfmc/core/audio/notification_message.pxd":95
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":95
+    /* "mpfmc/core/audio/notification_message.pxd":97
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":89
+    /* "mpfmc/core/audio/notification_message.pxd":91
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_stopped
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":78
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":80
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7191,8 +9987,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":97
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":99
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7203,18 +9999,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":107
+  /* "mpfmc/core/audio/notification_message.pxd":109
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":108
+  /* "mpfmc/core/audio/notification_message.pxd":110
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
@@ -7222,8 +10018,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":109
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":111
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7231,7 +10027,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_looping;
 
-    /* "mpfmc/core/audio/notification_message.pxd":110
+    /* "mpfmc/core/audio/notification_message.pxd":112
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7240,7 +10036,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":111
+    /* "mpfmc/core/audio/notification_message.pxd":113
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7249,35 +10045,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":112
+    /* "mpfmc/core/audio/notification_message.pxd":114
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":114
+    /* "mpfmc/core/audio/notification_message.pxd":116
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":108
+    /* "mpfmc/core/audio/notification_message.pxd":110
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_looping
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":97
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":99
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                  TrackState *track) nogil:
@@ -7287,8 +10083,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":116
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":118
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                          TrackState *track) nogil:
@@ -7299,18 +10095,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":126
+  /* "mpfmc/core/audio/notification_message.pxd":128
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":127
+  /* "mpfmc/core/audio/notification_message.pxd":129
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
@@ -7318,8 +10114,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":128
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":130
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7327,7 +10123,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_about_to_finish;
 
-    /* "mpfmc/core/audio/notification_message.pxd":129
+    /* "mpfmc/core/audio/notification_message.pxd":131
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7336,7 +10132,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":130
+    /* "mpfmc/core/audio/notification_message.pxd":132
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7345,35 +10141,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":131
+    /* "mpfmc/core/audio/notification_message.pxd":133
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":133
+    /* "mpfmc/core/audio/notification_message.pxd":135
  *         notification_message.sound_instance_id = sound_instance_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":127
+    /* "mpfmc/core/audio/notification_message.pxd":129
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_about_to_finish
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":116
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":118
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_about_to_finish_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                          TrackState *track) nogil:
@@ -7383,8 +10179,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":135
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":137
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                 TrackState *track,
@@ -7395,18 +10191,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":147
+  /* "mpfmc/core/audio/notification_message.pxd":149
  *         marker_id: The id of the marker being sent for the specified sound
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":148
+  /* "mpfmc/core/audio/notification_message.pxd":150
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
@@ -7414,8 +10210,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":149
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":151
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker             # <<<<<<<<<<<<<<
  *         notification_message.player = player
@@ -7423,7 +10219,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_marker;
 
-    /* "mpfmc/core/audio/notification_message.pxd":150
+    /* "mpfmc/core/audio/notification_message.pxd":152
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player             # <<<<<<<<<<<<<<
@@ -7432,7 +10228,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":151
+    /* "mpfmc/core/audio/notification_message.pxd":153
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7441,7 +10237,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":152
+    /* "mpfmc/core/audio/notification_message.pxd":154
  *         notification_message.player = player
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
@@ -7450,35 +10246,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":153
+    /* "mpfmc/core/audio/notification_message.pxd":155
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = sound_instance_id
  *         notification_message.data.marker.id = marker_id             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->data.marker.id = __pyx_v_marker_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":155
+    /* "mpfmc/core/audio/notification_message.pxd":157
  *         notification_message.data.marker.id = marker_id
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":148
+    /* "mpfmc/core/audio/notification_message.pxd":150
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_marker
  *         notification_message.player = player
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":135
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":137
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
  *                                                 TrackState *track,
@@ -7488,8 +10284,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":157
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":159
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7500,54 +10296,54 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":163
+  /* "mpfmc/core/audio/notification_message.pxd":165
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":164
+  /* "mpfmc/core/audio/notification_message.pxd":166
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":165
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":167
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  * 
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":166
+    /* "mpfmc/core/audio/notification_message.pxd":168
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":164
+    /* "mpfmc/core/audio/notification_message.pxd":166
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":157
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":159
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7557,8 +10353,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":168
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":170
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7569,54 +10365,54 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":174
+  /* "mpfmc/core/audio/notification_message.pxd":176
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":175
+  /* "mpfmc/core/audio/notification_message.pxd":177
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":176
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":178
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  * 
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_paused;
 
-    /* "mpfmc/core/audio/notification_message.pxd":177
+    /* "mpfmc/core/audio/notification_message.pxd":179
  *     if notification_message != NULL:
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":175
+    /* "mpfmc/core/audio/notification_message.pxd":177
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":168
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":170
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7626,8 +10422,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":179
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":181
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7638,18 +10434,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":188
+  /* "mpfmc/core/audio/notification_message.pxd":190
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":189
+  /* "mpfmc/core/audio/notification_message.pxd":191
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
@@ -7657,8 +10453,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":190
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":192
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7666,7 +10462,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_started;
 
-    /* "mpfmc/core/audio/notification_message.pxd":191
+    /* "mpfmc/core/audio/notification_message.pxd":193
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7675,7 +10471,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":192
+    /* "mpfmc/core/audio/notification_message.pxd":194
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7684,7 +10480,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":193
+    /* "mpfmc/core/audio/notification_message.pxd":195
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7693,7 +10489,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":194
+    /* "mpfmc/core/audio/notification_message.pxd":196
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7702,35 +10498,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":195
+    /* "mpfmc/core/audio/notification_message.pxd":197
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":197
+    /* "mpfmc/core/audio/notification_message.pxd":199
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":189
+    /* "mpfmc/core/audio/notification_message.pxd":191
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_started
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":179
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":181
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7740,8 +10536,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":199
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":201
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7752,18 +10548,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":208
+  /* "mpfmc/core/audio/notification_message.pxd":210
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":209
+  /* "mpfmc/core/audio/notification_message.pxd":211
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
@@ -7771,8 +10567,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":210
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":212
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7780,7 +10576,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":211
+    /* "mpfmc/core/audio/notification_message.pxd":213
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7789,7 +10585,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":212
+    /* "mpfmc/core/audio/notification_message.pxd":214
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7798,7 +10594,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":213
+    /* "mpfmc/core/audio/notification_message.pxd":215
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7807,7 +10603,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":214
+    /* "mpfmc/core/audio/notification_message.pxd":216
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7816,35 +10612,35 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":215
+    /* "mpfmc/core/audio/notification_message.pxd":217
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":217
+    /* "mpfmc/core/audio/notification_message.pxd":219
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":209
+    /* "mpfmc/core/audio/notification_message.pxd":211
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_stopped
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":199
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":201
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7854,8 +10650,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   /* function exit code */
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/notification_message.pxd":221
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -7866,18 +10662,18 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
   int __pyx_t_1;
 
-  /* "mpfmc/core/audio/notification_message.pxd":228
+  /* "mpfmc/core/audio/notification_message.pxd":230
  *         track: The TrackState pointer
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)             # <<<<<<<<<<<<<<
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(__pyx_v_track);
 
-  /* "mpfmc/core/audio/notification_message.pxd":229
+  /* "mpfmc/core/audio/notification_message.pxd":231
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
@@ -7885,8 +10681,8 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
   __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":230
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+    /* "mpfmc/core/audio/notification_message.pxd":232
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping             # <<<<<<<<<<<<<<
  *         notification_message.player = 0
@@ -7894,7 +10690,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping;
 
-    /* "mpfmc/core/audio/notification_message.pxd":231
+    /* "mpfmc/core/audio/notification_message.pxd":233
  *     if notification_message != NULL:
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0             # <<<<<<<<<<<<<<
@@ -7903,7 +10699,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":232
+    /* "mpfmc/core/audio/notification_message.pxd":234
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
@@ -7912,7 +10708,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":233
+    /* "mpfmc/core/audio/notification_message.pxd":235
  *         notification_message.player = 0
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
@@ -7921,7 +10717,7 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->sound_instance_id = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":234
+    /* "mpfmc/core/audio/notification_message.pxd":236
  *         notification_message.sound_id = sound_id
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
@@ -7930,34 +10726,34 @@ static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_sen
  */
     __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":235
+    /* "mpfmc/core/audio/notification_message.pxd":237
  *         notification_message.sound_instance_id = 0
  *         notification_message.data.sound_loop_set.id = sound_loop_set_id
  *         notification_message.data.sound_loop_set.player = player             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         message_ring_commit(track.notification_messages)
  */
     __pyx_v_notification_message->data.sound_loop_set.player = __pyx_v_player;
 
-    /* "mpfmc/core/audio/notification_message.pxd":237
+    /* "mpfmc/core/audio/notification_message.pxd":239
  *         notification_message.data.sound_loop_set.player = player
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         message_ring_commit(track.notification_messages)             # <<<<<<<<<<<<<<
  * 
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_f_5mpfmc_4core_5audio_12message_ring_message_ring_commit(__pyx_v_track->notification_messages);
 
-    /* "mpfmc/core/audio/notification_message.pxd":229
+    /* "mpfmc/core/audio/notification_message.pxd":231
  *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message(track)
  *     if notification_message != NULL:             # <<<<<<<<<<<<<<
  *         notification_message.message = notification_sound_loop_set_looping
  *         notification_message.player = 0
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":221
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -8137,8 +10933,11 @@ static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_5track_Track[] = {
   {"pause", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16pause},
   {"stop_all_sounds", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds},
   {"process", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21process, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_20process},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__},
+  {"get_mix_timing", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23get_mix_timing, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22get_mix_timing},
+  {"get_mix_timing_histogram", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25get_mix_timing_histogram, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24get_mix_timing_histogram},
+  {"reset_mix_timing", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27reset_mix_timing, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_26reset_mix_timing},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_28__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_31__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_30__setstate_cython__},
   {0, 0, 0, 0}
 };
 
@@ -8275,47 +11074,71 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_k_Allocated_track_audio_buffer_d_b, sizeof(__pyx_k_Allocated_track_audio_buffer_d_b), 0, 1, 0, 0},
+  {&__pyx_kp_u_Input_and_output_buffer_must_hav, __pyx_k_Input_and_output_buffer_must_hav, sizeof(__pyx_k_Input_and_output_buffer_must_hav), 0, 1, 0, 0},
+  {&__pyx_kp_u_Input_and_output_buffer_must_hav_2, __pyx_k_Input_and_output_buffer_must_hav_2, sizeof(__pyx_k_Input_and_output_buffer_must_hav_2), 0, 1, 0, 0},
   {&__pyx_kp_u_Must_be_overridden_in_derived_cl, __pyx_k_Must_be_overridden_in_derived_cl, sizeof(__pyx_k_Must_be_overridden_in_derived_cl), 0, 1, 0, 0},
   {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
   {&__pyx_n_s_Track, __pyx_k_Track, sizeof(__pyx_k_Track), 0, 0, 1, 1},
   {&__pyx_n_u_Track, __pyx_k_Track, sizeof(__pyx_k_Track), 0, 1, 0, 1},
   {&__pyx_kp_u_Track_2, __pyx_k_Track_2, sizeof(__pyx_k_Track_2), 0, 1, 0, 0},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_apply_volume_to_samples, __pyx_k_apply_volume_to_samples, sizeof(__pyx_k_apply_volume_to_samples), 0, 0, 1, 1},
   {&__pyx_n_s_audio_callback_data, __pyx_k_audio_callback_data, sizeof(__pyx_k_audio_callback_data), 0, 0, 1, 1},
   {&__pyx_n_s_buffer_size, __pyx_k_buffer_size, sizeof(__pyx_k_buffer_size), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_u_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 1, 0, 1},
+  {&__pyx_kp_u_d_notification_messages_were_dr, __pyx_k_d_notification_messages_were_dr, sizeof(__pyx_k_d_notification_messages_were_dr), 0, 1, 0, 0},
   {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
   {&__pyx_n_s_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 0, 1, 1},
   {&__pyx_n_s_fade_in_seconds, __pyx_k_fade_in_seconds, sizeof(__pyx_k_fade_in_seconds), 0, 0, 1, 1},
   {&__pyx_n_s_fade_out_seconds, __pyx_k_fade_out_seconds, sizeof(__pyx_k_fade_out_seconds), 0, 0, 1, 1},
   {&__pyx_n_s_fade_seconds, __pyx_k_fade_seconds, sizeof(__pyx_k_fade_seconds), 0, 0, 1, 1},
+  {&__pyx_n_s_float_samples_to_output, __pyx_k_float_samples_to_output, sizeof(__pyx_k_float_samples_to_output), 0, 0, 1, 1},
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_s_gain, __pyx_k_gain, sizeof(__pyx_k_gain), 0, 0, 1, 1},
   {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_input_buffer, __pyx_k_input_buffer, sizeof(__pyx_k_input_buffer), 0, 0, 1, 1},
+  {&__pyx_n_s_input_view, __pyx_k_input_view, sizeof(__pyx_k_input_view), 0, 0, 1, 1},
   {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_u_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 1, 0, 1},
   {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
+  {&__pyx_n_u_mean, __pyx_k_mean, sizeof(__pyx_k_mean), 0, 1, 0, 1},
+  {&__pyx_n_u_min, __pyx_k_min, sizeof(__pyx_k_min), 0, 1, 0, 1},
+  {&__pyx_n_u_missed_deadlines, __pyx_k_missed_deadlines, sizeof(__pyx_k_missed_deadlines), 0, 1, 0, 1},
+  {&__pyx_n_s_mix_samples, __pyx_k_mix_samples, sizeof(__pyx_k_mix_samples), 0, 0, 1, 1},
+  {&__pyx_n_s_mpfmc_core_audio_track, __pyx_k_mpfmc_core_audio_track, sizeof(__pyx_k_mpfmc_core_audio_track), 0, 0, 1, 1},
+  {&__pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_k_mpfmc_core_audio_track_pyx, sizeof(__pyx_k_mpfmc_core_audio_track_pyx), 0, 0, 1, 0},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
+  {&__pyx_n_s_output_buffer, __pyx_k_output_buffer, sizeof(__pyx_k_output_buffer), 0, 0, 1, 1},
+  {&__pyx_n_s_output_data, __pyx_k_output_data, sizeof(__pyx_k_output_data), 0, 0, 1, 1},
+  {&__pyx_n_u_p99, __pyx_k_p99, sizeof(__pyx_k_p99), 0, 1, 0, 1},
   {&__pyx_kp_u_pause_Action_may_only_be_used_wh, __pyx_k_pause_Action_may_only_be_used_wh, sizeof(__pyx_k_pause_Action_may_only_be_used_wh), 0, 1, 0, 0},
   {&__pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_k_pause_Applying_s_second_fade_out, sizeof(__pyx_k_pause_Applying_s_second_fade_out), 0, 1, 0, 0},
   {&__pyx_kp_u_pause_Pause_sound_processing_on, __pyx_k_pause_Pause_sound_processing_on, sizeof(__pyx_k_pause_Pause_sound_processing_on), 0, 1, 0, 0},
+  {&__pyx_n_u_period_share, __pyx_k_period_share, sizeof(__pyx_k_period_share), 0, 1, 0, 1},
   {&__pyx_kp_u_play_Action_may_only_be_used_whe, __pyx_k_play_Action_may_only_be_used_whe, sizeof(__pyx_k_play_Action_may_only_be_used_whe), 0, 1, 0, 0},
   {&__pyx_kp_u_play_Applying_s_second_fade_in, __pyx_k_play_Applying_s_second_fade_in, sizeof(__pyx_k_play_Applying_s_second_fade_in), 0, 1, 0, 0},
   {&__pyx_kp_u_play_Begin_sound_processing_on_t, __pyx_k_play_Begin_sound_processing_on_t, sizeof(__pyx_k_play_Begin_sound_processing_on_t), 0, 1, 0, 0},
   {&__pyx_n_s_post_mc_native_event, __pyx_k_post_mc_native_event, sizeof(__pyx_k_post_mc_native_event), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
   {&__pyx_n_s_round, __pyx_k_round, sizeof(__pyx_k_round), 0, 0, 1, 1},
+  {&__pyx_n_s_sample_count, __pyx_k_sample_count, sizeof(__pyx_k_sample_count), 0, 0, 1, 1},
   {&__pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_k_set_volume_Applying_s_second_fad, sizeof(__pyx_k_set_volume_Applying_s_second_fad), 0, 1, 0, 0},
   {&__pyx_kp_u_set_volume_Interrupting_an_exist, __pyx_k_set_volume_Interrupting_an_exist, sizeof(__pyx_k_set_volume_Interrupting_an_exist), 0, 1, 0, 0},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_soft_limiter, __pyx_k_soft_limiter, sizeof(__pyx_k_soft_limiter), 0, 0, 1, 1},
   {&__pyx_kp_u_stop_Action_may_only_be_used_whe, __pyx_k_stop_Action_may_only_be_used_whe, sizeof(__pyx_k_stop_Action_may_only_be_used_whe), 0, 1, 0, 0},
   {&__pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_k_stop_Applying_s_second_fade_out, sizeof(__pyx_k_stop_Applying_s_second_fade_out), 0, 1, 0, 0},
   {&__pyx_kp_u_stop_Stop_sound_processing_on_tr, __pyx_k_stop_Stop_sound_processing_on_tr, sizeof(__pyx_k_stop_Stop_sound_processing_on_tr), 0, 1, 0, 0},
@@ -8323,13 +11146,17 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_track, __pyx_k_track, sizeof(__pyx_k_track), 0, 0, 1, 1},
   {&__pyx_n_s_track_num, __pyx_k_track_num, sizeof(__pyx_k_track_num), 0, 0, 1, 1},
   {&__pyx_n_s_volume, __pyx_k_volume, sizeof(__pyx_k_volume), 0, 0, 1, 1},
+  {&__pyx_n_s_volume_left, __pyx_k_volume_left, sizeof(__pyx_k_volume_left), 0, 0, 1, 1},
+  {&__pyx_n_s_volume_right, __pyx_k_volume_right, sizeof(__pyx_k_volume_right), 0, 0, 1, 1},
   {&__pyx_n_s_warning, __pyx_k_warning, sizeof(__pyx_k_warning), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 97, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 132, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 136, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 488, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 668, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8339,14 +11166,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "mpfmc/core/audio/track.pyx":101
+  /* "mpfmc/core/audio/track.pyx":136
  *     @property
  *     def type(self):
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
@@ -8368,6 +11195,64 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "mpfmc/core/audio/track.pyx":668
+ *     try:
+ *         if input_view.len != buffer_length:
+ *             raise ValueError("Input and output buffer must have the same length")             # <<<<<<<<<<<<<<
+ * 
+ *         with nogil:
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Input_and_output_buffer_must_hav); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 668, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "mpfmc/core/audio/track.pyx":731
+ *     try:
+ *         if input_view.len != sample_count * sizeof(float):
+ *             raise ValueError("Input and output buffer must have the same number of samples")             # <<<<<<<<<<<<<<
+ * 
+ *         with nogil:
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Input_and_output_buffer_must_hav_2); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 731, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "mpfmc/core/audio/track.pyx":685
+ * 
+ * 
+ * def mix_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                 int volume_right=-1):
+ *     """
+ */
+  __pyx_tuple__6 = PyTuple_Pack(4, __pyx_n_s_output_buffer, __pyx_n_s_input_buffer, __pyx_n_s_volume_left, __pyx_n_s_volume_right); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_n_s_mix_samples, 685, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 685, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":698
+ * 
+ * 
+ * def apply_volume_to_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                             int volume_right=-1):
+ *     """
+ */
+  __pyx_tuple__8 = PyTuple_Pack(4, __pyx_n_s_output_buffer, __pyx_n_s_input_buffer, __pyx_n_s_volume_left, __pyx_n_s_volume_right); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 698, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_n_s_apply_volume_to_samples, 698, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 698, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":713
+ * 
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,             # <<<<<<<<<<<<<<
+ *                             bint soft_limiter=False):
+ *     """
+ */
+  __pyx_tuple__10 = PyTuple_Pack(7, __pyx_n_s_output_buffer, __pyx_n_s_input_buffer, __pyx_n_s_gain, __pyx_n_s_soft_limiter, __pyx_n_s_input_view, __pyx_n_s_output_data, __pyx_n_s_sample_count); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(4, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_track_pyx, __pyx_n_s_float_samples_to_output, 713, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 713, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8377,7 +11262,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8424,12 +11311,16 @@ static int __Pyx_modinit_type_init_code(void) {
   /*--- Type init code ---*/
   __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = &__pyx_vtable_5mpfmc_4core_5audio_5track_Track;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.get_state = (__pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track._check_dropped_notifications = (void (*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track__check_dropped_notifications;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio = (void (*)(Uint8 *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio_stereo = (void (*)(Uint8 *, Uint8 const *, Uint32, int, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_stereo;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_sound_to_track = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, Uint8 *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_sound_to_track;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_audio_float = (void (*)(float *, float const *, Uint32, float))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_audio_float;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.convert_float_to_output = (void (*)(Uint8 *, float const *, Uint32, float, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_convert_float_to_output;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.apply_volume = (void (*)(Uint8 *, Uint8 const *, Uint32, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume;
   __pyx_vtable_5mpfmc_4core_5audio_5track_Track.apply_volume_stereo = (void (*)(Uint8 *, Uint8 const *, Uint32, int, int))__pyx_f_5mpfmc_4core_5audio_5track_5Track_apply_volume_stereo;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_print = 0;
   #endif
@@ -8438,7 +11329,7 @@ static int __Pyx_modinit_type_init_code(void) {
   }
   #if CYTHON_UPDATE_DESCRIPTOR_DOC
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 23, __pyx_L1_error)
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 39, __pyx_L1_error)
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__.doc = __pyx_doc_5mpfmc_4core_5audio_5track_5Track_2__init__;
@@ -8446,9 +11337,9 @@ static int __Pyx_modinit_type_init_code(void) {
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Track, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Track, (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_5track_Track = &__pyx_type_5mpfmc_4core_5audio_5track_Track;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8459,10 +11350,28 @@ static int __Pyx_modinit_type_init_code(void) {
 
 static int __Pyx_modinit_type_import_code(void) {
   __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_36(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_36); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static int __Pyx_modinit_variable_import_code(void) {
@@ -8673,7 +11582,7 @@ if (!__Pyx_RefNanny) {
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
   if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_type_import_code();
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
   /*--- Execution code ---*/
@@ -8681,16 +11590,52 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "mpfmc/core/audio/track.pyx":6
- * from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
- * cimport cpython.pycapsule as pycapsule
+  /* "mpfmc/core/audio/track.pyx":8
+ * from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+ * from cpython.bytearray cimport PyByteArray_AS_STRING
  * import logging             # <<<<<<<<<<<<<<
  * 
  * from mpfmc.core.audio.sdl2 cimport *
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":685
+ * 
+ * 
+ * def mix_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                 int volume_right=-1):
+ *     """
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_5track_1mix_samples, NULL, __pyx_n_s_mpfmc_core_audio_track); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mix_samples, __pyx_t_1) < 0) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":698
+ * 
+ * 
+ * def apply_volume_to_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,             # <<<<<<<<<<<<<<
+ *                             int volume_right=-1):
+ *     """
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_5track_3apply_volume_to_samples, NULL, __pyx_n_s_mpfmc_core_audio_track); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 698, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_apply_volume_to_samples, __pyx_t_1) < 0) __PYX_ERR(0, 698, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":713
+ * 
+ * 
+ * def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,             # <<<<<<<<<<<<<<
+ *                             bint soft_limiter=False):
+ *     """
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_5track_5float_samples_to_output, NULL, __pyx_n_s_mpfmc_core_audio_track); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 713, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_float_samples_to_output, __pyx_t_1) < 0) __PYX_ERR(0, 713, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "mpfmc/core/audio/track.pyx":1
@@ -8703,8 +11648,8 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/notification_message.pxd":219
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/notification_message.pxd":221
+ *         message_ring_commit(track.notification_messages)
  * 
  * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, gpointer player, TrackState *track) nogil:             # <<<<<<<<<<<<<<
  *     """
@@ -9296,6 +12241,14 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
+/* DivInt[int] */
+static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
+    int q = a / b;
+    int r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
 /* PyErrFetchRestore */
 #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
@@ -9320,6 +12273,46 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 }
 #endif
 
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
 /* RaiseException */
 #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
@@ -9479,52 +12472,185 @@ bad:
 }
 #endif
 
-/* DivInt[int] */
-static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
-    int q = a / b;
-    int r = a - q*b;
+/* DivInt[ptrdiff_t] */
+static CYTHON_INLINE ptrdiff_t __Pyx_div_ptrdiff_t(ptrdiff_t a, ptrdiff_t b) {
+    ptrdiff_t q = a / b;
+    ptrdiff_t r = a - q*b;
     q -= ((r != 0) & ((r ^ b) < 0));
     return q;
 }
 
-/* WriteUnraisableException */
-static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-    else state = (PyGILState_STATE)0;
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
 #endif
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
     }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
     #else
-    ctx = PyUnicode_FromString(name);
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
     #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
 #endif
+
+/* DivInt[Py_ssize_t] */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
+    Py_ssize_t q = a / b;
+    Py_ssize_t r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
 }
 
 /* PyObject_GenericGetAttrNoDict */
@@ -9746,6 +12872,85 @@ __PYX_GOOD:
     return ret;
 }
 
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_36
+#define __PYX_HAVE_RT_ImportType_0_29_36
+static PyTypeObject *__Pyx_ImportType_0_29_36(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_36 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_36 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_36 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
@@ -10296,6 +13501,278 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     }
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint32) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint32) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint32),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(Uint32, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (Uint32) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 2 * PyLong_SHIFT) {
+                            return (Uint32) (((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 3 * PyLong_SHIFT) {
+                            return (Uint32) (((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 4 * PyLong_SHIFT) {
+                            return (Uint32) (((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (Uint32) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(Uint32, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(Uint32) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) ((((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            Uint32 val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (Uint32) -1;
+        }
+    } else {
+        Uint32 val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (Uint32) -1;
+        val = __Pyx_PyInt_As_Uint32(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to Uint32");
+    return (Uint32) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to Uint32");
+    return (Uint32) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const Uint64 neg_one = (Uint64) -1, const_zero = (Uint64) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint64) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint64) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint64) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint64),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
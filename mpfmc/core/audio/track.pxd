@@ -1,5 +1,6 @@
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.message_ring cimport *
 
 
 # ---------------------------------------------------------------------------
@@ -16,6 +17,11 @@ cdef enum:
 cdef enum:
     MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
 
+# The number of notification messages which fit into the notification ring of a track (must be
+# a power of two). Notifications are processed on every tick.
+cdef enum:
+    NOTIFICATION_RING_SIZE = 1024
+
 
 cdef enum TrackStatus:
     track_status_stopped = 0
@@ -28,6 +34,7 @@ ctypedef struct TrackState:
     # Common track state variables (for all track types)
     AudioCallbackData *callback_data
     void (*mix_callback_function)(TrackState *track, Uint32 buffer_length, AudioCallbackData *callback_data) nogil
+    void (*process_requests_function)(TrackState *track) nogil
     void* type_state
     TrackStatus status
     bint active
@@ -40,9 +47,11 @@ ctypedef struct TrackState:
     Uint32 fade_steps_remaining
     int buffer_size
     Uint8 *buffer
-    GSList *notification_messages
+    float *float_buffer
+    MessageRing *notification_messages
     bint ducking_is_active
     GArray* ducking_control_points
+    AudioTimingStats mix_timing
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +67,7 @@ cdef class Track:
     cdef object mc
     cdef SDL_AudioDeviceID device_id
     cdef object log
+    cdef Uint32 _dropped_notifications
 
     # Track attributes need to be stored in a C struct in order for them to be accessible in
     # the SDL callback functions without the GIL (for performance reasons).  The TrackState
@@ -65,6 +75,7 @@ cdef class Track:
     cdef TrackState *state
 
     cdef TrackState *get_state(self)
+    cdef void _check_dropped_notifications(self)
 
     # ---------------------------------------------------------------------------
     #    Static C functions designed to be called from the static audio callback
@@ -81,6 +92,17 @@ cdef class Track:
     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
                                int volume_left, int volume_right) nogil
 
+    @staticmethod
+    cdef void mix_sound_to_track(TrackState *track, Uint8 *track_buffer_position, const Uint8 *sound_buffer,
+                                 Uint32 buffer_length, int volume) nogil
+
+    @staticmethod
+    cdef void mix_audio_float(float *output_buffer, const float *input_buffer, Uint32 sample_count, float gain) nogil
+
+    @staticmethod
+    cdef void convert_float_to_output(Uint8 *output_buffer, const float *input_buffer, Uint32 sample_count,
+                                      float gain, bint soft_limiter) nogil
+
     @staticmethod
     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil
 
@@ -3,19 +3,35 @@
 
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from cpython.bytearray cimport PyByteArray_AS_STRING
 import logging
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.inline cimport lerpU8, in_out_quad
+from mpfmc.core.audio.audio_timing cimport *
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track cimport *
 
+cdef extern from "math.h" nogil:
+    float fabsf(float x)
+    float copysignf(float x, float y)
+
 
 # Max and min 16-bit audio sample values (used in audio mixing functions)
 DEF MAX_AUDIO_VALUE_S16 = ((1 << (16 - 1)) - 1)
 DEF MIN_AUDIO_VALUE_S16 = -(1 << (16 - 1))
 
+# SDL_MIX_MAXVOLUME is 128 (1 << 7). Shifting a sample multiplied by the volume right by 7 bits gives the same
+# result as the floor division by SDL_MIX_MAXVOLUME (also for negative samples) without any branches.
+DEF MIX_VOLUME_SHIFT = 7
+
+# The soft limiter of the float mix bus leaves samples below the threshold unchanged. Samples above it are
+# compressed smoothly into the remaining headroom so they never reach full scale.
+DEF LIMITER_THRESHOLD = 24576.0
+DEF LIMITER_HEADROOM = 8191.0
+
 
 # ---------------------------------------------------------------------------
 #    Track base class
@@ -52,11 +68,13 @@ cdef class Track:
         # Allocate memory for the track state (common among all track types)
         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
         self.state.mix_callback_function = NULL
+        self.state.process_requests_function = NULL
         self.state.type_state = NULL
         self.state.number = track_num
         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
         self.state.buffer_size = buffer_size
         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+        timing_stats_reset(&self.state.mix_timing)
         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
 
         # The easiest way to pass a C pointer in a constructor is to wrap it in a PyCapsule
@@ -64,6 +82,12 @@ cdef class Track:
         # pointer in a Python object. It can be extracted using PyCapsule_GetPointer.
         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
 
+        # Sounds are mixed into a float buffer when the float mix bus is used (one float per sample)
+        self.state.float_buffer = NULL
+        if self.state.callback_data.float_mix:
+            self.state.float_buffer = <float *>PyMem_Malloc(
+                buffer_size // self.state.callback_data.bytes_per_sample * sizeof(float))
+
         self.state.status = track_status_playing
         self.state.fade_steps = 0
         self.state.fade_steps_remaining = 0
@@ -73,14 +97,18 @@ cdef class Track:
         self.state.fade_volume_start = new_volume
         self.state.fade_volume_target = new_volume
 
-        self.state.notification_messages = NULL
+        # Notifications are passed from the audio callback to the track without the mixer lock
+        self.state.notification_messages = message_ring_create(NOTIFICATION_RING_SIZE,
+                                                               sizeof(NotificationMessageContainer))
+        self._dropped_notifications = 0
 
     def __dealloc__(self):
         """Destructor"""
-        SDL_LockAudio()
+        # No lock is needed, the audio interface does not mix any more when its tracks are freed
         g_array_free(self.state.ducking_control_points, True)
+        message_ring_free(self.state.notification_messages)
+        PyMem_Free(self.state.float_buffer)
         PyMem_Free(self.state)
-        SDL_UnlockAudio()
 
     def __repr__(self):
         return '<Track.{}.{}>'.format(self.number, self.name)
@@ -88,6 +116,13 @@ cdef class Track:
     cdef TrackState *get_state(self):
         return self.state
 
+    cdef void _check_dropped_notifications(self):
+        """Logs a warning when notifications did not fit into the notification ring (they are lost)."""
+        if self.state.notification_messages.dropped != self._dropped_notifications:
+            self.log.warning("%d notification messages were dropped because the notification ring was full",
+                             self.state.notification_messages.dropped - self._dropped_notifications)
+            self._dropped_notifications = self.state.notification_messages.dropped
+
     property name:
         def __get__(self):
             return self._name
@@ -105,9 +140,9 @@ cdef class Track:
         """Return the track number"""
         cdef int number = -1
         if self.state != NULL:
-            SDL_LockAudio()
+            SDL_LockMutex(self.state.callback_data.mixer_lock)
             number = self.state.number
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
         return number
 
     @property
@@ -155,9 +190,9 @@ cdef class Track:
         """Return whether or not the track is currently fading"""
         cdef bint fading = False
         if self.state != NULL:
-            SDL_LockAudio()
+            SDL_LockMutex(self.state.callback_data.mixer_lock)
             fading = self.state.fade_steps_remaining > 0
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
         return fading
 
     def clear_context(self, context):
@@ -167,7 +202,7 @@ cdef class Track:
     def set_volume(self, float volume, float fade_seconds = 0.0):
         """Sets the current track volume with an optional fade time"""
         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Fades require special logic
         if fade_seconds > 0:
@@ -196,7 +231,7 @@ cdef class Track:
             self.state.fade_volume_start = new_volume
             self.state.fade_volume_target = new_volume
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def play(self, float fade_in_seconds = 0.0):
         """
@@ -207,7 +242,7 @@ cdef class Track:
         """
         self.log.debug("play - Begin sound processing on track")
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Play is only supported when a track is paused, stopped, or is in the process of stopping
         if self.state.status == track_status_paused or \
@@ -238,7 +273,7 @@ cdef class Track:
             self.log.warning("play - Action may only be used when a track is stopped or is in the process "
                              "of stopping; action will be ignored.")
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def stop(self, float fade_out_seconds = 0.0):
         """
@@ -249,7 +284,7 @@ cdef class Track:
         """
         self.log.debug("stop - Stop sound processing on track and clear state")
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Stop is only supported when a track is playing
         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
@@ -277,7 +312,7 @@ cdef class Track:
             self.log.warning("stop - Action may only be used when a track is playing; action "
                              "will be ignored.")
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def pause(self, float fade_out_seconds = 0.0):
         """
@@ -288,7 +323,7 @@ cdef class Track:
         """
         self.log.debug("pause - Pause sound processing on track")
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Stop is only supported when a track is playing
         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
@@ -314,7 +349,7 @@ cdef class Track:
             self.log.warning("pause - Action may only be used when a track is playing; action "
                              "will be ignored.")
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def stop_all_sounds(self, float fade_out_seconds = 0.0):
         """
@@ -328,6 +363,26 @@ cdef class Track:
         """Processes the track queue each tick."""
         raise NotImplementedError('Must be overridden in derived class')
 
+    def get_mix_timing(self):
+        """
+        Get the timing statistics of the mix callback of the track (see
+        AudioInterface.get_timing_stats).
+        Returns:
+            A dictionary containing the count, min, mean, p99 and max duration (in ms), the mean
+            share of the buffer duration and the number of mixes which took longer than a buffer.
+        """
+        return timing_stats_to_dict(&self.state.mix_timing, self.state.callback_data.period_ticks)
+
+    def get_mix_timing_histogram(self):
+        """Get the bin counts of the timing histogram of the mix callback of the track."""
+        return timing_stats_histogram(&self.state.mix_timing)
+
+    def reset_mix_timing(self):
+        """Resets the timing statistics of the mix callback of the track."""
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
+        timing_stats_reset(&self.state.mix_timing)
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
+
 
     # ---------------------------------------------------------------------------
     #    Global C functions designed to be called from the static audio callback
@@ -396,7 +451,15 @@ cdef class Track:
 
             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
 
-            Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes, track_volume)
+            if callback_data.float_mix:
+                # Accumulate in the float master bus (no clipping until the final output conversion)
+                Track.mix_audio_float(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+                                      track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+                                      current_chunk_bytes // callback_data.bytes_per_sample,
+                                      <float>track_volume / SDL_MIX_MAXVOLUME)
+            else:
+                Track.mix_audio(output_buffer + buffer_pos, track_buffer + buffer_pos, current_chunk_bytes,
+                                track_volume)
 
             output_buffer_bytes_remaining -= current_chunk_bytes
             buffer_pos += current_chunk_bytes
@@ -413,39 +476,23 @@ cdef class Track:
             buffer_length: Length of audio buffers to process (input and output)
             volume: Volume level to apply to input buffer samples 
 
+        Notes:
+            The loop works on whole 16-bit samples and has no branches so the C compiler can vectorize it.
         """
-        cdef Sample16 input_sample, output_sample
+        cdef Sint16* output_samples = <Sint16*>output_buffer
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 sample_count = buffer_length // 2
+        cdef Uint32 i
         cdef int temp_sample
-        cdef Uint32 buffer_pos = 0
-
-        while buffer_pos < buffer_length:
-
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
 
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+        for i in range(sample_count):
+            # Mix the input sample multiplied by the volume with the existing output sample. The temporary
+            # output sample is a 32-bit value to avoid overflow.
+            temp_sample = output_samples[i] + ((input_samples[i] * volume) >> MIX_VOLUME_SHIFT)
 
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume) // SDL_MIX_MAXVOLUME)
-
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
-
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
-
-            buffer_pos += 2
+            # Clip the temp sample back to the 16-bit range (will cause distortion if samples on the channel
+            # are outside of the allowable 16-bit int range). min and max compile to branchless selects.
+            output_samples[i] = <Sint16>min(max(temp_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
 
     @staticmethod
     cdef void mix_audio_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
@@ -465,69 +512,97 @@ cdef class Track:
             SDL audio buffers are in interleaved format with the left channel first in stereo buffers.
 
         """
-        cdef Sample16 input_sample, output_sample
-        cdef int temp_sample
-        cdef Uint32 buffer_pos = 0
-
-        while buffer_pos < buffer_length:
-
-            # Process left channel
-
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
-
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+        cdef Sint16* output_samples = <Sint16*>output_buffer
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 frame_count = buffer_length // 4
+        cdef Uint32 i
+        cdef int left_sample, right_sample
 
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume_left) // SDL_MIX_MAXVOLUME)
+        for i in range(frame_count):
+            left_sample = output_samples[2 * i] + ((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+            right_sample = output_samples[2 * i + 1] + ((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
 
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
+            output_samples[2 * i] = <Sint16>min(max(left_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
+            output_samples[2 * i + 1] = <Sint16>min(max(right_sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
 
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    @staticmethod
+    cdef void mix_sound_to_track(TrackState *track, Uint8 *track_buffer_position, const Uint8 *sound_buffer,
+                                 Uint32 buffer_length, int volume) nogil:
+        """
+        Mixes sound samples into the track buffer applying the specified volume setting.
+        Args:
+            track: The track's state structure
+            track_buffer_position: Position in the track buffer (track.buffer) to mix the samples into
+            sound_buffer: Sound samples
+            buffer_length: Length of the sound samples to process (in bytes)
+            volume: Volume level to apply to the sound samples
 
-            buffer_pos += 2
+        Notes:
+            When the float mix bus is used the samples are mixed into the same position of the track's float
+            buffer instead. They are not clipped.
+        """
+        cdef float *output_samples
+        cdef const Sint16 *input_samples = <const Sint16*>sound_buffer
+        cdef float gain
+        cdef Uint32 i
 
-            # Process right channel
+        if not track.callback_data.float_mix:
+            SDL_MixAudioFormat(track_buffer_position, sound_buffer, track.callback_data.format, buffer_length, volume)
+            return
 
-            # Get sample (2 bytes) from the input buffer and combine into 16-bit value
-            input_sample.bytes.byte0 = input_buffer[buffer_pos]
-            input_sample.bytes.byte1 = input_buffer[buffer_pos + 1]
+        output_samples = track.float_buffer + (track_buffer_position - track.buffer) // track.callback_data.bytes_per_sample
+        gain = <float>volume / SDL_MIX_MAXVOLUME
 
-            # Get sample (2 bytes) from the output buffer and combine into 16-bit value
-            output_sample.bytes.byte0 = output_buffer[buffer_pos]
-            output_sample.bytes.byte1 = output_buffer[buffer_pos + 1]
+        for i in range(buffer_length // track.callback_data.bytes_per_sample):
+            output_samples[i] += input_samples[i] * gain
 
-            # Calculate the new output sample (mix the input sample multiplied by the volume with the existing output
-            # sample). The temporary output sample is a 32-bit value to avoid overflow.
-            temp_sample = output_sample.value + ((input_sample.value * volume_right) // SDL_MIX_MAXVOLUME)
+    @staticmethod
+    cdef void mix_audio_float(float *output_buffer, const float *input_buffer, Uint32 sample_count, float gain) nogil:
+        """
+        Mixes float input samples into existing float output samples applying the specified gain.
+        Args:
+            output_buffer: Output samples
+            input_buffer: Input samples
+            sample_count: Number of samples to process
+            gain: Gain to apply to the input samples (0.0 to 1.0)
+        """
+        cdef Uint32 i
 
-            # Clip the temp sample back to a 16-bit value (will cause distortion if samples
-            # on channel are outside of the allowable 16-bit int range)
-            if temp_sample > MAX_AUDIO_VALUE_S16:
-                temp_sample = MAX_AUDIO_VALUE_S16
-            elif temp_sample < MIN_AUDIO_VALUE_S16:
-                temp_sample = MIN_AUDIO_VALUE_S16
+        for i in range(sample_count):
+            output_buffer[i] += input_buffer[i] * gain
 
-            # Write the new output sample back to the output buffer (from
-            # a 32-bit value back to a 16-bit value that we know is in 16-bit value range)
-            output_sample.value = temp_sample
-            output_buffer[buffer_pos] = output_sample.bytes.byte0
-            output_buffer[buffer_pos + 1] = output_sample.bytes.byte1
+    @staticmethod
+    cdef void convert_float_to_output(Uint8 *output_buffer, const float *input_buffer, Uint32 sample_count,
+                                      float gain, bint soft_limiter) nogil:
+        """
+        Applies the gain (master volume) to float samples and converts them to 16-bit output samples.
+        Args:
+            output_buffer: Output audio buffer (16-bit samples)
+            input_buffer: Float samples (in the 16-bit range)
+            sample_count: Number of samples to process
+            gain: Gain to apply to the samples (0.0 to 1.0)
+            soft_limiter: Whether to compress samples above the limiter threshold instead of clipping them
 
-            buffer_pos += 2
+        Notes:
+            Samples are only clipped here, once for the whole mix. The limiter has no state, its curve
+            x -> t + h * e / (h + e) (e being the excess over the threshold t and h the headroom) has a slope of
+            1 at the threshold and approaches full scale.
+        """
+        cdef Sint16* output_samples = <Sint16*>output_buffer
+        cdef float sample, magnitude, excess
+        cdef Uint32 i
+
+        if soft_limiter:
+            for i in range(sample_count):
+                sample = input_buffer[i] * gain
+                magnitude = fabsf(sample)
+                excess = max(magnitude - LIMITER_THRESHOLD, 0.0)
+                magnitude = min(magnitude, LIMITER_THRESHOLD) + excess * LIMITER_HEADROOM / (LIMITER_HEADROOM + excess)
+                output_samples[i] = <Sint16>copysignf(magnitude, sample)
+        else:
+            for i in range(sample_count):
+                sample = input_buffer[i] * gain
+                output_samples[i] = <Sint16>min(max(sample, MIN_AUDIO_VALUE_S16), MAX_AUDIO_VALUE_S16)
 
     @staticmethod
     cdef void apply_volume(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length, int volume) nogil:
@@ -541,16 +616,12 @@ cdef class Track:
 
         """
         cdef Sint16* output_samples = <Sint16*>output_buffer
-        cdef Sint16* input_samples = <Sint16*>input_buffer
-        cdef Uint32 buffer_pos = 0
-
-        # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
-        # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
-        buffer_length = buffer_length // 2
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 sample_count = buffer_length // 2
+        cdef Uint32 i
 
-        while buffer_pos < buffer_length:
-            output_samples[buffer_pos] = (input_samples[buffer_pos] * volume) // SDL_MIX_MAXVOLUME
-            buffer_pos += 1
+        for i in range(sample_count):
+            output_samples[i] = <Sint16>((input_samples[i] * volume) >> MIX_VOLUME_SHIFT)
 
     @staticmethod
     cdef void apply_volume_stereo(Uint8* output_buffer, const Uint8* input_buffer, Uint32 buffer_length,
@@ -571,16 +642,95 @@ cdef class Track:
 
         """
         cdef Sint16* output_samples = <Sint16*>output_buffer
-        cdef Sint16* input_samples = <Sint16*>input_buffer
-        cdef Uint32 buffer_pos = 0
+        cdef const Sint16* input_samples = <const Sint16*>input_buffer
+        cdef Uint32 frame_count = buffer_length // 4
+        cdef Uint32 i
 
-        # We will be iterating over the audio buffers two bytes at a time (16-bit sample values) so
-        # effectively the buffer is half the length since we are casting the buffer pointer to 16-bit
-        buffer_length = buffer_length // 2
+        for i in range(frame_count):
+            output_samples[2 * i] = <Sint16>((input_samples[2 * i] * volume_left) >> MIX_VOLUME_SHIFT)
+            output_samples[2 * i + 1] = <Sint16>((input_samples[2 * i + 1] * volume_right) >> MIX_VOLUME_SHIFT)
 
-        while buffer_pos < buffer_length:
-            output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_left) // SDL_MIX_MAXVOLUME
-            buffer_pos += 1
 
-            output_samples[buffer_pos] = (input_samples[buffer_pos] * volume_right) // SDL_MIX_MAXVOLUME
-            buffer_pos += 1
+# ---------------------------------------------------------------------------
+#    Python wrappers for the mixing functions (used by tests and benchmarks)
+# ---------------------------------------------------------------------------
+
+cdef void _process_samples(bytearray output_buffer, object input_buffer, int volume_left, int volume_right,
+                           bint mix) except *:
+    """Calls a mixing function with the contents of two buffers."""
+    cdef Py_buffer input_view
+    cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)
+    cdef Uint32 buffer_length = len(output_buffer)
+
+    PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+    try:
+        if input_view.len != buffer_length:
+            raise ValueError("Input and output buffer must have the same length")
+
+        with nogil:
+            if mix and volume_right < 0:
+                Track.mix_audio(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+            elif mix:
+                Track.mix_audio_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+                                       volume_left, volume_right)
+            elif volume_right < 0:
+                Track.apply_volume(output_data, <const Uint8*>input_view.buf, buffer_length, volume_left)
+            else:
+                Track.apply_volume_stereo(output_data, <const Uint8*>input_view.buf, buffer_length,
+                                          volume_left, volume_right)
+    finally:
+        PyBuffer_Release(&input_view)
+
+
+def mix_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,
+                int volume_right=-1):
+    """
+    Mixes 16-bit input samples into the output samples (in place) using the same function as the audio callback.
+    Args:
+        output_buffer: Output samples
+        input_buffer: Input samples (bytes or any other buffer with the same length as the output buffer)
+        volume_left: Volume (0 to 128) of all samples or of the left channel
+        volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.
+    """
+    _process_samples(output_buffer, input_buffer, volume_left, volume_right, True)
+
+
+def apply_volume_to_samples(bytearray output_buffer not None, object input_buffer not None, int volume_left,
+                            int volume_right=-1):
+    """
+    Copies 16-bit input samples with the volume applied into the output buffer using the same function as the
+    audio callback.
+    Args:
+        output_buffer: Output samples
+        input_buffer: Input samples (bytes or any other buffer with the same length as the output buffer). This
+            may be the output buffer.
+        volume_left: Volume (0 to 128) of all samples or of the left channel
+        volume_right: Volume (0 to 128) of the right channel. The buffers are mono when it is -1.
+    """
+    _process_samples(output_buffer, input_buffer, volume_left, volume_right, False)
+
+
+def float_samples_to_output(bytearray output_buffer not None, object input_buffer not None, float gain=1.0,
+                            bint soft_limiter=False):
+    """
+    Converts float samples of the float mix bus to 16-bit output samples using the same function as the audio
+    callback.
+    Args:
+        output_buffer: Output samples (2 bytes per sample)
+        input_buffer: Float samples (e.g. an array('f'), 4 bytes per sample)
+        gain: Gain (master volume) to apply to the samples
+        soft_limiter: Whether to use the soft limiter
+    """
+    cdef Py_buffer input_view
+    cdef Uint8 *output_data = <Uint8*>PyByteArray_AS_STRING(output_buffer)
+    cdef Uint32 sample_count = len(output_buffer) // 2
+
+    PyObject_GetBuffer(input_buffer, &input_view, PyBUF_SIMPLE)
+    try:
+        if input_view.len != sample_count * sizeof(float):
+            raise ValueError("Input and output buffer must have the same number of samples")
+
+        with nogil:
+            Track.convert_float_to_output(output_data, <const float*>input_view.buf, sample_count, gain, soft_limiter)
+    finally:
+        PyBuffer_Release(&input_view)
@@ -21,6 +21,11 @@ from mpfmc.core.audio.track_sound_loop cimport *
 cdef class TrackSoundLoop(Track):
     """
     Live Loop track class
+
+    Only the notifications of this track go through the notification ring. Requests do not use a
+    request ring: the sound loop set players and their layers are allocated, changed and freed
+    by Python while the audio callback walks the same lists, so all of this (including the
+    processing of notifications which delete players) is done under the mixer lock.
     """
 
     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size,
@@ -43,7 +48,7 @@ cdef class TrackSoundLoop(Track):
 
         self.log = logging.getLogger("Track." + str(track_num) + ".TrackSoundLoop." + name)
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Set track type specific settings
         self.state.mix_callback_function = TrackSoundLoop.mix_playing_sounds
@@ -61,13 +66,12 @@ cdef class TrackSoundLoop(Track):
 
         self.log.debug("Created Track %d %s", self.number, self.name)
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def __dealloc__(self):
         """Destructor"""
 
-        SDL_LockAudio()
-
+        # No lock is needed, the audio interface does not mix any more when its tracks are freed
         # Free the specific track type state and other allocated memory
         if self.type_state != NULL:
 
@@ -86,8 +90,6 @@ cdef class TrackSoundLoop(Track):
             if self.state != NULL:
                 self.state.type_state = NULL
 
-        SDL_UnlockAudio()
-
     def __repr__(self):
         return '<Track.{}.SoundLoop.{}>'.format(self.number, self.name)
 
@@ -165,25 +167,25 @@ cdef class TrackSoundLoop(Track):
 
     def process(self):
         """Processes track messages each tick."""
+        cdef NotificationMessageContainer notification_message
+        cdef NotificationMessageContainer *next_notification_message
 
         # Lock the mutex to ensure no audio data is changed during the playback processing
         # (multi-threaded protection)
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
+        next_notification_message = <NotificationMessageContainer*>message_ring_peek(self.state.notification_messages)
+        while next_notification_message != NULL:
+            notification_message = next_notification_message[0]
+            message_ring_release(self.state.notification_messages)
+            self.process_notification_message(cython.address(notification_message))
+            next_notification_message = <NotificationMessageContainer*>message_ring_peek(self.state.notification_messages)
 
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
+        self._check_dropped_notifications()
 
         # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
@@ -191,7 +193,7 @@ cdef class TrackSoundLoop(Track):
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
@@ -208,7 +210,7 @@ cdef class TrackSoundLoop(Track):
                         self.mc.post_mc_native_event(event, track=self._name)
                 pass
 
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         self.log.debug("Processing notification message %d for sound instance (id: %d)",
@@ -221,7 +223,7 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Received a notification message for a sound loop set (id: %d) "
                                  "that is no longer active. Notification will be discarded.",
                                  notification_message.data.sound_loop_set.id)
-                SDL_UnlockAudio()
+                SDL_UnlockMutex(self.state.callback_data.mixer_lock)
                 return
 
             sound_loop_set_settings = self._active_sound_loop_sets[notification_message.data.sound_loop_set.id]
@@ -229,7 +231,7 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Could not retrieve settings for a sound loop set (id: %d) "
                                  "Notification will be discarded.",
                                  notification_message.data.sound_loop_set.id)
-                SDL_UnlockAudio()
+                SDL_UnlockMutex(self.state.callback_data.mixer_lock)
                 return
 
             if notification_message.message == notification_sound_loop_set_started:
@@ -262,7 +264,7 @@ cdef class TrackSoundLoop(Track):
                 self.log.warning("Received a notification message for a sound (id: %d) "
                                  "that does not exist. Notification will be discarded.",
                                  notification_message.sound_id)
-                SDL_UnlockAudio()
+                SDL_UnlockMutex(self.state.callback_data.mixer_lock)
                 return
 
             # In a sound loop track, sound instances are not created when playing a loop sound.  The sound
@@ -278,7 +280,7 @@ cdef class TrackSoundLoop(Track):
                                                      sound_instance=sound,
                                                      marker_id=notification_message.data.marker.id)
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def play_sound_loop_set(self, dict sound_loop_set not None, str context=None, dict player_settings=None):
         """
@@ -327,7 +329,7 @@ cdef class TrackSoundLoop(Track):
                            "not loaded, could not play loop set", player_settings['sound'])
             return
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Create new player
         player = <SoundLoopSetPlayer*>g_slice_alloc0(sizeof(SoundLoopSetPlayer))
@@ -354,7 +356,7 @@ cdef class TrackSoundLoop(Track):
             player.sample_pos = 0
             player.status = player_idle
             g_slice_free1(sizeof(SoundLoopSetPlayer), player)
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Setup sound loop set layers
@@ -480,7 +482,7 @@ cdef class TrackSoundLoop(Track):
 
         # print("play_sound_loop_set - status: ", self.get_status())
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     cdef _apply_layer_settings(self, SoundLoopLayerSettings *layer, dict layer_settings):
         cdef SoundFile sound_container
@@ -532,13 +534,13 @@ cdef class TrackSoundLoop(Track):
             fade_out: The number of seconds over which to fade out the currently playing
                       sound loop set before stopping.
         """
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("Stopping current sound loop set")
 
         if self.type_state.current == NULL or self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to stop sound loop set - no sound loop set is currently playing.")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Calculate new fade out if specified (overriding current setting)
@@ -558,19 +560,19 @@ cdef class TrackSoundLoop(Track):
         # Do we need to shorted the current fade-out?
         self._fade_out_all_players(self.type_state.current.master_sound_layer.fade_steps_remaining)
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def jump_to_time_current_sound_loop_set(self, time=0.0):
         """Immediately jumps the loop playback position to the specified time."""
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("Jumping to %f seconds playback position in current sound loop set", time)
 
         if self.type_state.current == NULL or self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to jump to specified playback position - "
                           "no sound loop set is currently playing.")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Set new playback position (make sure it is within the current sample length)
@@ -578,25 +580,25 @@ cdef class TrackSoundLoop(Track):
         while self.type_state.current.sample_pos >= self.type_state.current.length:
             self.type_state.current.sample_pos -= self.type_state.current.length
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def stop_looping_current_sound_loop_set(self):
         """
         Stops the currently playing sound loop set from continuing to loop (it will stop
         after the current loop iteration).
         """
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("Stopping looping current sound loop set")
 
         if self.type_state.current == NULL or self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to stop looping sound loop set - no sound loop set is currently playing.")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         self.type_state.current.stop_loop_samples_remaining = self.type_state.current.length - self.type_state.current.sample_pos
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def play_layer(self, int layer, float fade_in=0.0, str timing="loop_end", volume=None):
         """
@@ -615,31 +617,31 @@ cdef class TrackSoundLoop(Track):
             self.log.warning("Illegal layer value in call to play_layer (must be > 0).")
             return
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("play_layer - Play layer %d of the currently playing sound_loop_set (fade-in = %f sec).",
                        layer, fade_in)
 
         if self.type_state.current == NULL or self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to play layer - no sound loop set is currently playing.")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Retrieve the layer
         if self.type_state.current.layers == NULL:
             self.log.info("There are no layers defined in the current sound loop set: play_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         layer_settings = <SoundLoopLayerSettings*>g_slist_nth_data(self.type_state.current.layers, layer - 1)
         if layer_settings == NULL:
             self.log.info("The specified layer could not be found in the current sound loop set: play_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         if layer_settings.status != layer_stopped:
             self.log.info("The current sound loop set layer is already playing: play_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Layer volume (use layer settings or sound setting if None)
@@ -661,12 +663,12 @@ cdef class TrackSoundLoop(Track):
                 layer_settings.status = layer_playing
         else:
             self.log.error("Unknown timing value specified: %s", timing)
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         layer_settings.looping = True
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def stop_layer(self, int layer, float fade_out=0.0):
         """
@@ -682,31 +684,31 @@ cdef class TrackSoundLoop(Track):
             self.log.warning("Illegal layer value in call to stop_layer (must be > 0).")
             return
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("stop_layer - Stop layer %d of the currently playing sound_loop_set (fade-out = %f sec).",
                        layer, fade_out)
 
         if self.type_state.current == NULL or self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to stop layer - no sound loop set is currently playing.")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Retrieve the layer
         if self.type_state.current.layers == NULL:
             self.log.info("There are no layers defined in the current sound loop set: stop_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         layer_settings = <SoundLoopLayerSettings*>g_slist_nth_data(self.type_state.current.layers, layer - 1)
         if layer_settings == NULL:
             self.log.info("The specified layer could not be found in the current sound loop set: stop_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         if layer_settings.status == layer_stopped:
             self.log.info("The current sound loop set layer is already stopped: stop_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         # Calculate fading (done at control rate; need to calculate the number of steps over which to fade in/out)
@@ -718,7 +720,7 @@ cdef class TrackSoundLoop(Track):
             # TODO: Could perform a quick fade out rather than an abrupt stop
             layer_settings.status = layer_stopped
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def stop_looping_layer(self, int layer):
         """
@@ -734,7 +736,7 @@ cdef class TrackSoundLoop(Track):
             self.log.warning("Illegal layer value in call to stop_looping_layer (must be > 0).")
             return
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         self.log.debug("stop_looping_layer - Stop looping layer %d of the currently playing sound_loop_set.", layer)
 
@@ -742,25 +744,25 @@ cdef class TrackSoundLoop(Track):
         if self.type_state.current.layers == NULL:
             self.log.info("There are no layers defined in the current sound loop set: "
                           "stop_looping_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         layer_settings = <SoundLoopLayerSettings*>g_slist_nth_data(self.type_state.current.layers, layer - 1)
         if layer_settings == NULL:
             self.log.info("The specified layer could not be found in the current sound loop set: "
                           "stop_looping_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         if layer_settings.status == layer_stopped:
             self.log.info("The current sound loop set layer is already stopped: "
                           "stop_looping_layers has no effect")
-            SDL_UnlockAudio()
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
             return
 
         layer_settings.looping = False
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     cdef _initialize_player(self, SoundLoopSetPlayer *player):
         """Initializes a SoundLoopSetPlayer struct."""
@@ -871,7 +873,7 @@ cdef class TrackSoundLoop(Track):
         cdef int index = 0
         cdef GSList *iterator
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
         status = []
 
         iterator = self.type_state.players
@@ -917,7 +919,7 @@ cdef class TrackSoundLoop(Track):
 
             iterator = iterator.next
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
         return status
 
@@ -1177,11 +1179,11 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
             return buffer_length
 
         # Get master layer samples
-        SDL_MixAudioFormat(track.buffer + track_buffer_pos,
-                           <Uint8*>player.master_sound_layer.sound.data.memory.data + player.sample_pos,
-                           track.callback_data.format,
-                           current_chunk_bytes,
-                           player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME)
+        Track.mix_sound_to_track(track,
+                                 track.buffer + track_buffer_pos,
+                                 <Uint8*>player.master_sound_layer.sound.data.memory.data + player.sample_pos,
+                                 current_chunk_bytes,
+                                 player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME)
 
         # Process markers (do any markers fall in the current chunk?)
         # Note: the current sample position has already been incremented when the sample data was received so
@@ -1233,11 +1235,11 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
                                 layer_bytes_remaining = 0
 
                     if layer_sample_pos < layer.sound.data.memory.size:
-                        SDL_MixAudioFormat(track.buffer + track_buffer_pos + layer_track_buffer_pos_offset,
-                                           <Uint8*>layer.sound.data.memory.data + layer_sample_pos,
-                                           callback_data.format,
-                                           min(layer_chunk_bytes, layer.sound.data.memory.size - layer_sample_pos),
-                                           player_volume * layer_volume // SDL_MIX_MAXVOLUME)
+                        Track.mix_sound_to_track(track,
+                                                 track.buffer + track_buffer_pos + layer_track_buffer_pos_offset,
+                                                 <Uint8*>layer.sound.data.memory.data + layer_sample_pos,
+                                                 min(layer_chunk_bytes, layer.sound.data.memory.size - layer_sample_pos),
+                                                 player_volume * layer_volume // SDL_MIX_MAXVOLUME)
 
                         # Process markers (do any markers fall in the current chunk?)
                         # Note: the current sample position has already been incremented when the sample data was received so
@@ -3,6 +3,7 @@ from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.sound_file cimport *
 from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.notification_message cimport *
+from mpfmc.core.audio.request_message cimport *
 
 
 # ---------------------------------------------------------------------------
@@ -12,10 +13,16 @@ from mpfmc.core.audio.notification_message cimport *
 cdef enum:
     no_marker = 0xFFFFFFFF
 
+# The number of request messages which fit into the request ring of a track (must be a power
+# of two). Requests are processed on every audio callback.
+cdef enum:
+    REQUEST_RING_SIZE = 256
+
 ctypedef struct TrackStandardState:
     # State variables for TrackStandard tracks
     int sound_player_count
     SoundPlayer *sound_players
+    MessageRing *requests
 
 cdef enum SoundPlayerStatus:
     # Enumeration of the possible sound player status values.
@@ -28,14 +35,6 @@ cdef enum SoundPlayerStatus:
     player_finished = 6
     player_stopping = 7
 
-ctypedef struct DuckingSettings:
-    int track_bit_mask
-    Sint32 attack_start_pos
-    Sint32 attack_duration
-    Uint8 attenuation_volume
-    Sint32 release_start_pos
-    Sint32 release_duration
-
 cdef enum DuckingStage:
     ducking_stage_idle = 0
     ducking_stage_delay = 1
@@ -92,6 +91,7 @@ cdef class TrackStandard(Track):
 
     cdef list _sound_queue
     cdef dict _playing_instances_by_id
+    cdef list _player_instances
     cdef int _max_simultaneous_sounds
 
     # Track state needs to be stored in a C struct in order for them to be accessible in
@@ -106,12 +106,16 @@ cdef class TrackStandard(Track):
     cdef process_notification_message(self, NotificationMessageContainer *notification_message)
     cdef tuple _get_sound_player_with_lowest_priority(self)
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=?)
-    cdef _set_player_sound_settings(self, SoundSettings *sound_settings, object sound_instance)
-    cdef _set_player_playing(self, SoundPlayer *player, object sound_instance)
-    cdef _set_player_replacing(self, SoundPlayer *player, object sound_instance)
+    cdef RequestMessageContainer *_create_request_message(self, RequestMessage message, object sound_instance)
+    cdef _set_play_request_settings(self, RequestMessageDataPlaySound *play, object sound_instance)
+    cdef bint _send_stop_request(self, object sound_instance, Uint32 fade_out_steps)
+    cdef _apply_requests(self)
     cdef int _get_player_playing_sound_instance(self, sound_instance)
     cdef Uint32 _fix_sample_frame_pos(self, Uint32 sample_pos, Uint8 bytes_per_sample, int channels)
 
+    @staticmethod
+    cdef void process_requests(TrackState *track) nogil
+
     @staticmethod
     cdef void mix_playing_sounds(TrackState *track, Uint32 buffer_length, AudioCallbackData *callback_data) nogil
 
@@ -120,6 +124,7 @@ cdef class TrackStandard(Track):
 #    function (these functions do not use the GIL).
 # ---------------------------------------------------------------------------
 
+cdef void set_sound_settings_from_request(SoundSettings *sound, RequestMessageContainer *request_message) nogil
 cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
                                    Uint8 volume, TrackState *track, int player_num) nogil
 cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
@@ -55,7 +55,7 @@ cdef class TrackStandard(Track):
 
         self.log = logging.getLogger("Track." + str(track_num) + ".TrackStandard." + name)
 
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
 
         # Dictionary of SoundInstance class objects keyed by SoundInstance.id
         self._playing_instances_by_id = dict()
@@ -65,11 +65,15 @@ cdef class TrackStandard(Track):
 
         # Set track type specific settings
         self.state.mix_callback_function = TrackStandard.mix_playing_sounds
+        self.state.process_requests_function = TrackStandard.process_requests
 
         # Allocate memory for the specific track type state struct (TrackStandardState)
         self.type_state = <TrackStandardState*> PyMem_Malloc(sizeof(TrackStandardState))
         self.state.type_state = <void*>self.type_state
 
+        # Play and stop requests are passed to the audio callback without the mixer lock
+        self.type_state.requests = message_ring_create(REQUEST_RING_SIZE, sizeof(RequestMessageContainer))
+
         # Make sure the number of simultaneous sounds is within the allowable range
         if max_simultaneous_sounds > MAX_SIMULTANEOUS_SOUNDS_LIMIT:
             self.log.warning("The maximum number of simultaneous sounds per track is %d",
@@ -81,6 +85,10 @@ cdef class TrackStandard(Track):
         self._max_simultaneous_sounds = max_simultaneous_sounds
         self.type_state.sound_player_count = max_simultaneous_sounds
 
+        # The sound instance which has been requested on each sound player (None when the player is idle).
+        # The sound player state itself belongs to the audio callback.
+        self._player_instances = [None] * max_simultaneous_sounds
+
         # Allocate memory for the sound player structs needed for the desired number of
         # simultaneous sounds that can be played on the track.
         self.type_state.sound_players = <SoundPlayer*> PyMem_Malloc(self.type_state.sound_player_count * sizeof(SoundPlayer))
@@ -106,7 +114,7 @@ cdef class TrackStandard(Track):
             self.type_state.sound_players[i].current.ducking_stage = ducking_stage_idle
             self.type_state.sound_players[i].current.ducking_control_points = g_array_sized_new(False, False, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
             self.type_state.sound_players[i].current.marker_count = 0
-            self.type_state.sound_players[i].current.markers = g_array_new(False, False, sizeof(guint))
+            self.type_state.sound_players[i].current.markers = g_array_sized_new(False, False, sizeof(guint), MAX_MARKERS)
             self.type_state.sound_players[i].next.sample = NULL
             self.type_state.sound_players[i].next.loops_remaining = 0
             self.type_state.sound_players[i].next.current_loop = 0
@@ -123,19 +131,18 @@ cdef class TrackStandard(Track):
             self.type_state.sound_players[i].next.ducking_stage = ducking_stage_idle
             self.type_state.sound_players[i].next.ducking_control_points = g_array_sized_new(False, False, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
             self.type_state.sound_players[i].next.marker_count = 0
-            self.type_state.sound_players[i].next.markers = g_array_new(False, False, sizeof(guint))
+            self.type_state.sound_players[i].next.markers = g_array_sized_new(False, False, sizeof(guint), MAX_MARKERS)
 
         self.log.debug("Created Track %d %s with the following settings: "
                        "simultaneous_sounds = %d, volume = %f",
                        self.number, self.name, self.max_simultaneous_sounds, self.volume)
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     def __dealloc__(self):
         """Destructor"""
 
-        SDL_LockAudio()
-
+        # No lock is needed, the audio interface does not mix any more when its tracks are freed
         # Free the specific track type state and other allocated memory
         if self.type_state != NULL:
             for i in range(self.type_state.sound_player_count):
@@ -145,13 +152,12 @@ cdef class TrackStandard(Track):
                 g_array_free(self.type_state.sound_players[i].next.markers, True)
 
             PyMem_Free(self.type_state.sound_players)
+            message_ring_free(self.type_state.requests)
             PyMem_Free(self.type_state)
             self.type_state = NULL
             if self.state != NULL:
                 self.state.type_state = NULL
 
-        SDL_UnlockAudio()
-
     def __repr__(self):
         return '<Track.{}.Standard.{}>'.format(self.number, self.name)
 
@@ -179,56 +185,44 @@ cdef class TrackStandard(Track):
         Returns the index of the first idle sound player on the track.  If all
         players are currently busy playing, -1 is returned.
         """
-        SDL_LockAudio()
-
-        for index in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[index].status == player_idle:
-                SDL_UnlockAudio()
+        for index, sound_instance in enumerate(self._player_instances):
+            if sound_instance is None:
                 return index
 
-        SDL_UnlockAudio()
         return -1
 
     def process(self):
-        """Processes the track queue each tick."""
+        """Processes the track notifications and queue each tick."""
 
-        cdef bint keep_checking = True
+        cdef NotificationMessageContainer notification_message
+        cdef NotificationMessageContainer *next_notification_message
         cdef int idle_sound_player
-        cdef GSList *iterator = NULL
 
-        # Lock the mutex to ensure no audio data is changed during the playback processing
-        # (multi-threaded protection)
-        SDL_LockAudio()
+        # Process track notification messages first (sounds which have stopped free their sound players).
+        # Each message is copied out of the notification ring, so the audio callback can reuse its slot
+        # while the message is processed.
+        next_notification_message = <NotificationMessageContainer*>message_ring_peek(self.state.notification_messages)
+        while next_notification_message != NULL:
+            notification_message = next_notification_message[0]
+            message_ring_release(self.state.notification_messages)
+            self.process_notification_message(cython.address(notification_message))
+            next_notification_message = <NotificationMessageContainer*>message_ring_peek(self.state.notification_messages)
 
-        while keep_checking:
+        self._check_dropped_notifications()
+
+        while True:
             # See if there are now any idle sound players
             idle_sound_player = self._get_idle_sound_player()
-            if idle_sound_player >= 0:
-                # Found an idle player, check if there are any sounds queued for playback
-                sound_instance = self._get_next_sound()
-
-                if sound_instance is not None:
-                    self.log.debug("Getting sound from queue %s", sound_instance)
-                    self._play_sound_on_sound_player(sound_instance=sound_instance, player=idle_sound_player)
-                else:
-                    keep_checking = False
-            else:
-                keep_checking = False
-
-        # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
+            if idle_sound_player < 0:
+                break
 
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
+            # Found an idle player, check if there are any sounds queued for playback
+            sound_instance = self._get_next_sound()
+            if sound_instance is None:
+                break
 
-        # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
+            self.log.debug("Getting sound from queue %s", sound_instance)
+            self._play_sound_on_sound_player(sound_instance=sound_instance, player=idle_sound_player)
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
@@ -236,8 +230,6 @@ cdef class TrackStandard(Track):
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
-
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
             if notification_message.message == notification_track_stopped:
@@ -254,7 +246,6 @@ cdef class TrackStandard(Track):
                         self.mc.post_mc_native_event(event, track=self._name)
                 pass
 
-            SDL_UnlockAudio()
             return
 
         self.log.debug("Processing notification message %d for sound instance (id: %d)",
@@ -279,6 +270,11 @@ cdef class TrackStandard(Track):
                                "instance dictionary", str(sound_instance))
                 del self._playing_instances_by_id[sound_instance.id]
 
+                # The sound player is idle now (unless it has already been given another sound instance)
+                if 0 <= notification_message.player < len(self._player_instances) and \
+                        self._player_instances[notification_message.player] is sound_instance:
+                    self._player_instances[notification_message.player] = None
+
         elif notification_message.message == notification_sound_looping:
             sound_instance = self._playing_instances_by_id[notification_message.sound_instance_id]
             if sound_instance is not None:
@@ -296,8 +292,6 @@ cdef class TrackStandard(Track):
         else:
             raise AudioException("Unknown notification message received on %s track", self.name)
 
-        SDL_UnlockAudio()
-
     def _get_next_sound(self):
         """
         Returns the next sound in the priority queue ready for playback.
@@ -410,37 +404,17 @@ cdef class TrackStandard(Track):
     cdef int _get_playing_sound_count(self, Uint64 sound_id):
         """Return the number of currently playing instances of the given sound id"""
         cdef int count = 0
-        SDL_LockAudio()
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
+        for sound_instance in self._player_instances:
+            if sound_instance is not None and sound_instance.sound_id == sound_id:
                 count += 1
 
-        SDL_UnlockAudio()
         return count
 
     cdef list _get_playing_sound_instances(self, Uint64 sound_id):
         """Return the list of currently playing instances of the given sound id"""
-        cdef list instances = list()
-        cdef Uint64 instance_id
-
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
-
-                if self.type_state.sound_players[i].status == player_replacing:
-                    instance_id = self.type_state.sound_players[i].next.sound_instance_id
-                else:
-                    instance_id = self.type_state.sound_players[i].current.sound_instance_id
-
-                if instance_id in self._playing_instances_by_id:
-                    instances.append(self._playing_instances_by_id[instance_id])
-
-        SDL_UnlockAudio()
-        return instances
+        return [sound_instance for sound_instance in self._player_instances
+                if sound_instance is not None and sound_instance.sound_id == sound_id]
 
     def _get_oldest_playing_sound_instance(self, Uint64 sound_id):
         """Return the oldest sound instance currently playing"""
@@ -483,11 +457,6 @@ cdef class TrackStandard(Track):
         """
         self.log.debug("play_sound - Processing sound '%s' for playback.", sound.name)
 
-        SDL_LockAudio()
-
-        # A try/else/finally block is used here to ensure SDL_UnlockAudio is always called
-        # before the function returns (since there are so many return branches it is easier
-        # to use than placing the SDL_UnlockAudio call before every return).
         try:
 
             # Sound cannot be played if the track is stopped or paused
@@ -610,10 +579,6 @@ cdef class TrackStandard(Track):
             # No exception occurred, return the newly created sound instance that will be played
             return sound_instance
 
-        finally:
-            # Always unlock the audio mutex before returning
-            SDL_UnlockAudio()
-
     def _replace_sound_instance(self, old_instance not None, sound_instance not None):
         """
         Replace a currently playing instance with another sound instance.
@@ -625,7 +590,6 @@ cdef class TrackStandard(Track):
         self.log.debug("replace_sound_instance - Preparing to replace existing sound with a new sound instance")
 
         # Find which player is currently playing the specified sound instance to replace
-        SDL_LockAudio()
         player = self._get_player_playing_sound_instance(old_instance)
 
         if player >= 0:
@@ -634,8 +598,6 @@ cdef class TrackStandard(Track):
             self.log.debug("replace_sound_instance - Could not locate specified sound instance to replace")
             sound_instance.set_canceled()
 
-        SDL_UnlockAudio()
-
     def _queue_sound(self, sound_instance not None):
         """Adds a sound to the queue to be played when a sound player becomes available.
 
@@ -654,22 +616,8 @@ cdef class TrackStandard(Track):
 
     def _get_sound_instances_for_sound(self, sound not None):
         """Return list of sound instances of the given sound."""
-
-        cdef list instances = list()
-
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_id == sound.id:
-
-                sound_instance_id = self.type_state.sound_players[i].current.sound_instance_id
-                if sound_instance_id in self._playing_instances_by_id:
-                    instances.append(self._playing_instances_by_id[sound_instance_id])
-
-        SDL_UnlockAudio()
-
-        return instances
+        return [sound_instance for sound_instance in self._playing_instances_by_id.values()
+                if sound_instance.sound_id == sound.id]
 
     def stop_sound(self, sound not None, fade_out=None):
         """
@@ -692,47 +640,19 @@ cdef class TrackStandard(Track):
             sound_instance: The SoundInstance to stop
             fade_out: Optional amount of time (seconds) to fade out before stopping
         """
-        cdef SoundPlayer *player
-
-        SDL_LockAudio()
-
         self.log.debug("Stopping sound %s and removing any pending instances from queue", sound_instance.name)
 
         if fade_out is None:
             fade_out = sound_instance.fade_out
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_instance_id == sound_instance.id:
-
-                # Update player to stop playing sound
-                player = cython.address(self.type_state.sound_players[i])
-
-                # Calculate fade out (if necessary)
-                player.current.fade_steps_remaining = fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
-                if player.current.fade_steps_remaining > 0:
-                    player.current.fade_out_steps = player.current.fade_steps_remaining
-                    player.current.fading_status = fading_status_fading_out
-                    player.status = player_stopping
-                else:
-                    # Sound will stop immediately - send sound stopped notification
-                    send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
-
-                # Adjust ducking release (if necessary)
-                if player.current.sound_has_ducking:
-                    # player.current.ducking_settings.release_duration = min(sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor, request_message.data.stop.fade_out_duration)
-                    # player.current.ducking_settings.release_start_pos = player.current.sample_pos
-                    # TODO: Add more intelligent ducking release point calculation here:
-                    #       Take into consideration whether ducking is already in progress and when it was
-                    #       originally scheduled to finish.
-                    pass
+        # The sound is stopped by the audio callback (it sends the sound stopped notification)
+        if sound_instance.id in self._playing_instances_by_id:
+            self._send_stop_request(sound_instance,
+                                    fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
 
         # Remove any instances of the specified sound that are pending in the sound queue
         self._remove_sound_instance_from_queue(sound_instance)
 
-        SDL_UnlockAudio()
-
     def stop_sound_looping(self, sound not None):
         """
         Cancels looping for all instances of the specified sound on the track. Any queued instances
@@ -752,23 +672,17 @@ cdef class TrackStandard(Track):
         Args:
             sound_instance: The Sound to stop
         """
+        cdef RequestMessageContainer *request_message
 
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and self.type_state.sound_players[
-                i].current.sound_instance_id == sound_instance.id:
-                # Set sound's loops_remaining variable to zero and loop end position to the end of the sound
-                self.type_state.sound_players[i].current.loops_remaining = 0
-                self.type_state.sound_players[i].current.loop_end_pos = self.type_state.sound_players[
-                    i].current.sample.data.memory.size
+        if sound_instance.id in self._playing_instances_by_id:
+            request_message = self._create_request_message(request_sound_stop_looping, sound_instance)
+            if request_message != NULL:
+                message_ring_commit(self.type_state.requests)
 
         # Remove any instances of the specified sound that are pending in the sound queue.
         if self.sound_instance_is_in_queue(sound_instance):
             self._remove_sound_instance_from_queue(sound_instance)
 
-        SDL_UnlockAudio()
-
     def clear_context(self, context):
         """
         Triggers the end mode action for current sound instances played from the specified context.
@@ -785,8 +699,6 @@ cdef class TrackStandard(Track):
 
         self.log.debug("Clearing context %s", context)
 
-        SDL_LockAudio()
-
         # Clear any instances in the queue with the given context value
         self._remove_all_sounds_with_context_from_queue(context)
 
@@ -798,68 +710,45 @@ cdef class TrackStandard(Track):
                 else:
                     self.stop_sound_instance_looping(sound_instance)
 
-        SDL_UnlockAudio()
-
     def _reset_state(self):
         """Resets the track state (stops all sounds immediately and clears the queue)"""
-        SDL_LockAudio()
-
         self.log.debug("Resetting track state (sounds will be stopped and queue cleared")
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-                # Set stop sound event
-                send_sound_stopped_notification(i,
-                                                self.type_state.sound_players[i].current.sound_id,
-                                                self.type_state.sound_players[i].current.sound_instance_id,
-                                                self.state)
-                self.type_state.sound_players[i].status = player_idle
+        for sound_instance in list(self._playing_instances_by_id.values()):
+            self._send_stop_request(sound_instance, 0)
+        self._apply_requests()
 
         # Remove all sounds that are pending in the sound queue.
         self._remove_all_sounds_from_queue()
 
-        SDL_UnlockAudio()
-
     def stop_all_sounds(self, float fade_out_seconds = 0.0):
         """
         Stops all playing sounds immediately on the track.
         Args:
             fade_out_seconds: The number of seconds to fade out the sounds before stopping
         """
-        SDL_LockAudio()
+        cdef Uint32 fade_out_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
 
         self.log.debug("Stopping all sounds and removing any pending sounds from queue")
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-
-                # Update player to stop playing sound
-                player = cython.address(self.type_state.sound_players[i])
-
-                # Calculate fade out (if necessary)
-                player.current.fade_steps_remaining = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
-                if player.current.fade_steps_remaining > 0:
-                    player.current.fade_out_steps = player.current.fade_steps_remaining
-                    player.current.fading_status = fading_status_fading_out
-                    player.status = player_stopping
-                else:
-                    # Sound will stop immediately - send sound stopped notification
-                    send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
-
-                # Adjust ducking release (if necessary)
-                if player.current.sound_has_ducking:
-                    # player.current.ducking_settings.release_duration = min(sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor, request_message.data.stop.fade_out_duration)
-                    # player.current.ducking_settings.release_start_pos = player.current.sample_pos
-                    # TODO: Add more intelligent ducking release point calculation here:
-                    #       Take into consideration whether ducking is already in progress and when it was
-                    #       originally scheduled to finish.
-                    pass
+        for sound_instance in list(self._playing_instances_by_id.values()):
+            self._send_stop_request(sound_instance, fade_out_steps)
+        self._apply_requests()
 
         # Remove all sounds that are pending in the sound queue.
         self._remove_all_sounds_from_queue()
 
-        SDL_UnlockAudio()
+    cdef _apply_requests(self):
+        """
+        Applies all pending requests of the track now instead of in the next audio callback.
+        Used when all sounds are stopped, so the sound players are stopped when the call returns
+        (as when the players were changed directly) and no requests are left in the ring while
+        the audio callback is not running. The mixer lock keeps the mixer (the audio callback or
+        the premix thread) out of the request and notification rings meanwhile.
+        """
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
+        TrackStandard.process_requests(self.state)
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     cdef tuple _get_sound_player_with_lowest_priority(self):
         """
@@ -870,21 +759,16 @@ cdef class TrackStandard(Track):
             the sound playing on that player (or None if the player is idle).
 
         """
-        SDL_LockAudio()
-
         cdef int lowest_priority = 2147483647
         cdef int sound_player = -1
-        cdef int i
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status == player_idle:
-                SDL_UnlockAudio()
-                return i, None
-            elif self.type_state.sound_players[i].current.sound_priority < lowest_priority:
-                lowest_priority = self.type_state.sound_players[i].current.sound_priority
-                sound_player = i
-
-        SDL_UnlockAudio()
+        for index, sound_instance in enumerate(self._player_instances):
+            if sound_instance is None:
+                return index, None
+            elif sound_instance.priority < lowest_priority:
+                lowest_priority = sound_instance.priority
+                sound_player = index
+
         return sound_player, lowest_priority
 
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=False):
@@ -900,9 +784,9 @@ cdef class TrackStandard(Track):
         Returns:
             True if sound instance was able to be played, False otherwise
         """
-        self.log.debug("_play_sound_on_sound_player: %s, %s, %s", str(sound_instance), str(player), str(force))
+        cdef RequestMessageContainer *request_message
 
-        SDL_LockAudio()
+        self.log.debug("_play_sound_on_sound_player: %s, %s, %s", str(sound_instance), str(player), str(force))
 
         # The sound cannot be played if the track is stopped or paused
         if self.state.status == track_status_stopped or self.state.status == track_status_paused:
@@ -910,158 +794,192 @@ cdef class TrackStandard(Track):
                            "therefore the request to play sound %s will be canceled",
                            self.name, sound_instance.name)
             sound_instance.set_canceled()
-            SDL_UnlockAudio()
             return False
 
         if not sound_instance.sound.loaded:
             self.log.debug("Specified sound is not loaded, could not "
                            "play sound %s", sound_instance.name)
-            SDL_UnlockAudio()
             return False
 
         # Make sure the player in range
         if player in range(self.type_state.sound_player_count):
 
             # If the specified sound player is not idle do not play the sound if force is not set
-            if self.type_state.sound_players[player].status != player_idle and not force:
+            if self._player_instances[player] is not None and not force:
                 self.log.debug("All sound players are currently in use, "
                                "could not play sound %s", sound_instance.name)
-                SDL_UnlockAudio()
                 return False
 
+            # The sound player is started by the audio callback. If the player is currently busy
+            # playing another sound, it will be replaced with the sound instance.
+            if self._player_instances[player] is None:
+                request_message = self._create_request_message(request_sound_play, sound_instance)
+            else:
+                request_message = self._create_request_message(request_sound_replace, sound_instance)
+
+            if request_message == NULL:
+                sound_instance.set_canceled()
+                return False
+
+            request_message.player = player
+            self._set_play_request_settings(cython.address(request_message.data.play), sound_instance)
+            message_ring_commit(self.type_state.requests)
+
             # Add sound to the dictionary of active sound instances
             self.log.debug("Adding sound instance %s to active sound dictionary", str(sound_instance))
             self._playing_instances_by_id[sound_instance.id] = sound_instance
-
-            # Check if sound player is idle
-            if self.type_state.sound_players[player].status == player_idle:
-                # Start the player playing the sound instance
-                self._set_player_playing(cython.address(self.type_state.sound_players[player]), sound_instance)
-            else:
-                # The player is currently busy playing another sound, force it to be replaced with the sound instance
-                self._set_player_replacing(cython.address(self.type_state.sound_players[player]), sound_instance)
+            self._player_instances[player] = sound_instance
 
             self.log.debug("Sound %s is set to begin playback on standard track (loops=%d)",
                            sound_instance.name, sound_instance.loops)
 
-            SDL_UnlockAudio()
             return True
 
-        SDL_UnlockAudio()
         return False
 
-    cdef _set_player_sound_settings(self, SoundSettings *sound_settings, object sound_instance):
+    cdef RequestMessageContainer *_create_request_message(self, RequestMessage message, object sound_instance):
         """
-        Set sound settings for the player from the sound instance.
+        Creates a new request message for the sound instance in the request ring of the track. The
+        message is sent to the audio callback with message_ring_commit.
         Args:
-            sound_settings: A pointer to a SoundSettings structure
+            message: The request message type
             sound_instance: The sound instance
+
+        Returns:
+            A pointer to the new request message or NULL if the request ring is full.
+        """
+        cdef RequestMessageContainer *request_message = <RequestMessageContainer*>message_ring_reserve(
+            self.type_state.requests)
+
+        if request_message == NULL:
+            self.log.warning("The request ring of track %s is full. The request for sound %s will be discarded.",
+                             self.name, sound_instance.name)
+            return NULL
+
+        request_message.message = message
+        request_message.sound_id = sound_instance.sound_id
+        request_message.sound_instance_id = sound_instance.id
+        request_message.player = -1
+        return request_message
+
+    cdef bint _send_stop_request(self, object sound_instance, Uint32 fade_out_steps):
+        """
+        Sends a request to stop the sound instance to the audio callback.
+        Args:
+            sound_instance: The sound instance to stop
+            fade_out_steps: The number of control points over which to fade out the sound (0 = stop immediately)
+
+        Returns:
+            True if the request was sent, False otherwise
         """
-        cdef int bytes_per_sample_frame
+        cdef RequestMessageContainer *request_message = self._create_request_message(request_sound_stop,
+                                                                                      sound_instance)
+        if request_message == NULL:
+            return False
 
-        if sound_settings == NULL or sound_instance is None:
+        request_message.data.stop.fade_out_steps = fade_out_steps
+        message_ring_commit(self.type_state.requests)
+        return True
+
+    cdef _set_play_request_settings(self, RequestMessageDataPlaySound *play, object sound_instance):
+        """
+        Set the sound settings of a play request from the sound instance.
+        Args:
+            play: A pointer to the play sound data of a request message
+            sound_instance: The sound instance
+        """
+        if play == NULL or sound_instance is None:
             return
 
         # Get the sound sample buffer container
         cdef SoundFile sound_container = sound_instance.container
 
         # Setup the player to start playing the sound
-        sound_settings.sample_pos = <Uint32>(sound_instance.start_at * self.state.callback_data.seconds_to_bytes_factor)
-        sound_settings.sample_pos = self._fix_sample_frame_pos(sound_settings.sample_pos, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
-        if sound_settings.sample_pos > sound_container.sample.size:
-            sound_settings.sample_pos = 0
+        play.start_at_position = <Uint32>(sound_instance.start_at * self.state.callback_data.seconds_to_bytes_factor)
+        play.start_at_position = self._fix_sample_frame_pos(play.start_at_position, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
+        if play.start_at_position > sound_container.sample.size:
+            play.start_at_position = 0
 
         # Setup loop start position (defaults to 0)
-        sound_settings.loop_start_pos = <Uint32>(sound_instance.loop_start_at * self.state.callback_data.seconds_to_bytes_factor)
-        sound_settings.loop_start_pos = self._fix_sample_frame_pos(sound_settings.loop_start_pos, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
-        if sound_settings.loop_start_pos > sound_container.sample.size:
-            sound_settings.loop_start_pos = 0
+        play.loop_start_position = <Uint32>(sound_instance.loop_start_at * self.state.callback_data.seconds_to_bytes_factor)
+        play.loop_start_position = self._fix_sample_frame_pos(play.loop_start_position, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
+        if play.loop_start_position > sound_container.sample.size:
+            play.loop_start_position = 0
 
         # Setup loop end position (if loop_end_at is None, set loop end to end of sound)
         if sound_instance.loop_end_at is None:
-            sound_settings.loop_end_pos = sound_container.sample.size
+            play.loop_end_position = sound_container.sample.size
         else:
-            sound_settings.loop_end_pos = <Uint32>(sound_instance.loop_end_at * self.state.callback_data.seconds_to_bytes_factor)
-            sound_settings.loop_end_pos = self._fix_sample_frame_pos(sound_settings.loop_end_pos, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
-            if sound_settings.loop_end_pos > sound_container.sample.size:
-                sound_settings.loop_end_pos = sound_container.sample.size
-
-        sound_settings.current_loop = 0
-        sound_settings.sound_id = sound_instance.sound_id
-        sound_settings.sound_instance_id = sound_instance.id
-        sound_settings.sample = cython.address(sound_container.sample)
-        sound_settings.volume = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME)
-        sound_settings.volume_left = sound_settings.volume
-        sound_settings.volume_right = sound_settings.volume
-        sound_settings.loops_remaining = sound_instance.loops
-        sound_settings.sound_priority = sound_instance.priority
+            play.loop_end_position = <Uint32>(sound_instance.loop_end_at * self.state.callback_data.seconds_to_bytes_factor)
+            play.loop_end_position = self._fix_sample_frame_pos(play.loop_end_position, self.state.callback_data.bytes_per_sample, self.state.callback_data.channels)
+            if play.loop_end_position > sound_container.sample.size:
+                play.loop_end_position = sound_container.sample.size
+
+        play.sample = cython.address(sound_container.sample)
+        play.volume = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME)
+        play.volume_left = play.volume
+        play.volume_right = play.volume
+        play.loops = sound_instance.loops
+        play.priority = sound_instance.priority
 
         # If the sound is not set to loop, adjust the loop end position to the end of the sound
-        if sound_settings.loops_remaining == 0:
-            sound_settings.loop_end_pos = sound_container.sample.size
+        if play.loops == 0:
+            play.loop_end_position = sound_container.sample.size
 
         # Apply simple linear pan/balance setting
         if self.state.callback_data.channels == 2:
             if sound_instance.pan < 0:
-                sound_settings.volume_left = sound_settings.volume
-                sound_settings.volume_right = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME * in_out_quad(sound_instance.pan + 1.0))
+                play.volume_left = play.volume
+                play.volume_right = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME * in_out_quad(sound_instance.pan + 1.0))
             else:
-                sound_settings.volume_left = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME * in_out_quad(1.0 - sound_instance.pan))
-                sound_settings.volume_right = sound_settings.volume
+                play.volume_left = <Uint8>(sound_instance.volume * SDL_MIX_MAXVOLUME * in_out_quad(1.0 - sound_instance.pan))
+                play.volume_right = play.volume
 
         # Fading (done at control rate; need to calculate the number of steps over which to fade in/out)
-        sound_settings.fade_in_steps = sound_instance.fade_in * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
-        sound_settings.fade_out_steps = sound_instance.fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
-        sound_settings.fade_steps_remaining = sound_settings.fade_in_steps
-        if sound_settings.fade_steps_remaining > 0:
-            sound_settings.fading_status = fading_status_fading_in
-        else:
-            sound_settings.fading_status = fading_status_not_fading
+        play.fade_in_steps = sound_instance.fade_in * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
+        play.fade_out_steps = sound_instance.fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
 
         # Markers
-        sound_settings.marker_count = sound_instance.marker_count
-        g_array_set_size(sound_settings.markers, sound_settings.marker_count)
-        for index in range(sound_instance.marker_count):
-            g_array_insert_val_uint(sound_settings.markers,
-                                    index,
-                                    <guint>(sound_instance.markers[index]['time'] * self.state.callback_data.seconds_to_bytes_factor))
+        play.marker_count = min(sound_instance.marker_count, MAX_MARKERS)
+        for index in range(play.marker_count):
+            play.markers[index] = <guint>(sound_instance.markers[index]['time'] * self.state.callback_data.seconds_to_bytes_factor)
 
         # Set almost finished marker (calculate based on the end of the sound)
         if sound_instance.about_to_finish_time is None:
-            sound_settings.about_to_finish_marker = no_marker
+            play.about_to_finish_marker = no_marker
         elif sound_instance.about_to_finish_time > sound_container.duration:
-            sound_settings.about_to_finish_marker = 0
+            play.about_to_finish_marker = 0
         else:
-            sound_settings.about_to_finish_marker = (sound_container.duration - sound_instance.about_to_finish_time) * self.state.callback_data.seconds_to_bytes_factor
+            play.about_to_finish_marker = (sound_container.duration - sound_instance.about_to_finish_time) * self.state.callback_data.seconds_to_bytes_factor
 
         # If the sound has ducking settings, apply them
         if sound_instance.ducking is not None and sound_instance.ducking.track_bit_mask != 0:
             # To convert between the number of seconds and a buffer position (bytes), we need to
             # account for the sample rate (samples per second), the number of audio channels, and the
             # number of bytes per sample (all samples are 16 bits)
-            sound_settings.sound_has_ducking = True
-            sound_settings.ducking_stage = ducking_stage_delay
-            sound_settings.ducking_settings.track_bit_mask = sound_instance.ducking.track_bit_mask
-            sound_settings.ducking_settings.attack_start_pos = sound_instance.ducking.delay * self.state.callback_data.seconds_to_bytes_factor
-            sound_settings.ducking_settings.attack_duration = sound_instance.ducking.attack * self.state.callback_data.seconds_to_bytes_factor
-            sound_settings.ducking_settings.attenuation_volume = <Uint8>(sound_instance.ducking.attenuation * SDL_MIX_MAXVOLUME)
-            sound_settings.ducking_settings.release_duration = sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor
+            play.sound_has_ducking = True
+            play.ducking_settings.track_bit_mask = sound_instance.ducking.track_bit_mask
+            play.ducking_settings.attack_start_pos = sound_instance.ducking.delay * self.state.callback_data.seconds_to_bytes_factor
+            play.ducking_settings.attack_duration = sound_instance.ducking.attack * self.state.callback_data.seconds_to_bytes_factor
+            play.ducking_settings.attenuation_volume = <Uint8>(sound_instance.ducking.attenuation * SDL_MIX_MAXVOLUME)
+            play.ducking_settings.release_duration = sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor
 
             # Release point is relative to the end of the sound
-            sound_settings.ducking_settings.release_start_pos = (sound_container.duration - sound_instance.ducking.release_point) * self.state.callback_data.seconds_to_bytes_factor
+            play.ducking_settings.release_start_pos = (sound_container.duration - sound_instance.ducking.release_point) * self.state.callback_data.seconds_to_bytes_factor
         else:
             # Sound does not have ducking, assign settings appropriately
-            sound_settings.sound_has_ducking = False
-            sound_settings.ducking_stage = ducking_stage_idle
-            sound_settings.ducking_settings.track_bit_mask = 0
-            sound_settings.ducking_settings.attack_start_pos = 0
-            sound_settings.ducking_settings.attack_duration = 0
-            sound_settings.ducking_settings.attenuation_volume = SDL_MIX_MAXVOLUME
-            sound_settings.ducking_settings.release_duration = 0
-            sound_settings.ducking_settings.release_start_pos = 0
-
-        # Special handling is needed to start streaming for the specified sound at the correct location
+            play.sound_has_ducking = False
+            play.ducking_settings.track_bit_mask = 0
+            play.ducking_settings.attack_start_pos = 0
+            play.ducking_settings.attack_duration = 0
+            play.ducking_settings.attenuation_volume = SDL_MIX_MAXVOLUME
+            play.ducking_settings.release_duration = 0
+            play.ducking_settings.release_start_pos = 0
+
+        # Special handling is needed to start streaming for the specified sound at the correct location.
+        # The stream is shared with the audio callback, so this (GStreamer only) path still needs the mixer lock.
         if sound_container.sample.type == sound_type_streaming:
+            SDL_LockMutex(self.state.callback_data.mixer_lock)
             # Seek to the specified start position
             gst_element_seek_simple(sound_container.sample.data.stream.pipeline,
                                     GST_FORMAT_TIME,
@@ -1069,48 +987,7 @@ cdef class TrackStandard(Track):
                                     sound_instance.start_at * GST_SECOND)
             with nogil:
                 ret = gst_element_set_state(sound_container.sample.data.stream.pipeline, GST_STATE_PLAYING)
-
-    cdef _set_player_playing(self, SoundPlayer *player, object sound_instance):
-        """
-        Sets the player status and sound settings to begin playing the sound instance
-        Args:
-            player: A pointer to the SoundPlayer on which to play the sound
-            sound_instance: The sound instance to begin playing
-        """
-        if player == NULL or sound_instance is None:
-            return
-
-        # Setup the player to start playing the sound
-        player.status = player_playing
-        self._set_player_sound_settings(cython.address(player.current), sound_instance)
-
-        # Send sound started notification
-        send_sound_started_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-
-        self.log.debug("Sound %s is set to begin playback on playlist track (loops=%d)",
-                       sound_instance.name, sound_instance.loops)
-
-    cdef _set_player_replacing(self, SoundPlayer *player, object sound_instance):
-        """
-        Sets the player status and sound settings to replace the currently playing sound with the
-        sound instance.
-        Args:
-            player: A pointer to the SoundPlayer on which to replace the sound
-            sound_instance: The sound instance to begin playing
-        """
-        if player == NULL or sound_instance is None:
-            return
-
-        # Set current sound to fade out quickly
-        player.current.fade_out_steps = self.state.callback_data.quick_fade_steps
-        player.current.fade_steps_remaining = self.state.callback_data.quick_fade_steps
-        player.current.fading_status = fading_status_fading_out
-
-        # Set the next sound to play immediately after the current one fades out
-        player.status = player_replacing
-        self._set_player_sound_settings(cython.address(player.next), sound_instance)
-
-        # TODO: Figure out how to handle ducking when replacing an existing sound
+            SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
     cdef int _get_player_playing_sound_instance(self, sound_instance):
         """
@@ -1122,15 +999,10 @@ cdef class TrackStandard(Track):
             The sound player number currently playing the specified sound instance or -1 if the
             sound instance is not currently playing.
         """
-        SDL_LockAudio()
-
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
-                SDL_UnlockAudio()
-                return i
+        for index, player_instance in enumerate(self._player_instances):
+            if player_instance is not None and player_instance.id == sound_instance.id:
+                return index
 
-        SDL_UnlockAudio()
         return -1
 
     cdef Uint32 _fix_sample_frame_pos(self, Uint32 sample_pos, Uint8 bytes_per_sample, int channels):
@@ -1158,12 +1030,13 @@ cdef class TrackStandard(Track):
     def get_status(self):
         """
         Get the current track status (status of all sound players on the track).
-        Used for debugging and testing.
+        Used for debugging and testing (the mixer lock is held for a consistent snapshot of the
+        sound players).
         Returns:
             A list of status dictionaries containing the current settings for each
             sound player.
         """
-        SDL_LockAudio()
+        SDL_LockMutex(self.state.callback_data.mixer_lock)
         status = []
         for player in range(self.type_state.sound_player_count):
             status.append({
@@ -1193,7 +1066,7 @@ cdef class TrackStandard(Track):
                            self.type_state.sound_players[player].current.loops_remaining,
                            self.type_state.sound_players[player].current.sample_pos)
 
-        SDL_UnlockAudio()
+        SDL_UnlockMutex(self.state.callback_data.mixer_lock)
 
         return status
 
@@ -1212,37 +1085,19 @@ cdef class TrackStandard(Track):
         Returns:
             Integer number of sound players currently in use on the track.
         """
-        players_in_use_count = 0
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle:
-                players_in_use_count += 1
-        SDL_UnlockAudio()
-        return players_in_use_count
+        return len(self._player_instances) - self._player_instances.count(None)
 
     def sound_is_playing(self, sound not None):
         """Returns whether or not the specified sound is currently playing on the track"""
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound.id:
-                SDL_UnlockAudio()
+        for sound_instance in self._playing_instances_by_id.values():
+            if sound_instance.sound_id == sound.id:
                 return True
 
-        SDL_UnlockAudio()
         return False
 
     def sound_instance_is_playing(self, sound_instance not None):
         """Returns whether or not the specified sound instance is currently playing on the track"""
-        SDL_LockAudio()
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
-                SDL_UnlockAudio()
-                return True
-
-        SDL_UnlockAudio()
-        return False
+        return sound_instance.id in self._playing_instances_by_id
 
     def sound_is_in_queue(self, sound not None):
         """Returns whether or not an instance of the specified sound is currently in the queue"""
@@ -1314,6 +1169,108 @@ cdef class TrackStandard(Track):
 #    callback function.
 # ---------------------------------------------------------------------------
 
+    @staticmethod
+    cdef void process_requests(TrackState *track) nogil:
+        """
+        Applies the play and stop requests which have been sent to the specified standard track.
+        Args:
+            track: A pointer to the TrackState data structure for the track
+        Notes:
+            Called at the beginning of every audio callback (also when the track is stopped or paused).
+            Notification messages are generated.
+        """
+        cdef TrackStandardState *standard_track
+        cdef RequestMessageContainer *request_message
+        cdef SoundPlayer *player
+        cdef int player_num
+
+        if track == NULL or track.type_state == NULL:
+            return
+
+        standard_track = <TrackStandardState*>track.type_state
+
+        request_message = <RequestMessageContainer*>message_ring_peek(standard_track.requests)
+        while request_message != NULL:
+
+            if request_message.message == request_sound_play or request_message.message == request_sound_replace:
+                if 0 <= request_message.player < standard_track.sound_player_count:
+                    player = cython.address(standard_track.sound_players[request_message.player])
+
+                    if player.status == player_idle:
+                        # Setup the player to start playing the sound
+                        set_sound_settings_from_request(cython.address(player.current), request_message)
+                        player.status = player_playing
+                        send_sound_started_notification(player.number, player.current.sound_id,
+                                                        player.current.sound_instance_id, track)
+                    else:
+                        # A sound which was going to replace the current sound is replaced itself (it never started)
+                        if player.status == player_replacing:
+                            send_sound_stopped_notification(player.number, player.next.sound_id,
+                                                            player.next.sound_instance_id, track)
+
+                        # Set current sound to fade out quickly
+                        player.current.fade_out_steps = track.callback_data.quick_fade_steps
+                        player.current.fade_steps_remaining = track.callback_data.quick_fade_steps
+                        player.current.fading_status = fading_status_fading_out
+
+                        # Set the next sound to play immediately after the current one fades out
+                        player.status = player_replacing
+                        set_sound_settings_from_request(cython.address(player.next), request_message)
+
+                        # TODO: Figure out how to handle ducking when replacing an existing sound
+
+            elif request_message.message == request_sound_stop:
+                for player_num in range(standard_track.sound_player_count):
+                    player = cython.address(standard_track.sound_players[player_num])
+                    if player.status == player_idle:
+                        continue
+
+                    if player.status == player_replacing and \
+                            player.next.sound_instance_id == request_message.sound_instance_id:
+                        # The sound has not started yet (the current sound is still fading out)
+                        send_sound_stopped_notification(player.number, player.next.sound_id,
+                                                        player.next.sound_instance_id, track)
+                        player.status = player_stopping
+
+                    elif player.status != player_replacing and \
+                            player.current.sound_instance_id == request_message.sound_instance_id:
+                        # Calculate fade out (if necessary)
+                        player.current.fade_steps_remaining = request_message.data.stop.fade_out_steps
+                        if player.current.fade_steps_remaining > 0:
+                            player.current.fade_out_steps = player.current.fade_steps_remaining
+                            player.current.fading_status = fading_status_fading_out
+                            player.status = player_stopping
+                        else:
+                            # Sound will stop immediately - send sound stopped notification
+                            send_sound_stopped_notification(player.number, player.current.sound_id,
+                                                            player.current.sound_instance_id, track)
+                            player.status = player_idle
+
+                        # Adjust ducking release (if necessary)
+                        if player.current.sound_has_ducking:
+                            # TODO: Add more intelligent ducking release point calculation here:
+                            #       Take into consideration whether ducking is already in progress and when it was
+                            #       originally scheduled to finish.
+                            pass
+
+            elif request_message.message == request_sound_stop_looping:
+                for player_num in range(standard_track.sound_player_count):
+                    player = cython.address(standard_track.sound_players[player_num])
+                    if player.status == player_idle:
+                        continue
+
+                    # Set sound's loops_remaining variable to zero and loop end position to the end of the sound
+                    if player.current.sound_instance_id == request_message.sound_instance_id:
+                        player.current.loops_remaining = 0
+                        player.current.loop_end_pos = player.current.sample.data.memory.size
+                    elif player.status == player_replacing and \
+                            player.next.sound_instance_id == request_message.sound_instance_id:
+                        player.next.loops_remaining = 0
+                        player.next.loop_end_pos = player.next.sample.data.memory.size
+
+            message_ring_release(standard_track.requests)
+            request_message = <RequestMessageContainer*>message_ring_peek(standard_track.requests)
+
     @staticmethod
     cdef void mix_playing_sounds(TrackState *track, Uint32 buffer_length, AudioCallbackData *callback_data) nogil:
         """
@@ -1523,9 +1480,9 @@ cdef class TrackStandard(Track):
                         player.current.marker_count = player.next.marker_count
                         g_array_set_size(player.current.markers, player.current.marker_count)
                         for marker_id in range(player.next.marker_count):
-                            g_array_insert_val_uint(player.current.markers,
-                                                    marker_id,
-                                                    g_array_index_uint(player.next.markers, marker_id))
+                            g_array_set_val_uint(player.current.markers,
+                                                 marker_id,
+                                                 g_array_index_uint(player.next.markers, marker_id))
 
                         if player.next.sound_has_ducking:
                             player.current.sound_has_ducking = True
@@ -1559,6 +1516,52 @@ cdef class TrackStandard(Track):
                 track_buffer_pos += current_chunk_bytes
                 control_point += 1
 
+cdef void set_sound_settings_from_request(SoundSettings *sound, RequestMessageContainer *request_message) nogil:
+    """
+    Sets the sound settings of a sound player from a play request.
+    Args:
+        sound: A pointer to the SoundSettings of the sound player
+        request_message: A pointer to the play request message
+    """
+    cdef RequestMessageDataPlaySound *play = cython.address(request_message.data.play)
+    cdef int marker_id
+
+    sound.sample = play.sample
+    sound.sample_pos = play.start_at_position
+    sound.loop_start_pos = play.loop_start_position
+    sound.loop_end_pos = play.loop_end_position
+    sound.current_loop = 0
+    sound.sound_id = request_message.sound_id
+    sound.sound_instance_id = request_message.sound_instance_id
+    sound.volume = play.volume
+    sound.volume_left = play.volume_left
+    sound.volume_right = play.volume_right
+    sound.loops_remaining = play.loops
+    sound.sound_priority = play.priority
+
+    sound.fade_in_steps = play.fade_in_steps
+    sound.fade_out_steps = play.fade_out_steps
+    sound.fade_steps_remaining = play.fade_in_steps
+    if sound.fade_steps_remaining > 0:
+        sound.fading_status = fading_status_fading_in
+    else:
+        sound.fading_status = fading_status_not_fading
+
+    # The marker arrays are allocated for MAX_MARKERS markers (no memory is allocated here)
+    sound.marker_count = play.marker_count
+    g_array_set_size(sound.markers, sound.marker_count)
+    for marker_id in range(sound.marker_count):
+        g_array_set_val_uint(sound.markers, marker_id, play.markers[marker_id])
+
+    sound.about_to_finish_marker = play.about_to_finish_marker
+
+    sound.sound_has_ducking = play.sound_has_ducking
+    sound.ducking_settings = play.ducking_settings
+    if sound.sound_has_ducking:
+        sound.ducking_stage = ducking_stage_delay
+    else:
+        sound.ducking_stage = ducking_stage_idle
+
 cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, int channels,
                                    Uint8 volume, TrackState *track, int player_num) nogil:
     """
@@ -1614,7 +1617,7 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
                                        sound.volume_left,
                                        sound.volume_right)
             else:
-                SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_to_output, volume)
+                Track.mix_sound_to_track(track, output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, samples_remaining_to_output, volume)
 
             # Update buffer position pointers
             sound.sample_pos += samples_remaining_to_output
@@ -1631,7 +1634,7 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
                                        sound.volume_left,
                                        sound.volume_right)
             else:
-                SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_in_sound, volume)
+                Track.mix_sound_to_track(track, output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, samples_remaining_in_sound, volume)
 
             # Update buffer position pointers/samples remaining to place in the output buffer
             samples_remaining_to_output -= samples_remaining_in_sound
@@ -1713,9 +1716,9 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
                                            sound.volume_left,
                                            sound.volume_right)
                 else:
-                    SDL_MixAudioFormat(output_buffer + buffer_pos,
-                                       sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                       track.callback_data.format, samples_remaining_to_output, volume)
+                    Track.mix_sound_to_track(track, output_buffer + buffer_pos,
+                                             sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
+                                             samples_remaining_to_output, volume)
 
                 # Update buffer position pointers
                 sound.sample.data.stream.map_buffer_pos += samples_remaining_to_output
@@ -1733,9 +1736,9 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
                                            sound.volume_left,
                                            sound.volume_right)
                 else:
-                    SDL_MixAudioFormat(output_buffer + buffer_pos,
-                                       sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
-                                       track.callback_data.format, samples_remaining_in_map, volume)
+                    Track.mix_sound_to_track(track, output_buffer + buffer_pos,
+                                             sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos,
+                                             samples_remaining_in_map, volume)
 
                 # Update buffer position pointers/samples remaining to place in the output buffer
                 samples_remaining_to_output -= samples_remaining_in_map
@@ -0,0 +1,79 @@
+"""Cached decoder for incoming BCP commands."""
+import re
+import sys
+from functools import lru_cache
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+# number of distinct messages which are cached
+CACHE_SIZE = 4096
+
+# Messages which do not need any URL decoding (e.g. most trigger and
+# player_variable commands). Everything else goes through MPF's decoder.
+_SIMPLE_MESSAGE = re.compile(r'[\w.\-]+(\?[^%+#;\s\x00-\x1f]*)?\Z')
+
+
+def _convert_value(value):
+    """Convert a parameter value the same way as MPF does (without unquoting)."""
+    if value.startswith('int:'):
+        return int(value[4:])
+    if value.startswith('float:'):
+        return float(value[6:])
+    lower_value = value.lower()
+    if lower_value == 'bool:true':
+        return True
+    if lower_value == 'bool:false':
+        return False
+    if value == 'NoneType:':
+        return None
+    return value
+
+
+def _decode_simple(message):
+    """Decode a message which matches _SIMPLE_MESSAGE."""
+    bcp_command, _, query = message.partition('?')
+    kwargs = dict()
+    if query:
+        for field in query.split('&'):
+            if not field:
+                continue
+            name, _, value = field.partition('=')
+            name = sys.intern(name)
+            if name not in kwargs:
+                kwargs[name] = _convert_value(value)
+
+    return sys.intern(bcp_command), kwargs
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _decode_cached(message):
+    """Decode a message and return the command and a tuple of its parameters."""
+    if _SIMPLE_MESSAGE.match(message):
+        bcp_command, kwargs = _decode_simple(message)
+    else:
+        bcp_command, kwargs = bcp.decode_command_string(message)
+        bcp_command = sys.intern(bcp_command)
+        kwargs = {sys.intern(name): value for name, value in kwargs.items()}
+
+    return bcp_command, tuple(kwargs.items())
+
+
+def decode_command_string(message):
+    """Decode a BCP command string into the command and a dict of parameters.
+
+    The result is identical to decode_command_string in MPF. Identical
+    messages are only decoded once and command and parameter names are
+    interned. Every call returns a new dict because handlers may change it.
+    JSON messages are not cached because they may contain mutable values.
+    """
+    if '?json=' in message:
+        return bcp.decode_command_string(message)
+
+    bcp_command, items = _decode_cached(message)
+    return bcp_command, dict(items)
+
+
+def get_decoder_stats():
+    """Return hits, misses and the size of the decoder cache."""
+    info = _decode_cached.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
@@ -0,0 +1,146 @@
+"""Latency statistics for BCP commands."""
+import threading
+import time
+from bisect import bisect_left
+
+# upper bounds of the histogram buckets in seconds. the last bucket is open.
+BUCKETS = (.00001, .00002, .00005, .0001, .0002, .0005, .001, .002, .005, .01, .02, .05, .1, .2, .5, 1.0)
+
+
+class RollingHistogram:
+
+    """Histogram of durations in the last one to two windows.
+
+    Samples are counted in the current window. When it is older than window
+    seconds it becomes the previous window and a new one is started.
+    Statistics always cover the previous and the current window. Windows
+    expire by time, so samples are dropped even when no new ones arrive.
+
+    Args:
+        window: Length of a window in seconds.
+    """
+
+    __slots__ = ["window", "_window_start", "_current", "_previous"]
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self._window_start = None
+        self._current = self._new_window()
+        self._previous = self._new_window()
+
+    @staticmethod
+    def _new_window():
+        # bucket counts, then count, sum and max
+        return [0] * (len(BUCKETS) + 1) + [0, 0.0, 0.0]
+
+    def _expire(self, now):
+        """Rotate the windows which are over at now."""
+        if self._window_start is None:
+            self._window_start = now
+            return
+
+        elapsed = now - self._window_start
+        if elapsed <= self.window:
+            return
+
+        if elapsed > 2 * self.window:
+            # there has been no sample during the last window
+            self._previous = self._new_window()
+        else:
+            self._previous = self._current
+        self._current = self._new_window()
+        self._window_start += self.window * int(elapsed // self.window)
+
+    def add(self, duration, now):
+        """Add a duration (in seconds) which has been measured at now."""
+        self._expire(now)
+
+        current = self._current
+        current[bisect_left(BUCKETS, duration)] += 1
+        current[-3] += 1
+        current[-2] += duration
+        if duration > current[-1]:
+            current[-1] = duration
+
+    def get_stats(self, now=None):
+        """Return count, mean, percentiles and max in milliseconds.
+
+        Percentiles are the upper bound of the bucket they fall into. If now
+        is passed windows which are over by then are expired first.
+        """
+        if now is not None and self._window_start is not None:
+            self._expire(now)
+
+        num_buckets = len(BUCKETS) + 1
+        counts = [a + b for a, b in zip(self._current[:num_buckets], self._previous[:num_buckets])]
+        count = self._current[-3] + self._previous[-3]
+        maximum = max(self._current[-1], self._previous[-1])
+        stats = {'count': count}
+        if not count:
+            return stats
+
+        stats['mean'] = round(1000 * (self._current[-2] + self._previous[-2]) / count, 3)
+        for name, percentile in (('p50', .5), ('p90', .9), ('p99', .99)):
+            threshold = percentile * count
+            total = 0
+            for index, bucket_count in enumerate(counts):
+                total += bucket_count
+                if total >= threshold:
+                    break
+            # the open bucket is limited by the max
+            bound = BUCKETS[index] if index < len(BUCKETS) else maximum
+            stats[name] = round(1000 * min(bound, maximum), 3)
+
+        stats['max'] = round(1000 * maximum, 3)
+        return stats
+
+
+class BcpLatencyStats:
+
+    """Rolling latency histograms per stage and BCP command.
+
+    Stages for incoming commands are decode (in the BCP server thread), queue
+    (from receiving the command until it is processed) and handler. Outgoing
+    messages are measured in the send_queue stage (from send() until the
+    message is taken to be written to the socket).
+
+    Samples can be added from any thread.
+
+    Args:
+        window: Length of a window of the histograms in seconds.
+    """
+
+    STAGES = ('decode', 'queue', 'handler', 'send_queue')
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self._histograms = {stage: dict() for stage in self.STAGES}
+        self._lock = threading.Lock()
+
+    def add(self, stage, command, duration, now=None):
+        """Add a duration in seconds for a command in a stage."""
+        if now is None:
+            now = time.perf_counter()
+
+        with self._lock:
+            histogram = self._histograms[stage].get(command)
+            if not histogram:
+                histogram = self._histograms[stage][command] = RollingHistogram(self.window)
+            histogram.add(duration, now)
+
+    def get_stats(self):
+        """Return a dict of stage -> command -> statistics (in ms)."""
+        now = time.perf_counter()
+        with self._lock:
+            return {stage: {command: histogram.get_stats(now) for command, histogram in histograms.items()}
+                    for stage, histograms in self._histograms.items() if histograms}
+
+    def get_summary(self):
+        """Return a dict of stage -> worst p99 and max over all commands (in ms)."""
+        summary = dict()
+        for stage, commands in self.get_stats().items():
+            commands = [stats for stats in commands.values() if stats['count']]
+            if commands:
+                summary[stage] = {'p99': max(stats['p99'] for stats in commands),
+                                  'max': max(stats['max'] for stats in commands)}
+        return summary
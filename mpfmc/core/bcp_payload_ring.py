@@ -0,0 +1,137 @@
+"""Shared memory ring buffer for large BCP payloads."""
+import struct
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+# magic, version, capacity, reserved end
+_HEADER = struct.Struct('<4sIQQ')
+_RESERVED_END = struct.Struct('<Q')
+_RESERVED_END_OFFSET = 16
+HEADER_SIZE = 64
+MAGIC = b'BCPR'
+VERSION = 1
+ALIGNMENT = 8
+
+# names of the rings created by this process
+_created_names = set()
+
+
+class BcpPayloadRing:
+
+    """Ring buffer in shared memory for raw payloads (e.g. dmd_frame bytes).
+
+    Clients on the same machine can request the ring with a
+    payload_ring_request command. Afterwards, large payloads are written once
+    into the ring and the BCP message only contains their position:
+
+        dmd_frame?name=dmd&ring_position=int:1234&ring_bytes=int:4096
+
+    Positions grow monotonically. A payload is stored at
+    position % capacity (payloads never wrap around the end). The header
+    contains the end of the last reserved region. It is updated before a
+    payload is copied into the ring so a reader can detect that its payload
+    has been overwritten while copying it (see read).
+
+    Use create in the MC and attach in the client.
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        magic, version, self.capacity, _ = _HEADER.unpack_from(self._buf)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a BCP payload ring (version {}).".format(shm.name, VERSION))
+
+        self._position = 0
+        self._lock = threading.Lock()
+        self._recent = OrderedDict()
+        self.writes = 0
+        self.written_bytes = 0
+
+    @classmethod
+    def create(cls, capacity, name=None):
+        """Create a new ring with (at least) capacity bytes for payloads."""
+        capacity = (capacity + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, capacity, 0)
+        _created_names.add(shm.name)
+        return cls(shm, True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a ring which has been created by another process."""
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name not in _created_names:
+            try:
+                # Python would unlink the segment when this process exits
+                # although it did not create it
+                from multiprocessing import resource_tracker     # pylint: disable-msg=import-outside-toplevel
+                resource_tracker.unregister(shm._name, 'shared_memory')     # pylint: disable-msg=protected-access
+            except (ImportError, AttributeError, KeyError):
+                pass
+        return cls(shm, False)
+
+    @property
+    def name(self):
+        """Return the name of the shared memory segment."""
+        return self._shm.name
+
+    def write(self, payload):
+        """Copy a payload into the ring and return its position.
+
+        The same payload object is only written once as long as it has not
+        been overwritten (e.g. when it is sent to several clients). Returns
+        None if the payload is larger than the ring.
+        """
+        length = len(payload)
+        if length > self.capacity:
+            return None
+
+        with self._lock:
+            recent = self._recent.get(id(payload))
+            if recent and recent[0] is payload and self._position <= recent[1] + self.capacity:
+                return recent[1]
+
+            position = self._position
+            offset = position % self.capacity
+            if offset + length > self.capacity:
+                # skip the rest of the ring. payloads do not wrap.
+                position += self.capacity - offset
+                offset = 0
+
+            end = position + length
+            _RESERVED_END.pack_into(self._buf, _RESERVED_END_OFFSET, end)
+            self._buf[HEADER_SIZE + offset:HEADER_SIZE + offset + length] = memoryview(payload).cast('B')
+            self._position = (end + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+            self._recent[id(payload)] = (payload, position)
+            if len(self._recent) > 16:
+                self._recent.popitem(last=False)
+            self.writes += 1
+            self.written_bytes += length
+
+        return position
+
+    def read(self, position, length):
+        """Return a copy of a payload or None if it has been overwritten."""
+        if length > self.capacity:
+            return None
+
+        offset = position % self.capacity
+        data = bytes(self._buf[HEADER_SIZE + offset:HEADER_SIZE + offset + length])
+        reserved_end = _RESERVED_END.unpack_from(self._buf, _RESERVED_END_OFFSET)[0]
+        if reserved_end < position + length or reserved_end > position + self.capacity:
+            return None
+
+        return data
+
+    def close(self):
+        """Close the ring. The ring is removed when its creator closes it."""
+        self._recent.clear()
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            _created_names.discard(self._shm.name)
+            self._shm.unlink()
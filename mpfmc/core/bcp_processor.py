@@ -1,29 +1,59 @@
 import logging
 import queue
+import time
+from collections import deque
 from copy import deepcopy
 
 import mpf.core.bcp.bcp_socket_client as bcp
 import psutil
 from kivy.clock import Clock
+from mpf.core.utility_functions import Util
 from packaging import version
 
 from mpfmc._version import __bcp_version__
 from mpfmc._version import extended_version as mc_extended_version
 from mpfmc._version import version as mc_version
-from mpfmc.core.bcp_server import BCPServer
+from mpfmc.core.bcp_decoder import decode_command_string, get_decoder_stats
+from mpfmc.core.bcp_latency import BcpLatencyStats
+from mpfmc.core.bcp_selector_server import BCPSelectorServer
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+from mpfmc.core.bcp_server import BCPServer, ReceivedCommand
+from mpfmc.core.dmd_encoding import merge_frame
 
 
 class BcpProcessor:
+
+    # Incoming commands are processed in the order they have been received,
+    # within bcp_frame_budget per frame. Pending updates of a variable are
+    # coalesced, but not across these commands: Their handlers see the
+    # variables which have been received before them.
+    BARRIER_COMMANDS = frozenset(('hello', 'goodbye', 'reset', 'mode_start', 'mode_stop',
+                                  'player_added', 'player_turn_start', 'trigger', 'switch'))
+
     def __init__(self, mc):
         self.mc = mc
         self.log = logging.getLogger('BcpProcessor')
 
         self.socket_thread = None
         self.connected = False
+        # (frame command, DMD name) -> encodings which MPF can decode
+        self.requested_frame_encodings = dict()
         self.receive_queue = queue.Queue()
-        self.sending_queue = queue.Queue()
+        self.sending_queue = BcpSendQueue(
+            self.mc.machine_config['mpf-mc']['bcp_send_queue_limit'])
         self.mc_process = psutil.Process()
 
+        # commands taken from the receive_queue which have not been processed
+        self._pending = deque()
+        self._pending_variables = dict()
+        self.coalesced_variable_updates = 0
+        self.frame_budget = Util.string_to_secs(self.mc.machine_config['mpf-mc']['bcp_frame_budget'])
+        self.carried_over_frames = 0
+        self.carried_over_commands = 0
+        self.max_queue_depth = 0
+        self.latency_stats = BcpLatencyStats(
+            Util.string_to_secs(self.mc.machine_config['mpf-mc']['bcp_latency_window']))
+
         if self.mc.options['bcp']:
             self.mc.events.add_handler('init_done', self._start_socket_thread)
             self.enabled = True
@@ -35,6 +65,7 @@ class BcpProcessor:
         self.bcp_commands = {'error': self._bcp_error,
                              'goodbye': self._bcp_goodbye,
                              'hello': self._bcp_hello,
+                             'dmd_frame_encoding': self._bcp_dmd_frame_encoding,
                              'machine_variable': self._bcp_machine_variable,
                              'mode_start': self._bcp_mode_start,
                              'mode_stop': self._bcp_mode_stop,
@@ -53,8 +84,22 @@ class BcpProcessor:
 
         self.mc.events.add_handler('client_connected', self._client_connected)
         self.mc.events.add_handler('mc_reset_complete', self._reset_complete)
+        self.mc.events.add_handler('debug_dump_stats', self._debug_dump_stats)
+        self.mc.events.add_handler('shutdown', self._shutdown)
+
+        self.transport = self.mc.machine_config['mpf-mc']['bcp_transport']
+        if self.transport == 'selector':
+            # the server tells us when there is something to process
+            self._receive_trigger = Clock.create_trigger(self._get_from_queue)
+        elif self.transport == 'threaded':
+            self._receive_trigger = None
+            Clock.schedule_interval(self._get_from_queue, 0)
+        else:
+            raise AssertionError("Invalid bcp_transport {}. Use threaded or selector.".format(self.transport))
 
-        Clock.schedule_interval(self._get_from_queue, 0)
+        Clock.schedule_interval(
+            self._send_latency_report,
+            Util.string_to_secs(self.mc.machine_config['mpf-mc']['bcp_latency_report_interval']))
 
     def _client_connected(self, **kwargs):
         del kwargs
@@ -69,6 +114,11 @@ class BcpProcessor:
         self.register_trigger("update_segment_display")
         self.connected = True
 
+        # a new client has to negotiate compressed DMD frames again
+        self.requested_frame_encodings = dict()
+        for dmd in self.mc.dmds + self.mc.rgb_dmds:
+            dmd.set_frame_encodings([])
+
     def register_trigger(self, event):
         """Register a trigger for events from MPF."""
         self.send("register_trigger", event=event)
@@ -83,8 +133,15 @@ class BcpProcessor:
         if self.socket_thread:
             return
 
-        self.socket_thread = BCPServer(self.mc, self.receive_queue,
-                                       self.sending_queue)
+        if self.transport == 'selector':
+            self.socket_thread = BCPSelectorServer(self.mc, self.receive_queue,
+                                                   self.sending_queue,
+                                                   self._receive_trigger,
+                                                   self.latency_stats)
+        else:
+            self.socket_thread = BCPServer(self.mc, self.receive_queue,
+                                           self.sending_queue,
+                                           latency_stats=self.latency_stats)
         self.socket_thread.daemon = True
         self.socket_thread.start()
 
@@ -103,41 +160,194 @@ class BcpProcessor:
             **kwargs: Optional additional kwargs will be added to the BCP
                 command string.
 
+        Returns False if a frame has been dropped because the send queue is
+        full and True otherwise.
         """
+        queued = True
         if self.enabled:
             if not self.mc.bcp_client_connected:
                 raise AssertionError("Not connected to MPF.")
 
-            self.sending_queue.put(
-                (bcp.encode_command_string(bcp_command, **kwargs), rawbytes))
+            key = self._get_frame_key(bcp_command, kwargs)
+            if key:
+                # only the newest pending frame is sent
+                queued = self.sending_queue.put_latest(
+                    key, bcp_command, kwargs, rawbytes,
+                    self._merge_display_light_values if key[0] == 'display_light_player_apply' else None,
+                    merge_frame=merge_frame if 'encoding' in kwargs else None)
+            else:
+                self.sending_queue.put(
+                    (bcp.encode_command_string(bcp_command, **kwargs), rawbytes))
 
         if callback:
             callback()
 
+        return queued
+
+    @staticmethod
+    def _get_frame_key(bcp_command, kwargs):
+        """Return the key of a frame stream or None for ordinary commands."""
+        if bcp_command in ('dmd_frame', 'rgb_dmd_frame'):
+            return bcp_command, kwargs.get('name')
+
+        if bcp_command == 'trigger' and kwargs.get('name') == 'display_light_player_apply':
+            return 'display_light_player_apply', kwargs.get('context'), kwargs.get('element')
+
+        return None
+
+    @staticmethod
+    def _merge_display_light_values(old_kwargs, new_kwargs):
+        """Merge a superseded display_light_player_apply into the new one.
+
+        The display light player only sends lights which changed so we must
+        not lose the values of the superseded frame.
+        """
+        values = dict(old_kwargs['values'])
+        values.update(new_kwargs['values'])
+        kwargs = dict(new_kwargs)
+        kwargs['values'] = values
+        return kwargs
+
     def receive_bcp_message(self, msg):
         """Receives an incoming BCP message to be processed.
 
-        Note this method is intended for testing. Usually BCP messages are
-        handled by the BCP Server thread, but for test purposes it's possible
-        to run mpf-mc without the BCP Server, so in that case you can use this
-        method to send BCP messages into the mpf-mc.
+        Note this method is intended for testing and replays. Usually BCP
+        messages are handled by the BCP Server thread, but for test purposes
+        it's possible to run mpf-mc without the BCP Server, so in that case you
+        can use this method to send BCP messages into the mpf-mc.
 
         Args:
             msg: A string of the BCP message (in the standard BCP format:
                 command?param1=value1&param2=value2...
 
         """
-        cmd, kwargs = bcp.decode_command_string(msg)
-        self.receive_queue.put((cmd, kwargs))
+        received = time.perf_counter()
+        cmd, kwargs = decode_command_string(msg)
+        self.receive_queue.put(ReceivedCommand(cmd, kwargs, received))
+        if self._receive_trigger:
+            self._receive_trigger()
 
     def _get_from_queue(self, dt):
-        """Gets and processes all queued up incoming BCP commands."""
+        """Gets and processes queued up incoming BCP commands.
+
+        Processing stops when bcp_frame_budget is used up. Remaining commands
+        are carried over to the next frame.
+        """
         del dt
 
-        while not self.receive_queue.empty():
-            cmd, kwargs = self.receive_queue.get(False)
+        self._fill_pending()
+        queue_depth = self.get_queue_depth()
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
+        if self.frame_budget:
+            deadline = time.perf_counter() + self.frame_budget
+        else:
+            deadline = None
+
+        while True:
+            command = self._pop_pending()
+            if not command:
+                return
+
+            cmd, kwargs = command
+            received = getattr(command, 'received', None)
+            if received is not None:
+                now = time.perf_counter()
+                self.latency_stats.add('queue', cmd, now - received, now)
+
             self._process_command(cmd, **kwargs)
 
+            if deadline and time.perf_counter() > deadline:
+                break
+
+        carried_over = self.get_queue_depth()
+        if carried_over:
+            self.carried_over_frames += 1
+            self.carried_over_commands += carried_over
+            if self._receive_trigger:
+                # continue in the next frame
+                self._receive_trigger()
+
+    def get_queue_depth(self):
+        """Return the number of received commands which wait for processing."""
+        return len(self._pending) + self.receive_queue.qsize()
+
+    def _fill_pending(self):
+        """Move commands from the receive_queue to the pending commands."""
+        while True:
+            try:
+                command = self.receive_queue.get(False)
+            except queue.Empty:
+                return
+
+            cmd, kwargs = command
+            if cmd in self.BARRIER_COMMANDS:
+                # later updates must not move in front of this command
+                self._pending_variables.clear()
+            else:
+                key = self._get_variable_key(cmd, kwargs)
+                if key:
+                    pending_kwargs = self._pending_variables.get(key)
+                    if pending_kwargs is not None:
+                        # only the last value of a variable is applied
+                        self._merge_variable_update(pending_kwargs, kwargs)
+                        self.coalesced_variable_updates += 1
+                        continue
+
+                    self._pending_variables[key] = kwargs
+
+            self._pending.append(command)
+
+    @staticmethod
+    def _get_variable_key(cmd, kwargs):
+        """Return the key of a variable update or None for other commands."""
+        if cmd == 'player_variable':
+            return cmd, kwargs.get('player_num'), kwargs.get('name')
+
+        if cmd == 'machine_variable':
+            return cmd, kwargs.get('name')
+
+        return None
+
+    @staticmethod
+    def _merge_variable_update(pending_kwargs, kwargs):
+        """Merge a newer update of a variable into a pending one.
+
+        The value is taken from the newer update while prev_value stays the
+        one from before the pending update. change is calculated the same way
+        as MPF does.
+        """
+        prev_value = pending_kwargs.get('prev_value')
+        pending_change = pending_kwargs.get('change', True)
+        pending_kwargs.update(kwargs)
+        pending_kwargs['prev_value'] = prev_value
+
+        value = kwargs.get('value')
+        if prev_value is None and pending_change is True:
+            # the variable did not exist before
+            change = True
+        else:
+            try:
+                change = value - prev_value
+            except TypeError:
+                change = prev_value != value
+
+        pending_kwargs['change'] = change
+
+    def _pop_pending(self):
+        """Return the next command to process or None."""
+        if not self._pending:
+            self._fill_pending()
+            if not self._pending:
+                return None
+
+        command = self._pending.popleft()
+        key = self._get_variable_key(*command)
+        if key and self._pending_variables.get(key) is command[1]:
+            del self._pending_variables[key]
+        return command
+
     def _process_command(self, bcp_command, **kwargs):
         if self.debug_log:
             if 'rawbytes' in kwargs:
@@ -154,19 +364,83 @@ class BcpProcessor:
         # Can't use try/except KeyError here because there could be a KeyError
         # in the callback which we don't want it to swallow.
         if bcp_command in self.bcp_commands:
+            start = time.perf_counter()
             self.bcp_commands[bcp_command](**kwargs)
+            now = time.perf_counter()
+            self.latency_stats.add('handler', bcp_command, now - start, now)
         else:
             self.log.warning("Received invalid BCP command: %s", bcp_command[:9])
             # self.send('error',message='invalid command', command=bcp_command)
 
-    def _bcp_status_request(self, **kwargs):
-        """Status request."""
+    def _shutdown(self, **kwargs):
+        del kwargs
+        if self.socket_thread:
+            # let the server notice that we are stopping
+            self.socket_thread.wakeup()
+
+    def get_stats(self):
+        """Return a dict with BCP statistics."""
+        stats = dict()
+        stats['receive_queue'] = {
+            'pending': self.get_queue_depth(),
+            'max_depth': self.max_queue_depth,
+            'carried_over_frames': self.carried_over_frames,
+            'carried_over_commands': self.carried_over_commands,
+            'coalesced_variable_updates': self.coalesced_variable_updates,
+        }
+        stats['send_queue'] = self.sending_queue.get_stats()
+        if self.socket_thread:
+            stats['send'] = self.socket_thread.get_send_stats()
+            stats['clients'] = self.socket_thread.get_client_stats()
+        stats['latency'] = self.latency_stats.get_stats()
+        stats['decoder'] = get_decoder_stats()
+
+        return stats
+
+    def _get_frame_counters(self):
+        """Return the number of dropped and superseded frames of all queues."""
+        queue_stats = [self.sending_queue.get_stats()]
+        if self.socket_thread:
+            queue_stats.extend(client['send_queue'] for client in self.socket_thread.get_client_stats())
+
+        return (sum(queue['dropped_frames'] for queue in queue_stats),
+                sum(queue['superseded_frames'] for queue in queue_stats))
+
+    def _send_latency_report(self, dt):
+        """Send the latency stats to clients which monitor bcp_latency."""
+        del dt
+        if (self.enabled and self.mc.bcp_client_connected and self.socket_thread and
+                self.socket_thread.has_subscribers('bcp_latency')):
+            self.send('bcp_latency', stats=self.latency_stats.get_stats())
+
+    def _debug_dump_stats(self, **kwargs):
+        del kwargs
+        self.log.info("--- DEBUG DUMP BCP ---")
+        for name, value in self.get_stats().items():
+            self.log.info("%s: %s", name, value)
+        self.log.info("--- DEBUG DUMP BCP END ---")
+
+    def _bcp_status_request(self, stats=False, **kwargs):
+        """Status request.
+
+        The status handler in MPF only accepts cpu, rss and vms. Clients which
+        also want the BCP counters have to request them with stats=True.
+        """
         del kwargs
 
-        self.send("status_report",
-                  cpu=self.mc_process.cpu_percent(),
-                  rss=self.mc_process.memory_info().rss,
-                  vms=self.mc_process.memory_info().vms)
+        report = dict(cpu=self.mc_process.cpu_percent(),
+                      rss=self.mc_process.memory_info().rss,
+                      vms=self.mc_process.memory_info().vms)
+
+        if stats is True or str(stats).lower() == 'true':
+            report['frames_dropped'], report['frames_superseded'] = self._get_frame_counters()
+            report['receive_queue_depth'] = self.get_queue_depth()
+            report['receive_carried_over_frames'] = self.carried_over_frames
+            report['variable_updates_coalesced'] = self.coalesced_variable_updates
+            # worst p99 and max per stage in ms
+            report['latency'] = self.latency_stats.get_summary()
+
+        self.send("status_report", **report)
 
     def _bcp_hello(self, **kwargs):
         """Processes an incoming BCP 'hello' command."""
@@ -227,6 +501,22 @@ class BcpProcessor:
         for setting in settings:
             self.mc.settings.add_setting(setting)
 
+    def _bcp_dmd_frame_encoding(self, name, encodings='', rgb=False, **kwargs):
+        """Processes an incoming BCP 'dmd_frame_encoding' command.
+
+        MPF lists the encodings of DMD frames it can decode. The DMD confirms
+        the encoding it will use with the same command.
+        """
+        del kwargs
+        frame_command = 'rgb_dmd_frame' if rgb else 'dmd_frame'
+        encodings = [encoding for encoding in encodings.split(',') if encoding]
+        # DMDs which are created later will pick it up
+        self.requested_frame_encodings[(frame_command, name)] = encodings
+
+        for dmd in self.mc.rgb_dmds if rgb else self.mc.dmds:
+            if dmd.name == name:
+                dmd.set_frame_encodings(encodings)
+
     def _bcp_error(self, **kwargs):
         """Processes an incoming BCP 'error' command."""
         del kwargs
@@ -0,0 +1,67 @@
+"""Records incoming BCP commands to a file and reads them back."""
+import struct
+import threading
+import time
+
+MAGIC = b'MPFBCP\x01\n'
+
+# microseconds since the start of the recording, length of the message
+_RECORD = struct.Struct('<QI')
+
+
+class BcpRecorder:
+
+    """Writes every incoming BCP command with its arrival time to a file.
+
+    The file starts with MAGIC. Every record consists of the time since the
+    start of the recording (in microseconds) and the length of the command
+    followed by the UTF-8 encoded command (without newline).
+
+    Args:
+        path: Path of the file to write. It will be overwritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        self._file = open(path, 'wb')      # pylint: disable-msg=consider-using-with
+        self._file.write(MAGIC)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, message, received=None):
+        """Record a message which has been received at perf_counter() time received."""
+        if received is None:
+            received = time.perf_counter()
+        data = message.encode('utf-8')
+        with self._lock:
+            if not self._file:
+                return
+            self._file.write(_RECORD.pack(max(0, int((received - self._start) * 1000000)), len(data)))
+            self._file.write(data)
+            self.records += 1
+
+    def close(self):
+        """Flush and close the recording."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def read_recording(path):
+    """Yield (seconds since start, message) for every record in a recording."""
+    with open(path, 'rb') as recording:
+        if recording.read(len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not a BCP recording.".format(path))
+
+        while True:
+            header = recording.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                # end of file (or the last record has been cut off)
+                return
+            timestamp, length = _RECORD.unpack(header)
+            data = recording.read(length)
+            if len(data) < length:
+                return
+            yield timestamp / 1000000, data.decode('utf-8')
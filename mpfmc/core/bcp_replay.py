@@ -0,0 +1,112 @@
+"""Replays a BCP recording into the MC."""
+import logging
+import time
+
+from kivy.clock import Clock
+
+from mpfmc.core.bcp_recorder import read_recording
+
+
+class BcpReplay:
+
+    """Feeds a recording of BcpRecorder into the MC instead of MPF.
+
+    The MC has to be started without BCP server. Commands are fed at the
+    original pace (optionally scaled by speed) or, with fast, as fast as the
+    BcpProcessor takes them. At the end of the recording a summary with the
+    throughput and the BCP stats is logged.
+
+    Args:
+        mc: The MpfMc instance.
+        path: Path of the recording.
+        fast: Feed commands as fast as possible instead of at the original
+            pace.
+        speed: Factor for the original pace (e.g. 2 to replay twice as fast).
+        exit_when_done: Stop the MC at the end of the recording.
+    """
+
+    # in fast mode new commands are only fed while less are waiting
+    FAST_QUEUE_DEPTH = 256
+
+    def __init__(self, mc, path, fast=False, speed=1.0, exit_when_done=True):
+        self.mc = mc
+        self.log = logging.getLogger('BcpReplay')
+        self.path = path
+        self.fast = fast
+        self.speed = speed
+        self.exit_when_done = exit_when_done
+        self.commands = 0
+        self.summary = None
+
+        self._records = read_recording(path)
+        self._next_record = None
+        self._exhausted = False
+        self._start_time = None
+        self._start_ticks = 0
+
+        self.mc.events.add_handler('init_done', self._start)
+
+    def _start(self, **kwargs):
+        del kwargs
+        self.mc.events.remove_handler(self._start)
+        self.log.info("Replaying %s (%s)", self.path,
+                      "as fast as possible" if self.fast else "at {}x pace".format(self.speed))
+
+        # there is no BCP server which would post this
+        self.mc.bcp_client_connected = True
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=client_connected&host=replay&port=int:0')
+
+        self._start_time = time.perf_counter()
+        self._start_ticks = self.mc.ticks
+        Clock.schedule_interval(self._feed, 0)
+
+    def _feed(self, dt):
+        """Feed all commands which are due."""
+        del dt
+        processor = self.mc.bcp_processor
+
+        if self._exhausted:
+            if processor.get_queue_depth():
+                return True
+            self._finish()
+            return False
+
+        elapsed = (time.perf_counter() - self._start_time) * self.speed
+        while True:
+            if self._next_record is None:
+                self._next_record = next(self._records, None)
+                if self._next_record is None:
+                    self._exhausted = True
+                    return True
+
+            timestamp, message = self._next_record
+            if self.fast:
+                if processor.get_queue_depth() >= self.FAST_QUEUE_DEPTH:
+                    return True
+            elif timestamp > elapsed:
+                return True
+
+            processor.receive_bcp_message(message)
+            self.commands += 1
+            self._next_record = None
+
+    def _finish(self):
+        duration = time.perf_counter() - self._start_time
+        frames = self.mc.ticks - self._start_ticks
+        self.summary = {
+            'commands': self.commands,
+            'duration': round(duration, 3),
+            'commands_per_second': round(self.commands / duration, 1) if duration else 0,
+            'frames': frames,
+            'fps': round(frames / duration, 1) if duration else 0,
+        }
+
+        self.log.info("--- BCP REPLAY DONE ---")
+        for name, value in self.summary.items():
+            self.log.info("%s: %s", name, value)
+        for name, value in self.mc.bcp_processor.get_stats().items():
+            self.log.info("%s: %s", name, value)
+        self.log.info("--- BCP REPLAY DONE END ---")
+
+        if self.exit_when_done:
+            self.mc.stop()
@@ -0,0 +1,239 @@
+"""Selector based BCP Server for the MPF Media Controller"""
+
+import functools
+import selectors
+import socket
+import sys
+import time
+import traceback
+from queue import Empty
+
+from mpfmc.core.bcp_server import BCPServer, HAS_SENDMSG, IOV_MAX
+
+
+class BCPSelectorServer(BCPServer):
+    """BCP Server which reads, frames and writes on a single I/O thread.
+
+    The threaded BCPServer uses a listener thread and a reading and a sending
+    thread per client which all block and wake up every second. This server instead runs one non-blocking
+    selector loop. Outgoing messages wake it up through a socket pair and
+    incoming messages call on_receive so the main loop only needs to run when
+    something actually arrived. Every client is written without blocking so a
+    slow client only fills up its own send queue.
+
+    Args:
+        mc: A reference to the main MediaController instance.
+        receiving_queue: A shared Queue() object which holds incoming BCP
+            commands.
+        sending_queue: A shared BcpSendQueue() object which holds outgoing BCP
+            commands.
+        on_receive: Callable which is called from the I/O thread whenever new
+            commands have been put into the receiving queue.
+        latency_stats: Optional BcpLatencyStats which get the decode and send
+            queue latencies.
+
+    """
+
+    def __init__(self, mc, receiving_queue, sending_queue, on_receive=None, latency_stats=None):
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_receiver, self._wakeup_sender = socket.socketpair()
+        self._wakeup_receiver.setblocking(False)
+        self._wakeup_sender.setblocking(False)
+        self._running = False
+
+        super().__init__(mc, receiving_queue, sending_queue, on_receive, latency_stats)
+
+    def _start_sending(self):
+        """Outgoing messages are written by the I/O thread."""
+        self.sending_queue.on_put = self.wakeup
+
+    def wakeup(self):
+        """Wake up the I/O thread.
+
+        This can be called from any thread.
+        """
+        try:
+            self._wakeup_sender.send(b'\0')
+        except OSError:
+            # buffer is full (so there is a wakeup pending) or we are closed
+            pass
+
+    def run(self):
+        """The I/O thread's run loop."""
+        try:
+            self.socket.setblocking(False)
+            self._selector.register(self.socket, selectors.EVENT_READ, self._accept)
+            self._selector.register(self._wakeup_receiver, selectors.EVENT_READ, self._handle_wakeup)
+
+            self.log.info("Waiting for a connection...")
+            self._post_client_disconnected()
+            start_time = time.time()
+
+            self._running = True
+            while self._running and not self.mc.thread_stopper.is_set():
+                timeout = None
+                if not self.primary_client and self.mc.options['production']:
+                    timeout = start_time + 30 - time.time()
+                    if timeout <= 0:
+                        self.log.warning("Timeout while waiting for connection. Stopping!")
+                        self.mc.stop()
+                        return
+
+                for key, mask in self._selector.select(timeout):
+                    key.data(key.fileobj, mask)
+
+            self.log.info("Stopping BCP I/O thread")
+
+        except Exception:   # noqa
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value,
+                                               exc_traceback)
+            msg = ''.join(line for line in lines)
+            self.mc.crash_queue.put(msg)
+
+        finally:
+            self._close()
+
+    def _close(self):
+        for client in list(self.clients):
+            self._remove_client(client)
+        self._selector.close()
+        self._close_resources()
+        self._wakeup_receiver.close()
+        self._wakeup_sender.close()
+
+    def _accept(self, sock, mask):
+        del mask
+        try:
+            connection, client_address = sock.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+
+        connection.setblocking(False)
+        client = self._add_client(connection, client_address)
+        if not client:
+            return
+
+        client.handler = functools.partial(self._handle_connection, client)
+        self._selector.register(connection, selectors.EVENT_READ, client.handler)
+
+    def _remove_client(self, client):
+        if client.handler and not client.closed:
+            self._selector.unregister(client.connection)
+        return super()._remove_client(client)
+
+    def _handle_wakeup(self, sock, mask):
+        del mask
+        try:
+            while sock.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+        self._dispatch_pending()
+        for client in list(self.clients):
+            self._flush(client)
+
+    def _dispatch_pending(self):
+        """Move all pending messages into the send queues of the clients.
+
+        Every client queue keeps only the newest frame per key so frames which
+        a slow client did not take yet are superseded there.
+        """
+        while True:
+            try:
+                entry = self.sending_queue.get_entry(block=False)
+            except Empty:
+                return
+            self._dispatch(entry)
+
+    def _handle_connection(self, client, connection, mask):
+        if mask & selectors.EVENT_READ:
+            try:
+                data_read = connection.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                data_read = None
+            except ConnectionError:
+                data_read = b''
+            received = time.perf_counter()
+
+            if data_read == b'':
+                # no bytes -> socket closed
+                self._disconnect(client)
+                return
+
+            if data_read:
+                client.socket_chars += data_read
+                commands = client.socket_chars.split(b"\n")
+
+                # keep last incomplete command
+                client.socket_chars = commands.pop()
+
+                # process all complete commands
+                self._process_receives_messages(commands, client, received)
+
+                # answers of the server are queued for the client directly
+                self._flush(client)
+
+        if mask & selectors.EVENT_WRITE:
+            self._flush(client)
+
+    def _disconnect(self, client):
+        if self._remove_client(client) and client.primary:
+            # always exit when the primary client disconnects
+            self._running = False
+            self.mc.stop()
+
+    def _fill_out_buffers(self, client):
+        """Take pending messages from the send queue of a client.
+
+        Messages are only taken when everything before has been written.
+        Otherwise, they stay in the queue where newer frames can still replace
+        them.
+        """
+        messages = self._take_messages(client)
+        if not messages:
+            return False
+
+        client.out_buffers, num_bytes = self._build_buffers(messages, client.payload_ring)
+        client.out_index = 0
+        client.count_flush(len(messages), num_bytes)
+        return True
+
+    def _flush(self, client):
+        """Write as much as possible to a client without blocking."""
+        while not client.closed:
+            if client.out_index >= len(client.out_buffers) and not self._fill_out_buffers(client):
+                break
+
+            buffers = client.out_buffers[client.out_index:client.out_index + IOV_MAX]
+            try:
+                if HAS_SENDMSG:
+                    sent = client.connection.sendmsg(buffers)
+                else:
+                    sent = client.connection.send(buffers[0])
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except ConnectionError:
+                self._disconnect(client)
+                return
+
+            client.out_index = self._advance_buffers(client.out_buffers, client.out_index, sent)
+            if client.out_index < len(client.out_buffers):
+                # socket buffer is full. continue when it is writable again
+                self._set_want_write(client, True)
+                return
+
+        client.out_buffers = []
+        client.out_index = 0
+        self._set_want_write(client, False)
+
+    def _set_want_write(self, client, want_write):
+        if want_write == client.want_write or client.closed:
+            return
+
+        client.want_write = want_write
+        events = selectors.EVENT_READ
+        if want_write:
+            events |= selectors.EVENT_WRITE
+        self._selector.modify(client.connection, events, client.handler)
@@ -0,0 +1,209 @@
+"""Send queue for outgoing BCP messages."""
+import threading
+from collections import deque
+from queue import Empty
+from time import monotonic, perf_counter
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+
+class _Entry:
+
+    """A pending message in the send queue.
+
+    Ordinary messages are encoded by the sender. Keyed messages (frames) keep
+    their kwargs until they are taken out of the queue so a newer frame can
+    still replace or be merged into them.
+    """
+
+    __slots__ = ["key", "msg", "rawbytes", "bcp_command", "kwargs", "merge", "merge_frame", "dead", "queued"]
+
+    def __init__(self, key, msg, rawbytes, bcp_command=None, kwargs=None, merge=None, queued=None,
+                 merge_frame=None):
+        self.key = key
+        self.msg = msg
+        self.rawbytes = rawbytes
+        self.bcp_command = bcp_command
+        self.kwargs = kwargs
+        self.merge = merge
+        self.merge_frame = merge_frame
+        self.dead = False
+        # perf_counter() when the message has been sent by the MC
+        self.queued = queued if queued is not None else perf_counter()
+
+    @property
+    def command(self):
+        """Return the name of the BCP command."""
+        if self.bcp_command is None:
+            self.bcp_command = self.msg.partition('?')[0]
+        return self.bcp_command
+
+    def get_message(self):
+        """Return the (msg, rawbytes) tuple to send."""
+        if self.msg is None:
+            self.msg = bcp.encode_command_string(self.bcp_command, **self.kwargs)
+
+        return self.msg, self.rawbytes
+
+
+class BcpSendQueue:
+
+    """Queue for outgoing BCP messages with latest-frame-wins semantics.
+
+    Ordinary messages are strictly ordered and never dropped. Frames are put
+    with a key (e.g. the name of the DMD). Only the newest pending frame for
+    every key is kept. A frame which is replaced by a newer one before it has
+    been sent counts as superseded. When more than max_pending messages are
+    waiting (e.g. because MPF or the network stalls) new frames are dropped.
+
+    The interface is compatible with the parts of queue.Queue which are used
+    by the BCP server.
+
+    Args:
+        max_pending: Number of pending messages above which new frames will
+            be dropped. 0 means unlimited.
+    """
+
+    def __init__(self, max_pending=0):
+        self.max_pending = max_pending
+        self._entries = deque()
+        self._pending_by_key = dict()
+        self._live = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+        self.superseded_frames = 0
+        self.dropped_frames = 0
+
+        # optional callable which is called (from the putting thread) after a
+        # message has been queued. Used to wake up non-blocking senders.
+        self.on_put = None
+
+    def put(self, item, block=True, timeout=None):
+        """Put an ordinary (msg, rawbytes) tuple at the end of the queue."""
+        del block, timeout
+        msg, rawbytes = item
+        self._put(_Entry(None, msg, rawbytes))
+
+    def _put(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            self._live += 1
+            self._not_empty.notify()
+
+        if self.on_put:
+            self.on_put()
+
+    def put_latest(self, key, bcp_command, kwargs, rawbytes=None, merge=None, queued=None, merge_frame=None):
+        """Put a frame which replaces any pending frame with the same key.
+
+        Args:
+            key: Hashable key which identifies the frame stream.
+            bcp_command: String of the BCP command name.
+            kwargs: Dict of parameters for the BCP command.
+            rawbytes: Optional payload of the frame.
+            merge: Optional callable which gets the kwargs of the pending frame
+                and the new kwargs and returns the kwargs to send. Use this
+                when frames only contain changes.
+            queued: Optional perf_counter() time when the frame has been
+                sent. Defaults to now.
+            merge_frame: Like merge but gets kwargs and rawbytes of the pending
+                and the new frame and returns a (kwargs, rawbytes) tuple. Use
+                this when the payload only contains changes.
+
+        Returns True if the frame has been queued and False if it was dropped.
+        """
+        with self._lock:
+            old_entry = self._pending_by_key.pop(key, None)
+            if old_entry:
+                old_entry.dead = True
+                self._live -= 1
+                self.superseded_frames += 1
+                if merge:
+                    kwargs = merge(old_entry.kwargs, kwargs)
+                if merge_frame:
+                    kwargs, rawbytes = merge_frame(old_entry.kwargs, old_entry.rawbytes, kwargs, rawbytes)
+            elif self.max_pending and self._live >= self.max_pending:
+                self.dropped_frames += 1
+                return False
+
+            entry = _Entry(key, None, rawbytes, bcp_command, kwargs, merge, queued, merge_frame)
+            self._pending_by_key[key] = entry
+            self._entries.append(entry)
+            self._live += 1
+            self._not_empty.notify()
+
+        if self.on_put:
+            self.on_put()
+
+        return True
+
+    def _pop(self):
+        """Pop the next live entry. Needs to be called with the lock held."""
+        while True:
+            entry = self._entries.popleft()
+            if not entry.dead:
+                break
+
+        self._live -= 1
+        if entry.key is not None:
+            del self._pending_by_key[entry.key]
+
+        return entry
+
+    def put_entry(self, entry):
+        """Put an entry which was taken from another queue with get_entry."""
+        if entry.key is None:
+            self._put(_Entry(None, entry.msg, entry.rawbytes, entry.bcp_command, queued=entry.queued))
+        else:
+            self.put_latest(entry.key, entry.bcp_command, entry.kwargs, entry.rawbytes, entry.merge,
+                            entry.queued, entry.merge_frame)
+
+    def get_entry(self, block=True, timeout=None):
+        """Remove and return the next entry without encoding it.
+
+        Raises queue.Empty if no message is available (after timeout).
+        """
+        with self._lock:
+            if not block:
+                if not self._live:
+                    raise Empty
+            elif timeout is None:
+                while not self._live:
+                    self._not_empty.wait()
+            else:
+                end_time = monotonic() + timeout
+                while not self._live:
+                    remaining = end_time - monotonic()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+
+            return self._pop()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the next (msg, rawbytes) tuple.
+
+        Raises queue.Empty if no message is available (after timeout).
+        """
+        return self.get_entry(block, timeout).get_message()
+
+    def get_nowait(self):
+        """Remove and return the next message without blocking."""
+        return self.get(block=False)
+
+    def qsize(self):
+        """Return the number of pending messages."""
+        return self._live
+
+    def empty(self):
+        """Return True if no message is pending."""
+        return not self._live
+
+    def get_stats(self):
+        """Return counters about the queue."""
+        return {
+            'pending': self._live,
+            'superseded_frames': self.superseded_frames,
+            'dropped_frames': self.dropped_frames,
+        }
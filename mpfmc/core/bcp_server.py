@@ -1,6 +1,7 @@
 """BCP Server interface for the MPF Media Controller"""
 
 import logging
+import os
 import queue
 import socket
 import sys
@@ -13,69 +14,395 @@ import select
 import mpf.core.bcp.bcp_socket_client as bcp
 from mpf.exceptions.runtime_error import MpfRuntimeError
 
+from mpfmc._version import __bcp_version__
+from mpfmc.core.bcp_decoder import decode_command_string
+from mpfmc.core.bcp_payload_ring import BcpPayloadRing
+from mpfmc.core.bcp_recorder import BcpRecorder
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+
+# sendmsg is not available on Windows. We fall back to a single sendall there.
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = -1
+if IOV_MAX <= 0:
+    IOV_MAX = 1024
+
+# categories which additional (passive) clients can subscribe to using
+# monitor_start?category=<category>. The primary client receives everything.
+MESSAGE_CATEGORIES = {
+    'dmd_frame': 'dmd_frames',
+    'rgb_dmd_frame': 'dmd_frames',
+    'trigger': 'triggers',
+    'bcp_latency': 'bcp_latency',
+}
+
+# categories which are only sent to clients (including the primary one) which
+# subscribed to them
+MONITOR_CATEGORIES = frozenset(('bcp_latency', ))
+
+# prefix of bcp_interface to listen on a unix domain socket
+UNIX_SOCKET_PREFIX = 'unix:'
+
+# smaller payloads are always sent inline
+MIN_RING_PAYLOAD = 1024
+
+
+class ReceivedCommand(tuple):
+
+    """A (cmd, kwargs) tuple in the receive queue.
+
+    received is the perf_counter() time when the command has been read from
+    the socket.
+    """
+
+    def __new__(cls, cmd, kwargs, received):
+        command = super().__new__(cls, (cmd, kwargs))
+        command.received = received
+        return command
+
+
+class BcpClient:
+
+    """A connected BCP client with its own send queue.
+
+    The primary client (usually MPF) receives all outgoing messages and its
+    commands are processed by the MC. Additional clients (e.g. a backbox
+    monitor or a frame recorder) only receive the categories they subscribed
+    to. The role of a client is decided by its first command (see
+    BCPServer._identify_client).
+
+    Args:
+        connection: The connected socket.
+        address: Address of the client.
+        primary: True if this is the primary client.
+        max_pending: Limit for the send queue of this client (see
+            BcpSendQueue).
+    """
+
+    def __init__(self, connection, address, primary, max_pending=0):
+        self.connection = connection
+        self.address = address
+        self.primary = primary
+        self.identified = False
+        self.max_pending = max_pending
+        self.sending_queue = BcpSendQueue(max_pending)
+        self.subscriptions = set()
+        self.socket_chars = b''
+        self.closed = False
+        self.payload_ring = None
+        self.dropped_messages = 0
+
+        # used by the selector server
+        self.handler = None
+        self.out_buffers = []
+        self.out_index = 0
+        self.want_write = False
+
+        # counters for the batched writes
+        self.flush_count = 0
+        self.flushed_messages = 0
+        self.flushed_bytes = 0
+        self.last_flush_messages = 0
+        self.last_flush_bytes = 0
+        self.max_flush_messages = 0
+
+    def __repr__(self):
+        return '<BcpClient {}:{}{}>'.format(self.address[0], self.address[1],
+                                            ' (primary)' if self.primary else '')
+
+    def wants(self, category):
+        """Return True if messages of category should be sent to this client."""
+        if category in MONITOR_CATEGORIES:
+            return category in self.subscriptions
+        return self.primary or category in self.subscriptions
+
+    def put_entry(self, entry):
+        """Queue an entry from the main send queue for this client.
+
+        Frames are limited by the send queue itself. Other messages are never
+        dropped for the primary client. For other clients they are dropped
+        once the queue is full so a slow client cannot use unlimited memory.
+        """
+        if (not self.primary and entry.key is None and self.max_pending and
+                self.sending_queue.qsize() >= self.max_pending):
+            self.dropped_messages += 1
+            return
+
+        self.sending_queue.put_entry(entry)
+
+    def count_flush(self, num_messages, num_bytes):
+        """Count a batched write."""
+        self.flush_count += 1
+        self.flushed_messages += num_messages
+        self.flushed_bytes += num_bytes
+        self.last_flush_messages = num_messages
+        self.last_flush_bytes = num_bytes
+        self.max_flush_messages = max(self.max_flush_messages, num_messages)
+
+    def get_send_stats(self):
+        """Return counters about the batched writes to this client."""
+        return {
+            'flushes': self.flush_count,
+            'messages': self.flushed_messages,
+            'bytes': self.flushed_bytes,
+            'last_flush_messages': self.last_flush_messages,
+            'last_flush_bytes': self.last_flush_bytes,
+            'max_flush_messages': self.max_flush_messages,
+        }
+
+    def get_stats(self):
+        """Return the subscriptions and all counters of this client."""
+        return {
+            'address': '{}:{}'.format(self.address[0], self.address[1]),
+            'primary': self.primary,
+            'payload_ring': bool(self.payload_ring),
+            'subscriptions': sorted(self.subscriptions),
+            'dropped_messages': self.dropped_messages,
+            'send_queue': self.sending_queue.get_stats(),
+            'send': self.get_send_stats(),
+        }
+
 
 class BCPServer(threading.Thread):
     """Parent class for the BCP Server thread.
 
+    The server accepts up to bcp_max_clients connections. Outgoing messages
+    are put into the shared sending queue and fanned out into the send queues
+    of all clients which want them. Every client is written by its own sending
+    thread so one slow client cannot stall the others.
+
     Args:
         mc: A reference to the main MediaController instance.
         receiving_queue: A shared Queue() object which holds incoming BCP
             commands.
         sending_queue: A shared Queue() object which holds outgoing BCP
             commands.
+        on_receive: Optional callable which is called whenever new commands
+            have been put into the receiving queue.
+        latency_stats: Optional BcpLatencyStats which get the decode and send
+            queue latencies.
 
     """
 
-    def __init__(self, mc, receiving_queue, sending_queue):
+    def __init__(self, mc, receiving_queue, sending_queue, on_receive=None, latency_stats=None):
 
         threading.Thread.__init__(self)
         self.mc = mc
         self.log = logging.getLogger('MPF-MC BCP Server')
         self.receive_queue = receiving_queue
         self.sending_queue = sending_queue
-        self.connection = None
+        self.on_receive = on_receive
+        self.latency_stats = latency_stats
         self.socket = None
+        self.address = None
+        self.unix_socket_path = None
         self.done = False
 
+        self.max_batch_messages = 512
+        self.max_clients = mc.machine_config['mpf-mc'].get('bcp_max_clients', 1)
+        self.client_queue_limit = mc.machine_config['mpf-mc'].get('bcp_send_queue_limit', 0)
+        self.clients = []
+        self.primary_client = None
+        self._clients_lock = threading.Lock()
+
+        self.payload_ring = None
+        ring_size = mc.machine_config['mpf-mc'].get('bcp_payload_ring_size', 0)
+        if ring_size:
+            self.payload_ring = BcpPayloadRing.create(ring_size)
+
+        # record all commands from the primary client to replay them later
+        self.recorder = None
+        if mc.options.get('bcp_record'):
+            self.recorder = BcpRecorder(mc.options['bcp_record'])
+
         self.setup_server_socket(mc.machine_config['mpf-mc']['bcp_interface'],
                                  mc.machine_config['mpf-mc']['bcp_port'])
+        self.sending_thread = None
+        self._start_sending()
+
+    @property
+    def connection(self):
+        """The socket of the primary client (or None)."""
+        return self.primary_client.connection if self.primary_client else None
+
+    def _start_sending(self):
+        """Start the thread which fans out the sending queue."""
         self.sending_thread = threading.Thread(target=self.sending_loop)
         self.sending_thread.daemon = True
         self.sending_thread.start()
 
+    def wakeup(self):
+        """Wake up the server thread (e.g. to check for shutdown).
+
+        The threaded server polls for shutdown so there is nothing to do here.
+        """
+
     def setup_server_socket(self, interface='localhost', port=5050):
         """Sets up the socket listener.
 
         Args:
             interface: String name of which interface this socket will listen
-                on.
+                on. Use unix:<path> to listen on a unix domain socket instead
+                of TCP.
             port: Integer TCP port number the socket will listen on.
 
         """
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if interface.startswith(UNIX_SOCKET_PREFIX):
+            self._setup_unix_socket(interface[len(UNIX_SOCKET_PREFIX):])
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            self.log.info('Starting up on %s port %s', interface, port)
+
+            try:
+                self.socket.bind((interface, port))
+            except IOError as e:
+                raise MpfRuntimeError("Failed to bind BCP Socket to {} on port {}. "
+                                      "Is there another application running on that port?".format(interface, port), 1,
+                                      self.log.name) from e
+
+            self.address = self.socket.getsockname()[:2]
+
+        self.socket.listen(5)
+        self.socket.settimeout(1)
+
+    def _setup_unix_socket(self, path):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise MpfRuntimeError("Unix domain sockets are not supported on this platform. "
+                                  "Use a TCP interface for bcp_interface.", 1, self.log.name)
 
-        self.log.info('Starting up on %s port %s', interface, port)
+        self.log.info('Starting up on unix socket %s', path)
 
+        # remove a stale socket of a previous run
+        if os.path.exists(path):
+            os.unlink(path)
+
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            self.socket.bind((interface, port))
+            self.socket.bind(path)
         except IOError as e:
-            raise MpfRuntimeError("Failed to bind BCP Socket to {} on port {}. "
-                                  "Is there another application running on that port?".format(interface, port), 1,
+            raise MpfRuntimeError("Failed to bind BCP Socket to unix socket {}.".format(path), 1,
                                   self.log.name) from e
 
-        self.socket.listen(5)
-        self.socket.settimeout(1)
+        self.unix_socket_path = path
+        self.address = (path, 0)
+
+    def _close_resources(self):
+        """Close the listening socket, the payload ring and the recorder."""
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+        if self.unix_socket_path:
+            try:
+                os.unlink(self.unix_socket_path)
+            except OSError:
+                pass
+            self.unix_socket_path = None
+
+        if self.payload_ring:
+            self.payload_ring.close()
+            self.payload_ring = None
+
+        if self.recorder:
+            self.log.info("Recorded %s BCP commands to %s", self.recorder.records, self.recorder.path)
+            self.recorder.close()
+            self.recorder = None
+
+    def _add_client(self, connection, client_address):
+        """Create a client for a new connection.
+
+        Returns None if the connection has been rejected.
+        """
+        if self.unix_socket_path:
+            # unix sockets do not have a port. peers usually have no name.
+            client_address = (self.unix_socket_path, 0)
+
+        with self._clients_lock:
+            if len(self.clients) >= self.max_clients:
+                client = None
+            else:
+                client = BcpClient(connection, client_address, False, self.client_queue_limit)
+                self.clients.append(client)
+
+        if not client:
+            self.log.warning("Rejecting connection from %s. Already %s client(s) connected.",
+                             client_address, self.max_clients)
+            connection.close()
+            return None
+
+        self.log.info("Received connection from: %s:%s", client_address[0], client_address[1])
+        return client
+
+    def _identify_client(self, client, command):
+        """Decide the role of a client from its first command.
+
+        A client which starts with monitor_start (or monitor_stop) is passive.
+        Any other client (MPF starts with hello) becomes the primary client if
+        there is none. A passive client is disconnected if it would take the
+        last free slot of the primary client.
+        """
+        client.identified = True
+        with self._clients_lock:
+            if self.primary_client or client.closed:
+                return
+
+            if command not in ('monitor_start', 'monitor_stop'):
+                client.primary = True
+                self.primary_client = client
+            elif len(self.clients) < self.max_clients:
+                return
 
-    def _connect(self):
-        self.log.info("Waiting for a connection...")
+        if client.primary:
+            self._post_client_connected(client.address)
+        else:
+            self.log.warning("Disconnecting monitor %s. The last free connection is kept for MPF.", client)
+            self._remove_client(client)
+
+    def _remove_client(self, client):
+        """Forget a client and close its connection.
+
+        Returns True if the client was removed and False if it was already
+        gone.
+        """
+        with self._clients_lock:
+            if client.closed:
+                return False
+            client.closed = True
+            self.clients.remove(client)
+            if client is self.primary_client:
+                self.primary_client = None
+
+        try:
+            client.connection.close()
+        except OSError:
+            pass
+
+        self.log.info("Client %s disconnected", client)
+        return True
+
+    def _dispatch(self, entry):
+        """Put an entry from the sending queue into all clients which want it."""
+        category = MESSAGE_CATEGORIES.get(entry.command)
+        with self._clients_lock:
+            clients = list(self.clients)
+
+        for client in clients:
+            if client.wants(category):
+                client.put_entry(entry)
+
+    def _post_client_disconnected(self):
         # Since posting an event from a thread is not safe, we just
         # drop the event we want into the receive queue and let the
         # main loop pick it up
         self.receive_queue.put(('trigger',
                                 {'name': 'client_disconnected',
-                                 'host': self.socket.getsockname()[0],
-                                 'port': self.socket.getsockname()[1]}))
+                                 'host': self.address[0],
+                                 'port': self.address[1]}))
         '''event: client_disconnected
         desc: Posted on the MPF-MC only (e.g. not in MPF) when the BCP
         client disconnects. This event is also posted when the MPF-MC
@@ -86,27 +413,16 @@ class BCPServer(threading.Thread):
 
         args:
         host: The hostname or IP address that the socket is listening
-        on.
-        port: The port that the socket is listening on.
+        on (or the path of the unix socket).
+        port: The port that the socket is listening on (0 for unix
+        sockets).
 
         '''
         self.mc.bcp_client_connected = False
+        self._notify_received()
 
-        start_time = time.time()
-        while (not self.connection and
-               not self.mc.thread_stopper.is_set()):
-            try:
-                self.connection, client_address = self.socket.accept()
-            except (socket.timeout, OSError):
-                if self.mc.options['production'] and start_time + 30 < time.time():
-                    self.log.warning("Timeout while waiting for connection. Stopping!")
-                    self.mc.stop()
-                    return False
-                if self.mc.thread_stopper.is_set():
-                    self.log.info("Stopping BCP listener thread")
-                    return False
-
-        self.log.info("Received connection from: %s:%s",
+    def _post_client_connected(self, client_address):
+        self.log.info("Primary client: %s:%s",
                       client_address[0], client_address[1])
 
         # Since posting an event from a thread is not safe, we just
@@ -126,54 +442,106 @@ class BCPServer(threading.Thread):
         port: The port the client connected on.
         '''
         self.mc.bcp_client_connected = True
+        self._notify_received()
 
-        return True
+    def _notify_received(self):
+        """Tell the main loop that there are new messages in the queue."""
+        if self.on_receive:
+            self.on_receive()
 
     def run(self):
-        """The socket thread's run loop."""
+        """The socket thread's run loop.
+
+        Accepts clients and starts a reading and a sending thread for each of
+        them.
+        """
         try:
-            while not self.mc.thread_stopper.is_set():
-                if not self._connect():
-                    return
+            self.log.info("Waiting for a connection...")
+            self._post_client_disconnected()
+            start_time = time.time()
 
-                socket_chars = b''
+            while not self.mc.thread_stopper.is_set() and not self.done:
+                try:
+                    connection, client_address = self.socket.accept()
+                except (socket.timeout, OSError):
+                    if (not self.primary_client and self.mc.options['production'] and
+                            start_time + 30 < time.time()):
+                        self.log.warning("Timeout while waiting for connection. Stopping!")
+                        self.mc.stop()
+                        return
+                    continue
+
+                connection.settimeout(None)
+                client = self._add_client(connection, client_address)
+                if not client:
+                    continue
 
+                for target in (self._reading_loop, self._client_sending_loop):
+                    thread = threading.Thread(target=target, args=(client, ))
+                    thread.daemon = True
+                    thread.start()
+
+            self.log.info("Stopping BCP listener thread")
+
+        except Exception:   # noqa
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value,
+                                               exc_traceback)
+            msg = ''.join(line for line in lines)
+            self.mc.crash_queue.put(msg)
+
+        finally:
+            self._close()
+
+    def _close(self):
+        for client in list(self.clients):
+            try:
+                client.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._remove_client(client)
+
+        self._close_resources()
+
+    def _reading_loop(self, client):
+        """Read and process incoming commands from a client.
+
+        This method is run as a thread per client.
+        """
+        try:
+            if sys.platform in ("linux", "darwin"):
+                poller = select.poll()
+                poller.register(client.connection, select.POLLIN)
+
+            # Receive the data in small chunks and retransmit it
+            while not self.mc.thread_stopper.is_set() and not client.closed:
                 if sys.platform in ("linux", "darwin"):
-                    poller = select.poll()
-                    poller.register(self.connection, select.POLLIN)
-
-                # Receive the data in small chunks and retransmit it
-                while not self.mc.thread_stopper.is_set():
-                    if sys.platform in ("linux", "darwin"):
-                        ready = poller.poll(None)
-                    else:
-                        ready = select.select([self.connection], [], [], 1)
-                    if ready[0]:
-                        try:
-                            data_read = self.connection.recv(8192)
-                        except socket.timeout:
-                            pass
-
-                        if data_read:
-                            socket_chars += data_read
-                            commands = socket_chars.split(b"\n")
-
-                            # keep last incomplete command
-                            socket_chars = commands.pop()
-
-                            # process all complete commands
-                            self._process_receives_messages(commands)
-                        else:
-                            # no bytes -> socket closed
-                            break
-
-                # close connection. while loop will not exit if this is not intended.
-                self.connection.close()
-                self.connection = None
-
-                # always exit
-                self.mc.stop()
-                return
+                    ready = poller.poll(1000)
+                else:
+                    ready = select.select([client.connection], [], [], 1)[0]
+                if not ready:
+                    continue
+
+                try:
+                    data_read = client.connection.recv(8192)
+                except (ConnectionError, OSError):
+                    data_read = b''
+                received = time.perf_counter()
+
+                if data_read:
+                    client.socket_chars += data_read
+                    commands = client.socket_chars.split(b"\n")
+
+                    # keep last incomplete command
+                    client.socket_chars = commands.pop()
+
+                    # process all complete commands
+                    self._process_receives_messages(commands, client, received)
+                else:
+                    # no bytes -> socket closed
+                    break
+
+            self._disconnect(client)
 
         except Exception:   # noqa
             exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -182,7 +550,12 @@ class BCPServer(threading.Thread):
             msg = ''.join(line for line in lines)
             self.mc.crash_queue.put(msg)
 
-    def _process_receives_messages(self, commands):
+    def _disconnect(self, client):
+        """Remove a client. The MC exits when the primary client disconnects."""
+        if self._remove_client(client) and client.primary and not self.mc.thread_stopper.is_set():
+            self.mc.stop()
+
+    def _process_receives_messages(self, commands, client=None, received=None):
         # process all complete commands
         for cmd in commands:
             if cmd:
@@ -192,47 +565,85 @@ class BCPServer(threading.Thread):
                     self.log.warning("Failed to decode BCP message: %s", cmd.strip())
                     continue
 
-                self.process_received_message(decoded_cmd)
+                command = decoded_cmd.partition('?')[0]
+                if command == 'payload_ring_request':
+                    self._attach_payload_ring(client)
+                    continue
+
+                if client is not None and not client.identified:
+                    self._identify_client(client, command)
+                    if client.closed:
+                        break
+
+                if client is None or (client.primary and command not in ('monitor_start', 'monitor_stop')):
+                    self.process_received_message(decoded_cmd, received)
+                else:
+                    self.process_client_message(client, decoded_cmd)
+
+        self._notify_received()
+
+    def _attach_payload_ring(self, client):
+        """Answer a payload_ring_request from a client on the same machine.
+
+        The answer contains the name of the shared memory segment. It does not
+        contain a name if the ring is disabled. Large payloads to the client
+        will be written to the ring afterwards.
+        """
+        if self.payload_ring:
+            client.payload_ring = self.payload_ring
+            msg = bcp.encode_command_string('payload_ring', name=self.payload_ring.name,
+                                            size=self.payload_ring.capacity)
+        else:
+            msg = bcp.encode_command_string('payload_ring', size=0)
+
+        client.sending_queue.put((msg, None))
+
+    def process_client_message(self, client, message):
+        """Handle a message from an additional (passive) client.
+
+        Those clients can only say hello and subscribe to categories of
+        outgoing messages. Everything else is ignored. Subscriptions of the
+        primary client are handled here as well.
+        """
+        try:
+            cmd, kwargs = decode_command_string(message)
+        except ValueError:
+            self.log.warning("DECODE BCP ERROR from %s. Message: %s", client, message)
+            return
+
+        if cmd == 'hello':
+            client.sending_queue.put((bcp.encode_command_string('hello', version=__bcp_version__), None))
+        elif cmd == 'monitor_start':
+            client.subscriptions.add(kwargs.get('category'))
+        elif cmd == 'monitor_stop':
+            client.subscriptions.discard(kwargs.get('category'))
+        else:
+            self.log.debug("Ignoring %s from %s", message, client)
 
     def stop(self):
         """ Stops and shuts down the BCP server."""
         if not self.done:
             self.log.info("Socket thread stopping.")
-            self.sending_queue.put('goodbye', None)
+            self.sending_queue.put(('goodbye', None))
             time.sleep(1)  # give it a chance to send goodbye before quitting
             self.done = True
             self.mc.done = True
 
     def sending_loop(self):
-        """Sending loop which transmits data from the sending queue to the
-        remote socket.
+        """Fan out the sending queue into the send queues of all clients.
 
         This method is run as a thread.
         """
         try:
-            while not self.done and not self.mc.thread_stopper.is_set():
+            while not self.mc.thread_stopper.is_set():
                 try:
-                    msg, rawbytes = self.sending_queue.get(block=True,
-                                                           timeout=1)
-
+                    entry = self.sending_queue.get_entry(block=True, timeout=1)
                 except queue.Empty:
-                    if self.mc.thread_stopper.is_set():
-                        self.log.info("Stopping BCP sending thread")
-                        self.socket.shutdown(socket.SHUT_RDWR)
-                        self.socket.close()
-                        self.socket = None
-                        return
-
-                    else:
-                        continue
+                    continue
 
-                if not rawbytes:
-                    self.connection.sendall(('{}\n'.format(msg)).encode('utf-8'))
+                self._dispatch(entry)
 
-                else:
-                    self.connection.sendall('{}&bytes={}\n'.format(
-                        msg, len(rawbytes)).encode('utf-8'))
-                    self.connection.sendall(rawbytes)
+            self.log.info("Stopping BCP sending thread")
 
         except Exception:   # noqa
             exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -243,18 +654,169 @@ class BCPServer(threading.Thread):
 
             # todo this does not crash mpf-mc
 
-    def process_received_message(self, message):
+    def _client_sending_loop(self, client):
+        """Sending loop which transmits data from the send queue of a client to
+        its socket.
+
+        This method is run as a thread per client. Every message which is
+        pending when the loop wakes up is written to the socket with a single
+        (scatter-gather) write. Headers and raw payloads are passed as separate
+        buffers so frame data is never copied.
+        """
+        try:
+            while not self.mc.thread_stopper.is_set() and not client.closed:
+                # coalesce everything which is already waiting
+                messages = self._take_messages(client, timeout=1)
+                if not messages:
+                    continue
+
+                try:
+                    self._send_messages(client, messages)
+                except OSError:
+                    self._disconnect(client)
+
+        except Exception:   # noqa
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value,
+                                               exc_traceback)
+            msg = ''.join(line for line in lines)
+            self.mc.crash_queue.put(msg)
+
+    def _take_messages(self, client, timeout=None):
+        """Take a batch of (msg, rawbytes) tuples from the send queue of a client.
+
+        Waits up to timeout seconds for the first message if timeout is set.
+        Returns an empty list if no message is pending. The time a message
+        waited since it has been sent by the MC is added to the send_queue
+        latency stats.
+        """
+        messages = []
+        block = timeout is not None
+        now = None
+        while len(messages) < self.max_batch_messages:
+            try:
+                entry = client.sending_queue.get_entry(block, timeout)
+            except queue.Empty:
+                break
+
+            block = False
+            messages.append(entry.get_message())
+            if self.latency_stats:
+                if now is None:
+                    now = time.perf_counter()
+                self.latency_stats.add('send_queue', entry.command, now - entry.queued, now)
+
+        return messages
+
+    def has_subscribers(self, category):
+        """Return True if a client subscribed to category."""
+        with self._clients_lock:
+            return any(category in client.subscriptions for client in self.clients)
+
+    def _send_messages(self, client, messages):
+        """Write a batch of (msg, rawbytes) tuples to a client."""
+        buffers, num_bytes = self._build_buffers(messages, client.payload_ring)
+
+        if HAS_SENDMSG:
+            self._sendmsg_all(client.connection, buffers)
+        else:
+            client.connection.sendall(b''.join(buffers))
+
+        client.count_flush(len(messages), num_bytes)
+
+    @staticmethod
+    def _build_buffers(messages, payload_ring=None):
+        """Return a list of buffers and the total size for a batch of messages.
+
+        If payload_ring is passed large payloads are written to the ring
+        instead of the socket.
+        """
+        buffers = []
+        num_bytes = 0
+        for msg, rawbytes in messages:
+            position = None
+            if payload_ring and rawbytes and len(rawbytes) >= MIN_RING_PAYLOAD:
+                position = payload_ring.write(rawbytes)
+
+            if not rawbytes:
+                header = '{}\n'.format(msg).encode('utf-8')
+                buffers.append(header)
+                num_bytes += len(header)
+            elif position is not None:
+                header = '{}&ring_position=int:{}&ring_bytes=int:{}\n'.format(
+                    msg, position, len(rawbytes)).encode('utf-8')
+                buffers.append(header)
+                num_bytes += len(header)
+            else:
+                header = '{}&bytes={}\n'.format(msg, len(rawbytes)).encode('utf-8')
+                payload = memoryview(rawbytes).cast('B')
+                buffers.append(header)
+                buffers.append(payload)
+                num_bytes += len(header) + len(payload)
+
+        return buffers, num_bytes
+
+    def _sendmsg_all(self, connection, buffers):
+        """Send all buffers using as few sendmsg calls as possible."""
+        index = 0
+        while index < len(buffers):
+            sent = connection.sendmsg(buffers[index:index + IOV_MAX])
+            index = self._advance_buffers(buffers, index, sent)
+
+    @staticmethod
+    def _advance_buffers(buffers, index, sent):
+        """Skip sent bytes in a list of buffers and return the new index.
+
+        sendmsg may send less than requested (just like send). In that case
+        the partially sent buffer is replaced by a view on its remainder.
+        """
+        while sent:
+            length = len(buffers[index])
+            if sent >= length:
+                sent -= length
+                index += 1
+            else:
+                buffers[index] = memoryview(buffers[index])[sent:]
+                sent = 0
+
+        return index
+
+    def get_send_stats(self):
+        """Return counters about the batched writes to the primary client."""
+        client = self.primary_client
+        if client:
+            return client.get_send_stats()
+
+        return BcpClient(None, None, True).get_send_stats()
+
+    def get_client_stats(self):
+        """Return a list with the counters of all connected clients."""
+        with self._clients_lock:
+            clients = list(self.clients)
+
+        return [client.get_stats() for client in clients]
+
+    def process_received_message(self, message, received=None):
         """Puts a received BCP message into the receiving queue.
 
         Args:
             message: The incoming BCP message
+            received: Optional perf_counter() time when the message has been
+                read from the socket.
 
         """
         self.log.debug('Received "%s"', message)
 
         try:
-            cmd, kwargs = bcp.decode_command_string(message)
-            self.receive_queue.put((cmd, kwargs))
+            if received is None:
+                received = time.perf_counter()
+            if self.recorder:
+                self.recorder.record(message, received)
+            cmd, kwargs = decode_command_string(message)
+            if self.latency_stats:
+                now = time.perf_counter()
+                self.latency_stats.add('decode', cmd, now - received, now)
+            self.receive_queue.put(ReceivedCommand(cmd, kwargs, received))
         except ValueError:
             self.log.error("DECODE BCP ERROR. Message: %s", message)
             raise
@@ -0,0 +1,97 @@
+"""Offscreen render of a display which is shared by all consumers of its pixels."""
+from kivy.clock import Clock
+from kivy.graphics import ClearBuffers, ClearColor
+from kivy.graphics.fbo import Fbo
+from kivy.graphics.instructions import Callback
+from kivy.graphics.opengl import glReadPixels, GL_RGBA, GL_UNSIGNED_BYTE
+from kivy.graphics.texture import Texture
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.uix.display import Display     # pylint: disable-msg=cyclic-import,unused-import
+
+
+class DisplayCapture:
+
+    """Renders a display into an Fbo at most once per clock frame.
+
+    DMDs, RGB DMDs, the display_light_player and Display.get_frame_data all
+    need the content of a display. Instead of rendering the display once for
+    every consumer they share one capture per display (see
+    Display.get_capture). Consumers on the GPU draw texture (e.g. with their
+    own shader). Consumers on the CPU call get_pixels which reads the Fbo only
+    once per capture.
+
+    frame is incremented on every capture. Consumers remember the frame which
+    they used last, call update and compare the result.
+
+    Displays which are only used as a source (e.g. for a DMD) are not on
+    screen, so nothing draws their canvas and there is no cheap way to tell
+    whether their content changed (slides, animations, videos). The display
+    is therefore rendered once per clock frame in which a consumer asks for
+    it, just like before, but only once for all consumers.
+
+    The canvas of the display is drawn by reference. The widget tree is not
+    touched during a capture, so there are no parent/child property events
+    and no layout work. The canvas is not added to the Fbo because a Kivy
+    instruction has only one parent. The Fbo would take the place of a
+    DisplayOutput which shows the display and the DisplayOutput would no
+    longer be redrawn when the display changes.
+    """
+
+    def __init__(self, display: "Display") -> None:
+        """initialize capture."""
+        self.display = display
+        self.frame = 0
+        self._clock_frame = -1
+        self._pixels = None
+
+        texture = Texture.create(size=display.size, colorfmt='rgba')
+        self.fbo = Fbo(size=display.size, texture=texture, with_stencilbuffer=True)
+        with self.fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Callback(self._draw_display)
+
+    @property
+    def texture(self) -> Texture:
+        """Texture which contains the last capture."""
+        return self.fbo.texture
+
+    def update(self) -> int:
+        """Capture the display and return the current frame.
+
+        The display is rendered at most once per clock frame no matter how
+        many consumers call this.
+        """
+        if self._clock_frame != Clock.frames:
+            self._clock_frame = Clock.frames
+            self._render()
+            self.frame += 1
+            self._pixels = None
+
+        return self.frame
+
+    def _render(self) -> None:
+        # an Fbo is only redrawn if one of its instructions changed
+        self.fbo.flag_update()
+        self.fbo.draw()
+
+    def _draw_display(self, *args) -> None:
+        """Draw the canvas of the display into the Fbo."""
+        del args
+        self.display.container.canvas.draw()
+
+    def get_pixels(self) -> bytes:
+        """Return the RGBA pixels of the last capture (bottom row first).
+
+        The Fbo is read only once per capture. All consumers get the same
+        buffer.
+        """
+        if self._pixels is None:
+            self.fbo.bind()
+            self._pixels = glReadPixels(0, 0, self.display.native_size[0], self.display.native_size[1],
+                                        GL_RGBA, GL_UNSIGNED_BYTE)
+            self.fbo.release()
+
+        return self._pixels
@@ -1,17 +1,19 @@
 """DMD (hardware device)."""
-import struct
+from functools import lru_cache
 
-from kivy.graphics.instructions import Callback
-from kivy.uix.effectwidget import EffectWidget
+import numpy as np
+from kivy.graphics import ClearBuffers, ClearColor, Color, Rectangle
+from kivy.uix.effectwidget import EffectFbo
 
 from kivy.clock import Clock
-from kivy.graphics.fbo import Fbo
 from kivy.graphics.opengl import glReadPixels, GL_RGB, GL_UNSIGNED_BYTE
 from kivy.graphics.texture import Texture
+from mpf.core.config_spec_loader import ConfigSpecLoader
+from mpf.file_interfaces.yaml_interface import YamlInterface
 
-from mpfmc.effects.gain import GainEffect
-from mpfmc.effects.flip_vertical import FlipVerticalEffect
-from mpfmc.effects.gamma import GammaEffect
+from mpfmc.core.dmd_encoding import DmdFrameEncoder
+from mpfmc.core.dmd_frame_sink import DmdFrameSink
+from mpfmc.effects.dmd_output import DmdOutputEffect
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -22,6 +24,18 @@ class DmdBase:
     """Base class for DMD devices."""
 
     dmd_name_string = 'DMD'
+    frame_command = 'dmd_frame'
+    channels = 1
+
+    # settings which are only used by the MC. they are added to the spec of
+    # dmds and rgb_dmds.
+    mc_config_spec = '''
+readback: single|enum(sync,deferred)|sync
+frame_encoding: single|enum(raw,delta)|delta
+frame_sink: single|str|None
+bcp_frames: single|bool|true
+gpu_output: single|bool|true
+'''
 
     def __init__(self, mc: "MpfMc", name: str, config: dict) -> None:
         """initialize DMD."""
@@ -35,43 +49,103 @@ class DmdBase:
 
         self.source = self.mc.displays[self.config['source_display']]
         self.prev_data = None
-        self._dirty = True
-
-        # put the widget canvas on a Fbo
+        # the display is rendered by a capture which is shared with other
+        # consumers of the display (e.g. a second DMD)
+        self.capture = self.source.get_capture()
+        self._capture_frame = 0
+        # deferred readback: the Fbo contains a frame which has not been read
+        self._readback_pending = False
+        # set when MPF negotiated compressed frames
+        self._frame_encoder = None
+        self.fps = 0
+
+        if not 0.0 <= self.config['brightness'] <= 1.0:
+            raise ValueError("DMD brightness value should be between 0.0 "
+                             "and 1.0. Yours is {}".format(self.config['brightness']))
+
+        # draw the capture upside down (so the top row is read first) through
+        # the output effect which applies brightness, gamma and the pixel
+        # format on the GPU
+        width, height = self.source.size
         texture = Texture.create(size=self.source.size, colorfmt='rgb')
-        self.fbo = Fbo(size=self.source.size, texture=texture)
+        self.fbo = EffectFbo(size=self.source.size, texture=texture)
+        with self.fbo:
+            ClearColor(0, 0, 0, 1)
+            ClearBuffers()
+            Color(1, 1, 1, 1)
+            Rectangle(texture=self.capture.texture, size=self.source.size, tex_coords=(0, 1, 1, 1, 1, 0, 0, 0))
+        self.fbo['resolution'] = [float(width), float(height)]
+        self.fbo['time'] = 0.0
+
+        self.effect = self._attach_output_effect()
 
-        self.effect_widget = EffectWidget()
+        self._set_dmd_fps()
 
-        effect_list = list()
-        effect_list.append(FlipVerticalEffect())
+        # frames for a driver on the same machine
+        self.frame_sink = None
+        if self.config['frame_sink']:
+            width, height = self.source.native_size
+            self.frame_sink = DmdFrameSink(self.config['frame_sink'], width, height, self.channels)
+            self.mc.events.add_handler('shutdown', self._close_frame_sink)
 
-        if self.config['brightness'] != 1.0:
-            if not 0.0 <= self.config['brightness'] <= 1.0:
-                raise ValueError("DMD brightness value should be between 0.0 "
-                                 "and 1.0. Yours is {}".format(self.config['brightness']))
+        encodings = self.mc.bcp_processor.requested_frame_encodings.get((self.frame_command, self.name))
+        if encodings:
+            self.set_frame_encodings(encodings)
 
-            effect_list.append(GainEffect(gain=self.config['brightness']))
+    def _get_validated_config(self, config: dict) -> dict:
+        raise NotImplementedError
 
-        if self.config['gamma'] != 1.0:
-            effect_list.append(GammaEffect(gamma=self.config['gamma']))
+    def _add_mc_config_spec(self, section: str) -> None:
+        """Add the settings of mc_config_spec to a section of the config spec."""
+        spec = self.mc.config_validator.get_config_spec()[section]
+        mc_spec = ConfigSpecLoader.process_config_spec(YamlInterface.process(self.mc_config_spec), section)
+        for key, value in mc_spec.items():
+            spec.setdefault(key, value)
 
-        self.effect_widget.effects = effect_list
-        self.effect_widget.size = self.source.size
+    def _get_output_effect(self) -> DmdOutputEffect:
+        """Return the effect which converts the frame to the format of the DMD."""
+        raise NotImplementedError
 
-        self.fbo.add(self.effect_widget.canvas)
+    def _attach_output_effect(self):
+        """Attach the output effect to the Fbo.
 
-        with self.source.canvas:
-            self.callback = Callback(self._trigger_rendering)
+        Returns the effect or None if the frames are converted on the CPU
+        instead. This is the case when gpu_output is disabled or when the
+        shader of the effect does not compile (e.g. on some GL ES drivers).
+        """
+        if not self.config['gpu_output']:
+            return None
 
-        self._set_dmd_fps()
+        effect = self._get_output_effect()
+        try:
+            effect.fbo = self.fbo
+        except Exception:   # pylint: disable-msg=broad-except
+            # kivy raises a plain Exception and keeps the previous shader
+            effect.fbo = None
+            self.mc.log.warning("The output shader of %s %s failed to compile. Will convert its frames on the CPU.",
+                                self.dmd_name_string, self.name)
+            return None
 
-    def _trigger_rendering(self, *args):
-        del args
-        self._dirty = True
+        return effect
 
-    def _get_validated_config(self, config: dict) -> dict:
-        raise NotImplementedError
+    def _get_readback_size(self, native_size) -> tuple:
+        """Return the size of the area which has to be read from the Fbo."""
+        return native_size
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_color_table(brightness: float, gamma: float) -> np.ndarray:
+        """Return the adjusted value for every color value 0 to 255."""
+        values = (np.arange(256) / 255. * brightness) ** gamma
+        return np.rint(values * 255).astype(np.uint8)
+
+    def _adjust_colors(self, data: bytes) -> bytes:
+        """Apply brightness and gamma on the CPU (without the output effect)."""
+        if self.config['brightness'] == 1.0 and self.config['gamma'] == 1.0:
+            return data
+
+        table = self._get_color_table(self.config['brightness'], self.config['gamma'])
+        return table[np.frombuffer(data, dtype=np.uint8)].tobytes()
 
     def _set_dmd_fps(self) -> None:
         # fps is the rate that the connected client requested. We'll use the
@@ -99,6 +173,7 @@ class DmdBase:
             fps = Clock._max_fps
             update = 0
 
+        self.fps = fps
         Clock.schedule_interval(self.tick, update)
         self.mc.log.info("Setting %s to %sfps",
                          DmdBase.dmd_name_string, fps)
@@ -107,106 +182,282 @@ class DmdBase:
         """Draw image for DMD and send it."""
         del args
         # run this at the end of the tick to make sure all kivy bind callbacks have executed
-        if self._dirty:
-            Clock.schedule_once(self._render, -1)
+        Clock.schedule_once(self._render, -1)
 
     def _render(self, dt):
         del dt
-        self._dirty = False
-        widget = self.source
-        fbo = self.fbo
-
-        # detach the widget from the parent
-        parent = widget.parent
-        if parent and hasattr(parent, "remove_display_source"):
-            parent.remove_display_source(widget)
-
-        # clear the fbo background
-        fbo.bind()
-        fbo.clear_buffer()
-        fbo.release()
-
-        self.effect_widget.add_widget(widget.container)
-
-        fbo.draw()
-
-        fbo.bind()
-        data = glReadPixels(0, 0, widget.native_size[0], widget.native_size[1],
-                            GL_RGB, GL_UNSIGNED_BYTE)
-        fbo.release()
-
-        self.effect_widget.remove_widget(widget.container)
+        deferred = self.config['readback'] == 'deferred'
+        if self._readback_pending:
+            # the frame has been drawn in the last render. the GPU finished it
+            # in the meantime so this will not stall.
+            self._readback_pending = False
+            self._send_frame(self._read_fbo())
+
+        frame = self.capture.update()
+        if frame == self._capture_frame:
+            return
+
+        self._capture_frame = frame
+        # the instructions did not change, only the texture of the capture
+        self.fbo.flag_update()
+        self.fbo.draw()
+
+        if deferred:
+            # read it in the next render instead of waiting for the GPU now
+            self._readback_pending = True
+        else:
+            self._send_frame(self._read_fbo())
 
-        # reattach to the parent
-        if parent and hasattr(parent, "add_display_source"):
-            parent.add_display_source(widget)
+    def _read_fbo(self) -> bytes:
+        """Read the frame from the Fbo."""
+        self.fbo.bind()
+        width, height = self._get_readback_size(self.source.native_size)
+        data = glReadPixels(0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE)
+        self.fbo.release()
+        return data
 
+    def _send_frame(self, data: bytes) -> None:
         if not self.config['only_send_changes'] or self.prev_data != data:
-            self.prev_data = data
-            self.send(data)
-
-    def send(self, data: bytes) -> None:
-        """Send data to DMD via BCP."""
+            if self.send(data):
+                self.prev_data = data
+            else:
+                # MPF did not get the frame. read and send it again in the
+                # next render even if the display does not change.
+                self.prev_data = None
+                self._capture_frame = None
+
+    def set_frame_encodings(self, encodings: list) -> None:
+        """Use compressed frames if MPF can decode them.
+
+        Args:
+            encodings: List of the frame encodings which MPF can decode. An
+                empty list switches back to uncompressed frames.
+        """
+        encoding = self.config['frame_encoding']
+        if encoding in encodings:
+            # send a keyframe about every second
+            self._frame_encoder = DmdFrameEncoder(max(1, int(self.fps or 30)))
+        else:
+            encoding = 'raw'
+            self._frame_encoder = None
+
+        if encodings:
+            self.mc.bcp_processor.send('dmd_frame_encoding', name=self.name, rgb=self.frame_command == 'rgb_dmd_frame',
+                                       encoding=encoding)
+
+    def _close_frame_sink(self, **kwargs) -> None:
+        del kwargs
+        self.frame_sink.close()
+
+    def _output_frame(self, data: bytes, **kwargs) -> bool:
+        """Write a frame to the frame sink and/or send it to MPF.
+
+        Returns False if the frame has been dropped because the BCP send
+        queue is full.
+        """
+        if self.frame_sink:
+            self.frame_sink.write(data, kwargs.get('bits', 8))
+        if self.config['bcp_frames']:
+            return self._send_bcp_frame(data, **kwargs)
+        return True
+
+    def _send_bcp_frame(self, data: bytes, **kwargs) -> bool:
+        """Send a frame (compressed if negotiated) to MPF."""
+        if not self._frame_encoder:
+            return self.mc.bcp_processor.send(self.frame_command, rawbytes=data, name=self.name, **kwargs) is not False
+
+        encoding_kwargs, payload = self._frame_encoder.encode(data)
+        kwargs.update(encoding_kwargs)
+        if self.mc.bcp_processor.send(self.frame_command, rawbytes=payload, name=self.name, **kwargs) is False:
+            # MPF will not get this frame. start over with a keyframe.
+            self._frame_encoder.reset()
+            return False
+        return True
+
+    def send(self, data: bytes) -> bool:
+        """Send data to DMD via BCP.
+
+        Returns False if the frame has been dropped.
+        """
         raise NotImplementedError
 
 
 class Dmd(DmdBase):
     """Monochrome DMD."""
 
+    mc_config_spec = DmdBase.mc_config_spec + '''
+packed: single|bool|false
+dithering: single|bool|false
+'''
+
+    # bits per pixel of packed frames for the number of shades
+    PACKED_BITS = {16: 4, 4: 2}
+
+    # 4x4 Bayer matrix for ordered dithering
+    BAYER_MATRIX = np.array([[0, 8, 2, 10],
+                             [12, 4, 14, 6],
+                             [3, 11, 1, 9],
+                             [15, 7, 13, 5]])
+
     def _get_validated_config(self, config: dict) -> dict:
-        return self.mc.config_validator.validate_config('dmds', config)
+        self._add_mc_config_spec('dmds')
+        config = self.mc.config_validator.validate_config('dmds', config)
+        if config['packed'] and config['shades'] not in self.PACKED_BITS:
+            raise ValueError("Packed DMD frames need 4 or 16 shades. {} has {}".format(
+                self.name, config['shades']))
+
+        return config
+
+    @property
+    def bits(self):
+        """Return bits per pixel of packed frames or None."""
+        if self.config['packed']:
+            return self.PACKED_BITS[self.config['shades']]
+        return None
+
+    def _get_levels(self) -> int:
+        """Return the highest shade which is sent."""
+        if self.bits:
+            return (1 << self.bits) - 1
+        return 15
+
+    def _get_output_effect(self) -> DmdOutputEffect:
+        # with dithering the shades are calculated from the full luminosity
+        return DmdOutputEffect(brightness=self.config['brightness'],
+                               gamma=self.config['gamma'],
+                               luminosity=list(self.config['luminosity']),
+                               max_shade=255 if self.config['dithering'] else self._get_levels())
+
+    def _get_readback_size(self, native_size) -> tuple:
+        if not self.effect:
+            return native_size
+
+        # the output effect packs three pixels into one
+        pixels_per_texel = DmdOutputEffect.PIXELS_PER_TEXEL
+        return -(-native_size[0] // pixels_per_texel), native_size[1]
+
+    def _unpack_shades(self, data: bytes) -> bytes:
+        """Return one shade per pixel from packed data read from the Fbo."""
+        width, height = self.source.native_size
+        if len(data) == width * height:
+            return data
+
+        # remove the padding at the end of each row
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(height, -1)
+        return rows[:, :width].tobytes()
 
     @classmethod
-    def _convert_to_single_bytes(cls, data, config: dict) -> bytes:
-        new_data = bytearray()
-        loops = 0
+    def _convert_to_single_bytes(cls, data, config: dict, levels: int = 15) -> bytes:
+        """Convert RGB data to one brightness value (0-levels) per pixel.
+
+        This is the CPU version of the conversion in DmdOutputEffect which is
+        used when the effect is not available. The float operations are done
+        in the same order as for a single pixel and rint rounds half to even
+        like round() so the result is identical to the per pixel calculation.
+        """
         config.setdefault('luminosity', (.299, .587, .114))
         luminosity = config['luminosity']
 
-        for r, g, b in struct.iter_unpack('BBB', data):
-            loops += 1
-            try:
-                pixel_weight = ((r * luminosity[0]) + (g * luminosity[1]) + (b * luminosity[2])) / 255.
-                new_data.append(int(round(pixel_weight * 15)))
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.float64)
+        pixel_weight = ((pixels[:, 0] * luminosity[0]) + (pixels[:, 1] * luminosity[1]) +
+                        (pixels[:, 2] * luminosity[2])) / 255.
+        new_data = np.rint(pixel_weight * levels)
+
+        if new_data.size and not 0 <= new_data.min() <= new_data.max() <= 255:
+            raise ValueError("Luminosity {} results in pixel values out of range.".format(luminosity))
 
-            except ValueError:
-                raise ValueError(loops, r, g, b)
+        return new_data.astype(np.uint8).tobytes()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_dither_thresholds(width: int, height: int) -> np.ndarray:
+        """Return the threshold (between 0 and 1) for every pixel."""
+        repeat = (-(-height // 4), -(-width // 4))
+        return (np.tile(Dmd.BAYER_MATRIX, repeat)[:height, :width] + .5) / 16
 
-        return bytes(new_data)
+    @classmethod
+    def _dither(cls, data: bytes, width: int, height: int, levels: int) -> np.ndarray:
+        """Return shades 0 to levels for luminosity values 0 to 255 using ordered dithering."""
+        luminosity = np.frombuffer(data, dtype=np.uint8).reshape(height, width)
+        shades = np.floor(luminosity * (levels / 255.) + cls._get_dither_thresholds(width, height))
+        return np.minimum(shades, levels).astype(np.uint8)
 
-    def send(self, data: bytes) -> None:
+    @staticmethod
+    def _pack_pixels(shades, bits: int) -> bytes:
+        """Pack 8 / bits pixels into one byte (the first pixel in the highest bits)."""
+        shades = np.frombuffer(shades, dtype=np.uint8) if isinstance(shades, bytes) else shades.ravel()
+        pixels_per_byte = 8 // bits
+        padding = -len(shades) % pixels_per_byte
+        if padding:
+            shades = np.concatenate((shades, np.zeros(padding, dtype=np.uint8)))
+
+        shades = shades.reshape(-1, pixels_per_byte)
+        packed = np.zeros(len(shades), dtype=np.uint8)
+        for pixel in range(pixels_per_byte):
+            packed |= shades[:, pixel] << (8 - bits * (pixel + 1))
+        return packed.tobytes()
+
+    def send(self, data: bytes) -> bool:
         """Send data to DMD via BCP."""
-        data = self._convert_to_single_bytes(data, self.config)
+        if self.effect:
+            data = self._unpack_shades(data)
+        else:
+            data = self._convert_to_single_bytes(self._adjust_colors(data), self.config,
+                                                 255 if self.config['dithering'] else self._get_levels())
 
-        self.mc.bcp_processor.send('dmd_frame', rawbytes=data, name=self.name)
+        if self.config['dithering']:
+            width, height = self.source.native_size
+            data = self._dither(data, width, height, self._get_levels())
+            if not self.bits:
+                data = data.tobytes()
+
+        if self.bits:
+            return self._output_frame(self._pack_pixels(data, self.bits), bits=self.bits)
+        return self._output_frame(data)
 
 
 class RgbDmd(DmdBase):
     """RGB DMD."""
 
     dmd_name_string = 'RGB DMD'
+    frame_command = 'rgb_dmd_frame'
+    channels = 3
 
     def _get_validated_config(self, config: dict) -> dict:
+        self._add_mc_config_spec('rgb_dmds')
         return self.mc.config_validator.validate_config('rgb_dmds', config)
 
+    def _gpu_channel_order(self) -> bool:
+        """Return true if the output effect can reorder the channels."""
+        self._get_channel_permutation(self.config['channel_order'])
+        return len(self.config['channel_order']) == 3
+
+    def _get_output_effect(self) -> DmdOutputEffect:
+        return DmdOutputEffect(brightness=self.config['brightness'],
+                               gamma=self.config['gamma'],
+                               channel_order=self.config['channel_order'] if self._gpu_channel_order() else 'rgb')
+
     @staticmethod
-    def _reorder_channels(data, order):
-        new_data = bytearray()
-        for r, g, b in struct.iter_unpack('BBB', data):
-            for channel in order:
-                if channel == "r":
-                    new_data.append(r)
-                elif channel == "g":
-                    new_data.append(g)
-                elif channel == "b":
-                    new_data.append(b)
-                else:
-                    raise ValueError("Unknown channel {}".format(channel))
-
-        return bytes(new_data)
-
-    def send(self, data: bytes) -> None:
+    @lru_cache(maxsize=None)
+    def _get_channel_permutation(order):
+        """Return the index of the source channel for every channel in order."""
+        permutation = []
+        for channel in order:
+            if channel not in "rgb":
+                raise ValueError("Unknown channel {}".format(channel))
+            permutation.append("rgb".index(channel))
+
+        return np.array(permutation, dtype=np.intp)
+
+    @classmethod
+    def _reorder_channels(cls, data, order):
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        return pixels[:, cls._get_channel_permutation(order)].tobytes()
+
+    def send(self, data: bytes) -> bool:
         """Send data to RGB DMD via BCP."""
-        if self.config['channel_order'] != 'rgb':
+        if not self.effect:
+            data = self._adjust_colors(data)
+        if not self.effect or not self._gpu_channel_order():
             data = self._reorder_channels(data, self.config['channel_order'])
-        self.mc.bcp_processor.send('rgb_dmd_frame', rawbytes=data, name=self.name)
+        return self._output_frame(data)
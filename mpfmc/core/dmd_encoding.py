@@ -0,0 +1,220 @@
+"""Compressed DMD frames.
+
+A delta frame is the XOR of a frame with a base frame. Runs of unchanged
+(zero) bytes are skipped. The payload is a sequence of spans which consist
+of the number of bytes to skip (varint), the number of changed bytes
+(varint) and the XORed bytes. Unchanged bytes at the end are not encoded.
+
+Delta frames are sent with encoding=delta, the number of the frame and the
+number of the base frame. A base of -1 means that the delta is against an
+all black frame (a keyframe). When a delta frame is not smaller than the
+frame itself the frame is sent as it is (without encoding).
+
+Because XOR deltas can be combined, a pending frame which is superseded in
+the send queue is merged into the newer one (see merge_frame) and no frame
+is lost.
+"""
+import numpy as np
+
+DELTA = 'delta'
+
+# supported encodings in order of preference
+ENCODINGS = (DELTA, )
+
+# gaps of unchanged bytes which are shorter than this are encoded as part of
+# the span because a new span costs at least two bytes
+MIN_GAP = 4
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(payload, position: int) -> tuple:
+    value = 0
+    shift = 0
+    while True:
+        byte = payload[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _encode_spans(xor: np.ndarray) -> bytes:
+    changed = np.flatnonzero(xor)
+    if not changed.size:
+        return b''
+
+    breaks = np.flatnonzero(np.diff(changed) > MIN_GAP)
+    starts = changed[np.concatenate(([0], breaks + 1))]
+    ends = changed[np.concatenate((breaks, [changed.size - 1]))] + 1
+
+    payload = bytearray()
+    position = 0
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        _write_varint(payload, start - position)
+        _write_varint(payload, end - start)
+        payload += xor[start:end].tobytes()
+        position = end
+
+    return bytes(payload)
+
+
+def _decode_spans(payload, size: int = 0) -> np.ndarray:
+    """Return the XOR bytes of a delta (at least size bytes)."""
+    spans = []
+    position = 0
+    offset = 0
+    while offset < len(payload):
+        skip, offset = _read_varint(payload, offset)
+        length, offset = _read_varint(payload, offset)
+        position += skip
+        spans.append((position, offset, length))
+        position += length
+        offset += length
+
+    xor = np.zeros(max(size, position), dtype=np.uint8)
+    payload = np.frombuffer(payload, dtype=np.uint8)
+    for position, offset, length in spans:
+        xor[position:position + length] = payload[offset:offset + length]
+
+    return xor
+
+
+def encode_delta(frame: bytes, base_frame: bytes = None) -> bytes:
+    """Return the delta between frame and base_frame (or black)."""
+    xor = np.frombuffer(frame, dtype=np.uint8)
+    if base_frame is not None:
+        xor = np.bitwise_xor(xor, np.frombuffer(base_frame, dtype=np.uint8))
+
+    return _encode_spans(xor)
+
+
+def decode_delta(payload: bytes, base_frame: bytes = None, size: int = None) -> bytes:
+    """Apply a delta to base_frame (or to a black frame of size bytes)."""
+    if base_frame is None:
+        return _decode_spans(payload, size or 0).tobytes()
+
+    base = np.frombuffer(base_frame, dtype=np.uint8)
+    xor = _decode_spans(payload, len(base))
+    if len(xor) > len(base):
+        raise ValueError("Delta is larger than the frame.")
+
+    return np.bitwise_xor(base, xor).tobytes()
+
+
+def merge_deltas(old_payload: bytes, new_payload: bytes) -> bytes:
+    """Return one delta which has the same effect as both deltas."""
+    old_xor = _decode_spans(old_payload)
+    new_xor = _decode_spans(new_payload, len(old_xor))
+    new_xor[:len(old_xor)] ^= old_xor
+    return _encode_spans(new_xor)
+
+
+def merge_frame(old_kwargs: dict, old_rawbytes: bytes, kwargs: dict, rawbytes: bytes) -> tuple:
+    """Merge a pending frame into the frame which supersedes it.
+
+    Used as merge_frame in BcpSendQueue.put_latest. Returns kwargs and
+    rawbytes of the frame to send.
+    """
+    if kwargs.get('encoding') != DELTA or kwargs['base'] < 0:
+        # the new frame does not depend on the pending one
+        return kwargs, rawbytes
+
+    if old_kwargs.get('encoding') != DELTA:
+        # apply the delta to the pending full frame
+        kwargs = {key: value for key, value in kwargs.items() if key not in ('encoding', 'base')}
+        return kwargs, decode_delta(rawbytes, old_rawbytes)
+
+    kwargs = dict(kwargs)
+    kwargs['base'] = old_kwargs['base']
+    return kwargs, merge_deltas(old_rawbytes, rawbytes)
+
+
+class DmdFrameEncoder:
+
+    """Encodes the frames of one DMD.
+
+    Args:
+        keyframe_interval: Every keyframe_interval frames a keyframe is sent
+            so clients which missed a frame can recover.
+    """
+
+    def __init__(self, keyframe_interval: int = 30) -> None:
+        self.keyframe_interval = keyframe_interval
+        self.frame_number = 0
+        self._base_frame = None
+        self._frames_since_keyframe = 0
+
+    def reset(self) -> None:
+        """Start with a keyframe again (e.g. after a frame has been dropped)."""
+        self._base_frame = None
+
+    def encode(self, frame: bytes) -> tuple:
+        """Return the kwargs and the payload to send for a frame."""
+        self.frame_number += 1
+        base_frame = self._base_frame
+        if base_frame is not None and (self._frames_since_keyframe >= self.keyframe_interval or
+                                       len(base_frame) != len(frame)):
+            base_frame = None
+
+        self._base_frame = frame
+        payload = encode_delta(frame, base_frame)
+
+        if len(payload) >= len(frame):
+            self._frames_since_keyframe = 0
+            return {'frame': self.frame_number}, frame
+
+        if base_frame is None:
+            self._frames_since_keyframe = 0
+            base = -1
+        else:
+            self._frames_since_keyframe += 1
+            base = self.frame_number - 1
+
+        return {'encoding': DELTA, 'frame': self.frame_number, 'base': base}, payload
+
+
+class DmdFrameDecoder:
+
+    """Reference decoder for the frames of one DMD.
+
+    Args:
+        size: Number of bytes of a frame (e.g. width * height for a
+            monochrome DMD).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.frame = None
+        self.frame_number = None
+
+    def decode(self, rawbytes: bytes, encoding: str = None, frame: int = None, base: int = None, **kwargs):
+        """Decode a received frame.
+
+        Returns the complete frame or None if the frame depends on a frame
+        which has not been received. In that case the decoder waits for the
+        next keyframe.
+        """
+        del kwargs
+        if encoding is None:
+            self.frame = bytes(rawbytes)
+        elif encoding == DELTA:
+            if base < 0:
+                self.frame = decode_delta(rawbytes, size=self.size)
+            elif self.frame is not None and base == self.frame_number:
+                self.frame = decode_delta(rawbytes, self.frame)
+            else:
+                self.frame = None
+                self.frame_number = None
+                return None
+        else:
+            raise ValueError("Unknown frame encoding {}".format(encoding))
+
+        self.frame_number = frame
+        return self.frame
@@ -0,0 +1,166 @@
+"""Memory mapped ring of DMD frames for local hardware drivers."""
+import mmap
+import struct
+import time
+
+# magic, version, number of slots, slot size, width, height, channels, sequence of the latest frame
+_HEADER = struct.Struct('<8sIIIIIIQ')
+_SEQUENCE = struct.Struct('<Q')
+_SEQUENCE_OFFSET = 32
+HEADER_SIZE = 64
+MAGIC = b'MPFDMDFS'
+VERSION = 1
+
+# sequence, time (ns since the epoch), length of the frame, bits per pixel (8, 4 or 2)
+_SLOT_HEADER = struct.Struct('<QQII')
+SLOT_HEADER_SIZE = 32
+ALIGNMENT = 64
+
+
+class DmdFrameSink:
+
+    """Writes DMD frames into a ring of slots in a memory mapped file.
+
+    A driver on the same machine can map the file and use the frames without
+    copying them (see DmdFrameSinkReader).
+
+    The file starts with a header (see _HEADER) which contains the sequence
+    number of the latest complete frame. Frame n (starting at 1) is stored in
+    slot (n - 1) % slots. Every slot starts with a slot header (see
+    _SLOT_HEADER) followed by the frame. The sequence of a slot is set to 0
+    while the slot is written and to the sequence of the frame afterwards.
+    A reader which sees the same sequence in the slot before and after using
+    the frame got a consistent frame.
+
+    Args:
+        path: Path of the file (e.g. in /dev/shm). It will be overwritten.
+        width: Width of the DMD.
+        height: Height of the DMD.
+        channels: 1 for monochrome and 3 for RGB DMDs.
+        slots: Number of frames in the ring.
+    """
+
+    def __init__(self, path, width, height, channels=1, slots=4):
+        self.path = path
+        self.slots = slots
+        self.slot_size = (SLOT_HEADER_SIZE + width * height * channels + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+        self.sequence = 0
+
+        size = HEADER_SIZE + slots * self.slot_size
+        with open(path, 'wb') as sink_file:
+            sink_file.truncate(size)
+        self._file = open(path, 'r+b')      # pylint: disable-msg=consider-using-with
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+
+        # the magic is written last so readers never see a half initialized file
+        _HEADER.pack_into(self._mmap, 0, b'\x00' * 8, VERSION, slots, self.slot_size, width, height, channels, 0)
+        self._mmap[0:8] = MAGIC
+
+    def write(self, frame: bytes, bits: int = 8) -> int:
+        """Write a frame into the next slot and return its sequence."""
+        sequence = self.sequence + 1
+        offset = HEADER_SIZE + (sequence - 1) % self.slots * self.slot_size
+        if SLOT_HEADER_SIZE + len(frame) > self.slot_size:
+            raise ValueError("Frame with {} bytes does not fit into the frame sink.".format(len(frame)))
+
+        # invalidate the slot while it is written
+        _SEQUENCE.pack_into(self._mmap, offset, 0)
+        data_offset = offset + SLOT_HEADER_SIZE
+        self._mmap[data_offset:data_offset + len(frame)] = frame
+        _SLOT_HEADER.pack_into(self._mmap, offset, sequence, time.time_ns(), len(frame), bits)
+        _SEQUENCE.pack_into(self._mmap, _SEQUENCE_OFFSET, sequence)
+
+        self.sequence = sequence
+        return sequence
+
+    def close(self):
+        """Unmap and close the file. The file stays for the readers."""
+        if self._mmap:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+
+
+class DmdFrameSinkReader:
+
+    """Reference reader for a DmdFrameSink.
+
+    Usage:
+
+        reader = DmdFrameSinkReader(path)
+        frame = reader.wait_for_frame(timeout=1)
+        if frame:
+            sequence, data, bits = frame
+            send_to_hardware(data)      # data is a memoryview into the file
+            if not reader.is_valid(sequence):
+                # the writer overwrote the slot in the meantime
+                ...
+
+    Args:
+        path: Path of the file which has been created by DmdFrameSink.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')       # pylint: disable-msg=consider-using-with
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, self.slots, self.slot_size, self.width, self.height, self.channels, _ = \
+            _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("{} is not a DMD frame sink (version {}).".format(path, VERSION))
+
+        self.last_sequence = 0
+        self.missed_frames = 0
+
+    def _get_offset(self, sequence):
+        return HEADER_SIZE + (sequence - 1) % self.slots * self.slot_size
+
+    def get_latest_sequence(self) -> int:
+        """Return the sequence of the latest complete frame (0 if none)."""
+        return _SEQUENCE.unpack_from(self._mmap, _SEQUENCE_OFFSET)[0]
+
+    def is_valid(self, sequence) -> bool:
+        """Return true if the frame has not been overwritten yet."""
+        return _SEQUENCE.unpack_from(self._mmap, self._get_offset(sequence))[0] == sequence
+
+    def read_frame(self):
+        """Return (sequence, data, bits) of the latest frame or None if there is no new one.
+
+        data is a memoryview into the file. Use is_valid after using it.
+        """
+        sequence = self.get_latest_sequence()
+        if not sequence or sequence == self.last_sequence:
+            return None
+
+        offset = self._get_offset(sequence)
+        slot_sequence, _, length, bits = _SLOT_HEADER.unpack_from(self._mmap, offset)
+        if slot_sequence != sequence:
+            # overwritten already. try again.
+            return None
+
+        if self.last_sequence:
+            self.missed_frames += sequence - self.last_sequence - 1
+        self.last_sequence = sequence
+        data_offset = offset + SLOT_HEADER_SIZE
+        return sequence, self._view[data_offset:data_offset + length], bits
+
+    def wait_for_frame(self, timeout=None, interval=.0005):
+        """Poll for a new frame. Returns None on timeout."""
+        end_time = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            frame = self.read_frame()
+            if frame:
+                return frame
+            if end_time is not None and time.monotonic() > end_time:
+                return None
+            time.sleep(interval)
+
+    def close(self):
+        """Unmap and close the file."""
+        if self._mmap:
+            self._view.release()
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+
@@ -241,7 +241,8 @@ class MpfMc(App):
         del kwargs
         self.create_dmds()
         self.create_rgb_dmds()
-        self.events.remove_all_handlers_for_event("client_connected")
+        # other handlers (e.g. the BCP processor) run for every new client
+        self.events.remove_handler(self._create_dmds)
 
     def _load_font_paths(self):
         # Add local machine fonts path
@@ -0,0 +1,104 @@
+from kivy.uix.effectwidget import EffectBase
+from kivy.properties import NumericProperty, StringProperty, ListProperty
+
+
+class DmdOutputEffect(EffectBase):
+    """GLSL effect which converts a texture to the pixel format of a physical
+    DMD.
+
+    Brightness and gamma are applied first. RGB DMDs then get their channels
+    in channel_order. For monochrome DMDs (luminosity is set) every pixel is
+    converted to a shade between 0 and max_shade and three pixels are packed
+    into the RGB channels of one output pixel. This way only a third of the
+    width has to be read back and the bytes can be sent as they are.
+
+    Args:
+        brightness: Float which is multiplied by each color channel.
+        gamma: Gamma which is applied after the brightness.
+        channel_order: Order of the color channels for RGB DMDs.
+        luminosity: Factors for each color channel for monochrome DMDs. Leave
+            it empty for RGB DMDs.
+        max_shade: Highest shade of monochrome DMDs. Use 255 to get the full
+            luminosity (e.g. for dithering on the CPU).
+
+    """
+
+    brightness = NumericProperty(1.0)
+    gamma = NumericProperty(1.0)
+    channel_order = StringProperty('rgb')
+    luminosity = ListProperty([])
+    max_shade = NumericProperty(15)
+
+    # number of monochrome pixels which are packed into one output pixel
+    PIXELS_PER_TEXEL = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.do_glsl()
+
+    def on_brightness(self, *args):
+        self.do_glsl()
+
+    def on_gamma(self, *args):
+        self.do_glsl()
+
+    def on_channel_order(self, *args):
+        self.do_glsl()
+
+    def on_luminosity(self, *args):
+        self.do_glsl()
+
+    def on_max_shade(self, *args):
+        self.do_glsl()
+
+    def _get_adjust_glsl(self):
+        adjust = 'rgb'
+        if self.brightness != 1.0:
+            adjust = '({} * {})'.format(adjust, float(self.brightness))
+        if self.gamma != 1.0:
+            adjust = 'pow({}, vec3({}))'.format(adjust, float(self.gamma))
+        return adjust
+
+    def do_glsl(self):
+        if self.luminosity:
+            self.glsl = dmd_output_mono_glsl.format(self._get_adjust_glsl(),
+                                                    float(self.luminosity[0]),
+                                                    float(self.luminosity[1]),
+                                                    float(self.luminosity[2]),
+                                                    float(self.max_shade))
+        else:
+            if len(self.channel_order) != 3 or set(self.channel_order) - set('rgb'):
+                raise ValueError("Invalid channel order {}".format(self.channel_order))
+            self.glsl = dmd_output_rgb_glsl.format(self._get_adjust_glsl(), self.channel_order)
+
+
+dmd_output_rgb_glsl = '''
+vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
+{{
+    vec3 rgb = color.rgb;
+    rgb = {0};
+    return vec4(rgb.{1}, 1.0);
+}}
+'''
+
+dmd_output_mono_glsl = '''
+float dmd_shade(sampler2D source, vec2 pos)
+{{
+    vec3 rgb = texture2D(source, pos).rgb;
+    rgb = {0};
+    return floor(dot(rgb, vec3({1}, {2}, {3})) * {4} + 0.5) / 255.0;
+}}
+
+vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
+{{
+    float dx = 1.0 / resolution.x;
+    float x = (floor(coords.x) * 3.0 + 0.5) * dx;
+    return vec4(dmd_shade(texture, vec2(x, tex_coords.y)),
+                dmd_shade(texture, vec2(x + dx, tex_coords.y)),
+                dmd_shade(texture, vec2(x + 2.0 * dx, tex_coords.y)),
+                1.0);
+}}
+'''
+
+effect_cls = DmdOutputEffect
+name = 'dmd_output'
@@ -120,8 +120,8 @@ class MpfMcTestCase(unittest.TestCase):
         # used for commands sent from the MC to the PC
         # print((bcp_command, callback, kwargs))
         self.sent_bcp_commands.append((bcp_command, callback, kwargs))
-        self.orig_bcp_send(bcp_command=bcp_command, callback=callback,
-                           **kwargs)
+        return self.orig_bcp_send(bcp_command=bcp_command, callback=callback,
+                                  **kwargs)
 
     def setUp(self):
         # Most of the setup is done in run(). Explanation is there.
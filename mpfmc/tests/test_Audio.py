@@ -1,4 +1,6 @@
 import logging
+import os
+import tempfile
 
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 from unittest.mock import MagicMock, call, ANY
@@ -1059,3 +1061,91 @@ class TestAudio(MpfMcTestCase):
         self.send(bcp_command='mode_stop', name='mode1')
         self.assertFalse(self.mc.modes['mode1'].active)
         self.advance_real_time()
+
+    def test_sound_requests_before_mixing(self):
+        """ Tests sounds which are stopped before the mixer picked up their play request """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertIsNotNone(track_sfx)
+        self.advance_real_time()
+
+        self.assertIn('210871_synthping', self.mc.sounds)  # .wav
+        synthping = self.mc.sounds['210871_synthping']
+        if not synthping.loaded:
+            if not synthping.loading:
+                synthping.load()
+            self.advance_real_time(1)
+
+        # Play and stop in the same frame. The stop request follows the play
+        # request and the player is released once the mixer confirmed it.
+        instance1 = track_sfx.play_sound(synthping, context=None, settings={'loops': -1})
+        instance2 = track_sfx.play_sound(synthping, context=None, settings={'loops': -1})
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 2)
+        instance1.stop(0)
+        self.advance_real_time(0.2)
+
+        self.assertTrue(instance1.finished)
+        self.assertTrue(instance2.playing)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 1)
+
+        track_sfx.stop_all_sounds()
+        self.advance_real_time(0.2)
+        self.assertTrue(instance2.finished)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 0)
+
+    def test_timing_stats(self):
+        """ Tests the timing statistics of the audio callback and the tracks """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        interface.reset_timing_stats()
+        self.advance_real_time(0.5)
+
+        stats = interface.get_timing_stats()
+        self.assertAlmostEqual(stats['period'], 2048 / 44100 * 1000, 2)
+        self.assertGreater(stats['callback']['count'], 0)
+        for name in ('callback', 'mix'):
+            timing = stats[name]
+            self.assertLessEqual(timing['min'], timing['mean'])
+            self.assertLessEqual(timing['mean'], timing['max'])
+            self.assertLessEqual(timing['p99'], timing['max'])
+            self.assertGreaterEqual(timing['period_share'], 0)
+            self.assertIn('missed_deadlines', timing)
+        self.assertEqual(set(stats['tracks'].keys()), {'music', 'sfx', 'voice'})
+        self.assertIn('count', interface.get_track_by_name("sfx").get_mix_timing())
+
+        settings = interface.get_settings()
+        self.assertIn('callback_timing', settings)
+        self.assertIn('mix_timing', settings)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "histogram.csv")
+            interface.write_timing_histogram(file_name)
+            with open(file_name) as histogram_file:
+                lines = histogram_file.read().splitlines()
+        self.assertEqual(lines[0].split(',')[:4], ['from', 'to', 'callback', 'mix'])
+        self.assertEqual(len(lines), 97)
+        self.assertLessEqual(sum(int(line.split(',')[2]) for line in lines[1:]),
+                             interface.get_timing_stats()['callback']['count'])
@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestAudioLowLatency(MpfMcTestCase):
+    """
+    Tests the low-latency mode (small buffer which is mixed ahead by the premix thread). The dummy
+    audio driver of SDL takes the buffers in real time, so no audio device is needed.
+    """
+
+    buffer_samples = 256
+    premix_periods = 4
+
+    def setUp(self):
+        self.addCleanup(self._restore_audio_driver, os.environ.get('SDL_AUDIODRIVER'))
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        super().setUp()
+
+    @staticmethod
+    def _restore_audio_driver(audio_driver):
+        if audio_driver is None:
+            os.environ.pop('SDL_AUDIODRIVER', None)
+        else:
+            os.environ['SDL_AUDIODRIVER'] = audio_driver
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_low_latency.yaml'
+
+    def test_premix_without_underruns(self):
+        """ Tests that a small buffer plays without underruns while the main thread is busy """
+
+        if self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        settings = interface.get_settings()
+        self.assertIsNotNone(settings)
+        self.assertEqual(settings['buffer_samples'], self.buffer_samples)
+        self.assertEqual(settings['premix_periods'], self.premix_periods)
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertIsNotNone(track_sfx)
+        track_loops = interface.get_track_by_name("loops")
+        self.assertIsNotNone(track_loops)
+        self.advance_real_time()
+
+        for sound_name in ('198361_sfx-028', '210871_synthping', '4832__zajo__drum07',
+                           '84480__zgump__drum-fx-4', '100184__menegass__rick-drum-bd-hard'):
+            self.assertIn(sound_name, self.mc.sounds)
+            self.assertTrue(self.mc.sounds[sound_name].loaded)
+            track_sfx.play_sound(self.mc.sounds[sound_name], context=None, settings={'loops': -1})
+        track_loops.play_sound_loop_set(self.mc.sound_loop_sets['basic_beat_layers'])
+        self.advance_real_time(0.1)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 5)
+        self.assertEqual(track_loops.get_status()[0]['status'], 'playing')
+
+        # Keep the main thread (and the GIL) busy and take the mixer lock over and over (like the
+        # processing of the tracks on every tick). The premix thread needs neither and the audio
+        # callback only copies the buffers it has mixed.
+        periods_mixed = interface.get_settings()['premix_periods_mixed']
+        end_time = time.time() + 1.0
+        while time.time() < end_time:
+            interface.process()
+            track_sfx.get_status()
+            track_loops.get_status()
+            sum(i * i for i in range(1000))
+
+        settings = interface.get_settings()
+        self.assertEqual(settings['premix_underruns'], 0)
+        # about 172 buffers of 256 samples (86 of 512 samples) per second
+        self.assertGreater(settings['premix_periods_mixed'] - periods_mixed, 0.85 * 44100 / self.buffer_samples)
+
+        track_loops.stop_current_sound_loop_set()
+        track_sfx.stop_all_sounds()
+        self.advance_real_time(0.1)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 0)
+
+    def test_premix_thread_restart(self):
+        """ Tests that the premix thread stops cleanly and that sounds play after it has been restarted """
+
+        if self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertIsNotNone(track_sfx)
+        self.advance_real_time()
+        self.assertTrue(interface.premix_thread_running)
+
+        # disabling playback joins the premix thread
+        track_sfx.play_sound(self.mc.sounds['210871_synthping'], context=None, settings={'loops': -1})
+        self.advance_real_time(0.1)
+        interface.disable()
+        self.assertFalse(interface.enabled)
+        self.assertFalse(interface.premix_thread_running)
+
+        interface.enable()
+        self.assertTrue(interface.premix_thread_running)
+        periods_mixed = interface.get_settings()['premix_periods_mixed']
+
+        track_sfx.play_sound(self.mc.sounds['210871_synthping'], context=None, settings={'loops': -1})
+        self.advance_real_time(0.1)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 1)
+        self.assertGreater(interface.get_settings()['premix_periods_mixed'], periods_mixed)
+
+        track_sfx.stop_all_sounds()
+        self.advance_real_time(0.1)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 0)
+
+
+class TestAudioLowLatency512(TestAudioLowLatency):
+    """
+    Tests the low-latency mode with a 512 sample buffer and two buffers which are mixed ahead
+    """
+
+    buffer_samples = 512
+    premix_periods = 2
+
+    def get_config_file(self):
+        return 'test_audio_low_latency_512.yaml'
@@ -0,0 +1,96 @@
+import random
+import struct
+import unittest
+from array import array
+
+try:
+    from mpfmc.core.audio.track import mix_samples, apply_volume_to_samples, float_samples_to_output
+except ImportError:
+    mix_samples = None
+    apply_volume_to_samples = None
+    float_samples_to_output = None
+
+SDL_MIX_MAXVOLUME = 128
+
+
+def mix_per_sample(output_buffer, input_buffer, volume_left, volume_right=-1, mix=True):
+    """Reference which processes one sample at a time like the previous byte-wise mixing functions."""
+    count = len(output_buffer) // 2
+    output_samples = struct.unpack('<{}h'.format(count), output_buffer)
+    input_samples = struct.unpack('<{}h'.format(count), input_buffer)
+    result = []
+    for position, (output_sample, input_sample) in enumerate(zip(output_samples, input_samples)):
+        volume = volume_left if volume_right < 0 or position % 2 == 0 else volume_right
+        sample = (input_sample * volume) // SDL_MIX_MAXVOLUME
+        if mix:
+            sample = min(max(output_sample + sample, -32768), 32767)
+        result.append(sample)
+
+    return bytearray(struct.pack('<{}h'.format(count), *result))
+
+
+@unittest.skipIf(mix_samples is None, "mpfmc.core.audio library could not be loaded")
+class TestAudioMixing(unittest.TestCase):
+
+    def _get_buffer(self, rand, samples):
+        # include the extreme values to check clipping and rounding of negative samples
+        values = [rand.choice((-32768, 32767, -1, 1, rand.randint(-32768, 32767))) for _ in range(samples)]
+        return bytearray(struct.pack('<{}h'.format(samples), *values))
+
+    def test_mix_samples(self):
+        rand = random.Random(20)
+        for volume_left, volume_right in ((128, -1), (0, -1), (77, -1), (128, 0), (5, 128), (100, 33)):
+            output_buffer = self._get_buffer(rand, 512)
+            input_buffer = bytes(self._get_buffer(rand, 512))
+
+            expected = mix_per_sample(output_buffer, input_buffer, volume_left, volume_right)
+            mix_samples(output_buffer, input_buffer, volume_left, volume_right)
+            self.assertEqual(expected, output_buffer)
+
+    def test_apply_volume_to_samples(self):
+        rand = random.Random(21)
+        for volume_left, volume_right in ((128, -1), (1, -1), (64, 127)):
+            input_buffer = bytes(self._get_buffer(rand, 512))
+            output_buffer = bytearray(len(input_buffer))
+
+            expected = mix_per_sample(output_buffer, input_buffer, volume_left, volume_right, mix=False)
+            apply_volume_to_samples(output_buffer, input_buffer, volume_left, volume_right)
+            self.assertEqual(expected, output_buffer)
+
+            # in place (like the master volume)
+            buffer = bytearray(input_buffer)
+            apply_volume_to_samples(buffer, buffer, volume_left, volume_right)
+            self.assertEqual(expected, buffer)
+
+        with self.assertRaises(ValueError):
+            mix_samples(bytearray(4), bytes(2), 128)
+
+    def _float_to_output(self, values, gain=1.0, soft_limiter=False):
+        output_buffer = bytearray(len(values) * 2)
+        float_samples_to_output(output_buffer, array('f', values), gain, soft_limiter)
+        return list(struct.unpack('<{}h'.format(len(values)), output_buffer))
+
+    def test_float_samples_to_output(self):
+        # the float mix bus is only clipped at the output
+        values = [-70000, -32769, -32768, -1000, 0, 1000, 32767, 32768, 70000]
+        self.assertEqual([-32768, -32768, -32768, -1000, 0, 1000, 32767, 32767, 32767],
+                         self._float_to_output(values))
+        self.assertEqual([-32768, -16384, -16384, -500, 0, 500, 16383, 16384, 32767],
+                         self._float_to_output(values, gain=0.5))
+
+        with self.assertRaises(ValueError):
+            float_samples_to_output(bytearray(4), array('f', [0.0]))
+
+    def test_soft_limiter(self):
+        # samples below the threshold are not changed
+        values = [-24576, -12345, -1, 0, 1, 12345, 24576]
+        self.assertEqual(values, self._float_to_output(values, soft_limiter=True))
+
+        # louder samples are compressed smoothly and never clip
+        values = list(range(24576, 200000, 250))
+        output = self._float_to_output(values, soft_limiter=True)
+        self.assertEqual(output, sorted(output))
+        self.assertLess(output[-1], 32767)
+        self.assertGreater(output[-1], 32000)
+        self.assertEqual([-sample for sample in output],
+                         self._float_to_output([-value for value in values], soft_limiter=True))
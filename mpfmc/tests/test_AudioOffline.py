@@ -0,0 +1,218 @@
+import logging
+import os
+import tempfile
+import wave
+from array import array
+
+from mpf.exceptions.config_file_error import ConfigFileError
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestAudioOffline(MpfMcTestCase):
+    """
+    Tests rendering audio with the offline output (no audio device)
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def _render_scenario(self, interface, file_name):
+        track_loops = interface.get_track_by_name("loops")
+        track_sfx = interface.get_track_by_name("sfx")
+        scenario = [
+            (0.0, lambda: track_loops.play_sound_loop_set(self.mc.sound_loop_sets['hi_hat'])),
+            (0.5, lambda: track_sfx.play_sound(self.mc.sounds['210871_synthping'], None, {'volume': 0.8})),
+            (1.5, lambda: track_loops.stop_current_sound_loop_set(0)),
+        ]
+        frames = interface.render_to_wav(file_name, scenario, 2.0)
+
+        # let everything stop before the next scenario
+        track_sfx.stop_all_sounds()
+        interface.render(50)
+        return frames
+
+    def test_mc_settings(self):
+        """ Tests that the settings of the MC are in the sound_system spec and are validated """
+
+        if self.mc.sound_system is None:
+            self.skipTest("Sound system is not enabled")
+
+        spec = self.mc.config_validator.get_config_spec()['sound_system']
+        sound_system = self.mc.sound_system
+        for key in ('mix_format', 'soft_limiter', 'premix_periods', 'timing_histogram_file', 'output'):
+            self.assertIn(key, spec)
+        self.assertEqual(sound_system.config['mix_format'], 'int16')
+        self.assertFalse(sound_system.config['soft_limiter'])
+        self.assertEqual(sound_system.config['premix_periods'], 0)
+        self.assertIsNone(sound_system.config['timing_histogram_file'])
+        self.assertEqual(sound_system.config['output'], 'offline')
+
+        sound_system.config['mix_format'] = 'float32'
+        with self.assertRaises(ConfigFileError):
+            sound_system._validate_mc_settings()
+        sound_system.config['mix_format'] = 'int16'
+
+        # the premix thread needs an audio device
+        sound_system.config['premix_periods'] = 2
+        with self.assertRaises(ValueError):
+            sound_system._validate_mc_settings()
+        sound_system.config['premix_periods'] = -1
+        with self.assertRaises(ValueError):
+            sound_system._validate_mc_settings()
+        sound_system.config['premix_periods'] = 0
+
+    def test_timing_histogram_file(self):
+        """ Tests that the timing histogram is written to timing_histogram_file with the debug dump """
+
+        if self.mc.sound_system is None or self.mc.sound_system.audio_interface is None:
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        interface.reset_timing_stats()
+        interface.render(20)
+
+        # offline there is no audio callback, every buffer is mixed directly
+        stats = interface.get_timing_stats()
+        self.assertEqual(stats['callback']['count'], 0)
+        self.assertEqual(stats['mix']['count'], 20)
+        self.assertEqual(set(stats['tracks'].keys()), {'loops', 'sfx'})
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "histogram.csv")
+            self.mc.sound_system.config['timing_histogram_file'] = file_name
+            self.mc.events.post('debug_dump_stats')
+            self.advance_time()
+
+            with open(file_name) as histogram_file:
+                lines = histogram_file.read().splitlines()
+
+        self.assertEqual(lines[0].split(','), ['from', 'to', 'callback', 'mix', 'track_loops', 'track_sfx'])
+        self.assertEqual(len(lines), 97)
+        self.assertEqual(sum(int(line.split(',')[3]) for line in lines[1:]), 20)
+
+    def test_request_ring_overflow(self):
+        """ Tests that requests which do not fit into a full request ring are reported """
+
+        if self.mc.sound_system is None or self.mc.sound_system.audio_interface is None:
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        synthping = self.mc.sounds['210871_synthping']
+        retry_count = 10
+        while not synthping.loaded and retry_count:
+            self.advance_real_time(0.5)
+            retry_count -= 1
+
+        instance = track_sfx.play_sound(synthping, None, {'loops': -1})
+        interface.render(1)
+        self.assertTrue(instance.playing)
+
+        # the mixer only takes requests while rendering so the ring (256 requests) fills up
+        with self.assertLogs(level='WARNING') as logs:
+            for _ in range(300):
+                track_sfx.stop_sound_instance_looping(instance)
+        dropped = [line for line in logs.output if "The request ring of track sfx is full" in line]
+        self.assertEqual(len(dropped), 300 - 256)
+
+        # once the mixer took the requests new ones are accepted again
+        interface.render(1)
+        track_sfx.stop_sound_instance(instance, 0)
+        interface.render(2)
+        self.assertTrue(instance.finished)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 0)
+
+    def test_stop_all_sounds(self):
+        """ Tests that the sound players are stopped when stop_all_sounds returns """
+
+        if self.mc.sound_system is None or self.mc.sound_system.audio_interface is None:
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        synthping = self.mc.sounds['210871_synthping']
+        retry_count = 10
+        while not synthping.loaded and retry_count:
+            self.advance_real_time(0.5)
+            retry_count -= 1
+
+        instances = [track_sfx.play_sound(synthping, None, {'loops': -1}) for _ in range(3)]
+        interface.render(1)
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 3)
+
+        # a play request which the mixer has not taken yet is stopped as well
+        instances.append(track_sfx.play_sound(synthping, None, {'loops': -1}))
+
+        # no buffer is mixed in between (as when the audio callback is not running)
+        track_sfx.stop_all_sounds()
+        for status in track_sfx.get_status():
+            self.assertEqual(status['status'], 'idle')
+
+        # the players are free again once the notifications have been processed
+        self.advance_time()
+        self.assertEqual(track_sfx.get_sound_players_in_use_count(), 0)
+        for instance in instances:
+            self.assertTrue(instance.finished)
+
+    def test_render_scenario(self):
+        """ Tests that a scenario renders the same audio every time """
+
+        if self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        self.assertIsNotNone(self.mc.sound_system)
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        settings = interface.get_settings()
+        self.assertIsNotNone(settings)
+        self.assertEqual(settings['buffer_samples'], 512)
+        self.assertEqual(settings['sample_rate'], 44100)
+        self.assertEqual(settings['audio_channels'], 2)
+
+        retry_count = 10
+        while not (self.mc.sounds['hihat'].loaded and self.mc.sounds['210871_synthping'].loaded) and retry_count:
+            self.advance_real_time(0.5)
+            retry_count -= 1
+
+        # MPF sets the master volume (0 until then)
+        self.send(bcp_command='machine_variable', name='master_volume', value=1.0)
+        self.advance_time()
+        self.assertEqual(self.mc.sound_system.master_volume, 1.0)
+
+        # nothing plays yet
+        start_time = interface.get_render_time()
+        self.assertEqual(interface.render(2), bytes(2 * settings['buffer_size']))
+        self.assertAlmostEqual(interface.get_render_time() - start_time, 2 * 512 / 44100)
+
+        with tempfile.TemporaryDirectory() as directory:
+            outputs = []
+            for run in range(2):
+                file_name = os.path.join(directory, "scenario{}.wav".format(run))
+                frames = self._render_scenario(interface, file_name)
+                self.assertEqual(frames, 173 * 512)
+
+                with wave.open(file_name, 'rb') as wav_file:
+                    self.assertEqual(wav_file.getnchannels(), 2)
+                    self.assertEqual(wav_file.getsampwidth(), 2)
+                    self.assertEqual(wav_file.getframerate(), 44100)
+                    self.assertEqual(wav_file.getnframes(), frames)
+                    outputs.append(wav_file.readframes(frames))
+
+        # both runs are identical and not silent
+        self.assertEqual(outputs[0], outputs[1])
+        samples = array('h', outputs[0])
+        self.assertGreater(max(abs(sample) for sample in samples), 1000)
+
+        # the loop stops at 1.5s (after its fade) and the synth ping is short
+        self.assertEqual(interface.render(10), bytes(10 * settings['buffer_size']))
@@ -0,0 +1,72 @@
+import random
+import unittest
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+from mpfmc.core.bcp_decoder import decode_command_string, get_decoder_stats
+
+
+class TestBcpDecoder(unittest.TestCase):
+
+    MESSAGES = [
+        'hello',
+        'hello?version=1.1&controller_name=Mission%20Pinball%20Framework',
+        'trigger?name=ball_started',
+        'trigger?name=foo&num=int:3&ratio=float:0.5&flag=bool:True&off=bool:false&nothing=NoneType:',
+        'player_variable?name=score&value=int:1000&prev_value=int:0&change=int:1000&player_num=int:1',
+        'machine_variable?name=credits_string&value=1%20CREDIT&prev_value=&change=bool:True',
+        'trigger?name=a+b&text=100%25',
+        'trigger?name=double%2520quoted',
+        'trigger?name=first&name=second',
+        'trigger?name=&blank&&=empty_name',
+        'trigger?name=x;y',
+        'trigger?name=caf%C3%A9',
+        'trigger?name=café',
+        'mode_start?name=attract&priority=int:10',
+        'settings?json={"settings": [["a", 1], ["b", {"c": 2}]]}',
+        'trigger?json={"name": "foo", "values": {"l1": [1, 2, 3]}}',
+    ]
+
+    def test_identical_to_mpf(self):
+        for message in self.MESSAGES:
+            self.assertEqual(bcp.decode_command_string(message), decode_command_string(message), message)
+            # second time from the cache
+            self.assertEqual(bcp.decode_command_string(message), decode_command_string(message), message)
+
+    def test_random_messages(self):
+        rng = random.Random(42)
+        alphabet = 'abc_=&?:%+#;. 123int:float:bool:TrueNoneType:\t'
+        for _ in range(5000):
+            message = 'trigger?' + ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            try:
+                expected = bcp.decode_command_string(message)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    decode_command_string(message)
+                continue
+            self.assertEqual(expected, decode_command_string(message), message)
+
+    def test_returns_new_dict(self):
+        message = 'player_variable?name=score&value=int:1000'
+        _, kwargs = decode_command_string(message)
+        kwargs['value'] = 5
+        self.assertEqual(1000, decode_command_string(message)[1]['value'])
+
+        message = 'trigger?json={"name": "foo", "values": {"l1": [1, 2, 3]}}'
+        _, kwargs = decode_command_string(message)
+        kwargs['values']['l1'].append(4)
+        self.assertEqual([1, 2, 3], decode_command_string(message)[1]['values']['l1'])
+
+    def test_interning(self):
+        cmd, kwargs = decode_command_string('trigger?name=' + 'interned_test')
+        cmd2, kwargs2 = decode_command_string('trigger?name=' + 'interned_test2')
+        self.assertIs(cmd, cmd2)
+        self.assertIs(list(kwargs)[0], list(kwargs2)[0])
+
+    def test_stats(self):
+        before = get_decoder_stats()
+        decode_command_string('trigger?name=stats_test')
+        decode_command_string('trigger?name=stats_test')
+        after = get_decoder_stats()
+        self.assertEqual(before['misses'] + 1, after['misses'])
+        self.assertEqual(before['hits'] + 1, after['hits'])
@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+from mpfmc.core.bcp_latency import BcpLatencyStats, RollingHistogram
+
+
+class TestBcpLatency(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = RollingHistogram(window=10)
+        self.assertEqual({'count': 0}, histogram.get_stats())
+
+        for _ in range(98):
+            histogram.add(.00015, 1)
+        histogram.add(.003, 1)
+        histogram.add(2.5, 1)
+
+        stats = histogram.get_stats()
+        self.assertEqual(100, stats['count'])
+        self.assertEqual(0.2, stats['p50'])
+        self.assertEqual(0.2, stats['p90'])
+        self.assertEqual(5.0, stats['p99'])
+        self.assertEqual(2500.0, stats['max'])
+        self.assertAlmostEqual((98 * .15 + 3 + 2500) / 100, stats['mean'], places=3)
+
+    def test_rolling_window(self):
+        histogram = RollingHistogram(window=10)
+        histogram.add(.001, 100)
+        # the previous window is still included
+        histogram.add(.001, 111)
+        self.assertEqual(2, histogram.get_stats()['count'])
+        # now the first sample is gone
+        histogram.add(.001, 122)
+        self.assertEqual(2, histogram.get_stats()['count'])
+
+    def test_idle_expiry(self):
+        histogram = RollingHistogram(window=10)
+        histogram.add(.001, 100)
+        histogram.add(.001, 105)
+        self.assertEqual(2, histogram.get_stats(109)['count'])
+        # the window is over but still the previous one
+        self.assertEqual(2, histogram.get_stats(115)['count'])
+        # without new samples both windows expire
+        self.assertEqual({'count': 0}, histogram.get_stats(125))
+
+        histogram.add(.001, 127)
+        self.assertEqual(1, histogram.get_stats(128)['count'])
+        # a long idle time drops everything at once
+        self.assertEqual({'count': 0}, histogram.get_stats(200))
+
+    def test_stats(self):
+        latency = BcpLatencyStats()
+        self.assertEqual({}, latency.get_stats())
+
+        threads = [threading.Thread(target=lambda: [latency.add('decode', 'trigger', .0001) for _ in range(100)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        latency.add('handler', 'trigger', .002)
+        latency.add('handler', 'player_variable', .0005)
+
+        stats = latency.get_stats()
+        self.assertEqual(400, stats['decode']['trigger']['count'])
+        self.assertEqual({'trigger', 'player_variable'}, set(stats['handler']))
+        self.assertEqual({'decode': {'p99': .1, 'max': .1}, 'handler': {'p99': 2.0, 'max': 2.0}},
+                         latency.get_summary())
@@ -0,0 +1,47 @@
+import unittest
+
+from mpfmc.core.bcp_payload_ring import BcpPayloadRing
+
+
+class TestBcpPayloadRing(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = BcpPayloadRing.create(1000)
+        self.addCleanup(self.ring.close)
+        self.reader = BcpPayloadRing.attach(self.ring.name)
+        self.addCleanup(self.reader.close)
+
+    def test_write_and_read(self):
+        self.assertEqual(1000, self.reader.capacity)
+        position = self.ring.write(b'a' * 300)
+        position2 = self.ring.write(bytearray(b'b' * 300))
+        self.assertEqual(0, position)
+        self.assertEqual(304, position2)
+        self.assertEqual(b'a' * 300, self.reader.read(position, 300))
+        self.assertEqual(b'b' * 300, self.reader.read(position2, 300))
+
+        # too large
+        self.assertIsNone(self.ring.write(b'c' * 1001))
+
+    def test_payloads_do_not_wrap(self):
+        self.ring.write(b'a' * 600)
+        position = self.ring.write(b'b' * 600)
+        self.assertEqual(1000, position)
+        self.assertEqual(b'b' * 600, self.reader.read(position, 600))
+
+    def test_detect_overwritten_payloads(self):
+        position = self.ring.write(b'a' * 400)
+        self.ring.write(b'b' * 400)
+        self.assertEqual(b'a' * 400, self.reader.read(position, 400))
+        self.ring.write(b'c' * 400)
+        self.assertIsNone(self.reader.read(position, 400))
+
+        # positions which have not been written yet are invalid as well
+        self.assertIsNone(self.reader.read(5000, 100))
+
+    def test_same_payload_is_written_once(self):
+        payload = b'a' * 400
+        position = self.ring.write(payload)
+        self.assertEqual(position, self.ring.write(payload))
+        self.assertEqual(1, self.ring.writes)
+        self.assertNotEqual(position, self.ring.write(bytearray(payload)))
@@ -93,3 +93,152 @@ class TestBcpProcessor(MpfMcTestCase):
         self.advance_time()
         self.callback.assert_called_with(value='10', prev_value='0',
                                          change='10')
+
+    def test_status_request(self):
+        self.send('status_request')
+        bcp_command, _, kwargs = self.sent_bcp_commands[-1]
+        self.assertEqual('status_report', bcp_command)
+        # MPF only accepts these three
+        self.assertEqual({'cpu', 'rss', 'vms'}, set(kwargs.keys()))
+
+        self.send('status_request', stats=True)
+        bcp_command, _, kwargs = self.sent_bcp_commands[-1]
+        self.assertEqual('status_report', bcp_command)
+        self.assertEqual(0, kwargs['frames_dropped'])
+        self.assertEqual(0, kwargs['frames_superseded'])
+
+    def test_latency_stats(self):
+        self.send('trigger', name='latency_test')
+        self.advance_time()
+        latency = self.mc.bcp_processor.get_stats()['latency']
+        self.assertEqual(1, latency['handler']['trigger']['count'])
+
+        self.send('status_request', stats=True)
+        self.advance_time()
+        bcp_command, _, kwargs = self.sent_bcp_commands[-1]
+        self.assertEqual('status_report', bcp_command)
+        self.assertIn('handler', kwargs['latency'])
+
+    def test_frame_keys(self):
+        processor = self.mc.bcp_processor
+        self.assertEqual(('dmd_frame', 'dmd'), processor._get_frame_key('dmd_frame', {'name': 'dmd'}))
+        self.assertEqual(('rgb_dmd_frame', 'dmd'), processor._get_frame_key('rgb_dmd_frame', {'name': 'dmd'}))
+        self.assertIsNone(processor._get_frame_key('trigger', {'name': 'foo'}))
+        self.assertEqual(('display_light_player_apply', 'ctx', 'display1'),
+                         processor._get_frame_key('trigger', {'name': 'display_light_player_apply',
+                                                              'context': 'ctx', 'element': 'display1',
+                                                              'values': {}}))
+
+        merged = processor._merge_display_light_values(
+            {'name': 'display_light_player_apply', 'values': {'l1': (1, 2, 3), 'l2': -1}},
+            {'name': 'display_light_player_apply', 'values': {'l2': (4, 5, 6)}})
+        self.assertEqual({'l1': (1, 2, 3), 'l2': (4, 5, 6)}, merged['values'])
+
+    def test_order_and_budget(self):
+        processor = self.mc.bcp_processor
+        processed = []
+        processor._process_command = lambda cmd, **kwargs: processed.append((cmd, kwargs['num']))
+
+        commands = ['settings', 'player_variable', 'trigger', 'machine_variable', 'mode_start',
+                    'settings', 'trigger', 'player_variable']
+        for num, cmd in enumerate(commands):
+            processor.receive_queue.put((cmd, {'num': num, 'name': 'var'}))
+
+        processor.frame_budget = 0
+        processor._get_from_queue(0)
+
+        # commands are processed in the order they have been received. the
+        # updates of var are not coalesced across the trigger and mode_start.
+        self.assertEqual(list(enumerate(commands)), [(num, cmd) for cmd, num in processed])
+        self.assertEqual(0, processor.get_queue_depth())
+        self.assertEqual(0, processor.carried_over_frames)
+
+        # with a tiny budget only one command is processed per frame
+        processed.clear()
+        processor.frame_budget = 0.000000001
+        for num in range(3):
+            processor.receive_queue.put(('trigger', {'num': num}))
+
+        processor._get_from_queue(0)
+        self.assertEqual([('trigger', 0)], processed)
+        self.assertEqual(2, processor.get_queue_depth())
+        self.assertEqual(1, processor.carried_over_frames)
+
+        processor._get_from_queue(0)
+        processor._get_from_queue(0)
+        self.assertEqual([('trigger', 0), ('trigger', 1), ('trigger', 2)], processed)
+        self.assertEqual(0, processor.get_queue_depth())
+        self.assertEqual(2, processor.carried_over_frames)
+        self.assertEqual(3, processor.carried_over_commands)
+
+    def test_coalesce_variable_updates(self):
+        processor = self.mc.bcp_processor
+        processed = []
+        processor._process_command = lambda cmd, **kwargs: processed.append((cmd, kwargs))
+
+        processor.receive_queue.put(('player_variable', {'name': 'score', 'player_num': 1, 'value': 100,
+                                                         'prev_value': 0, 'change': 100}))
+        processor.receive_queue.put(('machine_variable', {'name': 'credits', 'value': '1 CREDIT',
+                                                          'prev_value': None, 'change': True}))
+        processor.receive_queue.put(('player_variable', {'name': 'score', 'player_num': 2, 'value': 5,
+                                                         'prev_value': 0, 'change': 5}))
+        processor.receive_queue.put(('player_variable', {'name': 'score', 'player_num': 1, 'value': 300,
+                                                         'prev_value': 100, 'change': 200}))
+        processor.receive_queue.put(('machine_variable', {'name': 'credits', 'value': '2 CREDITS',
+                                                          'prev_value': '1 CREDIT', 'change': True}))
+        processor.receive_queue.put(('player_variable', {'name': 'score', 'player_num': 1, 'value': 350,
+                                                         'prev_value': 300, 'change': 50}))
+
+        processor.frame_budget = 0
+        processor._get_from_queue(0)
+
+        self.assertEqual([
+            ('player_variable', {'name': 'score', 'player_num': 1, 'value': 350, 'prev_value': 0, 'change': 350}),
+            ('machine_variable', {'name': 'credits', 'value': '2 CREDITS', 'prev_value': None, 'change': True}),
+            ('player_variable', {'name': 'score', 'player_num': 2, 'value': 5, 'prev_value': 0, 'change': 5}),
+        ], processed)
+        self.assertEqual(3, processor.coalesced_variable_updates)
+
+        # once applied the next update is processed on its own
+        processed.clear()
+        processor.receive_queue.put(('player_variable', {'name': 'score', 'player_num': 1, 'value': 400,
+                                                         'prev_value': 350, 'change': 50}))
+        processor._get_from_queue(0)
+        self.assertEqual([('player_variable', {'name': 'score', 'player_num': 1, 'value': 400,
+                                               'prev_value': 350, 'change': 50})], processed)
+
+    def test_coalesce_variable_updates_around_triggers(self):
+        processor = self.mc.bcp_processor
+        processed = []
+        processor._process_command = lambda cmd, **kwargs: processed.append((cmd, kwargs.get('value')))
+
+        for value in (1, 2):
+            processor.receive_queue.put(('machine_variable', {'name': 'ball', 'value': value}))
+        processor.receive_queue.put(('trigger', {'name': 'ball_started'}))
+        for value in (3, 4):
+            processor.receive_queue.put(('machine_variable', {'name': 'ball', 'value': value}))
+
+        processor.frame_budget = 0
+        processor._get_from_queue(0)
+
+        # the trigger sees the value which was sent before it
+        self.assertEqual([('machine_variable', 2), ('trigger', None), ('machine_variable', 4)], processed)
+        self.assertEqual(2, processor.coalesced_variable_updates)
+        self.assertEqual({}, processor._pending_variables)
+
+    def test_coalesced_player_variable_events(self):
+        self.send('mode_start', name='game', priority='20')
+        self.send('player_added', player_num='1')
+        self.send('player_turn_start', player_num='1')
+        self.advance_time()
+
+        self.mock_event('player_score')
+        for value in (10, 20, 30):
+            self.mc.bcp_processor.receive_bcp_message(
+                'player_variable?name=score&value=int:{}&prev_value=int:{}&change=int:10&player_num=int:1'.format(
+                    value, value - 10))
+        self.advance_time()
+
+        self.assertEqual(30, self.mc.player.score)
+        self.assertEventCalled('player_score', times=1)
+        self.assertEqual(2, self.mc.bcp_processor.coalesced_variable_updates)
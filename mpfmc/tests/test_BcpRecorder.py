@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from mpfmc.core.bcp_recorder import BcpRecorder, read_recording
+
+
+class TestBcpRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'session.bcp')
+
+    def test_record_and_read(self):
+        recorder = BcpRecorder(self.path)
+        start = recorder._start
+        recorder.record('hello?version=1.1', start + .5)
+        recorder.record('trigger?name=f%C3%B6%C3%B6', start + 1.25)
+        recorder.record('player_variable?name=score&value=int:100', start + 90)
+        recorder.close()
+        # records after close are ignored
+        recorder.record('goodbye')
+
+        self.assertEqual(3, recorder.records)
+        self.assertEqual([(.5, 'hello?version=1.1'),
+                          (1.25, 'trigger?name=f%C3%B6%C3%B6'),
+                          (90, 'player_variable?name=score&value=int:100')],
+                         list(read_recording(self.path)))
+
+    def test_truncated_recording(self):
+        recorder = BcpRecorder(self.path)
+        recorder.record('hello?version=1.1')
+        recorder.record('trigger?name=foo')
+        recorder.close()
+
+        with open(self.path, 'r+b') as recording:
+            recording.truncate(os.path.getsize(self.path) - 2)
+
+        self.assertEqual(['hello?version=1.1'], [message for _, message in read_recording(self.path)])
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as recording:
+            recording.write(b'trigger?name=foo\n')
+
+        with self.assertRaises(ValueError):
+            list(read_recording(self.path))
@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+from mpfmc.core.bcp_recorder import BcpRecorder
+from mpfmc.core.bcp_replay import BcpReplay
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestBcpReplay(MpfMcTestCase):
+
+    def get_machine_path(self):
+        return 'tests/machine_files/bcp'
+
+    def get_config_file(self):
+        return 'test_bcp_processor.yaml'
+
+    def _record(self, messages):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'session.bcp')
+        recorder = BcpRecorder(path)
+        for offset, message in messages:
+            recorder.record(message, recorder._start + offset)
+        recorder.close()
+        return path
+
+    def test_fast_replay(self):
+        path = self._record([(0, 'trigger?name=replay_start'),
+                             (10, 'machine_variable?name=foo&value=int:1&prev_value=int:0&change=int:1'),
+                             (20, 'trigger?name=replay_end')])
+        self.mock_event('client_connected')
+        self.mock_event('replay_end')
+
+        replay = BcpReplay(self.mc, path, fast=True, exit_when_done=False)
+        replay._start()
+        self.advance_time(1)
+
+        self.assertEventCalled('client_connected')
+        self.assertEventCalled('replay_end')
+        self.assertEqual(1, self.mc.machine_vars['foo'])
+        self.assertEqual(3, replay.summary['commands'])
+
+    def test_original_pace(self):
+        path = self._record([(0, 'trigger?name=replay_start'),
+                             (60, 'trigger?name=replay_end')])
+        self.mock_event('replay_start')
+        self.mock_event('replay_end')
+
+        replay = BcpReplay(self.mc, path, exit_when_done=False)
+        replay._start()
+        self.advance_time(1)
+
+        # the second command is a minute away
+        self.assertEventCalled('replay_start')
+        self.assertEventNotCalled('replay_end')
+        self.assertIsNone(replay.summary)
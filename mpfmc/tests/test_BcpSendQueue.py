@@ -0,0 +1,99 @@
+import threading
+import unittest
+from queue import Empty
+
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+
+
+class TestBcpSendQueue(unittest.TestCase):
+
+    def test_ordinary_messages_keep_order(self):
+        queue = BcpSendQueue()
+        queue.put(('a', None))
+        queue.put(('b', None))
+        queue.put(('c', b'123'))
+
+        self.assertEqual(3, queue.qsize())
+        self.assertEqual(('a', None), queue.get_nowait())
+        self.assertEqual(('b', None), queue.get_nowait())
+        self.assertEqual(('c', b'123'), queue.get_nowait())
+        self.assertTrue(queue.empty())
+        with self.assertRaises(Empty):
+            queue.get_nowait()
+        with self.assertRaises(Empty):
+            queue.get(timeout=.01)
+
+    def test_latest_frame_wins(self):
+        queue = BcpSendQueue()
+        queue.put(('hello', None))
+        queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, b'1')
+        queue.put(('trigger?name=a', None))
+        queue.put_latest(('dmd_frame', 'dmd2'), 'dmd_frame', {'name': 'dmd2'}, b'x')
+        queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, b'2')
+
+        self.assertEqual(4, queue.qsize())
+        self.assertEqual(1, queue.superseded_frames)
+        self.assertEqual(('hello', None), queue.get_nowait())
+        self.assertEqual(('trigger?name=a', None), queue.get_nowait())
+        self.assertEqual(('dmd_frame?name=dmd2', b'x'), queue.get_nowait())
+        self.assertEqual(('dmd_frame?name=dmd', b'2'), queue.get_nowait())
+        self.assertTrue(queue.empty())
+
+        # once a frame has been sent the next one is queued again
+        queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, b'3')
+        self.assertEqual(('dmd_frame?name=dmd', b'3'), queue.get_nowait())
+        self.assertEqual(1, queue.superseded_frames)
+
+    def test_merge(self):
+        def merge(old_kwargs, new_kwargs):
+            values = dict(old_kwargs['values'])
+            values.update(new_kwargs['values'])
+            return {'values': values}
+
+        queue = BcpSendQueue()
+        queue.put_latest('lights', 'lights', {'values': {'a': 1, 'b': 1}}, merge=merge)
+        queue.put_latest('lights', 'lights', {'values': {'b': 2}}, merge=merge)
+        msg, _ = queue.get_nowait()
+        self.assertIn('"a": 1', msg)
+        self.assertIn('"b": 2', msg)
+
+    def test_merge_frame(self):
+        def merge_frame(old_kwargs, old_rawbytes, kwargs, rawbytes):
+            del old_kwargs
+            return kwargs, old_rawbytes + rawbytes
+
+        queue = BcpSendQueue()
+        queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'1', merge_frame=merge_frame)
+        queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'2', merge_frame=merge_frame)
+        self.assertEqual(('dmd_frame?name=dmd', b'12'), queue.get_nowait())
+
+        # entries which move to another queue keep merging
+        other_queue = BcpSendQueue()
+        queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'3', merge_frame=merge_frame)
+        other_queue.put_entry(queue.get_entry())
+        other_queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'4', merge_frame=merge_frame)
+        self.assertEqual(('dmd_frame?name=dmd', b'34'), other_queue.get_nowait())
+
+    def test_drop_frames_when_full(self):
+        queue = BcpSendQueue(max_pending=2)
+        queue.put(('a', None))
+        self.assertTrue(queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'1'))
+        # superseding a pending frame is always possible
+        self.assertTrue(queue.put_latest('dmd', 'dmd_frame', {'name': 'dmd'}, b'2'))
+        # but new frames are dropped
+        self.assertFalse(queue.put_latest('dmd2', 'dmd_frame', {'name': 'dmd2'}, b'1'))
+        # ordinary messages are never dropped
+        queue.put(('b', None))
+
+        self.assertEqual({'pending': 3, 'superseded_frames': 1, 'dropped_frames': 1},
+                         queue.get_stats())
+        self.assertEqual(('a', None), queue.get_nowait())
+        self.assertEqual(('dmd_frame?name=dmd', b'2'), queue.get_nowait())
+        self.assertEqual(('b', None), queue.get_nowait())
+
+    def test_blocking_get(self):
+        queue = BcpSendQueue()
+        timer = threading.Timer(.01, queue.put, [('a', None)])
+        timer.start()
+        self.assertEqual(('a', None), queue.get(timeout=5))
+        timer.join()
@@ -0,0 +1,330 @@
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import mpf.core.bcp.bcp_socket_client as bcp
+
+from mpfmc.core.bcp_latency import BcpLatencyStats
+from mpfmc.core.bcp_payload_ring import BcpPayloadRing
+from mpfmc.core.bcp_recorder import read_recording
+from mpfmc.core.bcp_selector_server import BCPSelectorServer
+from mpfmc.core.bcp_send_queue import BcpSendQueue
+from mpfmc.core.bcp_server import BCPServer
+
+
+class TestBcpServer(unittest.TestCase):
+
+    server_class = BCPServer
+
+    def get_interface(self):
+        return 'localhost'
+
+    def setUp(self):
+        self.record_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.record_dir.cleanup)
+        self.mc = MagicMock()
+        self.mc.machine_config = {'mpf-mc': {'bcp_interface': self.get_interface(), 'bcp_port': 0,
+                                             'bcp_max_clients': 2, 'bcp_send_queue_limit': 10,
+                                             'bcp_payload_ring_size': 65536}}
+        self.mc.options = {'production': False,
+                           'bcp_record': os.path.join(self.record_dir.name, 'session.bcp')}
+        self.mc.thread_stopper = threading.Event()
+        self.mc.crash_queue = queue.Queue()
+
+        self.receive_queue = queue.Queue()
+        self.sending_queue = BcpSendQueue()
+        self.received = threading.Semaphore(0)
+        self.latency_stats = BcpLatencyStats()
+        self.server = self.server_class(self.mc, self.receive_queue, self.sending_queue,
+                                        self.received.release, self.latency_stats)
+        self.server.daemon = True
+        self.server.start()
+
+        self.client = self._connect()
+        self.sockets = [self.client]
+
+    def tearDown(self):
+        for sock in self.sockets:
+            sock.close()
+        self.mc.thread_stopper.set()
+        self.server.wakeup()
+        self.server.join(5)
+        self.assertFalse(self.server.is_alive())
+        self.assertTrue(self.mc.crash_queue.empty())
+
+    def _connect(self):
+        if self.server.unix_socket_path:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(self.server.unix_socket_path)
+        else:
+            client = socket.create_connection(self.server.socket.getsockname())
+        client.settimeout(5)
+        return client
+
+    def _connect_additional(self):
+        client = self._connect()
+        self.sockets.append(client)
+        client.sendall(b'monitor_start?category=dmd_frames\nhello?version=1.1\n')
+        self.assertEqual(b'hello?version=1.1\n', self._recv(18, client))
+        return client
+
+    def _start_session(self):
+        # the first client which does not start with monitor_start becomes
+        # the primary client
+        self.client.sendall(b'hello?version=1.1\n')
+        return self._get_received(3)
+
+    def _get_received(self, num):
+        commands = []
+        while len(commands) < num:
+            self.assertTrue(self.received.acquire(timeout=5))
+            while not self.receive_queue.empty():
+                commands.append(self.receive_queue.get())
+        return commands
+
+    def _recv(self, num_bytes, client=None):
+        client = client or self.client
+        data = b''
+        while len(data) < num_bytes:
+            chunk = client.recv(num_bytes - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def _recv_line(self, client=None):
+        client = client or self.client
+        data = b''
+        while not data.endswith(b'\n'):
+            data += self._recv(1, client)
+        return bcp.decode_command_string(data.decode()[:-1])
+
+    def _wait_for(self, condition):
+        end_time = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), end_time)
+            time.sleep(.01)
+
+    def test_receive(self):
+        self.client.sendall(b'hello?version=1.1\ntrigger?name=foo&num=int:3\nmode_')
+        self.client.sendall(b'start?name=attract\n')
+        commands = self._get_received(5)
+        self.assertEqual('client_disconnected', commands[0][1]['name'])
+        # the client is the primary client once it said hello
+        self.assertEqual('client_connected', commands[1][1]['name'])
+        self.assertEqual([('hello', {'version': '1.1'}),
+                          ('trigger', {'name': 'foo', 'num': 3}),
+                          ('mode_start', {'name': 'attract'})],
+                         commands[2:])
+
+    def test_record(self):
+        self.client.sendall(b'hello?version=1.1\ntrigger?name=foo\n')
+        self._get_received(4)
+        # additional clients are not recorded
+        monitor = self._connect_additional()
+        monitor.sendall(b'trigger?name=bar\n')
+        self.client.sendall(b'trigger?name=baz\n')
+        self._get_received(1)
+
+        self.mc.thread_stopper.set()
+        self.server.wakeup()
+        self.server.join(5)
+        records = list(read_recording(self.mc.options['bcp_record']))
+        self.assertEqual(['hello?version=1.1', 'trigger?name=foo', 'trigger?name=baz'],
+                         [message for _, message in records])
+        self.assertLessEqual(records[0][0], records[1][0])
+
+    def test_send(self):
+        self._start_session()
+        frame = bytes(range(256)) * 8000
+        self.sending_queue.put(('hello?version=1.1', None))
+        self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, frame)
+        self.sending_queue.put(('goodbye', None))
+
+        header = 'dmd_frame?name=dmd&bytes={}\n'.format(len(frame)).encode()
+        expected = b'hello?version=1.1\n' + header + frame + b'goodbye\n'
+        self.assertEqual(expected, self._recv(len(expected)))
+
+        self._wait_for(lambda: self.server.get_send_stats()['messages'] == 3)
+        self.assertEqual(len(expected), self.server.get_send_stats()['bytes'])
+
+    def test_disconnect_stops_mc(self):
+        self._start_session()
+        self.client.close()
+        self._wait_for(lambda: self.mc.stop.called)
+        self.mc.stop.assert_called_once_with()
+
+    def test_additional_client(self):
+        self._start_session()
+        monitor = self._connect_additional()
+
+        # commands of additional clients are not processed by the MC
+        self.assertTrue(self.receive_queue.empty())
+
+        frame = b'\1' * 128
+        self.sending_queue.put(('trigger?name=foo', None))
+        self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, frame)
+
+        header = 'dmd_frame?name=dmd&bytes={}\n'.format(len(frame)).encode()
+        expected = b'trigger?name=foo\n' + header + frame
+        self.assertEqual(expected, self._recv(len(expected)))
+        # the monitor only subscribed to frames
+        self.assertEqual(header + frame, self._recv(len(header + frame), monitor))
+
+        self.assertEqual([True, False], [client['primary'] for client in self.server.get_client_stats()])
+        self.assertEqual(['dmd_frames'], self.server.get_client_stats()[1]['subscriptions'])
+
+        # an additional client may disconnect without stopping the MC
+        monitor.close()
+        self._wait_for(lambda: len(self.server.get_client_stats()) == 1)
+        self.assertFalse(self.mc.stop.called)
+
+    def test_monitor_connects_first(self):
+        # e.g. while MPF restarts
+        monitor = self.client
+        monitor.sendall(b'monitor_start?category=dmd_frames\nhello?version=1.1\n')
+        self.assertEqual(b'hello?version=1.1\n', self._recv(18, monitor))
+
+        mpf = self._connect()
+        self.sockets.append(mpf)
+        mpf.sendall(b'hello?version=1.1\n')
+        commands = self._get_received(3)
+        self.assertEqual('client_connected', commands[1][1]['name'])
+        self.assertEqual(('hello', {'version': '1.1'}), commands[2])
+        self.assertEqual([False, True], [client['primary'] for client in self.server.get_client_stats()])
+
+        # MPF gets everything, the monitor only its frames
+        frame = b'\1' * 128
+        self.sending_queue.put(('trigger?name=foo', None))
+        self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, frame)
+        header = 'dmd_frame?name=dmd&bytes={}\n'.format(len(frame)).encode()
+        self.assertEqual(b'trigger?name=foo\n' + header + frame, self._recv(17 + len(header + frame), mpf))
+        self.assertEqual(header + frame, self._recv(len(header + frame), monitor))
+
+        # the monitor may disconnect without stopping the MC
+        monitor.close()
+        self._wait_for(lambda: len(self.server.get_client_stats()) == 1)
+        self.assertFalse(self.mc.stop.called)
+
+    def test_monitor_keeps_slot_for_mpf(self):
+        self.server.max_clients = 1
+        self.client.sendall(b'monitor_start?category=dmd_frames\n')
+        self.assertEqual(b'', self._recv(1))
+        self._wait_for(lambda: not self.server.get_client_stats())
+
+        mpf = self._connect()
+        self.sockets.append(mpf)
+        mpf.sendall(b'hello?version=1.1\n')
+        commands = self._get_received(3)
+        self.assertEqual('client_connected', commands[1][1]['name'])
+        self.assertEqual([True], [client['primary'] for client in self.server.get_client_stats()])
+
+    def test_reject_clients_above_limit(self):
+        self._start_session()
+        self._connect_additional()
+        rejected = self._connect()
+        self.sockets.append(rejected)
+        self.assertEqual(b'', self._recv(1, rejected))
+
+    def test_slow_client_does_not_block(self):
+        self._start_session()
+        # the monitor subscribes to frames but never reads
+        self._connect_additional()
+
+        frame = bytes(1000000)
+        for i in range(50):
+            self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, frame)
+            self.sending_queue.put(('trigger?name=t{}'.format(i), None))
+
+        data = b''
+        while not data.endswith(b'trigger?name=t49\n'):
+            chunk = self.client.recv(1000000)
+            self.assertTrue(chunk)
+            data += chunk
+
+
+    def test_latency(self):
+        self._start_session()
+        self.client.sendall(b'trigger?name=foo\n')
+        command = self._get_received(1)[0]
+        self.assertGreater(command.received, 0)
+        self.assertEqual(1, self.latency_stats.get_stats()['decode']['trigger']['count'])
+
+        # bcp_latency is only sent to clients which monitor it
+        monitor = self._connect_additional()
+        self.sending_queue.put(('bcp_latency?foo=1', None))
+        self.sending_queue.put(('trigger?name=bar', None))
+        self.assertEqual(b'trigger?name=bar\n', self._recv(17))
+
+        self.client.sendall(b'monitor_start?category=bcp_latency\n')
+        monitor.sendall(b'monitor_start?category=bcp_latency\n')
+        self._wait_for(lambda: all('bcp_latency' in client['subscriptions']
+                                   for client in self.server.get_client_stats()))
+        self.assertTrue(self.server.has_subscribers('bcp_latency'))
+        self.sending_queue.put(('bcp_latency?foo=2', None))
+        self.assertEqual(b'bcp_latency?foo=2\n', self._recv(18))
+        self.assertEqual(b'bcp_latency?foo=2\n', self._recv(18, monitor))
+
+        self._wait_for(lambda: self.latency_stats.get_stats().get('send_queue', {}).get('bcp_latency'))
+        # monitor_start is handled by the server
+        self.assertTrue(self.receive_queue.empty())
+
+    def test_payload_ring(self):
+        self._start_session()
+        self.client.sendall(b'payload_ring_request\n')
+        cmd, kwargs = self._recv_line()
+        self.assertEqual('payload_ring', cmd)
+        self.assertEqual(65536, kwargs['size'])
+        ring = BcpPayloadRing.attach(kwargs['name'])
+        self.addCleanup(ring.close)
+
+        # the request is handled by the server
+        self.assertTrue(self.receive_queue.empty())
+
+        frame = os.urandom(4096)
+        self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, frame)
+        cmd, kwargs = self._recv_line()
+        self.assertEqual('dmd_frame', cmd)
+        self.assertEqual(4096, kwargs['ring_bytes'])
+        self.assertEqual(frame, ring.read(kwargs['ring_position'], kwargs['ring_bytes']))
+
+        # small payloads are sent inline
+        self.sending_queue.put_latest(('dmd_frame', 'dmd'), 'dmd_frame', {'name': 'dmd'}, b'123')
+        self.assertEqual(b'dmd_frame?name=dmd&bytes=3\n123', self._recv(30))
+
+
+class TestBcpSelectorServer(TestBcpServer):
+
+    server_class = BCPSelectorServer
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not supported")
+class TestBcpUnixServer(TestBcpServer):
+
+    def get_interface(self):
+        self.socket_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.socket_dir.cleanup)
+        return 'unix:' + os.path.join(self.socket_dir.name, 'bcp.sock')
+
+    def test_client_connected(self):
+        commands = self._start_session()
+        path = os.path.join(self.socket_dir.name, 'bcp.sock')
+        self.assertEqual({'name': 'client_connected', 'host': path, 'port': 0}, commands[1][1])
+
+    def test_socket_is_removed(self):
+        path = self.server.unix_socket_path
+        self.assertTrue(os.path.exists(path))
+        self.mc.thread_stopper.set()
+        self.server.wakeup()
+        self.server.join(5)
+        self.assertFalse(os.path.exists(path))
+
+
+class TestBcpSelectorUnixServer(TestBcpUnixServer):
+
+    server_class = BCPSelectorServer
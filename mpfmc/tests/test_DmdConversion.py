@@ -0,0 +1,111 @@
+import os
+import random
+import struct
+import unittest
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from mpfmc.core.dmd import Dmd, RgbDmd
+
+
+def convert_per_pixel(data, luminosity):
+    """Previous per pixel implementation of Dmd._convert_to_single_bytes."""
+    new_data = bytearray()
+    for r, g, b in struct.iter_unpack('BBB', data):
+        pixel_weight = ((r * luminosity[0]) + (g * luminosity[1]) + (b * luminosity[2])) / 255.
+        new_data.append(int(round(pixel_weight * 15)))
+    return bytes(new_data)
+
+
+def reorder_per_pixel(data, order):
+    """Previous per pixel implementation of RgbDmd._reorder_channels."""
+    new_data = bytearray()
+    for r, g, b in struct.iter_unpack('BBB', data):
+        for channel in order:
+            new_data.append({"r": r, "g": g, "b": b}[channel])
+    return bytes(new_data)
+
+
+class TestDmdConversion(unittest.TestCase):
+
+    LUMINOSITIES = [
+        (.299, .587, .114),
+        (1, 0, 0),
+        (.2126, .7152, .0722),
+        (.333, .333, .333),
+        (.5, .5, 0),
+    ]
+
+    def test_identical_to_per_pixel(self):
+        rand = random.Random(11)
+        data = bytes(rand.getrandbits(8) for _ in range(3 * 128 * 32))
+        # grey levels and pure channels hit the rounding boundaries
+        data += bytes(value for i in range(256) for value in (i, i, i))
+        data += bytes(value for i in range(256) for value in (i, 0, 0, 0, i, 0, 0, 0, i))
+
+        for luminosity in self.LUMINOSITIES:
+            config = {'luminosity': luminosity}
+            self.assertEqual(convert_per_pixel(data, luminosity), Dmd._convert_to_single_bytes(data, config))
+
+    def test_default_luminosity(self):
+        config = {}
+        self.assertEqual(b'\x00\x0f\x04\x09\x02', Dmd._convert_to_single_bytes(
+            b'\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\xff\x00\x00\x00\xff', config))
+        self.assertEqual((.299, .587, .114), config['luminosity'])
+
+    def test_levels(self):
+        # the full luminosity for dithering and 4 shades
+        data = b'\x00\x00\x00\xff\xff\xff\xff\x00\x00'
+        self.assertEqual(b'\x00\xff\x4c', Dmd._convert_to_single_bytes(data, {}, 255))
+        self.assertEqual(b'\x00\x03\x01', Dmd._convert_to_single_bytes(data, {}, 3))
+
+    def test_empty_and_out_of_range(self):
+        self.assertEqual(b'', Dmd._convert_to_single_bytes(b'', {}))
+        with self.assertRaises(ValueError):
+            Dmd._convert_to_single_bytes(b'\xff\xff\xff', {'luminosity': (10, 10, 10)})
+
+    def test_color_table(self):
+        self.assertEqual(list(range(256)), list(Dmd._get_color_table(1.0, 1.0)))
+        table = Dmd._get_color_table(.5, 2.0)
+        self.assertEqual([0, 64], [table[0], table[255]])
+
+    def test_reorder_channels(self):
+        rand = random.Random(12)
+        data = bytes(rand.getrandbits(8) for _ in range(3 * 128 * 32))
+
+        for order in ("rgb", "rbg", "grb", "gbr", "brg", "bgr", "rrr", "gb"):
+            self.assertEqual(reorder_per_pixel(data, order), RgbDmd._reorder_channels(data, order))
+
+        self.assertEqual(b'\x03\x02\x01\x06\x05\x04',
+                         RgbDmd._reorder_channels(b'\x01\x02\x03\x04\x05\x06', "bgr"))
+        self.assertEqual(b'', RgbDmd._reorder_channels(b'', "bgr"))
+
+        with self.assertRaises(ValueError):
+            RgbDmd._reorder_channels(data, "rgx")
+
+    def test_pack_pixels(self):
+        self.assertEqual(b'\x12\x34', Dmd._pack_pixels(b'\x01\x02\x03\x04', 4))
+        self.assertEqual(b'\x12\x30', Dmd._pack_pixels(b'\x01\x02\x03', 4))
+        self.assertEqual(b'\x1b\xc0', Dmd._pack_pixels(b'\x00\x01\x02\x03\x03', 2))
+
+        rand = random.Random(16)
+        for bits in (4, 2):
+            shades = bytes(rand.randrange(1 << bits) for _ in range(128 * 32))
+            bit_string = ''.join(format(shade, '0{}b'.format(bits)) for shade in shades)
+            expected = bytes(int(bit_string[i:i + 8], 2) for i in range(0, len(bit_string), 8))
+            self.assertEqual(expected, Dmd._pack_pixels(shades, bits))
+
+    def test_dither(self):
+        width, height = 130, 34
+        for levels in (15, 3):
+            for value in (0, 1, 76, 128, 200, 254, 255):
+                shades = Dmd._dither(bytes([value]) * width * height, width, height, levels)
+                self.assertEqual((height, width), shades.shape)
+                self.assertLessEqual(shades.max(), levels)
+                # the average of every 4x4 block is close to the exact shade
+                block = shades[:4, :4].astype(float)
+                self.assertAlmostEqual(value * levels / 255, block.mean(), delta=1 / 16)
+                self.assertTrue((shades[:4, :4] == shades[4:8, 8:12]).all())
+
+            self.assertEqual(0, Dmd._dither(b'\x00' * 16, 4, 4, levels).max())
+            self.assertEqual(levels, Dmd._dither(b'\xff' * 16, 4, 4, levels).min())
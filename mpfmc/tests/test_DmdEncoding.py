@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from mpfmc.core.dmd_encoding import DmdFrameDecoder, DmdFrameEncoder, decode_delta, encode_delta, \
+    merge_deltas, merge_frame
+
+
+class TestDmdEncoding(unittest.TestCase):
+
+    size = 128 * 32
+
+    def setUp(self):
+        self.rand = random.Random(15)
+
+    def _change(self, frame, changes=20):
+        frame = bytearray(frame)
+        for _ in range(changes):
+            frame[self.rand.randrange(len(frame))] = self.rand.randrange(16)
+        return bytes(frame)
+
+    def test_delta(self):
+        black = bytes(self.size)
+        self.assertEqual(b'', encode_delta(black))
+        self.assertEqual(b'', encode_delta(black, black))
+        self.assertEqual(black, decode_delta(b'', size=self.size))
+
+        frame = bytearray(self.size)
+        frame[200:210] = b'\x0f' * 10
+        frame[300] = 1
+        frame[302] = 2
+        frame = bytes(frame)
+        # skip 200, 10 changed bytes, skip 90, 3 changed bytes (the gap is too short for a new span)
+        self.assertEqual(b'\xc8\x01\x0a' + b'\x0f' * 10 + b'\x5a\x03\x01\x00\x02', encode_delta(frame))
+        self.assertEqual(frame, decode_delta(encode_delta(frame), size=self.size))
+
+        previous = frame
+        for _ in range(50):
+            frame = self._change(previous)
+            delta = encode_delta(frame, previous)
+            self.assertEqual(frame, decode_delta(delta, previous))
+            previous = frame
+
+        with self.assertRaises(ValueError):
+            decode_delta(encode_delta(bytes(10) + b'\x01'), bytes(10))
+
+    def test_merge_deltas(self):
+        frames = [bytes(self.size)]
+        for _ in range(5):
+            frames.append(self._change(frames[-1], 50))
+
+        merged = encode_delta(frames[1], frames[0])
+        for previous, frame in zip(frames[1:], frames[2:]):
+            merged = merge_deltas(merged, encode_delta(frame, previous))
+        self.assertEqual(frames[-1], decode_delta(merged, frames[0]))
+        self.assertEqual(encode_delta(frames[-1], frames[0]), merged)
+
+    def test_merge_frame(self):
+        frame1 = self._change(bytes(self.size))
+        frame2 = self._change(frame1)
+        frame3 = self._change(frame2)
+        delta2 = {'encoding': 'delta', 'frame': 2, 'base': 1}, encode_delta(frame2, frame1)
+        delta3 = {'encoding': 'delta', 'frame': 3, 'base': 2}, encode_delta(frame3, frame2)
+
+        # two deltas
+        kwargs, payload = merge_frame(*delta2, *delta3)
+        self.assertEqual({'encoding': 'delta', 'frame': 3, 'base': 1}, kwargs)
+        self.assertEqual(frame3, decode_delta(payload, frame1))
+
+        # a delta on top of a full frame
+        kwargs, payload = merge_frame({'frame': 2}, frame2, *delta3)
+        self.assertEqual(({'frame': 3}, frame3), (kwargs, payload))
+
+        # keyframes and full frames replace the pending frame
+        keyframe = {'encoding': 'delta', 'frame': 3, 'base': -1}, encode_delta(frame3)
+        self.assertEqual(keyframe, merge_frame(*delta2, *keyframe))
+        self.assertEqual(({'frame': 3}, frame3), merge_frame(*delta2, {'frame': 3}, frame3))
+
+    def test_encoder_and_decoder(self):
+        encoder = DmdFrameEncoder(keyframe_interval=10)
+        decoder = DmdFrameDecoder(self.size)
+
+        frame = bytes(self.size)
+        bases = []
+        for _ in range(25):
+            frame = self._change(frame)
+            kwargs, payload = encoder.encode(frame)
+            self.assertEqual('delta', kwargs['encoding'])
+            if kwargs['base'] >= 0:
+                self.assertLess(len(payload), 100)
+            bases.append(kwargs['base'])
+            self.assertEqual(frame, decoder.decode(payload, **kwargs))
+            self.assertEqual(kwargs['frame'], decoder.frame_number)
+
+        # a keyframe every 11 frames
+        self.assertEqual([0, 11, 22], [i for i, base in enumerate(bases) if base == -1])
+
+        # noise is sent as it is
+        noise = bytes(self.rand.randrange(256) for _ in range(self.size))
+        kwargs, payload = encoder.encode(noise)
+        self.assertEqual({'frame': 26}, kwargs)
+        self.assertEqual(noise, decoder.decode(payload, **kwargs))
+
+        # after a lost frame the decoder waits for a keyframe
+        encoder.encode(self._change(noise))
+        kwargs, payload = encoder.encode(self._change(noise))
+        self.assertIsNone(decoder.decode(payload, **kwargs))
+        encoder.reset()
+        frame = self._change(bytes(self.size))
+        kwargs, payload = encoder.encode(frame)
+        self.assertEqual(-1, kwargs['base'])
+        self.assertEqual(frame, decoder.decode(payload, **kwargs))
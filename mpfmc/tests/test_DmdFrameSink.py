@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from mpfmc.core.dmd_frame_sink import DmdFrameSink, DmdFrameSinkReader
+
+
+class TestDmdFrameSink(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'dmd')
+        self.sink = DmdFrameSink(self.path, 128, 32, channels=1, slots=3)
+        self.reader = DmdFrameSinkReader(self.path)
+
+    def tearDown(self):
+        self.reader.close()
+        self.sink.close()
+        self.directory.cleanup()
+
+    def test_header(self):
+        self.assertEqual((128, 32, 1, 3), (self.reader.width, self.reader.height, self.reader.channels,
+                                           self.reader.slots))
+        self.assertEqual(0, self.reader.get_latest_sequence())
+        self.assertIsNone(self.reader.read_frame())
+
+        with open(os.path.join(self.directory.name, 'other'), 'wb') as other:
+            other.write(bytes(128))
+        with self.assertRaises(ValueError):
+            DmdFrameSinkReader(os.path.join(self.directory.name, 'other'))
+
+    def test_frames(self):
+        frame = bytes(range(256)) * 16
+        self.assertEqual(1, self.sink.write(frame))
+        sequence, data, bits = self.reader.read_frame()
+        self.assertEqual((1, frame, 8), (sequence, bytes(data), bits))
+        self.assertTrue(self.reader.is_valid(sequence))
+        data.release()
+
+        # no new frame
+        self.assertIsNone(self.reader.read_frame())
+        self.assertIsNone(self.reader.wait_for_frame(timeout=.01))
+
+        # packed frame
+        self.sink.write(b'\x12' * 2048, bits=4)
+        sequence, data, bits = self.reader.wait_for_frame(timeout=1)
+        self.assertEqual((2, b'\x12' * 2048, 4), (sequence, bytes(data), bits))
+        data.release()
+
+        # the slot of frame 2 is reused by frame 5
+        for num in range(3, 6):
+            self.sink.write(bytes([num]) * 4096)
+        self.assertFalse(self.reader.is_valid(2))
+        sequence, data, _ = self.reader.read_frame()
+        self.assertEqual((5, bytes([5]) * 4096), (sequence, bytes(data)))
+        self.assertEqual(2, self.reader.missed_frames)
+        data.release()
+
+        with self.assertRaises(ValueError):
+            self.sink.write(bytes(4097 + 64))
@@ -0,0 +1,237 @@
+from unittest.mock import patch
+
+from kivy.clock import Clock
+
+from mpfmc.core.dmd import Dmd
+from mpfmc.effects.dmd_output import DmdOutputEffect
+from mpfmc.core.dmd_encoding import DmdFrameDecoder
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestDmdOutput(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/dmd'
+
+    def get_config_file(self):
+        return 'test_dmd_output.yaml'
+
+    def _connect(self):
+        # DMDs are created when MPF connects
+        self.mc.events.post('client_connected')
+        self.advance_time(.1)
+        self.sent_bcp_commands = []
+
+    def _get_last_frame(self, bcp_command, name):
+        frames = [kwargs['rawbytes'] for command, _, kwargs in self.sent_bcp_commands
+                  if command == bcp_command and kwargs['name'] == name]
+        self.assertTrue(frames)
+        return frames[-1]
+
+    def test_pixel_format(self):
+        self._connect()
+
+        self.mc.events.post('show_red')
+        self.advance_time(.1)
+
+        # 0.299 * 15 rounds to 4. the Fbo has been read back in packed format
+        self.assertEqual(b'\x04' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        # channel order bgr
+        self.assertEqual(b'\x00\x00\xff' * 128 * 32, self._get_last_frame('rgb_dmd_frame', 'rgb_dmd'))
+
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        self.assertEqual(b'\xff' * 3 * 128 * 32, self._get_last_frame('rgb_dmd_frame', 'rgb_dmd'))
+
+    def test_packed_frames(self):
+        self._connect()
+
+        self.mc.events.post('show_red')
+        self.advance_time(.1)
+
+        # 2 bits per pixel dithered from the luminosity (0.299 * 255)
+        expected = Dmd._pack_pixels(Dmd._dither(bytes([76]) * 128 * 32, 128, 32, 3), 2)
+        self.assertEqual(128 * 32 // 4, len(expected))
+        self.assertEqual(expected, self._get_last_frame('dmd_frame', 'packed_dmd'))
+        self.assertIn(('dmd_frame', None, {'name': 'packed_dmd', 'bits': 2, 'rawbytes': expected}),
+                      self.sent_bcp_commands)
+
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+        # white is shade 3 in every pixel (the threshold never rounds it up
+        # past the highest shade), so every byte is 0b11111111
+        expected = Dmd._pack_pixels(Dmd._dither(b'\xff' * 128 * 32, 128, 32, 3), 2)
+        self.assertEqual(b'\xff' * (128 * 32 // 4), expected)
+        self.assertEqual(expected, self._get_last_frame('dmd_frame', 'packed_dmd'))
+
+    def test_shared_capture(self):
+        self._connect()
+
+        capture = self.mc.displays['dmd'].get_capture()
+        for dmd in self.mc.dmds + self.mc.rgb_dmds:
+            self.assertIs(capture, dmd.capture)
+
+        # the display is rendered at most once per clock frame for all DMDs
+        render = capture._render
+        rendered_frames = []
+
+        def _render():
+            rendered_frames.append(Clock.frames)
+            render()
+
+        capture._render = _render
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+
+        self.assertTrue(rendered_frames)
+        self.assertEqual(len(rendered_frames), len(set(rendered_frames)))
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        self.assertEqual(b'\xff' * 3 * 128 * 32, self._get_last_frame('rgb_dmd_frame', 'rgb_dmd'))
+
+        # the pixels are read only once per capture
+        capture.update()
+        self.assertIs(capture.get_pixels(), self.mc.displays['dmd'].get_frame_data())
+        self.assertEqual(b'\xff' * 4 * 128 * 32, capture.get_pixels())
+
+    def test_capture_keeps_widget_tree(self):
+        self._connect()
+
+        # the display is drawn by reference without detaching it
+        display = self.mc.displays['dmd']
+        parent_changes = []
+        display.bind(parent=lambda *args: parent_changes.append(args))
+        display.container.bind(parent=lambda *args: parent_changes.append(args))
+
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+
+        self.assertEqual([], parent_changes)
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+
+    def test_frame_encoding(self):
+        self._connect()
+
+        self.send('dmd_frame_encoding', name='dmd', encodings='unknown,delta')
+        self.advance_time(.1)
+        self.assertIn(('dmd_frame_encoding', None, {'name': 'dmd', 'rgb': False, 'encoding': 'delta'}),
+                      self.sent_bcp_commands)
+
+        decoder = DmdFrameDecoder(128 * 32)
+        for text in ('show_red', 'show_white', 'show_red'):
+            self.sent_bcp_commands = []
+            self.mc.events.post(text)
+            self.advance_time(.1)
+
+            frame = None
+            encodings = []
+            for command, _, kwargs in self.sent_bcp_commands:
+                if command == 'dmd_frame' and kwargs['name'] == 'dmd':
+                    encodings.append(kwargs.get('encoding'))
+                    frame = decoder.decode(**kwargs)
+                elif command == 'rgb_dmd_frame':
+                    # not negotiated
+                    self.assertNotIn('encoding', kwargs)
+            self.assertEqual(b'\x0f' * 128 * 32 if text == 'show_white' else b'\x04' * 128 * 32, frame)
+            # every byte changed so the delta is larger than the frame and it
+            # is sent as it is. unchanged frames are sent as empty deltas.
+            self.assertEqual(1, encodings.count(None))
+            self.assertEqual({None, 'delta'}, set(encodings))
+
+        # a new client starts with uncompressed frames
+        self.mc.events.post('client_connected')
+        self.advance_time(.1)
+        self.sent_bcp_commands = []
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        for command, _, kwargs in self.sent_bcp_commands:
+            self.assertNotIn('encoding', kwargs)
+
+    def test_dropped_frame_is_resent(self):
+        self._connect()
+        dmd = self.mc.dmds[0]
+        dmd.config['only_send_changes'] = True
+
+        # the send queue is full so the frame is dropped
+        def drop_dmd_frames(bcp_command, callback=None, **kwargs):
+            if bcp_command == 'dmd_frame':
+                return False
+            return self._bcp_send(bcp_command, callback, **kwargs)
+
+        self.mc.bcp_processor.send = drop_dmd_frames
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+        self.assertIsNone(dmd.prev_data)
+
+        # the display did not change but the frame is sent again
+        self.mc.bcp_processor.send = self._bcp_send
+        self.sent_bcp_commands = []
+        dmd._render(0)
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        self.assertIsNotNone(dmd.prev_data)
+
+        # and only once
+        self.sent_bcp_commands = []
+        dmd._render(0)
+        self.assertFalse([command for command, _, kwargs in self.sent_bcp_commands
+                          if command == 'dmd_frame' and kwargs['name'] == 'dmd'])
+
+    def test_shader_failure(self):
+        def get_broken_effect(dmd):
+            effect = DmdOutputEffect(luminosity=list(dmd.config['luminosity']))
+            effect.glsl = 'vec4 effect(vec4 color) { broken }'
+            return effect
+
+        # the DMD falls back to the conversion on the CPU
+        with patch.object(Dmd, '_get_output_effect', get_broken_effect):
+            self._connect()
+
+        self.assertIsNone(self.mc.dmds[0].effect)
+        rgb_dmd = self.mc.rgb_dmds[0]
+        self.assertEqual(rgb_dmd.config['gpu_output'], rgb_dmd.effect is not None)
+
+        self.mc.events.post('show_red')
+        self.advance_time(.1)
+        self.assertEqual(b'\x04' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        expected = Dmd._pack_pixels(Dmd._dither(bytes([76]) * 128 * 32, 128, 32, 3), 2)
+        self.assertEqual(expected, self._get_last_frame('dmd_frame', 'packed_dmd'))
+
+
+class TestDmdDeferredReadback(TestDmdOutput):
+    def get_config_file(self):
+        return 'test_dmd_deferred.yaml'
+
+    def test_deferred_readback(self):
+        self._connect()
+
+        self.mc.events.post('show_white')
+        self.advance_time(.1)
+
+        # frames are read in the render after they have been drawn
+        for dmd in self.mc.dmds + self.mc.rgb_dmds:
+            self.assertEqual('deferred', dmd.config['readback'])
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+
+        # the last frame is read in the next render even if nothing new is drawn
+        dmd = self.mc.dmds[0]
+        self.assertTrue(dmd._readback_pending)
+        self.sent_bcp_commands = []
+        dmd._render(0)
+        self.assertFalse(dmd._readback_pending)
+        self.assertEqual(b'\x0f' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+
+class TestDmdCpuOutput(TestDmdOutput):
+    def get_config_file(self):
+        return 'test_dmd_cpu_output.yaml'
+
+    def test_cpu_output(self):
+        self._connect()
+
+        for dmd in self.mc.dmds + self.mc.rgb_dmds:
+            self.assertIsNone(dmd.effect)
+
+        self.mc.events.post('show_red')
+        self.advance_time(.1)
+        self.assertEqual(b'\x04' * 128 * 32, self._get_last_frame('dmd_frame', 'dmd'))
+        self.assertEqual(b'\x00\x00\xff' * 128 * 32, self._get_last_frame('rgb_dmd_frame', 'rgb_dmd'))
@@ -12,10 +12,9 @@ from kivy.uix.screenmanager import (ScreenManager, NoTransition,
                                     ScreenManagerException)
 from kivy.uix.widget import WidgetException as KivyWidgetException
 from kivy.uix.scatter import Scatter
-from kivy.graphics import (
-    Translate, Fbo, ClearColor, ClearBuffers, Scale)
 from kivy.properties import ObjectProperty
 
+from mpfmc.core.display_capture import DisplayCapture
 from mpfmc.uix.widget import Widget
 from mpfmc.uix.slide import Slide
 
@@ -61,6 +60,7 @@ class Display(ScreenManager):
         self.display = self
         self.parents = []
         self.mc.track_leak_reference(self)
+        self._capture = None  # type: Optional[DisplayCapture]
 
         Display.displays_to_initialize += 1
 
@@ -94,28 +94,26 @@ class Display(ScreenManager):
         return '<Display name={}{}, current slide={}, total slides={}>'.format(
             self.name, self.size, self.current_slide_name, len(self.slides))
 
+    def get_capture(self) -> DisplayCapture:
+        """Return the offscreen capture of this display.
+
+        The capture is shared by all consumers of the pixels of this display
+        (DMDs, the display_light_player and get_frame_data).
+        """
+        if not self._capture:
+            self._capture = DisplayCapture(self)
+        return self._capture
+
     def get_frame_data(self, *args):
-        """Return the content of this display as buffer.
+        """Return the content of this display as RGBA buffer (bottom row first).
 
         @see: widget.export_to_png
         """
         del args
 
-        fbo = Fbo(size=self._slide_manager_parent.size, with_stencilbuffer=True)
-
-        with fbo:
-            ClearColor(0, 0, 0, 1)
-            ClearBuffers()
-            Scale(1, -1, 1)
-            Translate(-self.x,
-                      -self.y - self.height, 0)
-
-        fbo.add(self.canvas)
-        fbo.draw()
-        data = fbo.texture.pixels
-        fbo.remove(self.canvas)
-
-        return data
+        capture = self.get_capture()
+        capture.update()
+        return capture.get_pixels()
 
     @property
     def ready(self):